@@ -129,6 +129,21 @@ class CLIHandler:
         Args:
             command: The command to send
         """
+        response_text = self.request_from_application(command)
+        if response_text is not None and response_text != "ACK":
+            print(f"Received unexpected response: {response_text}")
+
+    def request_from_application(self, command: str, response_size: int = 64 * 1024) -> str | None:
+        """
+        Send a command to the running YASB application and return its response.
+
+        Args:
+            command: The command to send
+            response_size: Largest response to read
+
+        Returns:
+            The response text, None if the application couldn't be reached
+        """
         try:
             pipe_handle = CreateFile(
                 CLI_SERVER_PIPE_NAME,
@@ -141,7 +156,7 @@ class CLIHandler:
             )
             if pipe_handle == INVALID_HANDLE_VALUE:
                 print("Failed to connect to YASB. Pipe not found. It may not be running.")
-                return
+                return None
 
             # Send the command as bytes
             command_bytes = command.encode("utf-8")
@@ -149,21 +164,19 @@ class CLIHandler:
             if not success:
                 print(f"Failed to write command. Err: {GetLastError()}")
                 CloseHandle(pipe_handle)
-                return
+                return None
 
-            success, response = ReadFile(pipe_handle, 64 * 1024)
+            success, response = ReadFile(pipe_handle, response_size)
             if not success or len(response) == 0:
                 print(f"Failed to read response. Err: {GetLastError()}")
                 CloseHandle(pipe_handle)
-                return
-
-            response_text = response.decode("utf-8").strip()
-            if response_text != "ACK":
-                print(f"Received unexpected response: {response_text}")
+                return None
 
             CloseHandle(pipe_handle)
+            return response.decode("utf-8").strip()
         except Exception as e:
             print(f"Error: {e}")
+            return None
 
     def _open_startup_registry(self, access_flag: int):
         """Helper function to open the startup registry key."""
@@ -361,6 +374,11 @@ class CLIHandler:
             help="Tail yasb process logs (cancel with Ctrl-C)",
             add_help=False,
         )
+        subparsers.add_parser(
+            "stats",
+            help="Print runtime statistics of the running application as JSON",
+            add_help=False,
+        )
         parser.add_argument(
             "-v",
             "--version",
@@ -501,6 +519,17 @@ class CLIHandler:
             except KeyboardInterrupt:
                 print("\nExiting YASB log client.")
 
+        elif args.command == "stats":
+            response_text = self.request_from_application("stats", 4 * 1024 * 1024)
+            if response_text is None:
+                sys.exit(1)
+            try:
+                print(json.dumps(json.loads(response_text), indent=2))
+            except json.JSONDecodeError:
+                print(f"Received unexpected response: {response_text}")
+                sys.exit(1)
+            sys.exit(0)
+
         elif args.command == "monitor-information":
             try:
                 from PyQt6.QtGui import QGuiApplication
@@ -625,6 +654,7 @@ class CLIHandler:
                   set-channel               Switch release channels (stable, dev)
                   update                    Update the application
                   log                       Tail yasb process logs (cancel with Ctrl-C)
+                  stats                     Print runtime statistics of the running application as JSON
                   reset                     Restore default config files and clear cache
                   config-dir                Open config directory in file explorer
                   help                      Print this message
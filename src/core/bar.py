@@ -110,7 +110,7 @@ class Bar(QWidget):
         self._target_screen.geometryChanged.connect(self.on_geometry_changed, Qt.ConnectionType.QueuedConnection)
 
         self.handle_bar_management.connect(self._handle_bar_management)
-        self._event_service.register_event("handle_bar_cli", self.handle_bar_management)
+        self._event_service.register_event("handle_bar_cli", self.handle_bar_management, owner=self)
 
         # Initialize animation manager
         self._animation_manager = BarAnimationManager(self, self)
@@ -144,6 +144,14 @@ class Bar(QWidget):
     def bar_id(self) -> str:
         return self._bar_id
 
+    @property
+    def bar_name(self) -> str:
+        return self._bar_name
+
+    @property
+    def widgets(self) -> dict[str, list[QWidget]]:
+        return self._widgets
+
     def on_geometry_changed(self, geo: QRect) -> None:
         logging.info(
             "Screen geometry changed. Updating position for bar %s on screen %s",
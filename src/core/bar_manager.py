@@ -1,4 +1,5 @@
 import logging
+import time
 import uuid
 from contextlib import suppress
 
@@ -75,13 +76,24 @@ class BarManager(QObject):
             logging.error("Error loading config: %s", e)
             return
         if config and (config != self.config):
-            # Fields that don't trigger a full application reload
+            config.bars = {n: bar for n, bar in config.bars.items() if bar.enabled}
+            # Fields that don't trigger any reload
             exclude = {"watch_config", "watch_stylesheet"}
+            # Fields that can be applied in-process by rebuilding the affected bars
+            hot_reloadable = exclude | {"bars", "widgets"}
 
-            if config.model_dump(exclude=exclude) != self.config.model_dump(exclude=exclude):
+            if config.model_dump(exclude=hot_reloadable) != self.config.model_dump(exclude=hot_reloadable):
                 self.config = config
                 self._disconnect_reload_signals()
                 reload_application("Reloading Application because of config change.")
+            elif config.model_dump(exclude=exclude) != self.config.model_dump(exclude=exclude):
+                try:
+                    self._hot_reload(config)
+                except Exception:
+                    logging.exception("In-process config update failed, falling back to full reload.")
+                    self._disconnect_reload_signals()
+                    reload_application("Reloading Application because of config change.")
+                    return
             else:
                 self.config = config
                 logging.info("Configuration updated (no reload required).")
@@ -89,12 +101,103 @@ class BarManager(QObject):
 
     @pyqtSlot(QScreen)
     def on_screens_update(self, _screen: QScreen) -> None:
-        logging.info("Screens updated. Re-initialising all bars.")
-        self._disconnect_reload_signals()
-        reload_application("Reloading Application because of screen update.")
+        logging.info("Screens updated. Re-initialising affected bars.")
+        try:
+            self._hot_reload(self.config)
+        except Exception:
+            logging.exception("In-process screen update failed, falling back to full reload.")
+            self._disconnect_reload_signals()
+            reload_application("Reloading Application because of screen update.")
+
+    def _hot_reload(self, config: YasbConfig) -> None:
+        """
+        Apply a new config in-process by rebuilding only the bars that are affected by the change.
+        Bars are rebuilt when their BarConfig changed, when any widget they contain (including
+        widgets nested in groupers) changed, or when their screen is no longer available.
+        Shared workers and listener threads stay alive.
+        """
+        start = time.perf_counter()
+        old_config = self.config
+        changed_widgets = {
+            name
+            for name in old_config.widgets.keys() | config.widgets.keys()
+            if old_config.widgets.get(name) != config.widgets.get(name)
+        }
+        self.config = config
+        self._widget_builder = WidgetBuilder(self.config.widgets)
+
+        wanted = {(bar_name, screen.name()): screen for bar_name, _, screen in self._resolve_bar_screens()}
+        kept: list[Bar] = []
+        removed: list[Bar] = []
+        for bar in self.bars:
+            key = (bar.bar_name, bar.screen_name)
+            new_bar_config = self.config.bars.get(bar.bar_name)
+            if (
+                key not in wanted
+                or new_bar_config != old_config.bars.get(bar.bar_name)
+                or self._bar_widget_names(bar.config, old_config.widgets) & changed_widgets
+            ):
+                removed.append(bar)
+            else:
+                kept.append(bar)
+                wanted.pop(key)
+
+        for bar in removed:
+            self._close_bar(bar)
+        self.bars = kept
+
+        # Hotkey handlers of closed bars can be taken over by the new ones
+        self._registered_hotkey_widgets = {
+            (widget.widget_name, bar.screen_name)
+            for bar in self.bars
+            for widget_list in bar.widgets.values()
+            for widget in widget_list
+            if getattr(widget, "_hotkey_enabled", False)
+        }
+
+        for (bar_name, _), screen in wanted.items():
+            self.create_bar(self.config.bars[bar_name], bar_name, screen)
+
+        self._initialized_screens = {bar.screen_name for bar in self.bars}
+        self._restart_hotkey_listener()
+        self.run_listeners_in_threads()
+        self._widget_builder.raise_alerts_if_errors_present()
+
+        logging.info(
+            "Hot reload finished in %.1f ms: %d bar(s) removed, %d bar(s) created, %d bar(s) kept, changed widgets: %s",
+            (time.perf_counter() - start) * 1000,
+            len(removed),
+            len(wanted),
+            len(kept),
+            ", ".join(sorted(changed_widgets)) or "none",
+        )
+
+    def _bar_widget_names(self, bar_config: BarConfig, widget_configs: dict) -> set[str]:
+        """Return all widget names used by a bar, including widgets nested inside groupers."""
+        names: set[str] = set()
+        pending = [name for column in bar_config.widgets.model_dump().values() for name in column]
+        while pending:
+            name = pending.pop()
+            if name in names:
+                continue
+            names.add(name)
+            widget_config = widget_configs.get(name)
+            if isinstance(widget_config, dict):
+                children = (widget_config.get("options") or {}).get("widgets")
+                if isinstance(children, list):
+                    pending.extend(child for child in children if isinstance(child, str))
+        return names
+
+    def _close_bar(self, bar: Bar) -> None:
+        with suppress(RuntimeError):
+            self.event_service.unregister_event("handle_bar_cli", bar.handle_bar_management)
+            bar._skip_animation = True
+            bar.close()
 
     def run_listeners_in_threads(self):
         for listener in self.widget_event_listeners:
+            if listener in self._threads:
+                continue
             logging.info("Starting %s...", listener.__name__)
             thread = listener()
             thread.start()
@@ -130,6 +233,21 @@ class BarManager(QObject):
 
     def initialize_bars(self, init: bool = False) -> None:
         self._widget_builder = WidgetBuilder(self.config.widgets)
+
+        # Create bars
+        initialized_screens: set[str] = set()
+        for bar_name, bar_config, screen in self._resolve_bar_screens():
+            self.create_bar(bar_config, bar_name, screen, init)
+            initialized_screens.add(screen.name())
+
+        self._initialized_screens = initialized_screens
+        self._collect_keybindings()
+        self._start_hotkey_listener()
+        self.run_listeners_in_threads()
+        self._widget_builder.raise_alerts_if_errors_present()
+
+    def _resolve_bar_screens(self) -> list[tuple[str, BarConfig, QScreen]]:
+        """Resolve which screens each configured bar should be created on."""
         primary_screen = QApplication.primaryScreen()
         primary_screen_name = primary_screen.name() if primary_screen else None
 
@@ -147,19 +265,16 @@ class BarManager(QObject):
                         continue
                     assigned_screens.add(resolved_name)
 
-        # Create bars
-        initialized_screens: set[str] = set()
+        assignments: list[tuple[str, BarConfig, QScreen]] = []
         for bar_name, bar_config in self.config.bars.items():
             if bar_config.screens == ["*"]:
                 for screen in available_screens:
                     if screen.name() in assigned_screens:
                         continue
-                    self.create_bar(bar_config, bar_name, screen, init)
-                    initialized_screens.add(screen.name())
+                    assignments.append((bar_name, bar_config, screen))
             elif bar_config.screens == ["**"]:
                 for screen in available_screens:
-                    self.create_bar(bar_config, bar_name, screen, init)
-                    initialized_screens.add(screen.name())
+                    assignments.append((bar_name, bar_config, screen))
             else:
                 for screen_name in bar_config.screens:
                     resolved_name = primary_screen_name if screen_name == "primary" else screen_name
@@ -168,14 +283,8 @@ class BarManager(QObject):
                         continue
                     screen = get_screen_by_name(resolved_name)
                     if screen:
-                        self.create_bar(bar_config, bar_name, screen, init)
-                        initialized_screens.add(screen.name())
-
-        self._initialized_screens = initialized_screens
-        self._collect_keybindings()
-        self._start_hotkey_listener()
-        self.run_listeners_in_threads()
-        self._widget_builder.raise_alerts_if_errors_present()
+                        assignments.append((bar_name, bar_config, screen))
+        return assignments
 
     def _collect_keybindings(self) -> None:
         """Collect keybindings from all widget configurations."""
@@ -223,6 +332,17 @@ class BarManager(QObject):
         self._hotkey_listener.start()
         logging.info("Starting HotkeyListener...")
 
+    def _restart_hotkey_listener(self) -> None:
+        """Restart the hotkey listener so it picks up changed keybindings and screens."""
+        if self._hotkey_listener is not None:
+            with suppress(Exception):
+                self._hotkey_listener.stop()
+                self._hotkey_listener.wait(1000)
+            self._hotkey_listener = None
+            self._hotkey_dispatcher = None
+        self._collect_keybindings()
+        self._start_hotkey_listener()
+
     def create_bar(self, config: BarConfig, name: str, screen: QScreen, init: bool = False) -> None:
         screen_name = screen.name().replace("\\", "").replace(".", "")
         bar_id = f"{name}_{screen_name}_{str(uuid.uuid4())[:8]}"
@@ -17,6 +17,7 @@ class Event(Enum, metaclass=MetaEvent):
 class KomorebiEvent(Event):
     KomorebiConnect = "KomorebiConnect"
     KomorebiUpdate = "KomorebiUpdate"
+    KomorebiUpdateDiff = "KomorebiUpdateDiff"
     KomorebiDisconnect = "KomorebiDisconnect"
     FocusWorkspaceNumber = "FocusWorkspaceNumber"
     FocusMonitorWorkspaceNumber = "FocusMonitorWorkspaceNumber"
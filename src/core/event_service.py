@@ -1,67 +1,148 @@
 import functools
 import logging
-from threading import RLock
+import time
+import weakref
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtBoundSignal, pyqtSignal
 
 from core.event_enums import Event
+from core.utils.runtime_stats import RuntimeStats
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _Subscriber:
+    signal: pyqtBoundSignal
+    # Object the signal belongs to, the subscriber is dropped once it is gone
+    owner: weakref.ref | None = None
+
+    def is_dead(self) -> bool:
+        if self.owner is None:
+            return False
+        owner = self.owner()
+        return owner is None or sip.isdeleted(owner)
 
 
 @functools.lru_cache()
 class EventService(QObject):
+    """
+    Dispatches application events to the signals registered for their type.
+
+    Subscribers are kept per event type in immutable tuples that are replaced on every
+    registration change, so `emit_event` reads them without taking a lock and only pays for
+    the subscribers of the emitted type (the lock is only held to count the emit). Subscribers
+    registered with an owner are dropped when the owner is destroyed, the others when
+    emitting to them fails.
+    """
+
+    # Emitted after the set of registered event types may have changed
+    registrations_changed = pyqtSignal()
+
     def __init__(self) -> None:
         super().__init__()
-        self._registered_event_signals: dict[Event, list[pyqtSignal]] = {}
-        self._mutex = RLock()
+        self._topics: dict[Event | str, tuple[_Subscriber, ...]] = {}
+        self._emit_counts: dict[Event | str, int] = {}
+        # Taken by writers and for the emit counts, readers use whatever tuple is currently stored
+        self._lock = Lock()
+        self._watched_owners: set[int] = set()
         self._is_shutdown: bool = False
+        self._stats = RuntimeStats()
+
+    def register_event(self, event_type: Event | str, event_signal: pyqtBoundSignal, owner: QObject | None = None):
+        """
+        Register a signal that is emitted with the arguments of every `event_type` event.
 
-    def register_event(self, event_type: Event, event_signal: pyqtSignal):
-        with self._mutex:
-            if event_type not in self._registered_event_signals:
-                self._registered_event_signals[event_type] = [event_signal]
-            else:
-                self._registered_event_signals[event_type].append(event_signal)
+        Pass the QObject the signal belongs to as `owner` to unregister it automatically
+        when that object is destroyed.
+        """
+        owner_ref = weakref.ref(owner) if owner is not None else None
+        with self._lock:
+            self._topics[event_type] = (*self._topics.get(event_type, ()), _Subscriber(event_signal, owner_ref))
+            watch = owner is not None and id(owner) not in self._watched_owners
+            if watch:
+                self._watched_owners.add(id(owner))
+        if watch:
+            owner.destroyed.connect(functools.partial(self._drop_owner, owner_ref, id(owner)))
+        self.registrations_changed.emit()
 
-    def unregister_event(self, event_type: Event, event_signal: pyqtSignal):
+    def unregister_event(self, event_type: Event | str, event_signal: pyqtBoundSignal):
         """
         Remove a previously registered signal for an event type.
         Safe to call multiple times; ignores missing entries.
         """
-        with self._mutex:
-            signals = self._registered_event_signals.get(event_type)
-            if not signals:
+        with self._lock:
+            subscribers = self._topics.get(event_type)
+            if not subscribers:
                 return
-            try:
-                while event_signal in signals:
-                    signals.remove(event_signal)
-            except ValueError:
-                pass
-            # Clean up empty lists to avoid growing the dict
-            if not signals:
-                self._registered_event_signals.pop(event_type, None)
-
-    def emit_event(self, event_type: Event, *args: Any):
+            self._set_subscribers(event_type, tuple(s for s in subscribers if s.signal != event_signal))
+        self.registrations_changed.emit()
+
+    def registered_events(self) -> list[Event | str]:
+        """Event types that currently have at least one registered signal."""
+        return [event_type for event_type, subscribers in list(self._topics.items()) if subscribers]
+
+    def emit_event(self, event_type: Event | str, *args: Any):
         if self._is_shutdown:
             return
-        with self._mutex:
-            event_signals = self._registered_event_signals.get(event_type, [])
-            # Iterate over a shallow copy so we can modify the original list safely
-            for event_signal in list(event_signals):
-                try:
-                    event_signal.emit(*args)
-                except Exception:
-                    logging.debug("Failed to emit signal %s. Removing link to %s.", event_signal, event_type)
-                    with self._mutex:
-                        if event_signal in event_signals:
-                            event_signals.remove(event_signal)
+        started = time.perf_counter()
+        with self._lock:
+            self._emit_counts[event_type] = self._emit_counts.get(event_type, 0) + 1
+        dead: list[_Subscriber] = []
+        for subscriber in self._topics.get(event_type, ()):
+            if subscriber.is_dead():
+                dead.append(subscriber)
+                continue
+            try:
+                subscriber.signal.emit(*args)
+            except Exception:
+                logging.debug("Failed to emit signal %s. Removing link to %s.", subscriber.signal, event_type)
+                dead.append(subscriber)
+        if dead:
+            with self._lock:
+                subscribers = self._topics.get(event_type, ())
+                self._set_subscribers(event_type, tuple(s for s in subscribers if s not in dead))
+            self.registrations_changed.emit()
+        self._stats.record_event(event_type, time.perf_counter() - started)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Subscriber and emit counts per event type."""
+        with self._lock:
+            topics = dict(self._topics)
+            counts = dict(self._emit_counts)
+        return {
+            str(event_type): {"subscribers": len(topics.get(event_type, ())), "emits": counts.get(event_type, 0)}
+            for event_type in topics.keys() | counts.keys()
+        }
 
     def clear(self):
-        with self._mutex:
-            self._registered_event_signals.clear()
+        with self._lock:
+            self._topics = {}
+            self._watched_owners.clear()
+        self.registrations_changed.emit()
 
     def shutdown(self):
         """Suppress future emits and clear registry during application shutdown."""
-        with self._mutex:
+        with self._lock:
             self._is_shutdown = True
-            self._registered_event_signals.clear()
+            self._topics = {}
+            self._watched_owners.clear()
+
+    def _set_subscribers(self, event_type: Event | str, subscribers: tuple[_Subscriber, ...]) -> None:
+        # Called with the lock held, empty topics are removed to avoid growing the dict
+        if subscribers:
+            self._topics[event_type] = subscribers
+        else:
+            self._topics.pop(event_type, None)
+
+    def _drop_owner(self, owner_ref: weakref.ref, owner_id: int, *_args) -> None:
+        """Remove every subscriber of a destroyed owner."""
+        with self._lock:
+            self._watched_owners.discard(owner_id)
+            for event_type, subscribers in list(self._topics.items()):
+                remaining = tuple(s for s in subscribers if s.owner is not owner_ref)
+                if len(remaining) != len(subscribers):
+                    self._set_subscribers(event_type, remaining)
+        self.registrations_changed.emit()
@@ -1,3 +1,4 @@
+import atexit
 import faulthandler
 import logging
 import sys
@@ -9,6 +10,8 @@ from os.path import join
 from PyQt6.QtCore import QtMsgType, qFormatLogMessage, qInstallMessageHandler
 
 from core.config import get_config_dir
+from core.utils.log_queue import QueueLogHandler
+from core.utils.runtime_stats import RuntimeStats
 from settings import APP_NAME, BUILD_VERSION, DEFAULT_LOG_FILENAME
 
 # Silence qasync debug logs
@@ -51,10 +54,34 @@ LOG_COLORS = {
 class ColoredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_color = LOG_COLORS.get(record.levelname, LOG_COLORS["RESET"])
+        # Records are shared between handlers, color a copy so the others get the plain level name
+        record = logging.makeLogRecord(record.__dict__)
         record.levelname = f"{log_color}{record.levelname:>8}{LOG_COLORS['RESET']}"
         return super().format(record)
 
 
+_log_queue: QueueLogHandler | None = None
+
+
+def add_log_handler(handler: logging.Handler) -> None:
+    """Attach a handler behind the log queue, or to the root logger if there is none."""
+    if _log_queue is not None:
+        _log_queue.add_handler(handler)
+    else:
+        logging.getLogger().addHandler(handler)
+
+
+def remove_log_handler(handler: logging.Handler) -> None:
+    if _log_queue is not None:
+        _log_queue.remove_handler(handler)
+    else:
+        logging.getLogger().removeHandler(handler)
+
+
+def log_queue_stats() -> dict[str, int]:
+    return _log_queue.stats() if _log_queue is not None else {}
+
+
 def _suppress_third_party_warnings():
     """Suppress noisy warnings and logs from third-party libraries."""
     logging.getLogger("asyncio").setLevel(logging.WARNING)
@@ -86,6 +113,7 @@ def _install_qt_message_filter():
 
 
 def init_logger():
+    global _log_queue
     _suppress_third_party_warnings()
     _install_qt_message_filter()
     # File handler should be without colors
@@ -98,13 +126,21 @@ def init_logger():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(ColoredFormatter(CONSOLE_FORMAT, datefmt=CONSOLE_DATETIME))
-    logging.basicConfig(level=logging.DEBUG, handlers=[file_handler, console_handler], encoding="utf-8")
+    # File and console output run on the writer thread of the queue handler
+    _log_queue = QueueLogHandler([file_handler, console_handler])
+    logging.basicConfig(level=logging.DEBUG, handlers=[_log_queue], encoding="utf-8")
+    # Registered after logging's own shutdown hook so it runs first and drains the queue
+    atexit.register(_log_queue.close)
+    RuntimeStats().register_queue("LogWriter", lambda: _log_queue.stats()["queued"])
 
     faulthandler.enable(file=file_handler.stream, all_threads=True, c_stack=True)
     logging.info("%s v%s", APP_NAME, BUILD_VERSION)
 
 
 def enable_debug_logging():
-    """Lower all root-logger handlers to DEBUG level."""
+    """Lower all root-logger handlers, and the handlers behind the log queue, to DEBUG level."""
     for handler in logging.root.handlers:
-        handler.setLevel(logging.DEBUG)
+        if isinstance(handler, QueueLogHandler):
+            handler.set_handlers_level(logging.DEBUG)
+        else:
+            handler.setLevel(logging.DEBUG)
@@ -0,0 +1,131 @@
+"""Track widget `class` properties and only repolish when the effective class string changed."""
+
+import logging
+from weakref import WeakKeyDictionary
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QWidget
+
+from core.utils.qobject import is_valid_qobject
+from core.utils.singleton import QSingleton
+
+
+def _normalize(class_names: str | list[str] | tuple[str, ...]) -> str:
+    """Return the class string with duplicate and empty names removed, keeping their order."""
+    if isinstance(class_names, str):
+        class_names = (class_names,)
+    return " ".join(dict.fromkeys(name for names in class_names for name in names.split()))
+
+
+class ClassStateManager(QObject, metaclass=QSingleton):
+    """
+    Keeps track of the class string each widget was last polished with.
+
+    Changing a class through this manager only schedules a repolish when the effective
+    class string differs from the polished one. Repolishes requested during the same
+    event loop turn are batched and applied once by `flush`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._polished: WeakKeyDictionary[QWidget, str] = WeakKeyDictionary()
+        self._pending: dict[int, QWidget] = {}
+        self._flush_scheduled = False
+        self.requested = 0
+        self.applied = 0
+        self.skipped = 0
+
+    def set_class(
+        self, widget: QWidget, class_names: str | list[str] | tuple[str, ...], immediate: bool = False
+    ) -> bool:
+        """Set the class of a widget. Returns True when a repolish was scheduled or applied."""
+        if not is_valid_qobject(widget):
+            return False
+        class_name = _normalize(class_names)
+        self.requested += 1
+        current = widget.property("class")
+        if current == class_name and self._polished.get(widget) == class_name:
+            self.skipped += 1
+            return False
+        if current != class_name:
+            widget.setProperty("class", class_name)
+        if immediate:
+            self._pending.pop(id(widget), None)
+            self._polish(widget)
+        else:
+            self._pending[id(widget)] = widget
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                QTimer.singleShot(0, self.flush)
+        return True
+
+    def add_class(self, widget: QWidget, *names: str, immediate: bool = False) -> bool:
+        return self.set_class(widget, [*self.classes(widget), *names], immediate)
+
+    def remove_class(self, widget: QWidget, *names: str, immediate: bool = False) -> bool:
+        return self.set_class(widget, [name for name in self.classes(widget) if name not in names], immediate)
+
+    def toggle_class(self, widget: QWidget, name: str, enabled: bool | None = None, immediate: bool = False) -> bool:
+        """Toggle a class name, or force it on/off when `enabled` is given."""
+        if enabled is None:
+            enabled = name not in self.classes(widget)
+        if enabled:
+            return self.add_class(widget, name, immediate=immediate)
+        return self.remove_class(widget, name, immediate=immediate)
+
+    def classes(self, widget: QWidget) -> list[str]:
+        if not is_valid_qobject(widget):
+            return []
+        return (widget.property("class") or "").split()
+
+    def flush(self) -> None:
+        """Repolish all widgets whose class changed since the last flush."""
+        self._flush_scheduled = False
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for widget in pending:
+            if is_valid_qobject(widget):
+                self._polish(widget)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requested": self.requested,
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "pending": len(self._pending),
+        }
+
+    def mark_polished(self, widget: QWidget) -> None:
+        """Record the current class of a widget that was repolished outside of the manager."""
+        self._polished[widget] = widget.property("class") or ""
+        self._pending.pop(id(widget), None)
+
+    def _polish(self, widget: QWidget) -> None:
+        style = widget.style()
+        if not style:
+            return
+        try:
+            style.unpolish(widget)
+            style.polish(widget)
+        except Exception:
+            logging.debug("Failed to repolish %s", widget)
+            return
+        self._polished[widget] = widget.property("class") or ""
+        self.applied += 1
+
+
+def set_widget_class(widget: QWidget, class_names: str | list[str] | tuple[str, ...], immediate: bool = False) -> bool:
+    """Set the class of a widget, repolishing it only if the effective class string changed."""
+    return ClassStateManager().set_class(widget, class_names, immediate)
+
+
+def add_widget_class(widget: QWidget, *names: str, immediate: bool = False) -> bool:
+    return ClassStateManager().add_class(widget, *names, immediate=immediate)
+
+
+def remove_widget_class(widget: QWidget, *names: str, immediate: bool = False) -> bool:
+    return ClassStateManager().remove_class(widget, *names, immediate=immediate)
+
+
+def toggle_widget_class(widget: QWidget, name: str, enabled: bool | None = None, immediate: bool = False) -> bool:
+    return ClassStateManager().toggle_class(widget, name, enabled, immediate)
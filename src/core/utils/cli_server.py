@@ -13,7 +13,8 @@ from win32con import (
     PIPE_WAIT,
 )
 
-from core.log import CLI_LOG_DATETIME, CLI_LOG_FORMAT, ColoredFormatter
+from core.log import CLI_LOG_DATETIME, CLI_LOG_FORMAT, ColoredFormatter, add_log_handler, remove_log_handler
+from core.utils.runtime_stats import RuntimeStats
 from core.utils.win32.bindings import (
     CloseHandle,
     ConnectNamedPipe,
@@ -67,7 +68,10 @@ def read_message(handle: int) -> dict[str, str] | None:
 
 
 class PipeLogHandler(logging.Handler):
-    """Custom logging handler to write log messages to a pipe"""
+    """Custom logging handler to write log messages to a pipe
+
+    Attached behind the log queue, so the blocking writes run on the log writer thread.
+    """
 
     def __init__(self, pipe_handle: int):
         super().__init__()
@@ -149,7 +153,7 @@ class LogPipeServer:
             handler.setLevel(root_logger.handlers[0].level if root_logger.handlers else logging.INFO)
             formatter = ColoredFormatter(CLI_LOG_FORMAT, datefmt=CLI_LOG_DATETIME)
             handler.setFormatter(formatter)
-            root_logger.addHandler(handler)
+            add_log_handler(handler)
 
             while True:
                 msg = read_message(handle)
@@ -165,9 +169,10 @@ class LogPipeServer:
                         break
                     time.sleep(1)
 
+            # Detach before closing the pipe so the log writer doesn't write to a closed handle
+            remove_log_handler(handler)
             DisconnectNamedPipe(handle)
             CloseHandle(handle)
-            root_logger.removeHandler(handler)
             logger.debug("Log pipe server client disconnected")
 
 
@@ -270,6 +275,15 @@ class CliPipeHandler:
 
             # Execute command
             self.cli_command(full_command)
+        elif command == "stats":
+            # Answered from this thread, the snapshot only reads counters
+            try:
+                response = json.dumps(RuntimeStats().snapshot(), separators=(",", ":")).encode("utf-8")
+            except Exception as e:
+                logger.error("Failed to collect runtime stats: %s", e)
+                response = json.dumps({"error": str(e)}).encode("utf-8")
+            if not WriteFile(pipe, response):
+                logger.error("Write stats failed. Err: %s", GetLastError())
         else:
             WriteFile(pipe, b"CLI Unknown Command")
 
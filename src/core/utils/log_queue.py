@@ -0,0 +1,154 @@
+"""
+Bounded log queue drained by a writer thread.
+
+Only depends on the standard library so it can be exercised without the rest of the
+application, `core.log` puts it in front of the file and console handlers.
+"""
+
+import logging
+import threading
+from collections import deque
+
+# Records held for the writer thread before the oldest ones are dropped
+LOG_QUEUE_CAPACITY = 10000
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Hands records to a writer thread that runs the actual handlers.
+
+    Emitting only merges the message arguments and appends the record to a bounded queue,
+    so a slow disk or a stalled CLI pipe never holds up the emitting thread. When the queue
+    is full the oldest record is dropped and counted, the writer reports the drops to its
+    handlers once it catches up. Closing the handler drains the queue before it returns.
+    """
+
+    def __init__(self, handlers: list[logging.Handler], capacity: int = LOG_QUEUE_CAPACITY):
+        super().__init__()
+        self.handlers = list(handlers)
+        self.capacity = capacity
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: deque[logging.LogRecord] = deque()
+        self._condition = threading.Condition()
+        # Held by the writer while it runs a batch through the handlers
+        self._write_lock = threading.Lock()
+        self._in_flight = 0
+        self._closed = False
+        self._update_level()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def add_handler(self, handler: logging.Handler) -> None:
+        with self._condition:
+            self.handlers = [*self.handlers, handler]
+            self._update_level()
+
+    def remove_handler(self, handler: logging.Handler) -> None:
+        """Remove a handler, once this returns the writer doesn't use it anymore."""
+        with self._condition:
+            self.handlers = [h for h in self.handlers if h is not handler]
+            self._update_level()
+        with self._write_lock:
+            pass
+
+    def set_handlers_level(self, level: int) -> None:
+        with self._condition:
+            for handler in self.handlers:
+                handler.setLevel(level)
+            self._update_level()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make the record safe to format later on another thread."""
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._queue) >= self.capacity:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(record)
+            self._condition.notify()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Wait until the queued records are written."""
+        if threading.current_thread() is self._thread:
+            return
+        with self._condition:
+            self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=5)
+        for handler in self.handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except Exception:
+                pass
+        super().close()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {"queued": len(self._queue), "capacity": self.capacity, "dropped": self.dropped}
+
+    def _update_level(self) -> None:
+        # Records below every handler's level are rejected before they're queued
+        self.setLevel(min((h.level for h in self.handlers), default=logging.INFO))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_flight = len(batch)
+                handlers = self.handlers
+                dropped = self.dropped - self._reported_dropped
+                self._reported_dropped = self.dropped
+                self._write_lock.acquire()
+            try:
+                if dropped:
+                    batch.insert(0, self._dropped_record(dropped))
+                for record in batch:
+                    for handler in handlers:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            finally:
+                self._write_lock.release()
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _dropped_record(count: int) -> logging.LogRecord:
+        return logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full, dropped {count} records",
+                "threadName": "LogWriter",
+            }
+        )
@@ -0,0 +1,252 @@
+"""
+Runtime statistics of the running application, reported by `yasbc stats`.
+
+Widgets, the event service and worker threads record into the `RuntimeStats` singleton,
+`snapshot` turns it into a JSON-serializable dict. Nothing here depends on Windows, the
+collection can be driven with fake widgets on an offscreen Qt platform.
+"""
+
+import functools
+import math
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Concatenate
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+from core.utils.singleton import Singleton
+
+STATS_SCHEMA_VERSION = 1
+
+# Recent durations kept per widget or event to estimate the p95
+_SAMPLE_WINDOW = 128
+
+HEARTBEAT_INTERVAL_MS = 500
+
+
+def _percentile(samples: Iterable[float], percent: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class TimingStats:
+    """Call count, cumulative time and a window of recent durations."""
+
+    __slots__ = ("calls", "total", "max", "_recent")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    def record(self, duration: float) -> None:
+        self.calls += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self._recent.append(duration)
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "calls": self.calls,
+            "total_ms": _ms(self.total),
+            "p95_ms": _ms(_percentile(self._recent, 95)),
+            "max_ms": _ms(self.max),
+        }
+
+
+class WidgetStats:
+    """Invocations of one widget instance, timer and callback runs are counted apart."""
+
+    __slots__ = ("timer_calls", "callback_calls", "label_updates", "timing")
+
+    def __init__(self):
+        self.timer_calls = 0
+        self.callback_calls = 0
+        self.label_updates = 0
+        self.timing = TimingStats()
+
+    def record(self, duration: float, timer: bool = False) -> None:
+        if timer:
+            self.timer_calls += 1
+        else:
+            self.callback_calls += 1
+        self.timing.record(duration)
+
+    def to_dict(self) -> dict[str, float | int]:
+        timing = self.timing.to_dict()
+        return {
+            "timer_calls": self.timer_calls,
+            "callback_calls": self.callback_calls,
+            "total_ms": timing["total_ms"],
+            "p95_ms": timing["p95_ms"],
+            "max_ms": timing["max_ms"],
+            "label_updates": self.label_updates,
+        }
+
+
+def timer_update[W: QObject, **P](method: Callable[Concatenate[W, P], None]) -> Callable[Concatenate[W, P], None]:
+    """Count a widget slot fed by a shared data source as a timer call.
+
+    Widgets that receive their periodic data from a sampler instead of their own timer
+    decorate the receiving slot, so `yasbc stats` reports their updates like timer runs.
+    """
+
+    @functools.wraps(method)
+    def wrapper(widget: W, *args: P.args, **kwargs: P.kwargs) -> None:
+        started = time.perf_counter()
+        try:
+            method(widget, *args, **kwargs)
+        finally:
+            RuntimeStats().widget(widget).record(time.perf_counter() - started, timer=True)
+
+    return wrapper
+
+
+class EventLoopMonitor(QObject):
+    """Measures event loop lag as the drift of a heartbeat timer.
+
+    The timer lives on the thread that creates the monitor, every timeout records how much
+    later than the interval it fired.
+    """
+
+    def __init__(self, interval_ms: int = HEARTBEAT_INTERVAL_MS, parent: QObject | None = None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.lag = TimingStats()
+        self.last_lag = 0.0
+        self._last: float | None = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+    def start(self) -> None:
+        self._last = time.perf_counter()
+        self._timer.start(self.interval_ms)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._last = None
+
+    def _on_heartbeat(self) -> None:
+        now = time.perf_counter()
+        if self._last is not None:
+            self.last_lag = max(0.0, now - self._last - self.interval_ms / 1000)
+            self.lag.record(self.last_lag)
+        self._last = now
+
+    def to_dict(self) -> dict[str, float | int]:
+        lag = self.lag.to_dict()
+        return {
+            "interval_ms": self.interval_ms,
+            "samples": lag["calls"],
+            "last_lag_ms": _ms(self.last_lag),
+            "p95_lag_ms": lag["p95_ms"],
+            "max_lag_ms": lag["max_ms"],
+        }
+
+
+class RuntimeStats(metaclass=Singleton):
+    """
+    Collects widget, event and thread statistics of the running application.
+
+    Recording happens on the threads doing the work and only touches counters, `snapshot`
+    may run on any thread (the CLI pipe server calls it on its own).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._widgets: weakref.WeakKeyDictionary[QObject, WidgetStats] = weakref.WeakKeyDictionary()
+        self._events: dict[str, TimingStats] = {}
+        # Thread name -> callable returning the number of items waiting for that thread
+        self._queues: dict[str, Callable[[], int]] = {}
+        self._monitor: EventLoopMonitor | None = None
+
+    def widget(self, widget: QObject) -> WidgetStats:
+        """Return the stats of a widget instance, registering it on first use."""
+        with self._lock:
+            stats = self._widgets.get(widget)
+            if stats is None:
+                stats = self._widgets[widget] = WidgetStats()
+            return stats
+
+    def record_event(self, event_type: object, duration: float) -> None:
+        """Record how long dispatching an event to its registered signals took."""
+        key = str(event_type)
+        stats = self._events.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._events.setdefault(key, TimingStats())
+        stats.record(duration)
+
+    def register_queue(self, thread_name: str, depth: Callable[[], int]) -> None:
+        """Report the queue depth of a worker thread, replacing an earlier registration."""
+        with self._lock:
+            self._queues[thread_name] = depth
+
+    def unregister_queue(self, thread_name: str) -> None:
+        with self._lock:
+            self._queues.pop(thread_name, None)
+
+    def start_heartbeat(self, interval_ms: int = HEARTBEAT_INTERVAL_MS) -> None:
+        """Start measuring the lag of the calling thread's event loop, normally the GUI thread."""
+        if self._monitor is None:
+            self._monitor = EventLoopMonitor(interval_ms)
+            self._monitor.start()
+
+    def stop_heartbeat(self) -> None:
+        if self._monitor is not None:
+            self._monitor.stop()
+            self._monitor = None
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            widgets = list(self._widgets.items())
+            events = list(self._events.items())
+            queues = dict(self._queues)
+        return {
+            "version": STATS_SCHEMA_VERSION,
+            "uptime_s": round(time.monotonic() - self._started, 1),
+            "widgets": [self._widget_entry(widget, stats) for widget, stats in widgets],
+            "events": {key: stats.to_dict() for key, stats in sorted(events)},
+            "event_loop": self._monitor.to_dict() if self._monitor is not None else None,
+            "threads": self._thread_entries(queues),
+        }
+
+    @staticmethod
+    def _widget_entry(widget: QObject, stats: WidgetStats) -> dict[str, object]:
+        return {
+            "name": getattr(widget, "widget_name", None),
+            "class": type(widget).__name__,
+            "screen": getattr(widget, "screen_name", None),
+            **stats.to_dict(),
+        }
+
+    @staticmethod
+    def _thread_entries(queues: dict[str, Callable[[], int]]) -> list[dict[str, object]]:
+        entries = []
+        for thread in threading.enumerate():
+            depth = queues.get(thread.name)
+            try:
+                queue_depth = depth() if depth is not None else None
+            except Exception:
+                queue_depth = None
+            entries.append(
+                {
+                    "name": thread.name,
+                    "daemon": thread.daemon,
+                    "queue_depth": queue_depth,
+                }
+            )
+        return entries
@@ -28,6 +28,7 @@ from PyQt6.QtWidgets import QApplication, QDialog, QFrame, QGraphicsDropShadowEf
 from winrt.windows.data.xml.dom import XmlDocument
 from winrt.windows.ui.notifications import ToastNotification, ToastNotificationManager
 
+from core.utils.class_state import ClassStateManager
 from core.utils.qobject import is_valid_qobject
 from core.utils.system import is_windows_10
 from core.utils.win32.backdrop import enable_blur
@@ -86,7 +87,8 @@ def refresh_widget_style(*widgets: QWidget) -> None:
             style.unpolish(widget)
             style.polish(widget)
         except Exception:
-            pass
+            continue
+        ClassStateManager().mark_polished(widget)
 
 
 def build_progress_widget(self, options: dict[str, Any]) -> None:
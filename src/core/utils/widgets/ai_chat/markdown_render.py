@@ -0,0 +1,192 @@
+"""
+Markdown to HTML conversion of chat messages and incremental rendering of streamed ones.
+
+Only depends on Qt, so the streamed and the final rendering can be compared offscreen.
+"""
+
+import re
+from functools import lru_cache
+
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QTextBrowser
+
+from core.utils.widgets.ai_chat.constants import CODE_MONO_FONT
+from core.utils.widgets.ai_chat.syntax_highlight import simple_syntax_highlight
+
+
+def _escape_html(s: str) -> str:
+    """Escape HTML special characters."""
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@lru_cache(maxsize=128)
+def _render_code_block(code: str, lang: str) -> str:
+    """Highlight a fenced code block, cached so a block closed while streaming is not highlighted again."""
+    highlighted_code = simple_syntax_highlight(code, lang)
+    return (
+        f'<table width="100%" cellpadding="10" style="background-color:rgba(0,0,0,0.2);'
+        f'border-radius:6px;"><tr><td>'
+        f'<pre style="white-space:pre-wrap;word-wrap:break-word;margin:0;'
+        f'font-family:{CODE_MONO_FONT};">{highlighted_code}</pre>'
+        f"</td></tr></table>"
+    )
+
+
+def find_closed_block_end(text: str, start: int = 0) -> int:
+    """
+    Return the end of the last closed Markdown block in text[start:], or `start` if none is closed yet.
+    A block is closed by an empty line outside of a code fence or by the closing fence of a code block,
+    and never while a link label is still open.
+    """
+    end = start
+    in_fence = False
+    pos = start
+    while True:
+        newline = text.find("\n", pos)
+        if newline == -1:
+            return end
+        line = text[pos:newline].strip()
+        pos = newline + 1
+        if in_fence:
+            if line.endswith("```"):
+                in_fence = False
+                end = pos
+        elif line.startswith("```"):
+            in_fence = len(line) == 3 or not line.endswith("```")
+            if not in_fence:
+                end = pos
+        elif not line and text.rfind("[", start, pos) <= text.rfind("]", start, pos):
+            end = pos
+
+
+class StreamingChatRenderer:
+    """
+    Append-only renderer for streamed chat messages.
+
+    Closed Markdown blocks are converted with `format_chat_text` once and appended to the
+    document as HTML, only the still-open tail is re-inserted as plain text on every update.
+    `finish` keeps the rendered blocks and only converts the remaining tail. Text that does not
+    continue the streamed message is rendered from scratch.
+    """
+
+    def __init__(self, browser: QTextBrowser):
+        self._browser = browser
+        self.reset()
+
+    def reset(self):
+        self._source = ""
+        self._tail_pos = 0
+
+    @property
+    def _source_pos(self) -> int:
+        return len(self._source)
+
+    def update(self, text: str):
+        doc = self._browser.document()
+        if not text.startswith(self._source):
+            self.reset()
+            doc.clear()
+
+        cursor = self._tail_cursor()
+        block_end = find_closed_block_end(text, self._source_pos)
+        if block_end > self._source_pos:
+            cursor.insertHtml(format_chat_text(text[self._source_pos : block_end]))
+            self._source = text[:block_end]
+            self._tail_pos = cursor.position()
+
+        tail = text[self._source_pos :]
+        if tail:
+            cursor.insertText(tail)
+
+    def finish(self, text: str):
+        if self._source and text.startswith(self._source):
+            tail = text[self._source_pos :]
+            cursor = self._tail_cursor()
+            if tail:
+                cursor.insertHtml(format_chat_text(tail))
+        elif text:
+            self._browser.setHtml(format_chat_text(text))
+        else:
+            self._browser.clear()
+        self.reset()
+
+    def _tail_cursor(self) -> QTextCursor:
+        """Remove the plain text tail after the rendered blocks and return a cursor at its place."""
+        doc = self._browser.document()
+        cursor = QTextCursor(doc)
+        cursor.setPosition(min(self._tail_pos, doc.characterCount() - 1))
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        return cursor
+
+
+def format_chat_text(text: str) -> str:
+    """
+    Format chat text to HTML with basic Markdown.
+    """
+    if not text:
+        return text
+
+    def repl(match):
+        label, url = match.group(1), match.group(2)
+        label_stripped = label.strip()
+        if label_stripped.startswith("[") and label_stripped.endswith("]"):
+            label_stripped = label_stripped[1:-1]
+        if label_stripped == url or re.match(r"https?://", label_stripped):
+            return url
+        return f"{label_stripped} {url}"
+
+    text = re.sub(r"\[([^\]]+)]\((https?://[^)]+)\)", repl, text)
+
+    # Extract code blocks BEFORE escaping HTML (syntax highlighter handles its own escaping)
+    code_blocks = []
+    code_block_placeholder = "\x00CODE_BLOCK_{}\x00"
+
+    def extract_code_block(match):
+        code_blocks.append(_render_code_block(match.group(2), match.group(1) or ""))
+        return code_block_placeholder.format(len(code_blocks) - 1)
+
+    text = re.sub(r"```([a-zA-Z0-9]*)[ \t]*\r?\n([\s\S]*?)```", extract_code_block, text)
+
+    # Extract inline code BEFORE escaping HTML
+    inline_codes = []
+    inline_code_placeholder = "\x00INLINE_CODE_{}\x00"
+
+    def extract_inline_code(match):
+        code = match.group(1)
+        escaped_code = _escape_html(code)
+        code_html = (
+            f'<code style="background-color:rgba(0,0,0,0.2);font-family:{CODE_MONO_FONT};"> {escaped_code} </code>'
+        )
+        inline_codes.append(code_html)
+        return inline_code_placeholder.format(len(inline_codes) - 1)
+
+    text = re.sub(r"`([^`\n]+)`", extract_inline_code, text)
+
+    # Now escape HTML for the rest of the text
+    text = _escape_html(text)
+
+    # Convert **bold** to <b>
+    text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", text)
+    # Convert *italic* to <i>, but not bullet points
+    text = re.sub(r"(?:(?<=\s)|^)\*(?!\s)([^*\n]+?)\*(?!\*)", r"<i>\1</i>", text, flags=re.MULTILINE)
+
+    def replace_url(match):
+        url = match.group(1)
+        href = "http://" + url if url.startswith("www.") else url
+        display_url = url.rstrip(".,;:!?)")
+        href = href.rstrip(".,;:!?)")
+        return f'<a href="{href}" style="color:#4A9EFF;">{display_url}</a>'
+
+    text = re.sub(r'((?:https?://|ftp://|www\.)[^\s<>"&]+)(?=\s|$|&(?:amp|lt|gt);)', replace_url, text)
+
+    # Convert newlines to <br> for proper display
+    text = text.replace("\n", "<br>")
+
+    # Restore code blocks and inline codes
+    for i, block in enumerate(code_blocks):
+        text = text.replace(code_block_placeholder.format(i), block)
+    for i, code in enumerate(inline_codes):
+        text = text.replace(inline_code_placeholder.format(i), code)
+
+    return text
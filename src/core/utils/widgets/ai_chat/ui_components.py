@@ -1,4 +1,3 @@
-import re
 from enum import StrEnum
 from typing import Any
 
@@ -7,95 +6,7 @@ from PyQt6.QtGui import QColor, QContextMenuEvent, QKeyEvent, QMouseEvent, QPain
 from PyQt6.QtWidgets import QLabel, QSizePolicy, QTextBrowser, QTextEdit, QWidget
 
 from core.utils.utilities import PopupWidget, refresh_widget_style
-from core.utils.widgets.ai_chat.constants import CODE_MONO_FONT
-from core.utils.widgets.ai_chat.syntax_highlight import simple_syntax_highlight
-
-
-def _escape_html(s: str) -> str:
-    """Escape HTML special characters."""
-    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-
-def format_chat_text(text: str) -> str:
-    """
-    Format chat text to HTML with basic Markdown.
-    """
-    if not text:
-        return text
-
-    def repl(match):
-        label, url = match.group(1), match.group(2)
-        label_stripped = label.strip()
-        if label_stripped.startswith("[") and label_stripped.endswith("]"):
-            label_stripped = label_stripped[1:-1]
-        if label_stripped == url or re.match(r"https?://", label_stripped):
-            return url
-        return f"{label_stripped} {url}"
-
-    text = re.sub(r"\[([^\]]+)]\((https?://[^)]+)\)", repl, text)
-
-    # Extract code blocks BEFORE escaping HTML (syntax highlighter handles its own escaping)
-    code_blocks = []
-    code_block_placeholder = "\x00CODE_BLOCK_{}\x00"
-
-    def extract_code_block(match):
-        lang = match.group(1) or ""
-        code = match.group(2)
-        highlighted_code = simple_syntax_highlight(code, lang)
-        block_html = (
-            f'<table width="100%" cellpadding="10" style="background-color:rgba(0,0,0,0.2);'
-            f'border-radius:6px;"><tr><td>'
-            f'<pre style="white-space:pre-wrap;word-wrap:break-word;margin:0;'
-            f'font-family:{CODE_MONO_FONT};">{highlighted_code}</pre>'
-            f"</td></tr></table>"
-        )
-        code_blocks.append(block_html)
-        return code_block_placeholder.format(len(code_blocks) - 1)
-
-    text = re.sub(r"```([a-zA-Z0-9]*)[ \t]*\r?\n([\s\S]*?)```", extract_code_block, text)
-
-    # Extract inline code BEFORE escaping HTML
-    inline_codes = []
-    inline_code_placeholder = "\x00INLINE_CODE_{}\x00"
-
-    def extract_inline_code(match):
-        code = match.group(1)
-        escaped_code = _escape_html(code)
-        code_html = (
-            f'<code style="background-color:rgba(0,0,0,0.2);font-family:{CODE_MONO_FONT};"> {escaped_code} </code>'
-        )
-        inline_codes.append(code_html)
-        return inline_code_placeholder.format(len(inline_codes) - 1)
-
-    text = re.sub(r"`([^`\n]+)`", extract_inline_code, text)
-
-    # Now escape HTML for the rest of the text
-    text = _escape_html(text)
-
-    # Convert **bold** to <b>
-    text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", text)
-    # Convert *italic* to <i>, but not bullet points
-    text = re.sub(r"(?:(?<=\s)|^)\*(?!\s)([^*\n]+?)\*(?!\*)", r"<i>\1</i>", text, flags=re.MULTILINE)
-
-    def replace_url(match):
-        url = match.group(1)
-        href = "http://" + url if url.startswith("www.") else url
-        display_url = url.rstrip(".,;:!?)")
-        href = href.rstrip(".,;:!?)")
-        return f'<a href="{href}" style="color:#4A9EFF;">{display_url}</a>'
-
-    text = re.sub(r'((?:https?://|ftp://|www\.)[^\s<>"&]+)(?=\s|$|&(?:amp|lt|gt);)', replace_url, text)
-
-    # Convert newlines to <br> for proper display
-    text = text.replace("\n", "<br>")
-
-    # Restore code blocks and inline codes
-    for i, block in enumerate(code_blocks):
-        text = text.replace(code_block_placeholder.format(i), block)
-    for i, code in enumerate(inline_codes):
-        text = text.replace(inline_code_placeholder.format(i), code)
-
-    return text
+from core.utils.widgets.ai_chat.markdown_render import StreamingChatRenderer
 
 
 class ContextMenuMixin:
@@ -258,21 +169,18 @@ class ChatMessageBrowser(ContextMenuMixin, QTextBrowser):
         self.document().setMaximumBlockCount(0)
         self.setLineWrapMode(QTextBrowser.LineWrapMode.WidgetWidth)
         self._init_context_menu(is_input_widget=False)
+        self._stream_renderer = StreamingChatRenderer(self)
         # Connect document size changes to update geometry
         self.document().contentsChanged.connect(self.updateGeometry)
 
     def setText(self, text):
         """Override setText to handle formatting and store original HTML"""
-        if text:
-            processed_text = format_chat_text(text)
-            self.setHtml(processed_text)
-        else:
-            self.clear()
+        self._stream_renderer.finish(text)
         self.updateGeometry()
 
     def set_streaming_text(self, text: str):
-        """Set plain text without formatting for streaming."""
-        self.setPlainText(text)
+        """Render the streamed text, only the part received since the last closed block is re-inserted."""
+        self._stream_renderer.update(text)
         self.updateGeometry()
 
     def sizeHint(self):
@@ -0,0 +1,330 @@
+"""Painting of the cava visualizer, kept apart from the widget so it only depends on Qt."""
+
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QLinearGradient, QPainter, QPainterPath, QPixmap, QPolygonF
+from PyQt6.QtWidgets import QFrame
+
+if TYPE_CHECKING:
+    from core.widgets.yasb.cava import CavaWidget
+
+
+class _RenderCache:
+    """Paint primitives of a `CavaBar` that only change with its size, dpr or config."""
+
+    __slots__ = ("key", "brushes", "bar_rects", "center_px", "height_px", "xs", "windows", "fade", "buffer")
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.brushes: tuple = ()
+        # (x, width) of every bar in logical coordinates
+        self.bar_rects: list[tuple[float, float]] = []
+        self.center_px = 0
+        self.height_px = 0
+        # Wave point x positions and the (start, end, count) smoothing window of every point
+        self.xs: list[float] = []
+        self.windows: list[tuple[int, int, int]] = []
+        self.fade: QLinearGradient | None = None
+        self.buffer: QPixmap | None = None
+
+
+class CavaBar(QFrame):
+    _dpr: float | None
+    _cava_widget: CavaWidget
+    _cache: _RenderCache | None
+    paint_pending: bool
+
+    def __init__(self, cava_widget: CavaWidget) -> None:
+        super().__init__()
+        self._dpr = None
+        self._cache = None
+        self.paint_pending = False
+        self._cava_widget = cava_widget
+        self.setFixedHeight(self._cava_widget.config.bar_height)
+        self.setFixedWidth(
+            self._cava_widget.config.bars_number
+            * (
+                self._cava_widget.config.bar_width
+                + (
+                    self._cava_widget.config.bar_spacing
+                    if self._cava_widget.config.bar_type == "bars_mirrored"
+                    or self._cava_widget.config.bar_type == "bars"
+                    else 0
+                )
+            )
+        )
+        self.setContentsMargins(0, 0, 0, 0)
+
+    def _device_pixel_ratio(self, painter: QPainter) -> float:
+        """Return device pixel ratio for the painter's device."""
+        if self._dpr is not None:
+            return self._dpr
+
+        try:
+            dev = painter.device()
+            if dev:
+                dpr = float(dev.devicePixelRatioF())
+            else:
+                dpr = 1.0
+        except Exception:
+            dpr = 1.0
+
+        self._dpr = dpr if dpr > 0 else 1.0
+        return self._dpr
+
+    def resizeEvent(self, event) -> None:
+        self._cache = None
+        super().resizeEvent(event)
+
+    def hideEvent(self, event) -> None:
+        # Hidden widgets are not painted, don't hold back frames for a paint that never comes
+        self.paint_pending = False
+        super().hideEvent(event)
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached paint primitives, e.g. after the screen or colors changed."""
+        self._dpr = None
+        self._cache = None
+
+    def _fade_widths(self) -> tuple[float, float]:
+        """Return the effective left and right edge fade widths."""
+        fade_left = self._cava_widget._edge_fade_left
+        fade_right = self._cava_widget._edge_fade_right
+        widget_width = self.width()
+
+        if fade_left > 0 and fade_right > 0:
+            # Both sides have fade - cap each to half width to prevent overlap
+            max_fade_width = widget_width / 2
+            return min(fade_left, max_fade_width), min(fade_right, max_fade_width)
+        # Only one side has fade - allow it to use full width if needed
+        return (
+            min(fade_left, widget_width) if fade_left > 0 else 0,
+            min(fade_right, widget_width) if fade_right > 0 else 0,
+        )
+
+    def _render_cache(self, dpr: float, bars_count: int) -> _RenderCache:
+        """Return the paint primitives for the current geometry, rebuilding them if anything changed."""
+        widget = self._cava_widget
+        config = widget.config
+        use_gradient = config.gradient == 1 and bool(widget.colors)
+        key = (
+            self.width(),
+            dpr,
+            bars_count,
+            use_gradient,
+            tuple(color.rgba() for color in widget.colors) if use_gradient else widget.foreground_color.rgba(),
+            widget._edge_fade_left,
+            widget._edge_fade_right,
+        )
+        if self._cache is not None and self._cache.key == key:
+            return self._cache
+
+        cache = _RenderCache(key)
+        height = float(config.bar_height)
+        bar_type = config.bar_type
+
+        if not use_gradient:
+            cache.brushes = (widget.foreground_color, widget.foreground_color)
+        elif bar_type == "waves_mirrored":
+            colors_len = len(widget.colors)
+            stop_step = 1.0 / (colors_len - 1) if colors_len > 1 else 1.0
+            gradient = QLinearGradient(0, 0, 0, 1)
+            gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+            for idx, color in enumerate(widget.colors):
+                s = idx * stop_step
+                gradient.setColorAt(max(0.0, 0.5 - s * 0.5), color)
+                gradient.setColorAt(min(1.0, 0.5 + s * 0.5), color)
+            cache.brushes = (gradient, gradient)
+        else:
+            stop_step = 1.0 / (len(widget.colors) - 1)
+            gradient_upper = QLinearGradient(0, 1, 0, 0)
+            gradient_upper.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+            gradient_lower = QLinearGradient(0, 0, 0, 1)
+            gradient_lower.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+            for idx, color in enumerate(widget.colors):
+                gradient_upper.setColorAt(idx * stop_step, color)
+                gradient_lower.setColorAt(idx * stop_step, color)
+            cache.brushes = (gradient_upper, gradient_lower)
+
+        if bar_type in ("bars", "bars_mirrored"):
+            bar_w_px = max(1, round(config.bar_width * dpr))
+            bar_s_px = max(0, round(config.bar_spacing * dpr))
+            if bar_type == "bars":
+                left_margin_px = round((config.bar_spacing / 2.0) * dpr)
+            else:
+                total_w_px = max(1, round(float(self.width()) * dpr))
+                total_bars_width_px = bars_count * bar_w_px + max(0, bars_count - 1) * bar_s_px
+                left_margin_px = max(0, (total_w_px - total_bars_width_px) // 2)
+            cache.bar_rects = [
+                ((left_margin_px + i * (bar_w_px + bar_s_px)) / dpr, bar_w_px / dpr) for i in range(bars_count)
+            ]
+            cache.center_px = round(height / 2.0 * dpr)
+            cache.height_px = round(height * dpr)
+        else:
+            step = float(self.width()) / max(1, bars_count)
+            cache.xs = [i * step + step / 2.0 for i in range(bars_count)]
+            radius = 1
+            cache.windows = [
+                (
+                    max(0, i - radius),
+                    min(bars_count, i + radius + 1),
+                    min(bars_count, i + radius + 1) - max(0, i - radius),
+                )
+                for i in range(bars_count)
+            ]
+
+        fade_left, fade_right = self._fade_widths()
+        if fade_left > 0 or fade_right > 0:
+            # Fading is applied to the whole frame at once as an alpha mask
+            width = float(self.width())
+            opaque, transparent = QColor(0, 0, 0, 255), QColor(0, 0, 0, 0)
+            fade = QLinearGradient(0, 0, width, 0)
+            fade.setColorAt(0.0, transparent if fade_left > 0 else opaque)
+            fade.setColorAt(1.0, transparent if fade_right > 0 else opaque)
+            if fade_left > 0:
+                fade.setColorAt(fade_left / width, opaque)
+            if fade_right > 0:
+                fade.setColorAt(1.0 - fade_right / width, opaque)
+            cache.fade = fade
+            cache.buffer = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+            cache.buffer.setDevicePixelRatio(dpr)
+
+        self._cache = cache
+        return cache
+
+    def paintEvent(self, event) -> None:
+        """Draw the cava bars according to the selected style."""
+        self.paint_pending = False
+        samples = self._cava_widget.samples
+        painter = QPainter(self)
+        try:
+            if not samples:
+                return
+            cache = self._render_cache(self._device_pixel_ratio(painter), len(samples))
+            if cache.fade is None:
+                self._draw(painter, cache, samples)
+                return
+            cache.buffer.fill(Qt.GlobalColor.transparent)
+            buffer_painter = QPainter(cache.buffer)
+            try:
+                self._draw(buffer_painter, cache, samples)
+                buffer_painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+                buffer_painter.fillRect(QRectF(0, 0, self.width(), self.height()), cache.fade)
+            finally:
+                buffer_painter.end()
+            painter.drawPixmap(0, 0, cache.buffer)
+        finally:
+            painter.end()
+            self._cava_widget.frame_painted()
+
+    def _draw(self, painter: QPainter, cache: _RenderCache, samples: list[float]) -> None:
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        except Exception:
+            pass
+
+        bar_type = self._cava_widget.config.bar_type
+        if bar_type == "bars_mirrored":
+            self.draw_bars_mirrored(painter, cache, samples)
+        elif bar_type == "waves":
+            self.draw_waves(painter, cache, samples)
+        elif bar_type == "waves_mirrored":
+            self.draw_waves_mirrored(painter, cache, samples)
+        else:
+            self.draw_bars(painter, cache, samples)
+
+    @staticmethod
+    def _fill_rects(painter: QPainter, rects: list[QRectF], brush) -> None:
+        # Object bounding gradients are mapped to every rect of the batch on its own,
+        # so one call draws each bar with the full gradient like a fillRect per bar would
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(brush)
+        painter.drawRects(rects)
+
+    def draw_bars(self, painter: QPainter, cache: _RenderCache, samples: list[float]) -> None:
+        """Draw traditional bar visualization"""
+        dpr = self._device_pixel_ratio(painter)
+        bar_height = float(self._cava_widget.config.bar_height)
+        min_height_logical = float(self._cava_widget.config.min_bar_height) / dpr
+
+        rects = []
+        for (rx, rw), sample in zip(cache.bar_rects, samples):
+            height = max(min_height_logical, sample * bar_height)
+            if height > 0.0:
+                y_px = max(0, round((bar_height - height) * dpr))
+                h_px = max(1, round(height * dpr))
+                rects.append(QRectF(rx, y_px / dpr, rw, h_px / dpr))
+        self._fill_rects(painter, rects, cache.brushes[0])
+
+    def draw_bars_mirrored(self, painter: QPainter, cache: _RenderCache, samples: list[float]) -> None:
+        """Draw mirrored bar visualization"""
+        dpr = self._device_pixel_ratio(painter)
+        bar_height = float(self._cava_widget.config.bar_height)
+        min_height_logical = float(self._cava_widget.config.min_bar_height) / dpr
+        center_px = cache.center_px
+        max_h_px = cache.height_px
+
+        upper_rects = []
+        lower_rects = []
+        for (rx, rw), sample in zip(cache.bar_rects, samples):
+            full_h_px = round(max(min_height_logical, sample * bar_height) * dpr)
+            if full_h_px <= 0:
+                continue
+
+            up_px = full_h_px // 2
+            down_px = min(full_h_px - up_px, max(0, max_h_px - center_px))
+            if up_px > 0:
+                uy_px = max(0, center_px - up_px)
+                upper_rects.append(QRectF(rx, uy_px / dpr, rw, up_px / dpr))
+            if down_px > 0:
+                lower_rects.append(QRectF(rx, center_px / dpr, rw, down_px / dpr))
+
+        self._fill_rects(painter, upper_rects, cache.brushes[0])
+        self._fill_rects(painter, lower_rects, cache.brushes[1])
+
+    @staticmethod
+    def _smoothed(cache: _RenderCache, samples: list[float]) -> list[float]:
+        """Average every sample with its neighbours using running sums."""
+        prefix = [0.0, *accumulate(samples)]
+        return [(prefix[end] - prefix[start]) / count for start, end, count in cache.windows]
+
+    def draw_waves(self, painter: QPainter, cache: _RenderCache, samples: list[float]) -> None:
+        """Draw wave visualization."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        dpr = self._device_pixel_ratio(painter)
+        height = float(self._cava_widget.config.bar_height)
+        min_h_logical = float(self._cava_widget.config.min_bar_height) / dpr
+        xs = cache.xs
+
+        points = [QPointF(xs[0], height)]
+        points.extend(
+            QPointF(cx, max(0.0, height - max(min_h_logical, value * height)))
+            for cx, value in zip(xs, self._smoothed(cache, samples))
+        )
+        points.append(QPointF(xs[-1], height))
+
+        path = QPainterPath()
+        path.addPolygon(QPolygonF(points))
+        path.closeSubpath()
+        painter.fillPath(path, cache.brushes[0])
+
+    def draw_waves_mirrored(self, painter: QPainter, cache: _RenderCache, samples: list[float]) -> None:
+        """Draw a mirrored wave visualization."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        dpr = self._device_pixel_ratio(painter)
+        height = float(self._cava_widget.config.bar_height)
+        center_y = height / 2.0
+        min_h_logical = float(self._cava_widget.config.min_bar_height) / dpr
+        xs = cache.xs
+
+        values = [max(min_h_logical, value * height / 2.0) for value in self._smoothed(cache, samples)]
+        points = [QPointF(xs[0], center_y)]
+        points.extend(QPointF(cx, max(0.0, center_y - val)) for cx, val in zip(xs, values))
+        points.extend(QPointF(cx, min(height, center_y + val)) for cx, val in zip(reversed(xs), reversed(values)))
+
+        path = QPainterPath()
+        path.addPolygon(QPolygonF(points))
+        path.closeSubpath()
+        painter.fillPath(path, cache.brushes[0])
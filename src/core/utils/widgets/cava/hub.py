@@ -0,0 +1,230 @@
+import logging
+import os
+import subprocess
+import threading
+from functools import lru_cache
+from typing import ClassVar
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from core.utils.system import app_data_path
+
+# Config fields that change what cava outputs, widgets differing only in other fields share a hub
+_CAPTURE_FIELDS = (
+    "sleep_timer",
+    "sensitivity",
+    "lower_cutoff_freq",
+    "higher_cutoff_freq",
+    "framerate",
+    "source",
+    "output_bit_format",
+    "channels",
+    "mono_option",
+    "reverse",
+    "waveform",
+    "monstercat",
+    "waves",
+    "noise_reduction",
+)
+
+
+@lru_cache(maxsize=2)
+def _normalization_table(bit_format: str) -> tuple[float, ...]:
+    """Lookup table mapping every raw cava value to its 0..1 float."""
+    maximum = 65535 if bit_format == "16bit" else 255
+    return tuple(value / maximum for value in range(maximum + 1))
+
+
+class CavaFrameDecoder:
+    """Decodes raw cava output frames into normalized samples."""
+
+    def __init__(self, bars: int, bit_format: str):
+        self.bars = bars
+        self._code = "H" if bit_format == "16bit" else "B"
+        self.frame_size = bars * (2 if self._code == "H" else 1)
+        self._table = _normalization_table(bit_format)
+        self.buffer = bytearray(self.frame_size)
+
+    def decode(self, data: bytes | bytearray | memoryview | None = None) -> tuple[float, ...]:
+        """Decode one frame, by default the one read into `buffer`."""
+        view = memoryview(self.buffer if data is None else data).cast(self._code)
+        return tuple(map(self._table.__getitem__, view))
+
+
+@lru_cache(maxsize=32)
+def _resample_plan(source: int, target: int) -> tuple[tuple[int, int, float], ...]:
+    if target == 1 or source == 1:
+        return tuple((0, 0, 0.0) for _ in range(target))
+    scale = (source - 1) / (target - 1)
+    plan = []
+    for i in range(target):
+        position = i * scale
+        low = int(position)
+        high = min(low + 1, source - 1)
+        plan.append((low, high, position - low))
+    return tuple(plan)
+
+
+def resample_frame(frame: tuple[float, ...], bars: int, stereo: bool = False) -> tuple[float, ...]:
+    """Linearly resample a frame to `bars` values. Stereo frames are resampled per channel half."""
+    if len(frame) == bars or not frame or bars <= 0:
+        return frame
+    if stereo and len(frame) % 2 == 0 and bars % 2 == 0:
+        half = len(frame) // 2
+        return resample_frame(frame[:half], bars // 2) + resample_frame(frame[half:], bars // 2)
+    return tuple(
+        frame[low] + (frame[high] - frame[low]) * weight for low, high, weight in _resample_plan(len(frame), bars)
+    )
+
+
+class CavaHub(QObject):
+    """Runs one cava process per unique capture configuration and fans its frames out to all subscribers.
+
+    Cava runs with the largest `bars_number` of its subscribers, widgets with fewer bars
+    resample the shared frame with `resample_frame`.
+    """
+
+    frame_ready = pyqtSignal(object)
+
+    _instances: ClassVar[dict[tuple, CavaHub]] = {}
+    _counter: ClassVar[int] = 0
+
+    @classmethod
+    def acquire(cls, config) -> CavaHub:
+        key = tuple(getattr(config, name) for name in _CAPTURE_FIELDS)
+        hub = cls._instances.get(key)
+        if hub is None:
+            hub = cls._instances[key] = cls(config, key)
+        hub._subscribers.append(config.bars_number)
+        if config.bars_number > hub._bars:
+            # A larger subscriber needs more resolution than the running process provides
+            hub._bars = config.bars_number
+            hub.restart()
+        elif not hub.is_running():
+            hub.start()
+        return hub
+
+    def __init__(self, config, key: tuple):
+        super().__init__()
+        CavaHub._counter += 1
+        self._id = CavaHub._counter
+        self._key = key
+        self._config = config
+        self._bars = config.bars_number
+        self._subscribers: list[int] = []
+        self._process: subprocess.Popen[bytes] | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def stereo(self) -> bool:
+        return self._config.channels == "stereo"
+
+    def release(self, bars_number: int) -> None:
+        try:
+            self._subscribers.remove(bars_number)
+        except ValueError:
+            return
+        if self._subscribers:
+            return
+        self.stop()
+        CavaHub._instances.pop(self._key, None)
+        try:
+            self.deleteLater()
+        except RuntimeError:
+            pass
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def restart(self) -> None:
+        self.stop()
+        self.start()
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._process_audio, args=(self._bars,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        process = self._process
+        if process and process.poll() is None:
+            try:
+                process.terminate()
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._thread and self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def _build_config(self, bars: int) -> str:
+        config = self._config
+        lines: list[str] = []
+        lines.append("# Cava config auto-generated by YASB")
+        lines.append("[general]")
+        lines.append(f"bars = {bars}")
+        lines.append(f"sleep_timer = {config.sleep_timer}")
+        lines.append(f"sensitivity = {config.sensitivity}")
+        lines.append(f"lower_cutoff_freq = {config.lower_cutoff_freq}")
+        lines.append(f"higher_cutoff_freq = {config.higher_cutoff_freq}")
+        lines.append(f"framerate = {config.framerate}")
+        lines.append("")
+        lines.append("[input]")
+        lines.append(f"source = {config.source}")
+        lines.append("")
+        lines.append("[output]")
+        lines.append("method = raw")
+        lines.append(f"bit_format = {config.output_bit_format}")
+        lines.append(f"channels = {config.channels}")
+        lines.append(f"mono_option = {config.mono_option}")
+        lines.append(f"reverse = {config.reverse}")
+        lines.append(f"waveform = {config.waveform}")
+        lines.append("")
+        lines.append("[smoothing]")
+        lines.append(f"monstercat = {config.monstercat}")
+        lines.append(f"waves = {config.waves}")
+        lines.append(f"noise_reduction = {int(config.noise_reduction)}")
+        return "\n".join(lines) + "\n"
+
+    def _process_audio(self, bars: int) -> None:
+        cava_config_path = None
+        decoder = CavaFrameDecoder(bars, self._config.output_bit_format)
+        try:
+            cava_config_path = app_data_path(f"yasb_cava_config_{self._id}")
+            with open(cava_config_path, "w") as config_file:
+                config_file.write(self._build_config(bars))
+
+            self._process = subprocess.Popen(
+                ["cava", "-p", cava_config_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+            if self._stop.is_set():
+                # Stopped while the process was starting
+                self._process.terminate()
+                return
+            stream = self._process.stdout
+            view = memoryview(decoder.buffer)
+            while not self._stop.is_set():
+                filled = 0
+                while filled < decoder.frame_size:
+                    read = stream.readinto(view[filled:])
+                    if not read:
+                        return
+                    filled += read
+                self.frame_ready.emit(decoder.decode())
+        except Exception as e:
+            if not self._stop.is_set():
+                logging.error("Error running cava process: %s", e)
+        finally:
+            # Clean up config file
+            if cava_config_path and os.path.exists(cava_config_path):
+                try:
+                    os.unlink(cava_config_path)
+                except OSError:
+                    pass
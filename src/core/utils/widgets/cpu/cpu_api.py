@@ -8,13 +8,11 @@ by running: lodctr /r (as Administrator) or rebuilding performance counters.
 
 import ctypes
 import logging
-import time
 from ctypes import POINTER, byref, wintypes
 from typing import NamedTuple
 
-from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtWidgets import QApplication
-
+from core.utils.widgets.telemetry.pdh_query import SYSTEM_QUERY, PdhQuery
+from core.utils.widgets.telemetry.scheduler import MetricSource
 from core.utils.win32.bindings.kernel32 import kernel32
 from core.utils.win32.bindings.pdh import pdh
 from core.utils.win32.constants import PDH_FMT_DOUBLE, PDH_FMT_LARGE
@@ -53,7 +51,7 @@ class CpuAPI:
     _cores_logical: int | None = None
     _cores_physical: int | None = None
 
-    _query: wintypes.HANDLE | None = None
+    _query: PdhQuery | None = None
     _counter_total: wintypes.HANDLE | None = None
     _counter_perf: wintypes.HANDLE | None = None
     _counters_per_core: list[wintypes.HANDLE] = []
@@ -112,7 +110,7 @@ class CpuAPI:
 
     @classmethod
     def _init_query(cls) -> bool:
-        """Initialize the PDH query with all counters."""
+        """Add all counters to the shared system PDH query."""
         if cls._query is not None:
             return True
         if cls._init_failed:
@@ -121,25 +119,17 @@ class CpuAPI:
         logical, _ = cls._get_core_counts()
 
         try:
-            cls._query = wintypes.HANDLE()
-            status = pdh.PdhOpenQueryW(None, None, byref(cls._query))
-            if status != 0:
-                cls._query = None
+            query = SYSTEM_QUERY
+            if query.handle is None:
                 cls._init_failed = True
                 if not cls._error_logged:
-                    logging.warning(
-                        "Failed to open PDH query (status=%s). CPU widget will show default values.", status
-                    )
+                    logging.warning("Failed to open PDH query. CPU widget will show default values.")
                     cls._error_logged = True
                 return False
 
             # Total CPU percent
-            cls._counter_total = wintypes.HANDLE()
-            status = pdh.PdhAddEnglishCounterW(
-                cls._query, r"\Processor Information(_Total)\% Processor Time", None, byref(cls._counter_total)
-            )
+            status, cls._counter_total = query.add_counter(r"\Processor Information(_Total)\% Processor Time")
             if status != 0:
-                cls._cleanup_query()
                 cls._init_failed = True
                 if not cls._error_logged:
                     logging.warning(
@@ -150,36 +140,23 @@ class CpuAPI:
                 return False
 
             # Processor performance (for frequency calculation)
-            cls._counter_perf = wintypes.HANDLE()
-            pdh.PdhAddEnglishCounterW(
-                cls._query, r"\Processor Information(_Total)\% Processor Performance", None, byref(cls._counter_perf)
-            )
+            _, cls._counter_perf = query.add_counter(r"\Processor Information(_Total)\% Processor Performance")
 
             # Per-core CPU percent
-            cls._counters_per_core = []
-            for i in range(logical):
-                counter = wintypes.HANDLE()
-                status = pdh.PdhAddEnglishCounterW(
-                    cls._query, f"\\Processor Information(0,{i})\\% Processor Time", None, byref(counter)
-                )
-                cls._counters_per_core.append(counter)
-
-            # Initial data collection
-            pdh.PdhCollectQueryData(cls._query)
-
-            # Cache base frequency
-            freq_counter = wintypes.HANDLE()
-            if (
-                pdh.PdhAddEnglishCounterW(
-                    cls._query, r"\Processor Information(_Total)\Processor Frequency", None, byref(freq_counter)
-                )
-                == 0
-            ):
-                pdh.PdhCollectQueryData(cls._query)
+            cls._counters_per_core = [
+                query.add_counter(f"\\Processor Information(0,{i})\\% Processor Time")[1] for i in range(logical)
+            ]
+
+            # Initial data collection, also caches the base frequency
+            status, freq_counter = query.add_counter(r"\Processor Information(_Total)\Processor Frequency")
+            query.collect()
+            if status == 0:
                 val = PDH_FMT_COUNTERVALUE_LARGE()
                 if pdh.PdhGetFormattedCounterValue(freq_counter, PDH_FMT_LARGE, None, byref(val)) == 0:
                     cls._base_freq = float(val.largeValue)
+                query.remove_counter(freq_counter)
 
+            cls._query = query
             return True
 
         except Exception as e:
@@ -192,12 +169,10 @@ class CpuAPI:
 
     @classmethod
     def _cleanup_query(cls):
-        """Release PDH query resources."""
+        """Remove the counters from the shared query."""
         if cls._query is not None:
-            try:
-                pdh.PdhCloseQuery(cls._query)
-            except Exception:
-                pass
+            for counter in (cls._counter_total, cls._counter_perf, *cls._counters_per_core):
+                cls._query.remove_counter(counter)
         cls._query = None
         cls._counter_total = None
         cls._counter_perf = None
@@ -218,9 +193,11 @@ class CpuAPI:
         return 0.0
 
     @classmethod
-    def get_data(cls) -> CpuData:
+    def get_data(cls, collect: bool = True) -> CpuData:
         """Collect all CPU data in a single call.
 
+        With `collect=False` the values of the last collection of the shared query are read,
+        the sampler collects it once for all sources using it.
         Returns safe defaults if PDH is unavailable or corrupted.
         """
         logical, physical = cls._get_core_counts()
@@ -235,7 +212,7 @@ class CpuAPI:
             )
 
         try:
-            status = pdh.PdhCollectQueryData(cls._query)
+            status = cls._query.collect() if collect else 0
             if status != 0:
                 return CpuData(
                     freq=CpuFreq(cls._base_freq, 0.0, cls._base_freq),
@@ -275,44 +252,17 @@ class CpuAPI:
             )
 
 
-class CpuWorker(QThread):
-    """Background thread for non-blocking CPU data collection."""
+class CpuSource(MetricSource):
+    """CPU usage and frequency, read from the shared system PDH query."""
 
-    _instance: CpuWorker | None = None
-    data_ready = pyqtSignal(object)
+    key = "cpu"
+    collector = SYSTEM_QUERY
 
-    @classmethod
-    def get_instance(cls, update_interval: int) -> CpuWorker:
-        """Get or create the singleton worker instance."""
-        if cls._instance is None:
-            cls._instance = cls(update_interval)
-        return cls._instance
-
-    def __init__(self, update_interval: int, parent=None):
-        super().__init__(parent)
-        self._running = True
-        self._update_interval = update_interval
-        app_inst = QApplication.instance()
-        if app_inst is not None:
-            app_inst.aboutToQuit.connect(self.stop)
-
-    def stop(self):
-        """Signal the worker to stop."""
-        self._running = False
-        CpuWorker._instance = None
-
-    def run(self):
-        """Collect CPU data in a loop until stopped."""
-        while self._running:
-            started = time.perf_counter()
-            try:
-                data = CpuAPI.get_data()
-                if self._running:
-                    self.data_ready.emit(data)
-            except Exception as e:
-                logging.error("CPU worker error: %s", e)
-
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            sleep_ms = self._update_interval - elapsed_ms
-            if sleep_ms > 0:
-                self.msleep(sleep_ms)
+    def open(self) -> None:
+        CpuAPI._init_query()
+
+    def sample(self) -> CpuData:
+        return CpuAPI.get_data(collect=False)
+
+    def close(self) -> None:
+        CpuAPI._cleanup_query()
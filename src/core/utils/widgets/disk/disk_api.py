@@ -0,0 +1,36 @@
+from typing import NamedTuple
+
+import win32api
+
+from core.utils.widgets.telemetry.scheduler import MetricSource
+
+
+class DiskSpace(NamedTuple):
+    """Free and total bytes of a volume."""
+
+    free: int
+    total: int
+
+
+def get_disk_space(volume_label: str) -> DiskSpace | None:
+    """Return the space of a volume like "C", None if it can't be read or is empty."""
+    try:
+        free_bytes, total_bytes, _ = win32api.GetDiskFreeSpaceEx(f"{volume_label}:\\")
+    except Exception:
+        return None
+    if total_bytes == 0:
+        return None
+    return DiskSpace(free_bytes, total_bytes)
+
+
+class DiskSource(MetricSource):
+    """Free and total space of one volume."""
+
+    min_interval_ms = 1000
+
+    def __init__(self, volume_label: str):
+        self.volume_label = volume_label.upper()
+        self.key = ("disk", self.volume_label)
+
+    def sample(self) -> DiskSpace | None:
+        return get_disk_space(self.volume_label)
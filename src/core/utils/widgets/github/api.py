@@ -1,14 +1,40 @@
 import json
 import logging
 import threading
+import time
 import urllib.error
 import urllib.request
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC
 from typing import Any
 
 from PyQt6.QtCore import QTimer
 
+# Fields added to a notification by the GraphQL enrichment
+_ENRICHMENT_FIELDS = (
+    "issue_state",
+    "pull_request_state",
+    "pull_request_is_merged",
+    "pull_request_is_draft",
+    "discussion_is_answered",
+    "comment_count",
+)
+
+# Timer ticks this early are still allowed to poll, QTimer doesn't fire exactly on time
+_POLL_SLACK = 1.0
+
+# Enriched notifications remembered across polls
+_ENRICHMENT_CACHE_SIZE = 500
+
+
+@dataclass
+class _NotificationCache:
+    """Result of the last notifications request for one query, reused when GitHub answers 304."""
+
+    last_modified: str
+    notifications: list[dict[str, Any]]
+
 
 class GitHubDataManager:
     """
@@ -25,6 +51,13 @@ class GitHubDataManager:
     _max_notification: int = 50
     _reason_filters: list[str] | None = None
     _show_comment_count: bool = False
+    _api_url: str = "https://api.github.com"
+    # Conditional request state per query and enrichment per (token, notification id)
+    _notification_cache: dict[tuple, _NotificationCache] = {}
+    _enrichment_cache: dict[tuple[str, str], tuple[str, bool, dict[str, Any]]] = {}
+    # Minimum seconds between polls advertised by GitHub through X-Poll-Interval
+    _poll_interval: int = 0
+    _next_poll_at: float = 0.0
 
     @classmethod
     def initialize(
@@ -69,8 +102,11 @@ class GitHubDataManager:
             cls._timer = None
 
     @classmethod
-    def _on_timer(cls) -> None:
-        """Called by QTimer - triggers data fetch."""
+    def _on_timer(cls, force: bool = False) -> None:
+        """Called by QTimer - triggers data fetch unless GitHub asked to poll less often."""
+        if not force and time.monotonic() + _POLL_SLACK < cls._next_poll_at:
+            logging.debug("GitHubDataManager skipping poll, server poll interval is %ss", cls._poll_interval)
+            return
         if cls._token:
             cls.fetch_notifications(
                 cls._token,
@@ -82,14 +118,14 @@ class GitHubDataManager:
 
     @classmethod
     def refresh(cls) -> None:
-        """Trigger an immediate data refresh (same as a timer tick)."""
-        cls._on_timer()
+        """Trigger an immediate data refresh, ignoring the server poll interval."""
+        cls._on_timer(force=True)
 
     @classmethod
     def set_token(cls, token: str) -> None:
         """Update the token after OAuth and trigger an immediate fetch."""
         cls._token = token
-        cls._on_timer()
+        cls._on_timer(force=True)
 
     @classmethod
     def register_callback(cls, callback: Callable) -> None:
@@ -161,6 +197,8 @@ class GitHubDataManager:
           when the given token matches the bar widget's token.
         """
         effective_token = token or cls._token
+        # The next poll must not be answered from the cache of the old read state
+        cls._notification_cache.clear()
 
         # Update local data only if same account as bar widget
         if effective_token and effective_token == cls._token:
@@ -188,7 +226,7 @@ class GitHubDataManager:
     def _sync_notification_read(cls, notification_id: str, token: str) -> None:
         """Sync single notification as read with GitHub API."""
         headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
-        url = f"https://api.github.com/notifications/threads/{notification_id}"
+        url = f"{cls._api_url}/notifications/threads/{notification_id}"
         req = urllib.request.Request(url, headers=headers, method="PATCH")
         try:
             with urllib.request.urlopen(req):
@@ -208,6 +246,7 @@ class GitHubDataManager:
         - Updates local shared data and notifies bar widget callbacks only
           when the given token matches the bar widget's token.
         """
+        cls._notification_cache.clear()
         # Update local data only if same account as bar widget
         if token and token == cls._token:
             with cls._lock:
@@ -234,7 +273,7 @@ class GitHubDataManager:
                 }
                 last_read_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
                 data = json.dumps({"last_read_at": last_read_at}).encode("utf-8")
-                url = "https://api.github.com/notifications"
+                url = f"{cls._api_url}/notifications"
                 req = urllib.request.Request(url, headers=headers, data=data, method="PUT")
                 with urllib.request.urlopen(req):
                     logging.info("GitHubDataManager marked all notifications as read on GitHub")
@@ -295,6 +334,16 @@ class GitHubDataManager:
                     links[rel] = url
         return links
 
+    @classmethod
+    def _update_poll_interval(cls, value: str | None, started: float) -> None:
+        """Remember the X-Poll-Interval of a response, the next poll may happen that long after `started`."""
+        if value:
+            try:
+                cls._poll_interval = max(0, int(value))
+            except ValueError:
+                pass
+        cls._next_poll_at = started + cls._poll_interval
+
     @classmethod
     def _get_all_notifications(
         cls,
@@ -304,7 +353,12 @@ class GitHubDataManager:
         reason_filters: list[str] | None = None,
         show_comment_count: bool = False,
     ) -> list[dict[str, Any]]:
-        """Core fetch + GraphQL enrichment logic. Raises on network/API errors."""
+        """
+        Core fetch + GraphQL enrichment logic. Raises on network/API errors.
+
+        The first page is requested with If-Modified-Since, when GitHub answers 304 the result
+        of the previous request for the same query is returned without any further requests.
+        """
         headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
         per_page = min(max_notification, 50)  # GitHub API caps per_page at 50
         params = {
@@ -313,24 +367,46 @@ class GitHubDataManager:
             "per_page": per_page,
         }
 
-        url = "https://api.github.com/notifications"
+        url = f"{cls._api_url}/notifications"
         query_string = "&".join(f"{k}={v}" for k, v in params.items())
         next_url: str | None = f"{url}?{query_string}"
 
+        # The poll interval counts from when the poll started, like the timer that triggers it
+        started = time.monotonic()
+        cache_key = (token, only_unread, max_notification, tuple(reason_filters or ()), show_comment_count)
+        with cls._lock:
+            cached = cls._notification_cache.get(cache_key)
+
         all_notifications: list[dict] = []
+        last_modified: str | None = None
+        first_page = True
         while next_url and len(all_notifications) < max_notification:
-            req = urllib.request.Request(next_url, headers=headers)
-            with urllib.request.urlopen(req) as response:
-                page = json.loads(response.read().decode())
-                all_notifications.extend(page)
-
-                # Check for next page via Link header
-                link_header = response.getheader("Link")
-                if link_header:
-                    links = cls._parse_link_header(link_header)
-                    next_url = links.get("next")
-                else:
-                    next_url = None
+            request_headers = headers
+            if first_page and cached is not None:
+                request_headers = {**headers, "If-Modified-Since": cached.last_modified}
+            req = urllib.request.Request(next_url, headers=request_headers)
+            try:
+                with urllib.request.urlopen(req) as response:
+                    if first_page:
+                        last_modified = response.getheader("Last-Modified")
+                        cls._update_poll_interval(response.getheader("X-Poll-Interval"), started)
+                    page = json.loads(response.read().decode())
+                    all_notifications.extend(page)
+
+                    # Check for next page via Link header
+                    link_header = response.getheader("Link")
+                    if link_header:
+                        links = cls._parse_link_header(link_header)
+                        next_url = links.get("next")
+                    else:
+                        next_url = None
+            except urllib.error.HTTPError as e:
+                if first_page and e.code == 304 and cached is not None:
+                    # Nothing changed since the last request, which doesn't count against the rate limit
+                    cls._update_poll_interval(e.headers.get("X-Poll-Interval"), started)
+                    return [dict(item) for item in cached.notifications]
+                raise
+            first_page = False
 
         # Trim to requested maximum
         all_notifications = all_notifications[:max_notification]
@@ -378,17 +454,50 @@ class GitHubDataManager:
                 result = [item for item in result if item.get("reason", "").lower() in normalized_filters]
 
         if token:
-            cls._enrich_notifications(
-                token,
-                result,
-                include_comment_count=show_comment_count,
-            )
+            # Only notifications updated since they were last enriched need another GraphQL query
+            pending = cls._apply_cached_enrichment(token, result, show_comment_count)
+            if pending and cls._enrich_notifications(token, pending, include_comment_count=show_comment_count):
+                cls._store_enrichment(token, pending, show_comment_count)
 
         for item in result:
             item.pop("__subject_api_url", None)
 
+        if last_modified:
+            with cls._lock:
+                cls._notification_cache[cache_key] = _NotificationCache(last_modified, [dict(item) for item in result])
+
         return result
 
+    @classmethod
+    def _apply_cached_enrichment(
+        cls, token: str, notifications: list[dict[str, Any]], include_comment_count: bool
+    ) -> list[dict[str, Any]]:
+        """Copy cached enrichment onto unchanged notifications, returns the ones still to enrich."""
+        pending = []
+        with cls._lock:
+            for notification in notifications:
+                if notification.get("type") not in {"Issue", "PullRequest", "Discussion"}:
+                    continue
+                entry = cls._enrichment_cache.get((token, notification["id"]))
+                if entry is not None and entry[0] == notification["updated_at"] and entry[1] == include_comment_count:
+                    notification.update(entry[2])
+                else:
+                    pending.append(notification)
+        return pending
+
+    @classmethod
+    def _store_enrichment(cls, token: str, notifications: list[dict[str, Any]], include_comment_count: bool) -> None:
+        with cls._lock:
+            cache = cls._enrichment_cache
+            for notification in notifications:
+                fields = {key: notification[key] for key in _ENRICHMENT_FIELDS if key in notification}
+                key = (token, notification["id"])
+                # Re-insert so the oldest entries are the first to go
+                cache.pop(key, None)
+                cache[key] = (notification["updated_at"], include_comment_count, fields)
+            while len(cache) > _ENRICHMENT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+
     @classmethod
     def _enrich_notifications(
         cls,
@@ -396,7 +505,8 @@ class GitHubDataManager:
         notifications: list[dict[str, Any]],
         *,
         include_comment_count: bool,
-    ) -> None:
+    ) -> bool:
+        """Add state and comment counts via one GraphQL query, returns False if the query failed."""
         query_parts: list[str] = []
         alias_map: dict[str, tuple[dict[str, Any], str]] = {}
 
@@ -433,7 +543,7 @@ class GitHubDataManager:
             alias_map[alias] = (notification, subject_type)
 
         if not query_parts:
-            return
+            return True
 
         selection = "\n".join(query_parts)
         graphql_query = f"query {{\n{selection}}}"
@@ -444,7 +554,7 @@ class GitHubDataManager:
             "Content-Type": "application/json",
         }
 
-        request = urllib.request.Request("https://api.github.com/graphql", data=payload, headers=headers, method="POST")
+        request = urllib.request.Request(f"{cls._api_url}/graphql", data=payload, headers=headers, method="POST")
 
         try:
             with urllib.request.urlopen(request) as response:
@@ -452,7 +562,7 @@ class GitHubDataManager:
 
             if data.get("errors"):
                 logging.warning("GitHubDataManager GraphQL errors: %s", data["errors"])
-                return
+                return False
 
             result_data = data.get("data", {})
             for alias, (notification, subject_type) in alias_map.items():
@@ -518,6 +628,7 @@ class GitHubDataManager:
                         total_count = discussion_data["comments"].get("totalCount")
                         if isinstance(total_count, int):
                             notification["comment_count"] = total_count
+            return True
         except urllib.error.HTTPError as exc:
             logging.error(
                 "GitHubDataManager GraphQL HTTP error: %s - %s", getattr(exc, "code", "?"), getattr(exc, "reason", "")
@@ -526,6 +637,7 @@ class GitHubDataManager:
             logging.error("GitHubDataManager no internet connection. Unable to enrich notifications via GraphQL.")
         except Exception as exc:
             logging.error("GitHubDataManager unexpected error enriching notifications: %s", exc)
+        return False
 
     @staticmethod
     def _parse_subject_metadata(subject_url: str) -> tuple[str, str, int] | None:
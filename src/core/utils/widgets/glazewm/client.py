@@ -2,7 +2,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
 from PyQt6.QtNetwork import QAbstractSocket
@@ -61,21 +61,70 @@ class TilingDirection(StrEnum):
     VERTICAL = auto()
 
 
+# Queries that can be affected by each subscription event
+EVENT_QUERIES: dict[str, tuple[QueryType, ...]] = {
+    "binding_modes_changed": (QueryType.BINDING_MODES,),
+    "tiling_direction_changed": (QueryType.TILING_DIRECTION,),
+    "focus_changed": (QueryType.MONITORS, QueryType.TILING_DIRECTION),
+    "focused_container_moved": (QueryType.MONITORS, QueryType.TILING_DIRECTION),
+    "workspace_activated": (QueryType.MONITORS,),
+    "workspace_deactivated": (QueryType.MONITORS,),
+    "workspace_updated": (QueryType.MONITORS,),
+}
+
+
 class GlazewmClient(QObject):
-    workspaces_data_processed = pyqtSignal(list)
+    """GlazeWM IPC client.
+
+    Widgets share one client per server URI through `get_instance` and declare the
+    events and queries they need with `subscribe`. Events are coalesced into a single
+    round of the queries they can affect, and results are only emitted when they
+    differ from the cached state. Widgets created after a result arrived read it from
+    the cache instead of querying again.
+    """
+
+    # Monitors whose state changed, `monitors` holds the full state
+    monitors_changed = pyqtSignal(list)
     tiling_direction_processed = pyqtSignal(TilingDirection)
     binding_mode_changed = pyqtSignal(BindingMode)
     glazewm_connection_status = pyqtSignal(bool)
 
+    _instances: ClassVar[dict[str, GlazewmClient]] = {}
+
+    @classmethod
+    def get_instance(cls, uri: str) -> GlazewmClient:
+        """Return the client shared by all widgets connected to `uri`."""
+        inst = cls._instances.get(uri)
+        if inst is None:
+            inst = cls._instances[uri] = cls(uri)
+        return inst
+
     def __init__(
         self,
         uri: str,
         initial_messages: list[str] | None = None,
         reconnect_interval: int = 4000,
+        coalesce_interval: int = 15,
     ):
         super().__init__()
         self.initial_messages = initial_messages if initial_messages else []
 
+        self._events: set[str] = set()
+        self._subscribed_events: set[str] = set()
+        self._queries: set[QueryType] = set()
+        self._pending_queries: set[QueryType] = set()
+        # Queries answered on the current connection, their cached results are up to date
+        self._fresh_queries: set[QueryType] = set()
+
+        self._monitors: dict[int, Monitor] = {}
+        self._tiling_direction: TilingDirection | None = None
+        self._binding_mode: BindingMode | None = None
+
+        self._query_timer = QTimer(self)
+        self._query_timer.setSingleShot(True)
+        self._query_timer.setInterval(coalesce_interval)
+        self._query_timer.timeout.connect(self._send_pending_queries)  # type: ignore
+
         self._uri = QUrl(uri)
         self._websocket = QWebSocket()
         self._websocket.connected.connect(self._on_connected)  # type: ignore
@@ -87,6 +136,39 @@ class GlazewmClient(QObject):
         self._reconnect_timer.setInterval(reconnect_interval)
         self._reconnect_timer.timeout.connect(self.connect)  # type: ignore
 
+    @property
+    def is_connected(self) -> bool:
+        return self._websocket.state() == QAbstractSocket.SocketState.ConnectedState
+
+    @property
+    def monitors(self) -> list[Monitor] | None:
+        """Cached monitors, None until the monitors query was answered on this connection."""
+        return list(self._monitors.values()) if QueryType.MONITORS in self._fresh_queries else None
+
+    @property
+    def tiling_direction(self) -> TilingDirection | None:
+        return self._tiling_direction if QueryType.TILING_DIRECTION in self._fresh_queries else None
+
+    @property
+    def binding_mode(self) -> BindingMode | None:
+        return self._binding_mode if QueryType.BINDING_MODES in self._fresh_queries else None
+
+    def subscribe(self, events: list[str], queries: list[QueryType]) -> None:
+        """Register the events and queries a widget needs.
+
+        New events are subscribed on the open connection. Only queries without a fresh
+        cached result are run, the widget reads the others from the cache.
+        """
+        self._events.update(events)
+        self._queries.update(queries)
+        if self.is_connected:
+            self._subscribe_events()
+            stale = set(queries) - self._fresh_queries
+            if stale:
+                self._pending_queries.update(stale)
+                self._query_timer.start()
+            QTimer.singleShot(0, lambda: self.glazewm_connection_status.emit(self.is_connected))
+
     def activate_workspace(self, workspace_name: str):
         self._websocket.sendTextMessage(f"command focus --workspace {workspace_name}")
 
@@ -112,7 +194,8 @@ class GlazewmClient(QObject):
         self._websocket.sendTextMessage("command focus --prev-active-workspace")
 
     def connect(self):
-        if self._websocket.state() == QAbstractSocket.SocketState.ConnectedState:
+        # The client is shared, a widget connecting while the handshake runs must not restart it
+        if self._websocket.state() != QAbstractSocket.SocketState.UnconnectedState:
             return
         logger.debug("Connecting to %s", self._uri.toString())
         self._websocket.open(self._uri)
@@ -123,11 +206,24 @@ class GlazewmClient(QObject):
             logger.debug("Sent initial message: %s", message)
             self._websocket.sendTextMessage(message)
 
+        # A new connection has no subscriptions and the cached state may be stale,
+        # clearing it makes the first results emit even when nothing changed
+        self._subscribed_events.clear()
+        self._subscribe_events()
+        self._fresh_queries.clear()
+        self._monitors = {}
+        self._tiling_direction = None
+        self._binding_mode = None
+        for query in self._queries:
+            self._websocket.sendTextMessage(query)
+
         # Stop reconnect timer
         self._reconnect_timer.stop()
 
     def _on_state_changed(self, state: QAbstractSocket.SocketState):
         logger.debug("WebSocket state changed: %s", state)
+        if state != QAbstractSocket.SocketState.ConnectedState:
+            self._fresh_queries.clear()
         self.glazewm_connection_status.emit(state == QAbstractSocket.SocketState.ConnectedState)
 
     def _on_error(self, error: QAbstractSocket.SocketError) -> None:
@@ -142,9 +238,18 @@ class GlazewmClient(QObject):
             return
 
         if response.get("messageType") == MessageType.EVENT_SUBSCRIPTION:
-            self._websocket.sendTextMessage(QueryType.MONITORS)
-            self._websocket.sendTextMessage(QueryType.TILING_DIRECTION)
-            self._websocket.sendTextMessage(QueryType.BINDING_MODES)
+            event_data = response.get("data")
+            event_type = event_data.get("eventType") if isinstance(event_data, dict) else None
+            if self._queries:
+                affected = EVENT_QUERIES.get(event_type) if event_type else None
+                self._pending_queries.update(self._queries.intersection(affected) if affected else self._queries)
+                if not self._query_timer.isActive():
+                    self._query_timer.start()
+            else:
+                # Unmanaged client, refresh everything as before
+                self._websocket.sendTextMessage(QueryType.MONITORS)
+                self._websocket.sendTextMessage(QueryType.TILING_DIRECTION)
+                self._websocket.sendTextMessage(QueryType.BINDING_MODES)
         elif response.get("messageType") == MessageType.CLIENT_RESPONSE:
             raw_data: Any = response.get("data")
             if not isinstance(raw_data, dict):
@@ -156,16 +261,50 @@ class GlazewmClient(QObject):
                 if monitors is None:
                     logger.warning("Expected 'monitors' to be a list, got None")
                     return
-                self.workspaces_data_processed.emit(self._process_workspaces(monitors))
+                self._update_monitors(self._process_workspaces(monitors))
             elif response.get("clientMessage") == QueryType.TILING_DIRECTION:
                 tiling_direction = TilingDirection(data.get("tilingDirection", TilingDirection.HORIZONTAL))
-                self.tiling_direction_processed.emit(tiling_direction)
+                self._fresh_queries.add(QueryType.TILING_DIRECTION)
+                if tiling_direction != self._tiling_direction:
+                    self._tiling_direction = tiling_direction
+                    self.tiling_direction_processed.emit(tiling_direction)
             elif response.get("clientMessage") == QueryType.BINDING_MODES:
                 binding_modes = data.get("bindingModes", [])
                 if binding_modes is None:
                     logger.warning("Expected 'bindingModes' to be a list, got %s", type(binding_modes).__name__)
                     return
-                self.binding_mode_changed.emit(self._process_binding_modes(binding_modes))
+                binding_mode = self._process_binding_modes(binding_modes)
+                self._fresh_queries.add(QueryType.BINDING_MODES)
+                if binding_mode != self._binding_mode:
+                    self._binding_mode = binding_mode
+                    self.binding_mode_changed.emit(binding_mode)
+
+    def _subscribe_events(self) -> None:
+        new_events = self._events - self._subscribed_events
+        if not new_events:
+            return
+        self._subscribed_events.update(new_events)
+        message = f"sub -e {' '.join(sorted(new_events))}"
+        logger.debug("Sent subscription: %s", message)
+        self._websocket.sendTextMessage(message)
+
+    def _send_pending_queries(self) -> None:
+        pending = self._pending_queries
+        self._pending_queries = set()
+        if not self.is_connected:
+            return
+        for query in pending:
+            self._websocket.sendTextMessage(query)
+
+    def _update_monitors(self, monitors: list[Monitor]) -> None:
+        """Diff the queried monitors against the cached ones and emit only on changes."""
+        self._fresh_queries.add(QueryType.MONITORS)
+        new_state = {monitor.hwnd: monitor for monitor in monitors}
+        changed = [monitor for monitor in monitors if self._monitors.get(monitor.hwnd) != monitor]
+        removed = self._monitors.keys() - new_state.keys()
+        self._monitors = new_state
+        if changed or removed:
+            self.monitors_changed.emit(changed)
 
     def _process_workspaces(self, data: list[dict[str, Any]]) -> list[Monitor]:
         monitors: list[Monitor] = []
@@ -3,9 +3,7 @@ import logging
 from ctypes import byref, wintypes
 from typing import NamedTuple
 
-from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtWidgets import QApplication
-
+from core.utils.widgets.telemetry.scheduler import MetricSource
 from core.utils.win32.bindings.pdh import pdh
 from core.utils.win32.constants import PDH_FMT_DOUBLE
 
@@ -482,51 +480,51 @@ class GpuApi:
             self._luid_info[luid]["adl_index"] = adl_idx
 
 
-class GpuWorker(QThread):
-    _instance: GpuWorker | None = None
-    data_ready = pyqtSignal(list)
+class GpuSource(MetricSource):
+    """Data of the GPUs requested with `add_index`.
 
-    @classmethod
-    def get_instance(cls, update_interval: int) -> GpuWorker:
-        if cls._instance is None:
-            cls._instance = cls(update_interval)
-        return cls._instance
+    The GPU counters are wildcard counters over every engine instance, they keep their own
+    PDH query so faster cpu and memory ticks don't pay for collecting them.
+    """
 
-    def add_index(self, index: int) -> None:
-        self._gpu_indices.add(index)
+    key = "gpu"
+    min_interval_ms = 500
 
-    def __init__(self, update_interval: int, parent=None):
-        super().__init__(parent)
-        self._running = True
-        self._update_interval = update_interval
+    def __init__(self) -> None:
         self._gpu_indices: set[int] = set()
-        app = QApplication.instance()
-        if app is not None:
-            app.aboutToQuit.connect(self.stop)
-
-    def stop(self) -> None:
-        self._running = False
-        GpuWorker._instance = None
+        self._api: GpuApi | None = None
+        self._available: set[int] = set()
+        self._dirty = False
 
-    def run(self) -> None:
-        api = GpuApi(self._gpu_indices)
+    def add_index(self, index: int) -> None:
+        if index not in self._gpu_indices:
+            # Replaced rather than mutated, the sampler thread may be iterating it
+            self._gpu_indices = self._gpu_indices | {index}
+            # Vendor sensor libraries are loaded for the requested GPUs only
+            self._dirty = True
+
+    def open(self) -> None:
+        self._dirty = False
+        self._api = GpuApi(set(self._gpu_indices))
+        self._api.prime()
+        self._available = {info["index"] for info in self._api._luid_info.values()}
+        missing = self._gpu_indices - self._available
+        if missing:
+            logger.warning("GpuSource gpu_index %s not found. Available indices: %s", missing, sorted(self._available))
+
+    def sample(self) -> list[GpuData]:
+        if self._dirty:
+            self.close()
+            self.open()
+        if self._api is None or not (self._gpu_indices & self._available):
+            return []
         try:
-            api.prime()
-            available = {info["index"] for info in api._luid_info.values()}
-            missing = self._gpu_indices - available
-            if missing:
-                logger.warning("GpuWorker gpu_index %s not found. Available indices: %s", missing, sorted(available))
-            if not (self._gpu_indices & available):
-                return
-            while self._running:
-                try:
-                    data = api.collect()
-                    if self._running:
-                        self.data_ready.emit(data)
-                except Exception as e:
-                    logger.error("GpuWorker %s", e)
-                    if self._running:
-                        self.data_ready.emit([])
-                self.msleep(self._update_interval)
-        finally:
-            api.close()
+            return self._api.collect()
+        except Exception as e:
+            logger.error("GpuSource %s", e)
+            return []
+
+    def close(self) -> None:
+        if self._api is not None:
+            self._api.close()
+            self._api = None
@@ -2,6 +2,16 @@ import json
 import logging
 import subprocess
 
+from core.utils.widgets.komorebi.command_channel import KomorebiCommand, KomorebiCommandChannel
+
+# komorebic layout names that don't map to the socket message by PascalCase conversion
+_LAYOUT_NAMES = {"bsp": "BSP"}
+_CYCLE_DIRECTIONS = {"next": "Next", "prev": "Previous"}
+
+
+def _pascal_case(value: str) -> str:
+    return "".join(part.capitalize() for part in value.split("-"))
+
 
 def add_index(dictionary: dict, dictionary_index: int) -> dict:
     dictionary["index"] = dictionary_index
@@ -26,16 +36,11 @@ class KomorebiClient:
         self._komorebic_path = komorebic_path
         self._previous_poll_offline = False
         self._previous_mouse_follows_focus = False
+        self._channel = KomorebiCommandChannel(komorebic_path, timeout_secs)
 
     def query_state(self) -> dict | None:
         try:
-            # Capture stderr to avoid raw komorebic panics leaking to console
-            output = subprocess.check_output(
-                [self._komorebic_path, "state"],
-                timeout=self._timeout_secs,
-                stderr=subprocess.PIPE,
-                shell=True,
-            )
+            output = self._channel.query({"type": "State"}, ("state",))
             return json.loads(output)
         except subprocess.TimeoutExpired:
             logging.error("Komorebi state query timed out in %s seconds", self._timeout_secs)
@@ -105,72 +110,52 @@ class KomorebiClient:
                         return add_index(workspace, i)
 
     def activate_workspace(self, m_idx: int, ws_idx: int, wait: bool = False) -> None:
-        args = [self._komorebic_path, "focus-monitor-workspace", str(m_idx), str(ws_idx)]
-        if wait:
-            try:
-                subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, shell=True)
-            except subprocess.SubprocessError, FileNotFoundError:
-                logging.exception("Failed to activate komorebi workspace")
-        else:
-            try:
-                subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True)
-            except subprocess.SubprocessError, FileNotFoundError:
-                logging.exception("Failed to activate komorebi workspace (spawn)")
+        self._channel.send(
+            KomorebiCommand(
+                ("focus-monitor-workspace", str(m_idx), str(ws_idx)),
+                {"type": "FocusMonitorWorkspaceNumber", "content": [m_idx, ws_idx]},
+                coalesce_key="focus-workspace",
+            ),
+            wait=wait,
+        )
 
     def next_workspace(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-workspace", "next"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi workspace")
+        self._cycle("cycle-workspace", "CycleFocusWorkspace", "next")
 
     def prev_workspace(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-workspace", "prev"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
+        self._cycle("cycle-workspace", "CycleFocusWorkspace", "prev")
+
+    def _cycle(self, command: str, message_type: str, direction: str) -> None:
+        self._channel.send(
+            KomorebiCommand(
+                (command, direction),
+                {"type": message_type, "content": _CYCLE_DIRECTIONS[direction]},
+                cycle=1 if direction == "next" else -1,
             )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi workspace")
+        )
 
     def toggle_focus_mouse(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "toggle-focus-follows-mouse"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
+        self._channel.send(
+            KomorebiCommand(
+                ("toggle-focus-follows-mouse",),
+                {"type": "ToggleFocusFollowsMouse", "content": "Windows"},
             )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to toggle focus-follows-mouse")
+        )
 
     def change_layout(self, m_idx: int, ws_idx: int, layout: str) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "workspace-layout", str(m_idx), str(ws_idx), layout],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
+        layout_name = _LAYOUT_NAMES.get(layout, _pascal_case(layout))
+        self._channel.send(
+            KomorebiCommand(
+                ("workspace-layout", str(m_idx), str(ws_idx), layout),
+                {"type": "WorkspaceLayout", "content": [m_idx, ws_idx, layout_name]},
+                coalesce_key=f"workspace-layout:{m_idx}:{ws_idx}",
             )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to change layout of currently active workspace to %s", layout)
+        )
 
     def flip_layout(self, direction: str) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "flip-layout", direction],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            pass
+        self._channel.send(
+            KomorebiCommand(("flip-layout", direction), {"type": "FlipLayout", "content": _pascal_case(direction)})
+        )
 
     def flip_layout_horizontal(self) -> None:
         self.flip_layout("horizontal")
@@ -182,16 +167,15 @@ class KomorebiClient:
         self.flip_layout("horizontal-and-vertical")
 
     def toggle(self, toggle_type: str, wait: bool = False) -> None:
-        try:
-            command = (
-                f'"{self._komorebic_path}" focus-monitor-at-cursor && "{self._komorebic_path}" toggle-{toggle_type}'
-            )
-            if wait:
-                subprocess.run(command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
-            else:
-                subprocess.Popen(command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to toggle %s for currently active workspace", toggle_type)
+        # Toggling on whatever monitor had focus would hit the wrong workspace, so a failed focus aborts
+        self._channel.send(
+            KomorebiCommand(
+                (f"toggle-{toggle_type}",),
+                {"type": f"Toggle{_pascal_case(toggle_type)}"},
+                prerequisite=KomorebiCommand(("focus-monitor-at-cursor",), {"type": "FocusMonitorAtCursor"}),
+            ),
+            wait=wait,
+        )
 
     def wait_until_subscribed_to_pipe(self, pipe_name: str):
         proc = subprocess.Popen(
@@ -277,34 +261,16 @@ class KomorebiClient:
             return None
 
     def focus_stack_window(self, w_idx: int) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "focus-stack-window", str(w_idx)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
+        self._channel.send(
+            KomorebiCommand(
+                ("focus-stack-window", str(w_idx)),
+                {"type": "FocusStackWindow", "content": w_idx},
+                coalesce_key="focus-stack-window",
             )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to focus stack window")
+        )
 
     def next_stack_window(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-stack", "next"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi stack")
+        self._cycle("cycle-stack", "CycleStack", "next")
 
     def prev_stack_window(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-stack", "prev"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi stack")
+        self._cycle("cycle-stack", "CycleStack", "prev")
@@ -0,0 +1,215 @@
+"""Queued command channel to komorebi.
+
+Commands are executed in order by a single background thread. When possible they are
+written as `SocketMessage` JSON lines to komorebi's command socket over one persistent
+connection, otherwise `komorebic.exe` is started directly (without a `cmd.exe` shell).
+"""
+
+import json
+import logging
+import os
+import socket
+import subprocess
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+from core.utils.runtime_stats import RuntimeStats
+
+KOMOREBI_SOCKET_PATH = os.path.join(os.environ.get("LOCALAPPDATA", ""), "komorebi", "komorebi.sock")
+
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+@dataclass(slots=True)
+class KomorebiCommand:
+    """A komorebic invocation and the equivalent komorebi socket message.
+
+    Pending commands with the same `coalesce_key` are replaced by the newest one, and a
+    pending cycle is cancelled out by a cycle in the opposite direction (`cycle` is +1/-1).
+    A `prerequisite` runs first on the same turn of the queue, the command is dropped when
+    it fails.
+    """
+
+    args: tuple[str, ...]
+    message: dict | None = None
+    coalesce_key: str | None = None
+    cycle: int = 0
+    prerequisite: KomorebiCommand | None = None
+    done: threading.Event | None = field(default=None, compare=False)
+
+
+class _SocketTransport:
+    """Persistent connection to komorebi's command socket, komorebi reads one message per line."""
+
+    def __init__(self, path: str = KOMOREBI_SOCKET_PATH, timeout: float = 0.5):
+        self._path = path
+        self._timeout = timeout
+        self._sock: socket.socket | None = None
+
+    @staticmethod
+    def is_supported(path: str = KOMOREBI_SOCKET_PATH) -> bool:
+        return hasattr(socket, "AF_UNIX") and os.path.exists(path)
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        sock.connect(self._path)
+        return sock
+
+    def send(self, message: dict) -> None:
+        payload = (json.dumps(message) + "\n").encode("utf-8")
+        for attempt in (0, 1):
+            if self._sock is None:
+                self._sock = self._connect()
+            try:
+                self._sock.sendall(payload)
+                return
+            except OSError:
+                # Komorebi may have restarted, reconnect once before giving up
+                self.close()
+                if attempt:
+                    raise
+
+    def query(self, message: dict) -> bytes:
+        with self._connect() as sock:
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            chunks: list[bytes] = []
+            while chunk := sock.recv(64 * 1024):
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+class KomorebiCommandChannel:
+    """Executes komorebi commands in order on a single background thread."""
+
+    def __init__(self, komorebic_path: str, timeout_secs: float):
+        self._komorebic_path = komorebic_path
+        self._timeout_secs = timeout_secs
+        self._queue: deque[KomorebiCommand] = deque()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._socket = _SocketTransport(timeout=timeout_secs)
+        self._use_socket = _SocketTransport.is_supported()
+        # Fall back to the shell if komorebic is only reachable through it (e.g. a .cmd shim)
+        self._use_shell = False
+        RuntimeStats().register_queue("komorebic-commands", self.pending)
+
+    def pending(self) -> int:
+        """Number of commands waiting to be executed."""
+        with self._condition:
+            return len(self._queue)
+
+    def send(self, command: KomorebiCommand, wait: bool = False) -> None:
+        """Queue a command, optionally blocking until it was executed."""
+        if wait:
+            command.done = threading.Event()
+        with self._condition:
+            if not self._coalesce(command):
+                self._queue.append(command)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="komorebic-commands", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        if command.done is not None:
+            command.done.wait()
+
+    def query(self, message: dict, args: tuple[str, ...]) -> bytes:
+        """Run a query and return its raw output, preferring the socket."""
+        if self._use_socket:
+            try:
+                output = self._socket.query(message)
+                if output.strip():
+                    return output
+            except OSError as e:
+                logging.debug("Komorebi socket query failed, falling back to komorebic: %s", e)
+        try:
+            # Capture stderr to avoid raw komorebic panics leaking to console
+            return subprocess.check_output(
+                self._process_args(args),
+                timeout=self._timeout_secs,
+                stderr=subprocess.PIPE,
+                shell=self._use_shell,
+                creationflags=_NO_WINDOW,
+            )
+        except FileNotFoundError:
+            if self._use_shell:
+                raise
+            self._use_shell = True
+            return self.query(message, args)
+
+    def _coalesce(self, command: KomorebiCommand) -> bool:
+        """Merge a command into the pending queue, returns True when it doesn't need to be queued."""
+        if command.done is not None or not self._queue:
+            return False
+        # Only the newest pending command is merged so the order of different commands is kept
+        last = self._queue[-1]
+        if last.done is not None:
+            return False
+        if command.coalesce_key is not None and last.coalesce_key == command.coalesce_key:
+            self._queue[-1] = command
+            return True
+        if command.cycle and last.cycle == -command.cycle and last.args[:-1] == command.args[:-1]:
+            self._queue.pop()
+            return True
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    if not self._condition.wait(timeout=30):
+                        # Idle, the thread is started again by the next command
+                        self._thread = None
+                        self._socket.close()
+                        return
+                command = self._queue.popleft()
+            try:
+                prerequisite = command.prerequisite
+                if prerequisite is not None and not self._execute(prerequisite):
+                    logging.warning(
+                        "komorebic %s failed, skipping %s", " ".join(prerequisite.args), " ".join(command.args)
+                    )
+                else:
+                    self._execute(command)
+            except Exception:
+                logging.exception("Failed to run komorebic %s", " ".join(command.args))
+            finally:
+                if command.done is not None:
+                    command.done.set()
+
+    def _execute(self, command: KomorebiCommand) -> bool:
+        """Run a command, returns False when komorebic reported a failure."""
+        if self._use_socket and command.message is not None:
+            try:
+                self._socket.send(command.message)
+                return True
+            except OSError as e:
+                logging.debug("Komorebi socket unavailable, falling back to komorebic: %s", e)
+                self._use_socket = False
+        try:
+            result = subprocess.run(
+                self._process_args(command.args),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                shell=self._use_shell,
+                creationflags=_NO_WINDOW,
+            )
+        except FileNotFoundError:
+            if self._use_shell:
+                raise
+            self._use_shell = True
+            return self._execute(command)
+        return result.returncode == 0
+
+    def _process_args(self, args: tuple[str, ...]) -> list[str]:
+        return [self._komorebic_path, *args]
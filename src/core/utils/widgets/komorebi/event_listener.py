@@ -1,16 +1,18 @@
-import json
 import logging
 import threading
 import uuid
 
 import pywintypes
+import win32event
 import win32file
 import win32pipe
+import winerror
 from PyQt6.QtCore import QThread
 
 from core.event_enums import KomorebiEvent
 from core.event_service import EventService
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state import KomorebiMessageFramer, diff_komorebi_state
 
 KOMOREBI_PIPE_BUFF_SIZE = 64 * 1024
 KOMOREBI_PIPE_NAME = "yasb"
@@ -25,6 +27,10 @@ class KomorebiEventListener(QThread):
         self.buffer_size = buffer_size
         self.event_service = EventService()
         self.pipe = None
+        self._framer = KomorebiMessageFramer()
+        self._last_state: dict | None = None
+        # Signalled by stop() to wake up a pending overlapped read or connect
+        self._stop_handle = win32event.CreateEvent(None, True, False, None)
 
     def __str__(self):
         return "Komorebi Event Listener"
@@ -34,8 +40,9 @@ class KomorebiEventListener(QThread):
         return not self._stop_event.is_set()
 
     def _create_pipe(self) -> None:
-        open_mode = win32pipe.PIPE_ACCESS_DUPLEX
-        pipe_mode = win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT
+        open_mode = win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_OVERLAPPED
+        # Messages are framed by KomorebiMessageFramer, so the pipe is read as a byte stream
+        pipe_mode = win32pipe.PIPE_TYPE_BYTE | win32pipe.PIPE_READMODE_BYTE | win32pipe.PIPE_WAIT
         max_instances = 1
         buffer_size_in = self.buffer_size
         buffer_size_out = self.buffer_size
@@ -66,40 +73,40 @@ class KomorebiEventListener(QThread):
             should_reconnect = True
             try:
                 self._create_pipe()
+                self._framer.reset()
                 self._wait_until_komorebi_online()
 
-                while self._app_running:
-                    try:
-                        buffer, bytes_to_read, result = win32pipe.PeekNamedPipe(self.pipe, 1)
-                        if not bytes_to_read:
-                            if self._stop_event.wait(0.05):
-                                break
-                            continue
-
-                        result, data = win32file.ReadFile(self.pipe, bytes_to_read, None)
-
-                        if not data.strip():
-                            continue
-
-                        try:
-                            event_message = json.loads(data.decode("utf-8"))
-                            event = event_message["event"]
-                            state = event_message["state"]
+                overlapped = pywintypes.OVERLAPPED()
+                overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+                buffer = win32file.AllocateReadBuffer(self.buffer_size)
 
+                while self._app_running and self.pipe is not None:
+                    try:
+                        data = self._read_pipe(buffer, overlapped)
+                        if data is None:
+                            break
+                        for message in self._framer.feed(data):
+                            try:
+                                event = message["event"]
+                                state = message["state"]
+                            except KeyError, TypeError:
+                                logging.warning("Received komorebi message without event or state")
+                                continue
                             if event and state:
                                 self._emit_event(event, state)
-                        except KeyError, ValueError:
-                            logging.exception("Failed to parse komorebi state. Received data: %s", data)
                     except pywintypes.error as e:
-                        if e.winerror == 109:  # ERROR_BROKEN_PIPE
+                        if e.winerror == winerror.ERROR_BROKEN_PIPE:
                             logging.warning("Pipe has been ended: %s", e)
                             break
                         else:
                             logging.exception("Unexpected error occurred: %s", e)
+                            if self._stop_event.wait(0.5):
+                                break
             except BaseException, Exception:
                 logging.exception("Komorebi has disconnected from the named pipe %s", self.pipe_name)
             finally:
                 self._close_pipe()
+                self._last_state = None
                 self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
                 if not self._app_running:
                     should_reconnect = False
@@ -110,14 +117,39 @@ class KomorebiEventListener(QThread):
             if not should_reconnect:
                 break
 
+    def _read_pipe(self, buffer, overlapped) -> bytes | None:
+        """Block until data arrives on the pipe. Returns None when the listener is stopping."""
+        win32event.ResetEvent(overlapped.hEvent)
+        hr, _ = win32file.ReadFile(self.pipe, buffer, overlapped)
+        if hr not in (0, winerror.ERROR_IO_PENDING, winerror.ERROR_MORE_DATA):
+            raise pywintypes.error(hr, "ReadFile", "Pipe read failed")
+        if not self._wait_overlapped(overlapped):
+            return None
+        bytes_read = win32file.GetOverlappedResult(self.pipe, overlapped, False)
+        return bytes(buffer[:bytes_read])
+
+    def _wait_overlapped(self, overlapped) -> bool:
+        """Wait for an overlapped operation, cancelling it if the listener is stopped first."""
+        result = win32event.WaitForMultipleObjects([overlapped.hEvent, self._stop_handle], False, win32event.INFINITE)
+        if result == win32event.WAIT_OBJECT_0:
+            return True
+        try:
+            win32file.CancelIo(self.pipe)
+        except pywintypes.error:
+            pass
+        return False
+
     def stop(self):
         self._stop_event.set()
-        self._close_pipe()
+        win32event.SetEvent(self._stop_handle)
 
     def _emit_event(self, event: dict, state: dict) -> None:
         if isinstance(event, str):
             return
+        diff = diff_komorebi_state(self._last_state, state)
+        self._last_state = state
         self.event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state)
+        self.event_service.emit_event(KomorebiEvent.KomorebiUpdateDiff, event, state, diff)
 
         if event["type"] in KomorebiEvent:
             self.event_service.emit_event(KomorebiEvent[event["type"]], event, state)
@@ -143,7 +175,11 @@ class KomorebiEventListener(QThread):
         if not self._app_running or self.pipe is None:
             return
 
-        win32pipe.ConnectNamedPipe(self.pipe, None)
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        hr = win32pipe.ConnectNamedPipe(self.pipe, overlapped)
+        if hr == winerror.ERROR_IO_PENDING and not self._wait_overlapped(overlapped):
+            return
         logging.info("Komorebi connected to named pipe: %s", self.pipe_name)
         state = self._komorebic.query_state()
 
@@ -156,4 +192,5 @@ class KomorebiEventListener(QThread):
                 return
             state = self._komorebic.query_state()
 
+        self._last_state = state
         self.event_service.emit_event(KomorebiEvent.KomorebiConnect, state)
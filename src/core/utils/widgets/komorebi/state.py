@@ -0,0 +1,197 @@
+"""Platform independent parsing and diffing of the komorebi notification stream."""
+
+import codecs
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+_TOKEN_RE = re.compile(r'[{}"\\]')
+_json_decoder = json.JSONDecoder()
+
+
+class KomorebiMessageFramer:
+    """Splits a byte stream of concatenated JSON objects into messages.
+
+    Komorebi notifications can arrive split across several reads or several of them
+    in a single read. Whole objects are decoded directly, the scanner only has to walk
+    an object that is still incomplete, and it resumes where the previous read ended.
+    """
+
+    def __init__(self, max_message_size: int = 32 * 1024 * 1024):
+        self.max_message_size = max_message_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._reset()
+
+    def _reset(self) -> None:
+        self._text = ""
+        # Scanner state of the incomplete object at the start of _text
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def reset(self) -> None:
+        """Drop buffered data, e.g. after the pipe was reconnected."""
+        self._decoder.reset()
+        self._reset()
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Add received bytes and return the messages completed by them."""
+        self._text += self._decoder.decode(data)
+        messages: list[Any] = []
+        if self._depth:
+            if not self._scan():
+                self._check_size()
+                return messages
+            self._pop_message(messages)
+        while True:
+            start = self._text.find("{")
+            if start == -1:
+                # Whitespace or separators between messages
+                self._text = ""
+                return messages
+            if start:
+                skipped = self._text[:start].strip()
+                if skipped:
+                    logging.debug("Skipped %d bytes of unexpected komorebi data", len(skipped))
+                self._text = self._text[start:]
+            try:
+                message, end = _json_decoder.raw_decode(self._text)
+            except ValueError:
+                # Incomplete (or invalid) object, walk it to find out where it ends
+                self._pos, self._depth, self._in_string = 1, 1, False
+                if not self._scan():
+                    self._check_size()
+                    return messages
+                self._pop_message(messages)
+                continue
+            messages.append(message)
+            self._text = self._text[end:]
+
+    def _scan(self) -> bool:
+        """Advance the scanner, returns True once the object at the start of the buffer is complete."""
+        text = self._text
+        pos, depth, in_string = self._pos, self._depth, self._in_string
+        while True:
+            match = _TOKEN_RE.search(text, pos)
+            if match is None:
+                self._pos, self._depth, self._in_string = max(pos, len(text)), depth, in_string
+                return False
+            token = match.group()
+            pos = match.end()
+            if in_string:
+                if token == "\\":
+                    # Skip the escaped character, even if it hasn't been received yet
+                    pos += 1
+                elif token == '"':
+                    in_string = False
+            elif token == '"':
+                in_string = True
+            elif token == "{":
+                depth += 1
+            elif token == "}":
+                depth -= 1
+                if depth == 0:
+                    self._pos, self._depth, self._in_string = pos, 0, False
+                    return True
+
+    def _pop_message(self, messages: list[Any]) -> None:
+        raw = self._text[: self._pos]
+        self._text = self._text[self._pos :]
+        self._pos = 0
+        try:
+            messages.append(json.loads(raw))
+        except ValueError:
+            logging.exception("Failed to parse komorebi message. Received data: %s", raw[:1024])
+
+    def _check_size(self) -> None:
+        if len(self._text) > self.max_message_size:
+            logging.warning("Discarding komorebi message larger than %d bytes", self.max_message_size)
+            self._reset()
+
+
+@dataclass(frozen=True)
+class KomorebiStateDiff:
+    """Parts of the komorebi state that changed between two notifications.
+
+    Monitors are identified by their `id` (the monitor handle), workspaces by their
+    index on the monitor. `global_changed` covers everything outside of the monitors,
+    like `float_override` or the focused monitor.
+    """
+
+    global_changed: bool = False
+    monitors: frozenset[int] = frozenset()
+    workspaces: dict[int, frozenset[int]] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        return self.global_changed or bool(self.monitors)
+
+    def affects_monitor(self, monitor_id: int | None) -> bool:
+        """True if anything a widget on the given monitor renders may have changed."""
+        return monitor_id is None or self.global_changed or monitor_id in self.monitors
+
+    def changed_workspaces(self, monitor_id: int) -> frozenset[int]:
+        return self.workspaces.get(monitor_id, frozenset())
+
+
+FULL_STATE_DIFF = KomorebiStateDiff(global_changed=True)
+
+
+def _monitor_elements(state: dict) -> list[dict]:
+    monitors = state.get("monitors")
+    if not isinstance(monitors, dict):
+        return []
+    return monitors.get("elements") or []
+
+
+def _without(mapping: dict, key: str) -> dict:
+    return {k: v for k, v in mapping.items() if k != key}
+
+
+def diff_komorebi_state(old: dict | None, new: dict) -> KomorebiStateDiff:
+    """Compute which monitors and workspaces differ between two komorebi state documents."""
+    if not old:
+        return FULL_STATE_DIFF
+
+    global_changed = _without(old, "monitors") != _without(new, "monitors")
+    old_monitors = old.get("monitors")
+    new_monitors = new.get("monitors")
+    if isinstance(old_monitors, dict) and isinstance(new_monitors, dict):
+        global_changed = global_changed or _without(old_monitors, "elements") != _without(new_monitors, "elements")
+    elif old_monitors != new_monitors:
+        global_changed = True
+
+    old_by_id = {m.get("id"): m for m in _monitor_elements(old)}
+    new_by_id = {m.get("id"): m for m in _monitor_elements(new)}
+    if list(old_by_id) != list(new_by_id):
+        # Monitors were added, removed or reordered
+        global_changed = True
+
+    changed_monitors: set[int] = set(old_by_id.keys() ^ new_by_id.keys())
+    changed_workspaces: dict[int, frozenset[int]] = {}
+    for monitor_id, new_monitor in new_by_id.items():
+        old_monitor = old_by_id.get(monitor_id)
+        if old_monitor is None or old_monitor == new_monitor:
+            continue
+        changed_monitors.add(monitor_id)
+        old_ws = old_monitor.get("workspaces") or {}
+        new_ws = new_monitor.get("workspaces") or {}
+        old_elements = old_ws.get("elements") or []
+        new_elements = new_ws.get("elements") or []
+        indexes = {
+            i
+            for i in range(max(len(old_elements), len(new_elements)))
+            if i >= len(old_elements) or i >= len(new_elements) or old_elements[i] != new_elements[i]
+        }
+        if old_ws.get("focused") != new_ws.get("focused"):
+            indexes.update(i for i in (old_ws.get("focused"), new_ws.get("focused")) if isinstance(i, int))
+        if indexes:
+            changed_workspaces[monitor_id] = frozenset(indexes)
+
+    return KomorebiStateDiff(
+        global_changed=global_changed,
+        monitors=frozenset(changed_monitors),
+        workspaces=changed_workspaces,
+    )
@@ -0,0 +1,154 @@
+import re
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from PyQt6.QtWidgets import QLabel
+
+from core.utils.runtime_stats import WidgetStats
+
+_SPAN_SPLIT_RE = re.compile(r"(<span.*?>.*?</span>)")
+_SPAN_TAG_RE = re.compile(r"<span.*?>|</span>")
+_SPAN_CLASS_RE = re.compile(r'class=(["\'])([^"\']+?)\1')
+_PLACEHOLDER_RE = re.compile(r"\{[^{}]*\}")
+
+
+@dataclass(frozen=True, slots=True)
+class LabelSegment:
+    """A single part of a label template, either an icon `<span>` or a text part."""
+
+    text: str
+    is_icon: bool
+    class_name: str
+    placeholders: tuple[str, ...]
+
+    def format(self, *args: Any, **kwargs: Any) -> str:
+        """`str.format` the segment, skipping the call entirely for static segments."""
+        if not self.placeholders:
+            return self.text
+        return self.text.format(*args, **kwargs)
+
+    def format_map(self, mapping: Mapping[str, Any]) -> str:
+        if not self.placeholders:
+            return self.text
+        return self.text.format_map(mapping)
+
+    def replace(self, replacements: Mapping[str, Any]) -> str:
+        """Replace literal `{placeholder}` tokens, only visiting the ones present in this segment."""
+        text = self.text
+        for placeholder in self.placeholders:
+            if placeholder in replacements:
+                text = text.replace(placeholder, str(replacements[placeholder]))
+        return text
+
+
+class LabelTemplate:
+    """A label or label_alt template parsed once into its icon and text segments.
+
+    Templates are immutable and shared, use `compile_label_template` to get one.
+    """
+
+    __slots__ = ("source", "segments")
+
+    def __init__(self, source: str):
+        self.source = source
+        segments: list[LabelSegment] = []
+        for part in _SPAN_SPLIT_RE.split(source):
+            part = part.strip()
+            if not part:
+                continue
+            if "<span" in part and "</span>" in part:
+                class_match = _SPAN_CLASS_RE.search(part)
+                text = _SPAN_TAG_RE.sub("", part).strip()
+                segments.append(
+                    LabelSegment(
+                        text=text,
+                        is_icon=True,
+                        class_name=class_match.group(2) if class_match else "icon",
+                        placeholders=tuple(dict.fromkeys(_PLACEHOLDER_RE.findall(text))),
+                    )
+                )
+            else:
+                segments.append(
+                    LabelSegment(
+                        text=part,
+                        is_icon=False,
+                        class_name="label",
+                        placeholders=tuple(dict.fromkeys(_PLACEHOLDER_RE.findall(part))),
+                    )
+                )
+        self.segments: tuple[LabelSegment, ...] = tuple(segments)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __iter__(self) -> Iterator[LabelSegment]:
+        return iter(self.segments)
+
+
+@lru_cache(maxsize=256)
+def compile_label_template(source: str) -> LabelTemplate:
+    """Return the compiled template for `source`, parsing it only the first time it is seen."""
+    return LabelTemplate(source)
+
+
+class LabelRenderer:
+    """Binds a compiled template to the QLabels built from it.
+
+    The renderer remembers the text each label currently shows, so `render` only
+    calls `setText` on labels whose text actually changed.
+    """
+
+    __slots__ = ("template", "labels", "stats", "_texts")
+
+    def __init__(self, template: LabelTemplate, labels: Sequence[QLabel], stats: WidgetStats | None = None):
+        self.template = template
+        self.labels = list(labels)
+        # Counts the label updates of the owning widget
+        self.stats = stats
+        self._texts: list[str | None] = [None] * len(self.labels)
+
+    def render(self, render_text: Callable[[LabelSegment], str], render_icons: bool = False) -> list[QLabel]:
+        """Render the text segments with `render_text`.
+
+        Icon segments keep their static text unless `render_icons` is set and they contain placeholders.
+        Returns the labels whose text changed.
+        """
+        changed: list[QLabel] = []
+        texts = self._texts
+        for index, (segment, label) in enumerate(zip(self.template.segments, self.labels)):
+            if segment.is_icon and not (render_icons and segment.placeholders):
+                text = segment.text
+            else:
+                text = render_text(segment)
+            if texts[index] != text:
+                texts[index] = text
+                label.setText(text)
+                changed.append(label)
+        if changed and self.stats is not None:
+            self.stats.label_updates += len(changed)
+        return changed
+
+    def set_text(self, index: int, text: str) -> bool:
+        """Set the text of a single label, returns False when it was already showing `text`."""
+        if self._texts[index] == text:
+            return False
+        self._texts[index] = text
+        self.labels[index].setText(text)
+        if self.stats is not None:
+            self.stats.label_updates += 1
+        return True
+
+    def invalidate(self) -> None:
+        """Forget the cached texts, e.g. after the labels were modified outside the renderer."""
+        self._texts = [None] * len(self.labels)
+
+    def items(self) -> Iterator[tuple[int, LabelSegment, QLabel]]:
+        for index, (segment, label) in enumerate(zip(self.template.segments, self.labels)):
+            yield index, segment, label
+
+    def text_labels(self) -> Iterator[QLabel]:
+        for segment, label in zip(self.template.segments, self.labels):
+            if not segment.is_icon:
+                yield label
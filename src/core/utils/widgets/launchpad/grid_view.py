@@ -0,0 +1,193 @@
+from collections.abc import Callable, Hashable
+
+from PyQt6.QtCore import QRect, QSize, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QScrollArea, QWidget
+
+from core.utils.widgets.launchpad.model import LaunchpadAppModel, LaunchpadItem
+
+# Rows created above and below the visible area so scrolling doesn't show empty cells
+OVERSCAN_ROWS = 1
+
+
+class LaunchpadGridView(QWidget):
+    """Grid of Launchpad cells backed by a `LaunchpadAppModel`.
+
+    The view sits inside a scroll area and only creates cell widgets for rows that are
+    (nearly) visible. Cells are kept per item key and reused when the filter changes,
+    they are dropped when the model's apps change.
+    """
+
+    cells_created = pyqtSignal(list)
+
+    def __init__(self, scroll_area: QScrollArea, cell_factory: Callable[[LaunchpadItem], QWidget], parent=None):
+        super().__init__(parent)
+        self._scroll_area = scroll_area
+        self._cell_factory = cell_factory
+        self._model: LaunchpadAppModel | None = None
+        self._generation = -1
+        self._cells: dict[Hashable, QWidget] = {}
+        self._shown: dict[int, QWidget] = {}
+        # Cells created since `cells_created` was last emitted
+        self._created: list[QWidget] = []
+        self._placeholder: QWidget | None = None
+        self._cell_size = QSize()
+        self.columns = 1
+        scroll_area.verticalScrollBar().valueChanged.connect(self._update_visible)
+
+    def set_model(self, model: LaunchpadAppModel) -> None:
+        self._model = model
+        model.modelReset.connect(self._relayout)
+
+    def set_placeholder(self, widget: QWidget) -> None:
+        """Widget shown instead of the grid when the model is empty."""
+        self._placeholder = widget
+        widget.setParent(self)
+        widget.hide()
+
+    def count(self) -> int:
+        return self._model.rowCount() if self._model else 0
+
+    def cells(self) -> list[QWidget]:
+        """All cells created so far, including those of rows that are currently filtered out."""
+        return list(self._cells.values())
+
+    def cell(self, row: int) -> QWidget | None:
+        """Return the cell of a row, creating it if it wasn't visible yet."""
+        if not 0 <= row < self.count():
+            return None
+        cell = self._shown.get(row)
+        if cell is None:
+            cell = self._place(row)
+            self._emit_created()
+        return cell
+
+    def row_of(self, widget: QWidget | None) -> int:
+        for row, cell in self._shown.items():
+            if cell is widget:
+                return row
+        return -1
+
+    def focused_row(self) -> int:
+        return self.row_of(QApplication.focusWidget())
+
+    def focused_cell(self) -> QWidget | None:
+        row = self.focused_row()
+        return self._shown.get(row) if row != -1 else None
+
+    def ensure_visible(self, row: int) -> None:
+        """Scroll so that the given row is inside the visible area."""
+        if not self._cell_size.isValid():
+            return
+        rect = self._cell_rect(row)
+        viewport_height = self._scroll_area.viewport().height()
+        scrollbar = self._scroll_area.verticalScrollBar()
+        if rect.top() < scrollbar.value():
+            scrollbar.setValue(rect.top())
+        elif rect.bottom() > scrollbar.value() + viewport_height:
+            scrollbar.setValue(rect.bottom() - viewport_height)
+
+    def clear_cells(self) -> None:
+        for cell in self._cells.values():
+            cell.hide()
+            cell.deleteLater()
+        self._cells.clear()
+        self._shown.clear()
+        self._created.clear()
+        self._cell_size = QSize()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        if self._cell_size.isValid() and self._calculate_columns() != self.columns:
+            self._relayout()
+        elif self._placeholder is not None and self._placeholder.isVisible():
+            self._placeholder.setGeometry(0, 0, self.width(), self.height())
+
+    def _relayout(self) -> None:
+        model = self._model
+        if model is None:
+            return
+        if model.generation != self._generation:
+            self._generation = model.generation
+            self.clear_cells()
+
+        for cell in self._shown.values():
+            cell.hide()
+        self._shown.clear()
+
+        count = model.rowCount()
+        if count == 0:
+            if self._placeholder is not None:
+                self._placeholder.show()
+                height = self._placeholder.sizeHint().height()
+                self._placeholder.setGeometry(0, 0, self.width(), height)
+                self.setFixedHeight(height)
+            return
+        if self._placeholder is not None:
+            self._placeholder.hide()
+
+        if not self._cell_size.isValid():
+            # All cells share the size of the first one
+            first = self._create(model.item(0))
+            first.ensurePolished()
+            first.adjustSize()
+            self._cell_size = first.size()
+            if self._cell_size.isEmpty():
+                self._cell_size = first.sizeHint().expandedTo(QSize(1, 1))
+
+        self.columns = self._calculate_columns()
+        rows = (count + self.columns - 1) // self.columns
+        self.setFixedHeight(rows * self._cell_size.height())
+        self._update_visible()
+
+    def _calculate_columns(self) -> int:
+        width = self.width()
+        if self._scroll_area.verticalScrollBar().isVisible():
+            width += 4
+        cell_width = self._cell_size.width()
+        return max(1, width // cell_width) if cell_width > 0 else 1
+
+    def _cell_rect(self, row: int) -> QRect:
+        size = self._cell_size
+        left = max(0, (self.width() - self.columns * size.width()) // 2)
+        return QRect(
+            left + (row % self.columns) * size.width(),
+            (row // self.columns) * size.height(),
+            size.width(),
+            size.height(),
+        )
+
+    def _update_visible(self) -> None:
+        count = self.count()
+        if not count or not self._cell_size.isValid():
+            return
+        top = self._scroll_area.verticalScrollBar().value()
+        bottom = top + self._scroll_area.viewport().height()
+        cell_height = self._cell_size.height()
+        first_row = max(0, top // cell_height - OVERSCAN_ROWS)
+        last_row = bottom // cell_height + OVERSCAN_ROWS
+        for row in range(first_row * self.columns, min(count, (last_row + 1) * self.columns)):
+            if row not in self._shown:
+                self._place(row)
+        self._emit_created()
+
+    def _emit_created(self) -> None:
+        if self._created:
+            created, self._created = self._created, []
+            self.cells_created.emit(created)
+
+    def _place(self, row: int) -> QWidget:
+        item = self._model.item(row)
+        cell = self._cells.get(item.key)
+        if cell is None:
+            cell = self._create(item)
+        cell.setGeometry(self._cell_rect(row))
+        cell.show()
+        self._shown[row] = cell
+        return cell
+
+    def _create(self, item: LaunchpadItem) -> QWidget:
+        cell = self._cell_factory(item)
+        cell.setParent(self)
+        self._cells[item.key] = cell
+        self._created.append(cell)
+        return cell
@@ -0,0 +1,137 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+@dataclass(slots=True)
+class LaunchpadItem:
+    """A cell of the Launchpad grid, either a single app or a group folder."""
+
+    kind: str
+    key: tuple
+    title: str
+    app: dict[str, Any] | None = None
+    apps: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_group(self) -> bool:
+        return self.kind == "group"
+
+
+class LaunchpadSearchIndex:
+    """Lowercased titles and groups of the apps, built once per apps list.
+
+    A query that extends the previous one only rescans the previous matches.
+    """
+
+    def __init__(self, apps: list[dict[str, Any]]):
+        self._titles = [(app.get("title") or "").lower() for app in apps]
+        self._groups = [(app.get("group") or "").lower() for app in apps]
+        self._exact_groups = [app.get("group") for app in apps]
+        self._last: tuple[str, str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def search(self, text: str) -> list[int]:
+        """Return the indexes of the apps matching a search, `group:name` filters by group."""
+        if not text:
+            return list(range(len(self._titles)))
+        if text.startswith("group:"):
+            field_name, needle, values = "group", text[6:].strip().lower(), self._groups
+        else:
+            field_name, needle, values = "title", text.lower(), self._titles
+        candidates = range(len(values))
+        if self._last is not None and self._last[0] == field_name and needle.startswith(self._last[1]):
+            candidates = self._last[2]
+        matches = [i for i in candidates if needle in values[i]]
+        self._last = (field_name, needle, matches)
+        return matches
+
+    def group(self, name: str) -> list[int]:
+        """Return the indexes of the apps in exactly this group."""
+        return [i for i, group in enumerate(self._exact_groups) if group == name]
+
+
+class LaunchpadAppModel(QAbstractListModel):
+    """Launchpad apps held in memory, exposing the currently shown grid cells as rows."""
+
+    ItemRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._apps: list[dict[str, Any]] = []
+        self._index = LaunchpadSearchIndex([])
+        self._items: list[LaunchpadItem] = []
+        # Incremented whenever the apps themselves change, views drop their cells then
+        self.generation = 0
+
+    def apps(self) -> list[dict[str, Any]]:
+        return self._apps
+
+    def set_apps(self, apps: list[dict[str, Any]]) -> None:
+        """Replace the apps. The shown rows are updated by the next `set_filter` call."""
+        self._apps = apps
+        self._index = LaunchpadSearchIndex(apps)
+        self.generation += 1
+
+    def set_filter(self, text: str = "", group: str | None = None, grouped: bool = False) -> None:
+        """Show the apps matching `text`, or all apps of `group`. With `grouped` apps are shown in group folders."""
+        if group is not None:
+            apps = [self._apps[i] for i in self._index.group(group)]
+        else:
+            apps = [self._apps[i] for i in self._index.search(text)]
+
+        if grouped and group is None and not text:
+            items = self._grouped_items(apps)
+        else:
+            items = [self._app_item(app) for app in apps]
+
+        self.beginResetModel()
+        self._items = items
+        self.endResetModel()
+
+    def item(self, row: int) -> LaunchpadItem | None:
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        item = self.item(index.row()) if index.isValid() else None
+        if item is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.title
+        if role == self.ItemRole:
+            return item
+        return None
+
+    @staticmethod
+    def _app_item(app: dict[str, Any]) -> LaunchpadItem:
+        app_id = app.get("id")
+        return LaunchpadItem(
+            kind="app",
+            key=("app", app_id if app_id is not None else id(app)),
+            title=app.get("title", "Unknown"),
+            app=app,
+        )
+
+    def _grouped_items(self, apps: list[dict[str, Any]]) -> list[LaunchpadItem]:
+        """Group folders sorted by name, followed by the apps without a group."""
+        groups: dict[str, list[dict[str, Any]]] = {}
+        uncategorized = []
+        for app in apps:
+            group = app.get("group")
+            if group:
+                groups.setdefault(group, []).append(app)
+            else:
+                uncategorized.append(app)
+        items = [
+            LaunchpadItem(kind="group", key=("group", name), title=name, apps=groups[name]) for name in sorted(groups)
+        ]
+        items.extend(self._app_item(app) for app in uncategorized)
+        return items
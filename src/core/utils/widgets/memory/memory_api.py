@@ -1,13 +1,11 @@
 """Windows native API for memory statistics."""
 
 import ctypes
-import logging
 from ctypes import wintypes
 from typing import NamedTuple
 
-from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtWidgets import QApplication
-
+from core.utils.widgets.telemetry.pdh_query import SYSTEM_QUERY, PdhQuery
+from core.utils.widgets.telemetry.scheduler import MetricSource
 from core.utils.win32.bindings.kernel32 import kernel32
 from core.utils.win32.bindings.ntdll import SystemMemoryListInformation, ntdll
 from core.utils.win32.bindings.pdh import pdh
@@ -51,49 +49,45 @@ class MemoryData(NamedTuple):
 class MemoryAPI:
     """Windows native memory API using GlobalMemoryStatusEx and GetPerformanceInfo."""
 
-    # Cached PDH query for swap percent (avoids open/close every call)
-    _swap_query: wintypes.HANDLE | None = None
+    # Swap percent counter on the shared system PDH query
+    _swap_query: PdhQuery | None = None
     _swap_counter: wintypes.HANDLE | None = None
     _swap_init_failed: bool = False
 
     @classmethod
     def _init_swap_query(cls) -> bool:
-        """Initialize and cache the PDH query for swap usage."""
+        """Add the swap usage counter to the shared system PDH query."""
         if cls._swap_query is not None:
             return True
         if cls._swap_init_failed:
             return False
 
         try:
-            cls._swap_query = wintypes.HANDLE()
-            if pdh.PdhOpenQueryW(None, 0, ctypes.byref(cls._swap_query)) != 0:
-                cls._swap_query = None
-                cls._swap_init_failed = True
-                return False
-
-            cls._swap_counter = wintypes.HANDLE()
-            status = pdh.PdhAddEnglishCounterW(
-                cls._swap_query, "\\Paging File(_Total)\\% Usage", 0, ctypes.byref(cls._swap_counter)
-            )
+            status, counter = SYSTEM_QUERY.add_counter("\\Paging File(_Total)\\% Usage")
             if status != 0:
-                pdh.PdhCloseQuery(cls._swap_query)
-                cls._swap_query = None
-                cls._swap_counter = None
                 cls._swap_init_failed = True
                 return False
-
+            cls._swap_query = SYSTEM_QUERY
+            cls._swap_counter = counter
             return True
         except Exception:
             cls._swap_init_failed = True
             return False
 
     @classmethod
-    def _get_swap_percent(cls) -> float:
-        """Get swap usage percentage using cached PDH counter."""
+    def _cleanup_swap_query(cls) -> None:
+        if cls._swap_query is not None:
+            cls._swap_query.remove_counter(cls._swap_counter)
+        cls._swap_query = None
+        cls._swap_counter = None
+
+    @classmethod
+    def _get_swap_percent(cls, collect: bool = True) -> float:
+        """Get swap usage percentage using the shared PDH counter."""
         if not cls._init_swap_query():
             return 0.0
         try:
-            if pdh.PdhCollectQueryData(cls._swap_query) != 0:
+            if collect and cls._swap_query.collect() != 0:
                 return 0.0
 
             counter_value = PDH_FMT_COUNTERVALUE_DOUBLE()
@@ -163,7 +157,7 @@ class MemoryAPI:
             return VirtualMemory(total=0, available=0, percent=0.0, used=0, free=0)
 
     @classmethod
-    def swap_memory(cls) -> SwapMemory:
+    def swap_memory(cls, collect: bool = True) -> SwapMemory:
         """Get swap (page file) memory statistics."""
         try:
             perf = PERFORMANCE_INFORMATION()
@@ -178,7 +172,7 @@ class MemoryAPI:
             total = (perf.CommitLimit - perf.PhysicalTotal) * page_size
 
             if total > 0:
-                percent_swap = cls._get_swap_percent()
+                percent_swap = cls._get_swap_percent(collect)
                 used = int(0.01 * percent_swap * total)
             else:
                 percent_swap = 0.0
@@ -197,48 +191,29 @@ class MemoryAPI:
             return SwapMemory(total=0, used=0, free=0, percent=0.0)
 
     @classmethod
-    def get_data(cls) -> MemoryData:
-        """Collect all memory data in a single call."""
+    def get_data(cls, collect: bool = True) -> MemoryData:
+        """Collect all memory data in a single call.
+
+        With `collect=False` the swap counter is read from the last collection of the shared query.
+        """
         return MemoryData(
             virtual=cls.virtual_memory(),
-            swap=cls.swap_memory(),
+            swap=cls.swap_memory(collect),
             cached_bytes=cls._get_cached_bytes(),
         )
 
 
-class MemoryWorker(QThread):
-    """Background thread for non-blocking memory data collection."""
+class MemorySource(MetricSource):
+    """Physical, swap and cached memory, the swap counter is read from the shared system PDH query."""
 
-    _instance: MemoryWorker | None = None
-    data_ready = pyqtSignal(object)
+    key = "memory"
+    collector = SYSTEM_QUERY
 
-    @classmethod
-    def get_instance(cls, update_interval: int) -> MemoryWorker:
-        """Get or create the singleton worker instance."""
-        if cls._instance is None:
-            cls._instance = cls(update_interval)
-        return cls._instance
-
-    def __init__(self, update_interval: int, parent=None):
-        super().__init__(parent)
-        self._running = True
-        self._update_interval = update_interval
-        app_inst = QApplication.instance()
-        if app_inst is not None:
-            app_inst.aboutToQuit.connect(self.stop)
-
-    def stop(self):
-        """Signal the worker to stop."""
-        self._running = False
-        MemoryWorker._instance = None
-
-    def run(self):
-        """Collect memory data in a loop until stopped."""
-        while self._running:
-            try:
-                data = MemoryAPI.get_data()
-                if self._running:
-                    self.data_ready.emit(data)
-            except Exception as e:
-                logging.error("Memory worker error: %s", e)
-            self.msleep(self._update_interval)
+    def open(self) -> None:
+        MemoryAPI._init_swap_query()
+
+    def sample(self) -> MemoryData:
+        return MemoryAPI.get_data(collect=False)
+
+    def close(self) -> None:
+        MemoryAPI._cleanup_swap_query()
@@ -20,7 +20,7 @@ class WindowsNotificationEventListener(QThread):
         self._stop_event = threading.Event()
 
         self.clear_notifications.connect(self._clear_notifications)
-        self.event_service.register_event("WindowsNotificationClear", self.clear_notifications)
+        self.event_service.register_event("WindowsNotificationClear", self.clear_notifications, owner=self)
 
     def _clear_notifications(self, _msg: str = ""):
         if self._loop and self._loop.is_running():
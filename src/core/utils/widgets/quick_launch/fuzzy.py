@@ -27,6 +27,18 @@ def _split_camel(name: str) -> str:
     return _CAMEL_RE.sub(" ", name)
 
 
+class FuzzyTarget:
+    """A match target with the lowered text, initials and words computed once."""
+
+    __slots__ = ("text", "lower", "initials", "words")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.initials = _get_initials(text)
+        self.words = tuple(self.lower.split())
+
+
 def fuzzy_score(query: str, target: str) -> int | None:
     """Score how well *query* matches *target*.
 
@@ -42,21 +54,26 @@ def fuzzy_score(query: str, target: str) -> int | None:
     """
     if not query or not target:
         return 0 if not query else None
+    return fuzzy_score_target(query.lower(), FuzzyTarget(target))
+
 
-    q = query.lower()
-    t = target.lower()
+def fuzzy_score_target(q: str, target: FuzzyTarget) -> int | None:
+    """Same as `fuzzy_score` for an already lowered query and a precomputed target."""
+    if not q or not target.text:
+        return 0 if not q else None
 
     # Initials match (highest priority)
-    initials = _get_initials(target)
-    if initials.startswith(q):
-        return 6 if q == initials else 5
+    if target.initials.startswith(q):
+        return 6 if q == target.initials else 5
+
+    t = target.lower
 
     # Prefix match
     if t.startswith(q):
         return 4
 
     # Word prefix match
-    for word in t.split():
+    for word in target.words:
         if word.startswith(q):
             return 3
 
@@ -65,11 +82,63 @@ def fuzzy_score(query: str, target: str) -> int | None:
         return 2
 
     # Subsequence match (characters appear in order)
-    qi = 0
-    for ch in t:
-        if qi < len(q) and ch == q[qi]:
-            qi += 1
-    if qi == len(q):
+    chars = iter(t)
+    if all(ch in chars for ch in q):
         return 1
 
     return None
+
+
+class AppSearchIndex:
+    """Search data for the app list, built once per app list load.
+
+    Stores the precomputed fuzzy targets for every app name and, for UWP apps,
+    the CamelCase-split package name used as a fallback match.
+    """
+
+    __slots__ = ("names", "paths", "keys", "targets", "pkg_targets")
+
+    def __init__(self, apps: list[tuple[str, str, object]]):
+        self.names: list[str] = []
+        self.paths: list[str] = []
+        self.keys: list[str] = []
+        self.targets: list[FuzzyTarget] = []
+        self.pkg_targets: list[FuzzyTarget | None] = []
+        for name, path, _ in apps:
+            self.names.append(name)
+            self.paths.append(path)
+            self.keys.append(f"{name}::{path}")
+            self.targets.append(FuzzyTarget(name))
+            pkg_target = None
+            if path.startswith("UWP::"):
+                appid = path[5:].split("!")[0].split("_")[0]
+                pkg_name = appid.rsplit(".", 1)[-1] if "." in appid else appid
+                # Split CamelCase (WindowsTerminal -> Windows Terminal)
+                # and match against the human-readable form.
+                pkg_target = FuzzyTarget(_split_camel(pkg_name))
+            self.pkg_targets.append(pkg_target)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, candidates: list[int] | None = None) -> list[tuple[int, float]]:
+        """Return (app index, match score) for every app matching the lowered *query*.
+
+        *candidates* restricts the scan to the given app indices, e.g. the matches of a
+        shorter query that *query* extends. Results keep the app list order.
+        """
+        targets = self.targets
+        pkg_targets = self.pkg_targets
+        matches: list[tuple[int, float]] = []
+        for i in range(len(targets)) if candidates is None else candidates:
+            fs = fuzzy_score_target(query, targets[i])
+            if fs is None and pkg_targets[i] is not None:
+                pkg_fs = fuzzy_score_target(query, pkg_targets[i])
+                if pkg_fs is not None:
+                    # Cap package-name matches between word-prefix (3)
+                    # and prefix (4). Frecency can bridge the gap to
+                    # higher tiers for frequently used apps.
+                    fs = min(pkg_fs, 3.5)
+            if fs is not None:
+                matches.append((i, float(fs)))
+        return matches
@@ -1,9 +1,11 @@
 import logging
 import math
 import os
+import time
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from core.utils.widgets.quick_launch.icon_store import IconStore
 from core.utils.win32.icon_extractor import IconExtractorUtil
 
 # Standard icon sizes found in ICO / PE resources.
@@ -11,6 +13,10 @@ from core.utils.win32.icon_extractor import IconExtractorUtil
 # artwork than 32px, so downscaling from 48 looks better than from 32.
 _STANDARD_SIZES = (48, 64, 96, 128, 256)
 
+# Resolved icons are delivered in batches of this size, or after this many seconds
+_BATCH_SIZE = 32
+_BATCH_INTERVAL = 0.15
+
 
 def compute_extraction_size(icon_size: int, dpr: float) -> int:
     """Return the optimal extraction size for a given logical icon size and DPR.
@@ -28,9 +34,15 @@ def compute_extraction_size(icon_size: int, dpr: float) -> int:
 
 
 class IconResolverWorker(QThread):
-    """Background thread that resolves icons for discovered apps."""
+    """
+    Background thread that resolves icons for discovered apps.
 
-    icon_ready = pyqtSignal(str, str)
+    Icons are looked up in the packed `IconStore` first, only unknown sources are extracted.
+    Results are emitted through `icons_ready` as lists of `(app_key, icon_path)` tuples, where
+    `icon_path` is either an `IconStore` reference or the default icon file.
+    """
+
+    icons_ready = pyqtSignal(list)
 
     def __init__(self, apps: list[tuple[str, str, object]], icons_dir: str, size: int = 48):
         super().__init__()
@@ -43,21 +55,42 @@ class IconResolverWorker(QThread):
         self._should_stop = True
 
     def run(self):
+        store = IconStore()
         self._default_icon = IconExtractorUtil.extract_default_icon(self._icons_dir, size=self._size)
+        batch = []
+        last_emit = time.monotonic()
         for name, path, _ in self._apps:
             if self._should_stop:
                 break
             app_key = f"{name}::{path}"
             try:
-                icon_path = self._resolve_icon(path)
-                if not icon_path or not os.path.isfile(icon_path):
-                    icon_path = self._default_icon
-                if icon_path and os.path.isfile(icon_path):
-                    self.icon_ready.emit(app_key, icon_path)
+                icon_path = self._stored_icon(store, path)
             except Exception as e:
                 logging.debug("Icon resolve failed for %s: %s", name, e)
-                if self._default_icon:
-                    self.icon_ready.emit(app_key, self._default_icon)
+                icon_path = self._default_icon
+            if icon_path:
+                batch.append((app_key, icon_path))
+            now = time.monotonic()
+            if batch and (len(batch) >= _BATCH_SIZE or now - last_emit >= _BATCH_INTERVAL):
+                self.icons_ready.emit(batch)
+                batch = []
+                last_emit = now
+        if batch and not self._should_stop:
+            self.icons_ready.emit(batch)
+
+    def _stored_icon(self, store: IconStore, path: str) -> str | None:
+        key = store.key(path, self._size)
+        length = store.length(key)
+        if length is None:
+            data = b""
+            icon_path = self._resolve_icon(path)
+            if icon_path and icon_path != self._default_icon and os.path.isfile(icon_path):
+                with open(icon_path, "rb") as f:
+                    data = f.read()
+            store.put(key, data)
+            length = len(data)
+        # Sources without an icon of their own are stored empty
+        return store.ref(key) if length else self._default_icon
 
     def _resolve_icon(self, path: str) -> str | None:
         sz = self._size
@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+
+from core.utils.singleton import Singleton
+from core.utils.system import app_data_path
+
+ICON_STORE_FILE = "quick_launch_icons.pack"
+
+# Icon paths starting with this prefix are read from the store instead of the file system
+ICON_REF_PREFIX = "iconstore:"
+
+_MAGIC = b"YQLI\x02\x00\x00\x00"
+# 16 byte key digest followed by the length of the PNG data
+_RECORD = struct.Struct("<16sI")
+# The first half of a key digest identifies the icon source, the second half its version
+_SOURCE_DIGEST_SIZE = 8
+
+# Compact once superseded records take up more than this and more than the live data
+_COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+
+
+class IconStore(metaclass=Singleton):
+    """
+    Resolved app icons packed into a single append-only file.
+
+    Every record holds the PNG data of one icon, keyed by a digest of the icon source path and
+    the extraction size followed by a digest of the source's mtime and size. A record for a new
+    version of a source supersedes the previous one, superseded records count as dead bytes and
+    are dropped when the file is compacted. The index is rebuilt from the record headers when
+    the store is opened, reads slice a memory map of the file. An empty record marks a source
+    without an icon of its own so it isn't extracted again on every start.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else app_data_path(ICON_STORE_FILE)
+        self._lock = threading.Lock()
+        # Key digest -> (offset, length) of the PNG data
+        self._index: dict[bytes, tuple[int, int]] | None = None
+        # Source digest -> key digest of its current record
+        self._sources: dict[bytes, bytes] = {}
+        self._map: mmap.mmap | None = None
+        self._end = 0
+        self._dead_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: str, size: int) -> str:
+        """Return the key of an icon source, file sources include their mtime and size."""
+        try:
+            stat = os.stat(source)
+            version = f"{stat.st_mtime_ns}|{stat.st_size}"
+        except OSError, ValueError:
+            version = ""
+        return (
+            hashlib.blake2b(f"{source}|{size}".encode(), digest_size=_SOURCE_DIGEST_SIZE).hexdigest()
+            + hashlib.blake2b(version.encode(), digest_size=_SOURCE_DIGEST_SIZE).hexdigest()
+        )
+
+    @staticmethod
+    def ref(key: str) -> str:
+        return f"{ICON_REF_PREFIX}{key}"
+
+    @staticmethod
+    def is_ref(icon_path: str) -> bool:
+        return icon_path.startswith(ICON_REF_PREFIX)
+
+    def length(self, key: str) -> int | None:
+        """Return the size of a stored icon without reading it, None if the key is unknown."""
+        with self._lock:
+            entry = self._load_index().get(bytes.fromhex(key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def get(self, key: str) -> bytes | None:
+        """Return the PNG data of an icon, empty for sources without an icon, None if unknown."""
+        with self._lock:
+            entry = self._load_index().get(bytes.fromhex(key))
+            if entry is None:
+                return None
+            offset, length = entry
+            if not length:
+                return b""
+            if self._map is None or offset + length > len(self._map):
+                self._remap()
+            if self._map is None:
+                return None
+            return self._map[offset : offset + length]
+
+    def read_ref(self, icon_path: str) -> bytes | None:
+        return self.get(icon_path[len(ICON_REF_PREFIX) :])
+
+    def put(self, key: str, data: bytes) -> None:
+        digest = bytes.fromhex(key)
+        with self._lock:
+            index = self._load_index()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "ab") as f:
+                    if self._end == 0:
+                        f.write(_MAGIC)
+                        self._end = len(_MAGIC)
+                    f.write(_RECORD.pack(digest, len(data)))
+                    f.write(data)
+            except OSError as e:
+                logging.debug("Failed to write icon store %s: %s", self.path, e)
+                return
+            self._add_record(index, digest, (self._end + _RECORD.size, len(data)))
+            self._end += _RECORD.size + len(data)
+            if self._dead_bytes > _COMPACT_MIN_DEAD_BYTES and self._dead_bytes > self._end - self._dead_bytes:
+                self._compact()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._index or ()),
+                "bytes": self._end,
+                "dead_bytes": self._dead_bytes,
+            }
+
+    def _remap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        try:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError, ValueError:
+            # Missing or empty file
+            self._map = None
+
+    def _load_index(self) -> dict[bytes, tuple[int, int]]:
+        if self._index is not None:
+            return self._index
+        self._index = {}
+        self._remap()
+        data = self._map
+        if data is None or data[: len(_MAGIC)] != _MAGIC:
+            if data is not None:
+                logging.warning("Discarding unreadable or outdated icon store %s", self.path)
+                self._map.close()
+                self._map = None
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+            self._end = 0
+            return self._index
+        offset = len(_MAGIC)
+        size = len(data)
+        while offset + _RECORD.size <= size:
+            digest, length = _RECORD.unpack_from(data, offset)
+            if offset + _RECORD.size + length > size:
+                # Truncated by an interrupted write
+                break
+            self._add_record(self._index, digest, (offset + _RECORD.size, length))
+            offset += _RECORD.size + length
+        self._end = offset
+        if offset < size:
+            self._map.close()
+            self._map = None
+            try:
+                with open(self.path, "r+b") as f:
+                    f.truncate(offset)
+            except OSError:
+                pass
+        return self._index
+
+    def _add_record(self, index: dict[bytes, tuple[int, int]], digest: bytes, entry: tuple[int, int]) -> None:
+        """Index a record, the record it supersedes becomes dead."""
+        source = digest[:_SOURCE_DIGEST_SIZE]
+        previous = self._sources.get(source)
+        if previous is not None:
+            old = index.pop(previous, None)
+            if old is not None:
+                self._dead_bytes += _RECORD.size + old[1]
+        self._sources[source] = digest
+        index[digest] = entry
+
+    def _compact(self) -> None:
+        """Rewrite the file with only the current record of every key."""
+        self._remap()
+        if self._map is None:
+            return
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        index = {}
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_MAGIC)
+                offset = len(_MAGIC)
+                for digest, (start, length) in self._index.items():
+                    f.write(_RECORD.pack(digest, length))
+                    f.write(self._map[start : start + length])
+                    index[digest] = (offset + _RECORD.size, length)
+                    offset += _RECORD.size + length
+            # The file can't be replaced while it is mapped
+            self._map.close()
+            self._map = None
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.debug("Failed to compact icon store %s: %s", self.path, e)
+            return
+        self._index = index
+        self._end = offset
+        self._dead_bytes = 0
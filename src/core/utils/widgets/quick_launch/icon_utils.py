@@ -1,17 +1,85 @@
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QPainter, QPixmap
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QImage, QPainter, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
-_ICON_CACHE: dict[str, QPixmap] = {}
+from core.utils.widgets.quick_launch.icon_store import IconStore
+
+
+class PixmapCache:
+    """LRU cache of rendered pixmaps keyed by `(icon source, size, dpr)`, bounded by a byte budget.
+
+    Shared by the result list, the preview pane and the empty state so icons survive
+    between queries. Only used from the GUI thread.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._pixmaps: OrderedDict[Hashable, QPixmap] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        if pixmap.isNull():
+            return
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= self._size_of(old)
+        self._pixmaps[key] = pixmap
+        self._bytes += self._size_of(pixmap)
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= self._size_of(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+        }
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+PIXMAP_CACHE = PixmapCache()
 
 
 def load_and_scale_icon(icon_path: str, size: int, dpr: float = 1.0) -> QPixmap:
-    key = f"{icon_path}_{size}_{dpr}"
-    if key in _ICON_CACHE:
-        return _ICON_CACHE[key]
+    key = ("file", icon_path, size, dpr)
+    cached = PIXMAP_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         target = int(size * dpr)
-        pixmap = QPixmap(icon_path)
+        if IconStore.is_ref(icon_path):
+            pixmap = QPixmap()
+            data = IconStore().read_ref(icon_path)
+            if data:
+                pixmap.loadFromData(data, "PNG")
+        else:
+            pixmap = QPixmap(icon_path)
         if pixmap.isNull():
             return QPixmap()
         scaled = pixmap.scaled(
@@ -20,7 +88,7 @@ def load_and_scale_icon(icon_path: str, size: int, dpr: float = 1.0) -> QPixmap:
             Qt.TransformationMode.SmoothTransformation,
         )
         scaled.setDevicePixelRatio(dpr)
-        _ICON_CACHE[key] = scaled
+        PIXMAP_CACHE.put(key, scaled)
         return scaled
     except Exception:
         return QPixmap()
@@ -28,9 +96,10 @@ def load_and_scale_icon(icon_path: str, size: int, dpr: float = 1.0) -> QPixmap:
 
 def svg_to_pixmap(svg_text: str, size: int, dpr: float = 1.0) -> QPixmap:
 
-    key = f"svg_{hash(svg_text)}_{size}_{dpr}"
-    if key in _ICON_CACHE:
-        return _ICON_CACHE[key]
+    key = ("svg", svg_text, size, dpr)
+    cached = PIXMAP_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         renderer = QSvgRenderer(svg_text.encode("utf-8"))
         if not renderer.isValid():
@@ -57,7 +126,49 @@ def svg_to_pixmap(svg_text: str, size: int, dpr: float = 1.0) -> QPixmap:
             renderer.render(painter)
         painter.end()
         pixmap.setDevicePixelRatio(dpr)
-        _ICON_CACHE[key] = pixmap
+        PIXMAP_CACHE.put(key, pixmap)
         return pixmap
     except Exception:
         return QPixmap()
+
+
+def scale_image_data(data: bytes, size: QSize) -> QPixmap:
+    """Decode encoded image data and scale it to fit `size`, keeping the aspect ratio."""
+    key = ("image", hash(data), len(data), size.width(), size.height())
+    cached = PIXMAP_CACHE.get(key)
+    if cached is not None:
+        return cached
+    pixmap = QPixmap()
+    pixmap.loadFromData(data)
+    if pixmap.isNull():
+        return pixmap
+    scaled = pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    PIXMAP_CACHE.put(key, scaled)
+    return scaled
+
+
+def alpha_bounds(image: QImage) -> QRect | None:
+    """Return the bounding rect of the non-transparent pixels of an image, None if it is fully transparent.
+
+    The image is reduced to its 8-bit alpha channel and every row is scanned with bytes
+    comparisons and strips, which run in C instead of a per-pixel Python loop.
+    """
+    alpha = image.convertToFormat(QImage.Format.Format_Alpha8)
+    width, height = alpha.width(), alpha.height()
+    bpl = alpha.bytesPerLine()
+    ptr = alpha.constBits()
+    ptr.setsize(alpha.sizeInBytes())
+    raw = bytes(ptr)
+    empty = bytes(width)
+    rows = [raw[y * bpl : y * bpl + width] for y in range(height)]
+    filled = [y for y, row in enumerate(rows) if row != empty]
+    if not filled:
+        return None
+    top, bottom = filled[0], filled[-1]
+    left = width
+    right = 0
+    for y in filled:
+        row = rows[y]
+        left = min(left, width - len(row.lstrip(b"\0")))
+        right = max(right, len(row.rstrip(b"\0")) - 1)
+    return QRect(left, top, right - left + 1, bottom - top + 1)
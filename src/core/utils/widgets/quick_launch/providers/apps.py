@@ -18,7 +18,7 @@ from core.utils.widgets.quick_launch.base_provider import (
     ProviderMenuActionResult,
     ProviderResult,
 )
-from core.utils.widgets.quick_launch.fuzzy import _split_camel, fuzzy_score
+from core.utils.widgets.quick_launch.fuzzy import AppSearchIndex
 from core.utils.widgets.quick_launch.providers.resources.icons import ICON_APPS
 
 
@@ -274,6 +274,10 @@ class AppsProvider(BaseProvider):
         self._history = LaunchHistory()
         self._desc_cache: dict[str, str] = {}
         self._desc_worker: DescriptionResolverWorker | None = None
+        # Matches of the previous query, narrowed when the next query extends it
+        self._last_index: AppSearchIndex | None = None
+        self._last_query = ""
+        self._last_matches: list[int] = []
 
     @property
     def service(self):
@@ -327,28 +331,24 @@ class AppsProvider(BaseProvider):
                 apps = [(n, p) for n, p, _ in sorted(svc.apps, key=lambda a: (_is_subfolder_app(a[1]), a[0].lower()))]
         else:
             # Search query fuzzy match by name, fallback to app id
+            index = svc.app_index
+            candidates = None
+            if index is self._last_index and self._last_query and text_lower.startswith(self._last_query):
+                # Every match of the extended query also matched the previous one
+                candidates = self._last_matches
+            matches = index.search(text_lower, candidates)
+            self._last_index = index
+            self._last_query = text_lower
+            self._last_matches = [i for i, _ in matches]
+
             scored_apps: list[tuple[float, str, str]] = []
-            for n, p, _ in svc.apps:
-                fs = fuzzy_score(text_lower, n)
-                if fs is None and p.startswith("UWP::"):
-                    appid = p[5:].split("!")[0].split("_")[0]
-                    pkg_name = appid.rsplit(".", 1)[-1] if "." in appid else appid
-                    # Split CamelCase (WindowsTerminal -> Windows Terminal)
-                    # and match against the human-readable form.
-                    pkg_words = _split_camel(pkg_name)
-                    pkg_fs = fuzzy_score(text_lower, pkg_words)
-                    if pkg_fs is not None:
-                        # Cap package-name matches between word-prefix (3)
-                        # and prefix (4). Frecency can bridge the gap to
-                        # higher tiers for frequently used apps.
-                        fs = min(pkg_fs, 3.5)
-                if fs is not None:
-                    # Demote apps with default icon (system shortcuts,
-                    # not real apps) so they sink below real app matches.
-                    icon = svc.icon_paths.get(f"{n}::{p}", "")
-                    if icon.endswith("_default_app.png"):
-                        fs = min(fs, 0.5)
-                    scored_apps.append((float(fs), n, p))
+            for i, fs in matches:
+                # Demote apps with default icon (system shortcuts,
+                # not real apps) so they sink below real app matches.
+                icon = svc.icon_paths.get(index.keys[i], "")
+                if icon.endswith("_default_app.png"):
+                    fs = min(fs, 0.5)
+                scored_apps.append((fs, index.names[i], index.paths[i]))
 
             if show_recent:
                 for i, (fs, n, p) in enumerate(scored_apps):
@@ -6,6 +6,7 @@ from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
 from core.utils.widgets.quick_launch.base_provider import BaseProvider
+from core.utils.widgets.quick_launch.fuzzy import AppSearchIndex
 from core.utils.widgets.quick_launch.icon_resolver import IconResolverWorker, compute_extraction_size
 from core.utils.widgets.quick_launch.providers import (
     AppsProvider,
@@ -72,8 +73,8 @@ class QuickLaunchService(QObject):
     """Quick Launch service."""
 
     request_refresh = pyqtSignal()
-    icon_ready = pyqtSignal(str, str)
-    query_finished = pyqtSignal(str, list)
+    icons_ready = pyqtSignal(list)
+    query_finished = pyqtSignal(str, list, bool)
 
     _instance: QuickLaunchService | None = None
 
@@ -87,6 +88,7 @@ class QuickLaunchService(QObject):
         super().__init__()
 
         self._apps: list[tuple[str, str, object]] = []
+        self._app_index = AppSearchIndex([])
         self._apps_loaded = False
         self._icon_paths: dict[str, str] = {}
         self._providers: list[BaseProvider] = []
@@ -111,6 +113,10 @@ class QuickLaunchService(QObject):
     def apps(self) -> list[tuple[str, str, object]]:
         return self._apps
 
+    @property
+    def app_index(self) -> AppSearchIndex:
+        return self._app_index
+
     @property
     def apps_loaded(self) -> bool:
         return self._apps_loaded
@@ -153,24 +159,46 @@ class QuickLaunchService(QObject):
         self._query_worker.submit(query_id, text, max_results, list(self._providers))
         return query_id
 
-    def _on_query_finished(self, query_id: str, results: list):
-        self.query_finished.emit(query_id, results)
+    def provider_stats(self) -> dict[str, dict]:
+        """Per-provider query latency stats collected by the query worker."""
+        return self._query_worker.provider_stats()
 
-    def _start_app_loading(self):
+    def _on_query_finished(self, query_id: str, results: list, final: bool):
+        self.query_finished.emit(query_id, results, final)
+
+    def _start_app_loading(self, refresh: bool = False):
         if self._app_loader:
             self._app_loader.apps_loaded.disconnect(self._on_apps_loaded)
-        self._app_loader = AppListLoader()
+            self._app_loader.apps_changed.disconnect(self._on_apps_changed)
+        self._app_loader = AppListLoader(refresh=refresh)
         self._app_loader.apps_loaded.connect(self._on_apps_loaded)
+        self._app_loader.apps_changed.connect(self._on_apps_changed)
         self._app_loader.start()
 
     def _on_apps_loaded(self, apps: list):
         self._apps = apps
+        self._app_index = AppSearchIndex(apps)
         self._apps_loaded = True
         if self._show_icons:
             self._start_icon_resolution()
         self._start_description_resolution()
         self.request_refresh.emit()
 
+    def _on_apps_changed(self, delta):
+        """Apply a catalog refresh, only icons of added or changed apps are resolved again."""
+        self._apps = delta.apps
+        self._app_index = AppSearchIndex(delta.apps)
+        self._apps_loaded = True
+        for name, path, _ in delta.removed:
+            self._icon_paths.pop(f"{name}::{path}", None)
+        if self._show_icons:
+            changed = set(delta.added) | set(delta.updated)
+            pending = [app for app in delta.apps if app in changed or f"{app[0]}::{app[1]}" not in self._icon_paths]
+            if pending:
+                self._start_icon_resolution(pending)
+        self._start_description_resolution()
+        self.request_refresh.emit()
+
     def _start_description_resolution(self):
         for provider in self._providers:
             if isinstance(provider, AppsProvider):
@@ -178,9 +206,9 @@ class QuickLaunchService(QObject):
                     provider.start_description_resolution(self._apps)
                 break
 
-    def _start_icon_resolution(self):
+    def _start_icon_resolution(self, apps: list | None = None):
         if self._icon_worker and self._icon_worker.isRunning():
-            self._icon_worker.icon_ready.disconnect(self._on_icon_ready)
+            self._icon_worker.icons_ready.disconnect(self._on_icons_ready)
             self._icon_worker.stop()
             self._icon_worker.wait()
 
@@ -189,13 +217,13 @@ class QuickLaunchService(QObject):
         if screen:
             dpr = screen.devicePixelRatio()
         size = compute_extraction_size(self._icon_size, dpr)
-        self._icon_worker = IconResolverWorker(self._apps, self._icons_dir, size=size)
-        self._icon_worker.icon_ready.connect(self._on_icon_ready)
+        self._icon_worker = IconResolverWorker(self._apps if apps is None else apps, self._icons_dir, size=size)
+        self._icon_worker.icons_ready.connect(self._on_icons_ready)
         self._icon_worker.start()
 
-    def _on_icon_ready(self, app_key: str, icon_path: str):
-        self._icon_paths[app_key] = icon_path
-        self.icon_ready.emit(app_key, icon_path)
+    def _on_icons_ready(self, icons: list):
+        self._icon_paths.update(icons)
+        self.icons_ready.emit(icons)
 
     def _setup_fs_watcher(self):
         self._fs_watcher = QFileSystemWatcher(self)
@@ -211,4 +239,4 @@ class QuickLaunchService(QObject):
     def _on_fs_change(self):
         logging.info("Quick Launch rebuilding app list after install/uninstall detected")
         AppListLoader.clear_cache()
-        self._start_app_loading()
+        self._start_app_loading(refresh=True)
@@ -1,7 +1,10 @@
 import logging
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from queue import Empty, SimpleQueue
-from threading import Event
+from threading import Event, Lock
+from weakref import WeakKeyDictionary
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -32,21 +35,68 @@ class StartMenuWatcherThread(QThread):
         self.dirs_ready.emit(dirs)
 
 
+class ProviderStats:
+    """Latency counters of a single provider, updated by the query worker."""
+
+    __slots__ = ("calls", "total_ms", "max_ms", "last_ms", "timeouts", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.timeouts = 0
+        self.errors = 0
+
+    def record(self, elapsed_ms: float):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "last_ms": round(self.last_ms, 2),
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
 class QueryWorker(QThread):
-    """Persistent single-thread query executor.
+    """Persistent query dispatcher.
 
     A single thread stays alive for the lifetime of the service.
     New queries are submitted via `submit()` which cancels any
     in-progress work and queues the new query. The thread drains
     the queue to only process the latest query, avoiding wasted work.
+
+    Non-prefixed providers run concurrently on a bounded pool. Every time
+    a provider completes, the results collected so far are emitted as a
+    partial update, ordered by provider priority. The final update is
+    emitted once all providers completed or the query deadline passed;
+    providers still running at that point are cancelled and ignored. A provider
+    that is still busy with a cancelled query is skipped for the new one.
     """
 
-    finished = pyqtSignal(str, list)
+    # query_id, results, final
+    finished = pyqtSignal(str, list, bool)
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, deadline: float = 3.0):
         super().__init__()
         self._queue: SimpleQueue[tuple[str, str, int, list] | None] = SimpleQueue()
         self._cancel = Event()
+        self._deadline = deadline
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quick_launch_query")
+        # A provider runs at most one query at a time, calls while a cancelled one is still
+        # finishing are skipped
+        self._provider_locks: WeakKeyDictionary[object, Lock] = WeakKeyDictionary()
+        self._stats: dict[str, ProviderStats] = {}
+        # Also guards creating provider locks, concurrent queries must not get two locks for one provider
+        self._stats_lock = Lock()
 
     def submit(self, query_id: str, text: str, max_results: int, providers: list):
         self._cancel.set()
@@ -55,6 +105,12 @@ class QueryWorker(QThread):
     def shutdown(self):
         self._cancel.set()
         self._queue.put(None)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def provider_stats(self) -> dict[str, dict]:
+        """Return per-provider latency stats, useful for tuning provider `priority`."""
+        with self._stats_lock:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
 
     def run(self):
         while True:
@@ -72,34 +128,108 @@ class QueryWorker(QThread):
                     break
 
             query_id, text, max_results, providers = item
-            self._cancel.clear()
-            self._run_query(query_id, text.lstrip(), max_results, providers)
+            # Each query gets its own event so providers of a cancelled query stay cancelled
+            self._cancel = Event()
+            self._run_query(query_id, text.lstrip(), max_results, providers, self._cancel)
 
-    def _run_query(self, query_id: str, text: str, max_results: int, providers: list):
-        all_results: list[ProviderResult] = []
+    def _run_query(self, query_id: str, text: str, max_results: int, providers: list, cancel: Event):
         try:
             # Prefixed providers get exclusive handling (require prefix + space)
             for provider in providers:
-                if self._cancel.is_set():
+                if cancel.is_set():
                     return
                 if provider.prefix and text.startswith(provider.prefix + " "):
-                    results = provider.get_results(text, cancel_event=self._cancel)[:max_results]
-                    if not self._cancel.is_set():
-                        self.finished.emit(query_id, results)
+                    results = self._call_provider(provider, text, cancel)[:max_results]
+                    if not cancel.is_set():
+                        self.finished.emit(query_id, results, True)
                     return
 
             # Non-prefixed providers contribute to combined results
-            for provider in providers:
-                if self._cancel.is_set():
-                    return
-                if provider.prefix:
+            active = [p for p in providers if not p.prefix and p.match(text)]
+            futures = {
+                self._pool.submit(self._call_provider, provider, text, cancel): index
+                for index, provider in enumerate(active)
+            }
+            collected: list[list[ProviderResult] | None] = [None] * len(active)
+            pending = set(futures)
+            deadline = time.perf_counter() + self._deadline
+            while pending and not cancel.is_set():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
                     continue
-                if provider.match(text):
-                    all_results.extend(provider.get_results(text, cancel_event=self._cancel))
+                for future in done:
+                    collected[futures[future]] = future.result()
+                if pending and not cancel.is_set():
+                    self.finished.emit(query_id, self._merge(collected, max_results), False)
 
-            if not self._cancel.is_set():
-                self.finished.emit(query_id, all_results[:max_results])
+            if cancel.is_set():
+                return
+            if pending:
+                # Deadline passed, let the stragglers know their results are no longer wanted
+                cancel.set()
+                with self._stats_lock:
+                    for future in pending:
+                        self._get_stats(active[futures[future]]).timeouts += 1
+                logging.debug(
+                    "Quick launch query deadline passed, dropped providers: %s",
+                    ", ".join(active[futures[f]].name for f in pending),
+                )
+            self.finished.emit(query_id, self._merge(collected, max_results), True)
         except Exception as e:
             logging.debug("Query worker error: %s", e)
-            if not self._cancel.is_set():
-                self.finished.emit(query_id, [])
+            if not cancel.is_set():
+                self.finished.emit(query_id, [], True)
+
+    def _provider_lock(self, provider) -> Lock:
+        with self._stats_lock:
+            lock = self._provider_locks.get(provider)
+            if lock is None:
+                lock = self._provider_locks[provider] = Lock()
+            return lock
+
+    def _call_provider(self, provider, text: str, cancel: Event) -> list[ProviderResult]:
+        lock = self._provider_lock(provider)
+        if not lock.acquire(blocking=False):
+            # A cancelled query is still inside the provider, waiting for it would hold a pool
+            # worker that faster providers of the new query need
+            with self._stats_lock:
+                self._get_stats(provider).timeouts += 1
+            logging.debug("Quick launch provider %s is busy, skipped", provider.name)
+            return []
+        try:
+            if cancel.is_set():
+                return []
+            start = time.perf_counter()
+            try:
+                results = provider.get_results(text, cancel_event=cancel)
+            except Exception as e:
+                logging.debug("Quick launch provider %s failed: %s", provider.name, e)
+                with self._stats_lock:
+                    self._get_stats(provider).errors += 1
+                return []
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if not cancel.is_set():
+                with self._stats_lock:
+                    self._get_stats(provider).record(elapsed_ms)
+            return results
+        finally:
+            lock.release()
+
+    def _get_stats(self, provider) -> ProviderStats:
+        stats = self._stats.get(provider.name)
+        if stats is None:
+            stats = self._stats[provider.name] = ProviderStats()
+        return stats
+
+    @staticmethod
+    def _merge(collected: list[list[ProviderResult] | None], max_results: int) -> list[ProviderResult]:
+        merged: list[ProviderResult] = []
+        for results in collected:
+            if results:
+                merged.extend(results)
+                if len(merged) >= max_results:
+                    break
+        return merged[:max_results]
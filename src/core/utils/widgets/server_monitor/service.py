@@ -12,6 +12,7 @@ class ServerCheckService(QObject):
     """Server-check runner."""
 
     status_updated = pyqtSignal(int, list)
+    server_checked = pyqtSignal(int, dict)
     refresh_started = pyqtSignal()
 
     _instances: ClassVar[dict[tuple, ServerCheckService]] = {}
@@ -57,6 +58,7 @@ class ServerCheckService(QObject):
         self._worker = ServerCheckWorker()
         self._worker.set_servers(servers, ssl_verify, ssl_check, timeout)
         self._worker.status_updated.connect(self._on_worker_status_updated)
+        self._worker.server_checked.connect(self._on_worker_server_checked)
 
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._start_if_idle)
@@ -103,3 +105,6 @@ class ServerCheckService(QObject):
 
     def _on_worker_status_updated(self, status_list: list) -> None:
         self.status_updated.emit(self._run_id, status_list)
+
+    def _on_worker_server_checked(self, status: dict) -> None:
+        self.server_checked.emit(self._run_id, status)
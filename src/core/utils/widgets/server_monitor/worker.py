@@ -1,8 +1,10 @@
+import http.client
 import logging
 import socket
 import ssl
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -10,9 +12,39 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 logger = logging.getLogger("server_monitor")
 
+# Upper bound of servers probed at the same time
+MAX_CONCURRENT_CHECKS = 8
+
+
+class _CertRecordingHTTPSHandler(urllib.request.HTTPSHandler):
+    """HTTPS handler that keeps the peer certificate of the last connection it opened.
+
+    Redirects open a new connection per hop, so after `urlopen` returns the recorded
+    certificate belongs to the host that served the final response.
+    """
+
+    def __init__(self, context: ssl.SSLContext | None = None):
+        super().__init__(context=context)
+        self._ssl_context = context
+        self.peer_cert: dict | None = None
+
+    def https_open(self, req):
+        return self.do_open(self._connect, req, context=self._ssl_context)
+
+    def _connect(self, host, **kwargs):
+        handler = self
+
+        class _Connection(http.client.HTTPSConnection):
+            def connect(self):
+                super().connect()
+                handler.peer_cert = self.sock.getpeercert()
+
+        return _Connection(host, **kwargs)
+
 
 class ServerCheckWorker(QThread):
     status_updated = pyqtSignal(list)
+    server_checked = pyqtSignal(dict)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -33,20 +65,32 @@ class ServerCheckWorker(QThread):
         self.wait()
 
     def run(self) -> None:
-        if not self.running:
+        if not self.running or not self.servers:
             return
 
-        server_statuses: list[dict] = []
-
-        for server in self.servers:
-            if not self.running:
-                break
+        server_statuses: list[dict | None] = [None] * len(self.servers)
 
-            status = self.check_single_server(server["url"], self.ssl_verify, self.ssl_check, self.timeout)
-            status["name"] = server["name"]
-            server_statuses.append(status)
-
-        self.status_updated.emit(server_statuses)
+        pool = ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_CHECKS, len(self.servers)), thread_name_prefix="server_check"
+        )
+        try:
+            futures = {
+                pool.submit(self.check_single_server, server["url"], self.ssl_verify, self.ssl_check, self.timeout): i
+                for i, server in enumerate(self.servers)
+            }
+            for future in as_completed(futures):
+                if not self.running:
+                    break
+                index = futures[future]
+                status = future.result()
+                status["name"] = self.servers[index]["name"]
+                server_statuses[index] = status
+                self.server_checked.emit(status)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # Keep the configured server order
+        self.status_updated.emit([status for status in server_statuses if status is not None])
 
     def check_single_server(self, server: str, ssl_verify: bool, ssl_check: bool, timeout: int) -> dict:
         ping_result = self.ping_server(server, ssl_verify, ssl_check, timeout)
@@ -73,12 +117,16 @@ class ServerCheckWorker(QThread):
             context.check_hostname = False
             context.verify_mode = ssl.CERT_NONE
 
+        # The certificate is read from the request's own TLS handshake
+        cert_handler = _CertRecordingHTTPSHandler(context=context)
+        opener = urllib.request.build_opener(cert_handler)
+
         try:
             start_time = datetime.now()
             request = urllib.request.Request(url, method="GET")
 
             try:
-                with urllib.request.urlopen(request, timeout=timeout, context=context) as response:
+                with opener.open(request, timeout=timeout) as response:
                     http_status = response.status
                     parsed_url = urlparse(response.url)
                     final_hostname = parsed_url.netloc or server
@@ -107,7 +155,13 @@ class ServerCheckWorker(QThread):
         status = "Online" if http_status is not None and http_status < 500 else "Offline"
 
         # Only attempt SSL expiry checks when online.
-        ssl_days = self.check_ssl_expiry(final_hostname, timeout) if (ssl_check and status == "Online") else None
+        ssl_days = None
+        if ssl_check and status == "Online":
+            if cert_handler.peer_cert and "notAfter" in cert_handler.peer_cert:
+                ssl_days = self._days_until_expiry(cert_handler.peer_cert)
+            else:
+                # Unverified handshakes (ssl_verify disabled) don't expose the decoded certificate
+                ssl_days = self.check_ssl_expiry(final_hostname, timeout)
 
         return {
             "status": status,
@@ -122,9 +176,7 @@ class ServerCheckWorker(QThread):
             context = ssl.create_default_context()
             with socket.create_connection((hostname, 443), timeout=timeout) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
-                    exp_date = datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z")
-                    return (exp_date - datetime.now()).days
+                    return self._days_until_expiry(ssock.getpeercert())
         except OSError as e:
             reason = str(e).lower()
             if "getaddrinfo" in reason or "name or service not known" in reason:
@@ -132,3 +184,8 @@ class ServerCheckWorker(QThread):
             else:
                 logger.debug("SSL check failed for '%s': connection error", hostname)
             return None
+
+    @staticmethod
+    def _days_until_expiry(cert: dict) -> int:
+        exp_date = datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z")
+        return (exp_date - datetime.now()).days
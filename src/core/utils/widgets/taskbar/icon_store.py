@@ -0,0 +1,120 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from PIL import Image
+from PyQt6.QtGui import QImage, QPixmap
+
+from core.utils.singleton import Singleton
+
+# Window lookups remembered per (hwnd, title, pixel size, dpr), they only point into the pixmap store
+MAX_WINDOW_KEYS = 2048
+
+
+class TaskbarIconStore(metaclass=Singleton):
+    """Process-wide store of taskbar icon pixmaps shared by all taskbar widgets.
+
+    Pixmaps are keyed by a hash of the source icon content and the target pixel size,
+    so windows showing the same icon (or a window whose title changed) share one
+    resized pixmap. Least recently used pixmaps are evicted once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._pixmaps: OrderedDict[Hashable, tuple[QPixmap, int]] = OrderedDict()
+        self._window_keys: OrderedDict[tuple, Hashable] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def window_icon(
+        self,
+        hwnd: int,
+        title: str,
+        pixel_size: int,
+        dpr: float,
+        loader: Callable[[int], Image.Image | None],
+    ) -> QPixmap | None:
+        """Return the pixmap of a window icon, calling `loader(hwnd)` only when the window is not known yet."""
+        window_key = (hwnd, title, pixel_size, dpr)
+        key = self._window_keys.get(window_key)
+        if key is not None:
+            pixmap = self.get(key)
+            if pixmap is not None:
+                self._window_keys.move_to_end(window_key)
+                return pixmap
+        image = loader(hwnd)
+        if image is None:
+            return None
+        key = self.image_key(image, pixel_size, dpr)
+        pixmap = self.get(key)
+        if pixmap is None:
+            pixmap = self.put(key, self._to_pixmap(image, pixel_size, dpr))
+        self._window_keys[window_key] = key
+        self._window_keys.move_to_end(window_key)
+        while len(self._window_keys) > MAX_WINDOW_KEYS:
+            self._window_keys.popitem(last=False)
+        return pixmap
+
+    def image_pixmap(
+        self, key: Hashable, pixel_size: int, dpr: float, loader: Callable[[], Image.Image | None]
+    ) -> QPixmap | None:
+        """Return the pixmap stored under a caller defined key, e.g. for stock icons."""
+        full_key = (key, pixel_size, dpr)
+        pixmap = self.get(full_key)
+        if pixmap is not None:
+            return pixmap
+        image = loader()
+        if image is None:
+            return None
+        return self.put(full_key, self._to_pixmap(image, pixel_size, dpr))
+
+    @staticmethod
+    def image_key(image: Image.Image, pixel_size: int, dpr: float) -> tuple:
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        return (digest, image.size, image.mode, pixel_size, dpr)
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        entry = self._pixmaps.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> QPixmap:
+        size = pixmap.width() * pixmap.height() * 4
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._pixmaps[key] = (pixmap, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, (_, evicted_size) = self._pixmaps.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+        return pixmap
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._window_keys.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+        }
+
+    @staticmethod
+    def _to_pixmap(image: Image.Image, pixel_size: int, dpr: float) -> QPixmap:
+        image = image.resize((pixel_size, pixel_size), Image.LANCZOS).convert("RGBA")
+        qimage = QImage(image.tobytes(), image.width, image.height, QImage.Format.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(qimage)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
@@ -0,0 +1,71 @@
+import logging
+import threading
+from ctypes import byref, wintypes
+
+from core.utils.widgets.telemetry.scheduler import Collector
+from core.utils.win32.bindings.pdh import pdh
+
+
+class PdhQuery(Collector):
+    """
+    A PDH query shared by several metric sources.
+
+    Sources add their counters to the query and the sampler collects it once per tick
+    with a single `PdhCollectQueryData` call before the due sources read their values.
+    The query is opened lazily and reopened after `close`, sources re-add their counters
+    when they are opened again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handle: wintypes.HANDLE | None = None
+        self._open_failed = False
+
+    @property
+    def handle(self) -> wintypes.HANDLE | None:
+        """The open query handle, None if PDH is unavailable."""
+        with self._lock:
+            if self._handle is None and not self._open_failed:
+                handle = wintypes.HANDLE()
+                status = pdh.PdhOpenQueryW(None, None, byref(handle))
+                if status != 0:
+                    self._open_failed = True
+                    logging.warning("Failed to open PDH query (status=%s)", status)
+                else:
+                    self._handle = handle
+            return self._handle
+
+    def add_counter(self, path: str) -> tuple[int, wintypes.HANDLE | None]:
+        """Add an English counter path, returns the PDH status and the counter handle."""
+        query = self.handle
+        if query is None:
+            return -1, None
+        counter = wintypes.HANDLE()
+        status = pdh.PdhAddEnglishCounterW(query, path, None, byref(counter))
+        return status, counter if status == 0 else None
+
+    def remove_counter(self, counter: wintypes.HANDLE | None) -> None:
+        with self._lock:
+            if counter is not None and self._handle is not None:
+                pdh.PdhRemoveCounter(counter)
+
+    def collect(self) -> int:
+        """Collect all counters of the query, returns the PDH status."""
+        with self._lock:
+            if self._handle is None:
+                return -1
+            return pdh.PdhCollectQueryData(self._handle)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                try:
+                    pdh.PdhCloseQuery(self._handle)
+                except Exception:
+                    pass
+            self._handle = None
+            self._open_failed = False
+
+
+# Query holding the cheap system counters (cpu and paging file)
+SYSTEM_QUERY = PdhQuery()
@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from core.utils.widgets.telemetry.scheduler import MetricSource, SampleScheduler, Subscription
+
+
+class SampleSubscription(QObject):
+    """Qt side of a subscription, `data_ready` is emitted on the owner's thread.
+
+    Destroying the subscription, e.g. together with its parent widget, unsubscribes it.
+    """
+
+    data_ready = pyqtSignal(object)
+
+    def __init__(self, sampler: TelemetrySampler, parent: QObject | None = None):
+        super().__init__(parent)
+        self._sampler = sampler
+        self._subscription: Subscription | None = None
+
+    def cancel(self) -> None:
+        if self._subscription is not None:
+            self._sampler._unsubscribe(self._subscription)
+            self._subscription = None
+
+    def _deliver(self, value: object) -> None:
+        try:
+            self.data_ready.emit(value)
+        except RuntimeError:
+            # The owning widget is gone
+            self.cancel()
+
+
+class TelemetrySampler:
+    """
+    Samples system metrics (cpu, memory, gpu, disk, network) on one background thread.
+
+    Widgets subscribe to a `MetricSource` at their own update interval, all sources are
+    driven by a single `SampleScheduler` so wakeups of different metrics are aligned and
+    sources sharing a collector (e.g. a PDH query) are collected once per tick.
+    """
+
+    _instance: TelemetrySampler | None = None
+
+    @classmethod
+    def instance(cls) -> TelemetrySampler:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, tick_ms: int = 250):
+        self._scheduler = SampleScheduler(tick_ms)
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def subscribe(self, source: MetricSource, interval_ms: int, parent: QObject | None = None) -> SampleSubscription:
+        """Subscribe to a source, the returned object emits `data_ready` every `interval_ms`."""
+        handle = SampleSubscription(self, parent)
+        with self._condition:
+            subscription = self._scheduler.subscribe(source, interval_ms, handle._deliver)
+            handle._subscription = subscription
+            self._condition.notify()
+        # Plain function so the connection doesn't keep the deleted wrapper alive
+        handle.destroyed.connect(lambda _=None, s=subscription: self._unsubscribe(s))
+        self._ensure_running()
+        return handle
+
+    def source(self, key) -> MetricSource | None:
+        """Return the registered source with this key, e.g. to adjust it for a new subscriber."""
+        with self._condition:
+            return self._scheduler.source(key)
+
+    def stats(self) -> dict[str, object]:
+        with self._condition:
+            return self._scheduler.stats()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=2)
+        self._thread = None
+        with self._condition:
+            self._scheduler.close()
+        TelemetrySampler._instance = None
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._condition:
+            self._scheduler.unsubscribe(subscription)
+            self._condition.notify()
+
+    def _ensure_running(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="TelemetrySampler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                wakeup = self._scheduler.next_wakeup()
+                timeout = None if wakeup is None else wakeup - time.monotonic()
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+                batch = self._scheduler.take_due()
+            # Sample and deliver outside the lock, a slow source (e.g. a sleeping network drive)
+            # must not block subscribing from the GUI thread, and unsubscribing from a slot must
+            # not deadlock
+            try:
+                deliveries = self._scheduler.sample_due(batch)
+            except Exception as e:
+                logging.error("Telemetry sampler error: %s", e)
+                deliveries = []
+            for subscription, value in deliveries:
+                subscription.callback(value)
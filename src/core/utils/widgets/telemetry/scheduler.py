@@ -0,0 +1,243 @@
+"""
+Multi-rate scheduler for telemetry sources.
+
+This module has no Qt or Windows dependencies so it can be driven with fake sources and a
+fake clock. `TelemetrySampler` runs it on a background thread.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+
+
+class Collector:
+    """A collection step shared by several sources, e.g. one PDH query holding their counters.
+
+    `collect` runs once per tick before any of the due sources using it are sampled.
+    """
+
+    def collect(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MetricSource:
+    """A metric sampled by the scheduler.
+
+    Sources are identified by `key`, subscribing with a new source object whose key is
+    already registered reuses the registered one. `open` and `close` run on the sampling
+    thread, `sample` returns the value delivered to the due subscribers.
+    """
+
+    key: Hashable = None
+    # Fastest rate the source may be sampled at
+    min_interval_ms: int = 250
+    collector: Collector | None = None
+
+    def open(self) -> None:
+        pass
+
+    def sample(self) -> object:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass(eq=False)
+class Subscription:
+    """A consumer of a source at its own interval."""
+
+    source_key: Hashable
+    interval: float
+    callback: Callable[[object], None]
+    next_due: float = 0.0
+    delivered: int = 0
+
+
+@dataclass(eq=False)
+class _SourceState:
+    source: MetricSource
+    subscriptions: list[Subscription] = field(default_factory=list)
+    opened: bool = False
+    samples: int = 0
+    errors: int = 0
+    last_duration: float = 0.0
+
+
+@dataclass(eq=False)
+class DueBatch:
+    """Work picked by `SampleScheduler.take_due` for one wakeup."""
+
+    due: list[tuple[_SourceState, list[Subscription]]]
+    closing: list[_SourceState]
+    # ids of the collectors of the sources registered when the batch was taken
+    collectors_in_use: set[int]
+
+
+class SampleScheduler:
+    """
+    Schedules sampling of registered sources for their subscribers.
+
+    Intervals are rounded up to a multiple of `tick_ms` and due times are aligned to
+    multiples of the interval, so subscribers at 1 s and 2 s wake up together. A source is
+    sampled at most once per tick and the value goes to every subscriber due at that tick,
+    slower subscribers simply skip the samples in between. Collectors shared by the due
+    sources run once per tick.
+    """
+
+    def __init__(self, tick_ms: int = 250, clock: Callable[[], float] = time.monotonic):
+        self.tick = tick_ms / 1000
+        self._clock = clock
+        self._sources: dict[Hashable, _SourceState] = {}
+        self._closing: list[_SourceState] = []
+        self.ticks = 0
+
+    def subscribe(self, source: MetricSource, interval_ms: int, callback: Callable[[object], None]) -> Subscription:
+        state = self._sources.get(source.key)
+        if state is None:
+            state = self._sources[source.key] = _SourceState(source)
+        interval_ms = max(interval_ms, state.source.min_interval_ms)
+        interval = math.ceil(interval_ms / 1000 / self.tick) * self.tick
+        subscription = Subscription(source.key, interval, callback)
+        subscription.next_due = self._next_aligned(self._clock(), interval)
+        state.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        state = self._sources.get(subscription.source_key)
+        if state is None or subscription not in state.subscriptions:
+            return
+        state.subscriptions.remove(subscription)
+        if not state.subscriptions:
+            del self._sources[subscription.source_key]
+            # Closed by the next sample_due, a running one may still be opening it
+            self._closing.append(state)
+
+    def source(self, key: Hashable) -> MetricSource | None:
+        state = self._sources.get(key)
+        return state.source if state else None
+
+    def next_wakeup(self) -> float | None:
+        """Return the clock time of the next due subscription, None if there are none."""
+        if self._closing:
+            # Released sources are closed right away
+            return self._clock()
+        return min(
+            (sub.next_due for state in self._sources.values() for sub in state.subscriptions),
+            default=None,
+        )
+
+    def take_due(self, now: float | None = None) -> DueBatch | None:
+        """Pick the due subscriptions and schedule their next run, None if there is nothing to do.
+
+        Only touches the bookkeeping, the slow part happens in `sample_due` so a caller holding
+        a lock around the scheduler can release it while sources are sampled.
+        """
+        if now is None:
+            now = self._clock()
+        closing, self._closing = self._closing, []
+        due_states = []
+        for state in self._sources.values():
+            due = [sub for sub in state.subscriptions if sub.next_due <= now]
+            if due:
+                for sub in due:
+                    sub.next_due = self._next_aligned(now, sub.interval)
+                due_states.append((state, due))
+        if not closing and not due_states:
+            return None
+        if due_states:
+            self.ticks += 1
+        # Collectors still used by a registered source stay open
+        in_use = {id(state.source.collector) for state in self._sources.values()}
+        return DueBatch(due_states, closing, in_use)
+
+    def sample_due(self, batch: DueBatch | None) -> list[tuple[Subscription, object]]:
+        """Close released sources, sample the due ones and return the values to deliver.
+
+        Only reads the batch, so it may run without the lock that guards `take_due`.
+        """
+        if batch is None:
+            return []
+        self._close_states(batch.closing, batch.collectors_in_use)
+
+        collected = set()
+        for state, _ in batch.due:
+            collector = state.source.collector
+            if collector is not None and id(collector) not in collected:
+                collected.add(id(collector))
+                try:
+                    collector.collect()
+                except Exception as e:
+                    logging.debug("Telemetry collector %s failed: %s", type(collector).__name__, e)
+
+        deliveries = []
+        for state, due in batch.due:
+            started = self._clock()
+            try:
+                if not state.opened:
+                    state.source.open()
+                    state.opened = True
+                value = state.source.sample()
+            except Exception as e:
+                state.errors += 1
+                logging.debug("Telemetry source %s failed: %s", state.source.key, e)
+                continue
+            state.samples += 1
+            state.last_duration = self._clock() - started
+            for sub in due:
+                sub.delivered += 1
+                deliveries.append((sub, value))
+        return deliveries
+
+    def run_due(self, now: float | None = None) -> list[tuple[Subscription, object]]:
+        """Sample all sources with a due subscription and return the values to deliver."""
+        return self.sample_due(self.take_due(now))
+
+    def close(self) -> None:
+        closing, self._closing = [*self._closing, *self._sources.values()], []
+        self._sources.clear()
+        self._close_states(closing, set())
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "ticks": self.ticks,
+            "sources": {
+                str(key): {
+                    "subscribers": len(state.subscriptions),
+                    "samples": state.samples,
+                    "errors": state.errors,
+                    "last_duration_ms": round(state.last_duration * 1000, 2),
+                }
+                for key, state in self._sources.items()
+            },
+        }
+
+    def _next_aligned(self, now: float, interval: float) -> float:
+        # Small epsilon so a tick that fires right on time isn't scheduled twice
+        return (math.floor(now / interval + 1e-6) + 1) * interval
+
+    def _close_states(self, closing: list[_SourceState], collectors_in_use: set[int]) -> None:
+        """Close sources whose last subscriber is gone, and collectors no registered source uses."""
+        for state in closing:
+            if not state.opened:
+                continue
+            current = self._sources.get(state.source.key)
+            if current is not None and current.source is state.source:
+                # Subscribed again before it was closed
+                current.opened = True
+                continue
+            try:
+                state.source.close()
+            except Exception as e:
+                logging.debug("Failed to close telemetry source %s: %s", state.source.key, e)
+            collector = state.source.collector
+            if collector is not None and id(collector) not in collectors_in_use:
+                try:
+                    collector.close()
+                except Exception as e:
+                    logging.debug("Failed to close telemetry collector: %s", e)
@@ -7,6 +7,7 @@ from datetime import datetime
 from PyQt6.QtWidgets import QApplication
 
 from core.utils.system import app_data_path
+from core.utils.widgets.telemetry.scheduler import MetricSource
 from core.utils.widgets.traffic.network_api import NetworkAPI
 
 
@@ -189,10 +190,15 @@ class TrafficDataManager:
         speed_threshold: dict[str, int],
         max_label_length: int = 0,
         max_label_length_align: str = "left",
+        current_io=None,
     ):
-        """Calculate all network data including speeds, totals, and handle counter resets"""
+        """Calculate all network data including speeds, totals, and handle counter resets
+
+        `current_io` are counters already sampled by the telemetry sampler, they are read here if omitted.
+        """
         try:
-            current_io = cls.get_interface_io_counters(interface)
+            if current_io is None:
+                current_io = cls.get_interface_io_counters(interface)
             if not current_io:
                 return None
 
@@ -540,3 +546,14 @@ class TrafficDataManager:
                 return f"{bits_per_sec:.{decimal_places}f} bps"
             else:
                 return "0 bps"
+
+
+class NetworkSource(MetricSource):
+    """IO counters of one interface, or of all interfaces for "auto"."""
+
+    def __init__(self, interface: str):
+        self.interface = interface
+        self.key = ("network", interface)
+
+    def sample(self):
+        return TrafficDataManager.get_interface_io_counters(self.interface)
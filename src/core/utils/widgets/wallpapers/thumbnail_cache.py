@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PyQt6.QtGui import QImage
+
+from core.utils.singleton import Singleton
+from core.utils.system import app_data_path
+
+THUMBNAIL_CACHE_DIR = "wallpaper_thumbnails"
+
+
+class WallpaperThumbnailCache(metaclass=Singleton):
+    """Thumbnails of wallpaper images, kept in memory and as small encoded files on disk.
+
+    Entries are addressed by a hash of the image path, its mtime and size, and the target
+    dimensions and DPR, so an edited or replaced image never hits a stale thumbnail.
+    Both tiers evict least recently used entries once their byte budget is exceeded.
+    All methods are thread safe and only deal with `QImage`, converting to `QPixmap`
+    is left to the GUI thread.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_disk_bytes: int = 128 * 1024 * 1024,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.directory = Path(directory) if directory else app_data_path(THUMBNAIL_CACHE_DIR)
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, QImage] = OrderedDict()
+        self._memory_bytes = 0
+        # File name -> size on disk, oldest first, loaded lazily
+        self._disk: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(image_path: str, width: int, height: int, dpr: float) -> str | None:
+        """Return the cache key of a thumbnail, or None if the image can't be accessed."""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        raw = (
+            f"{os.path.normcase(os.path.abspath(image_path))}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}@{dpr}"
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def cached(self, key: str | None) -> QImage | None:
+        """Return a thumbnail from memory only, cheap enough for the GUI thread."""
+        if key is None:
+            return None
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+            return image
+
+    def get(self, key: str | None) -> QImage | None:
+        """Return a thumbnail from memory or disk."""
+        image = self.cached(key)
+        if image is not None or key is None:
+            return image
+        with self._lock:
+            disk = self._load_disk_index()
+            name = self._file_name(key, disk)
+            if name is None:
+                self.misses += 1
+                return None
+            # Most recently used before loading, so a concurrent put evicts other files first
+            disk.move_to_end(name)
+        path = self.directory / name
+        image = QImage(str(path))
+        with self._lock:
+            if image.isNull():
+                # Corrupt, or removed behind our back or by an eviction while loading
+                self._forget_file(name)
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, image)
+        try:
+            # Keep the file's age meaningful for the eviction order of the next session
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def put(self, key: str | None, image: QImage) -> None:
+        """Store a thumbnail in memory and on disk."""
+        if key is None or image.isNull():
+            return
+        with self._lock:
+            self._remember(key, image)
+        # Thumbnails are cropped to fill their cell, only images that couldn't be read keep transparency
+        name = f"{key}.png" if image.hasAlphaChannel() else f"{key}.jpg"
+        path = self.directory / name
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            if not image.save(str(tmp_path), path.suffix[1:].upper(), 90):
+                return
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logging.debug("Failed to write wallpaper thumbnail %s: %s", path, e)
+            return
+        with self._lock:
+            disk = self._load_disk_index()
+            self._disk_bytes += size - disk.pop(name, 0)
+            disk[name] = size
+            self._evict_disk()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for name in list(self._load_disk_index()):
+                self._forget_file(name)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk or ()),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, image: QImage) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old.sizeInBytes()
+        self._memory[key] = image
+        self._memory_bytes += image.sizeInBytes()
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.sizeInBytes()
+
+    def _load_disk_index(self) -> OrderedDict[str, int]:
+        if self._disk is not None:
+            return self._disk
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.endswith(".tmp"):
+                        # Left over from an interrupted write
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+                        continue
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        except OSError:
+            pass
+        entries.sort()
+        self._disk = OrderedDict((name, size) for _, name, size in entries)
+        self._disk_bytes = sum(self._disk.values())
+        self._evict_disk()
+        return self._disk
+
+    def _file_name(self, key: str, disk: OrderedDict[str, int]) -> str | None:
+        for name in (f"{key}.jpg", f"{key}.png"):
+            if name in disk:
+                return name
+        return None
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            name = next(iter(self._disk))
+            self._forget_file(name)
+
+    def _forget_file(self, name: str) -> None:
+        self._disk_bytes -= self._disk.pop(name, 0)
+        try:
+            os.unlink(self.directory / name)
+        except OSError:
+            pass
@@ -42,7 +42,7 @@ class WallpaperManager(QObject):
 
         # Register Set Wallpaper handler
         self._set_wallpaper_signal.connect(self.change_background)
-        self._event_service.register_event("set_wallpaper_signal", self._set_wallpaper_signal)
+        self._event_service.register_event("set_wallpaper_signal", self._set_wallpaper_signal, owner=self)
 
     def configure(
         self, image_path: str | list[str], update_interval: int, change_automatically: bool, run_after: list[str]
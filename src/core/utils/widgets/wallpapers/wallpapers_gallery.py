@@ -16,7 +16,7 @@ from PyQt6.QtCore import (
     pyqtProperty,
     pyqtSignal,
 )
-from PyQt6.QtGui import QCursor, QImageReader, QPainter, QPainterPath, QPixmap, QWheelEvent
+from PyQt6.QtGui import QCursor, QImage, QImageReader, QPainter, QPainterPath, QPixmap, QWheelEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QFrame,
@@ -36,6 +36,7 @@ from PyQt6.QtWidgets import (
 from core.bar_helper import ThemeState
 from core.event_service import EventService
 from core.utils.utilities import refresh_widget_style
+from core.utils.widgets.wallpapers.thumbnail_cache import WallpaperThumbnailCache
 from core.utils.win32.backdrop import enable_blur
 from core.utils.win32.window_actions import force_foreground_focus
 
@@ -120,11 +121,16 @@ class HoverLabel(QFrame):
 
 
 class ImageSignals(QObject):
-    loaded = pyqtSignal(str, QPixmap, int)
+    loaded = pyqtSignal(str, QImage, int)
 
 
 class ImageLoader(QRunnable):
-    def __init__(self, image_path, width, height, corner_radius, index, dpr: float = 1.0):
+    """Produces the thumbnail of a wallpaper as a `QImage`, from the thumbnail cache when possible.
+
+    Loaders with a negative index only prefetch into the cache and emit nothing.
+    """
+
+    def __init__(self, image_path, width, height, corner_radius, index, dpr: float = 1.0, cache=None):
         super().__init__()
         self.image_path = image_path
         self.target_width = width
@@ -132,12 +138,31 @@ class ImageLoader(QRunnable):
         self.corner_radius = corner_radius
         self.index = index
         self.dpr = float(dpr) if dpr else 1.0
+        self.cache = cache
         self.signals = ImageSignals()
 
     def run(self):
         target_w = int(self.target_width * self.dpr)
         target_h = int(self.target_height * self.dpr)
 
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.image_path, target_w, target_h, self.dpr)
+            image = self.cache.get(key)
+            if image is not None:
+                self._emit(image)
+                return
+
+        image = self._render(target_w, target_h)
+        if self.cache is not None:
+            self.cache.put(key, image)
+        self._emit(image)
+
+    def _emit(self, image):
+        if self.index >= 0:
+            self.signals.loaded.emit(self.image_path, image, self.index)
+
+    def _render(self, target_w, target_h):
         # Get original image dimensions first
         reader = QImageReader(self.image_path)
         original_size = reader.size()
@@ -163,19 +188,23 @@ class ImageLoader(QRunnable):
             reader.setScaledSize(QSize(scaled_width, scaled_height))
             image = reader.read()
 
-        # Create a transparent pixmap of the target size
-        pixmap = QPixmap(target_w, target_h)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        # Calculate position to center the image (may crop edges)
+        x = (target_w - image.width()) // 2
+        y = (target_h - image.height()) // 2
+
+        if x <= 0 and y <= 0 and not image.isNull():
+            # The image fills the target area, a plain crop keeps it opaque
+            return image.copy(QRect(-x, -y, target_w, target_h))
+
+        # Create a transparent image of the target size
+        thumbnail = QImage(target_w, target_h, QImage.Format.Format_ARGB32_Premultiplied)
+        thumbnail.fill(Qt.GlobalColor.transparent)
 
         # Paint the image centered within the target area
-        painter = QPainter(pixmap)
+        painter = QPainter(thumbnail)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
 
-        # Calculate position to center the image (may crop edges)
-        x = (target_w - image.width()) // 2
-        y = (target_h - image.height()) // 2
-
         # Create source rectangle that ensures the image fills the target area
         source_x = max(0, -x)
         source_y = max(0, -y)
@@ -189,10 +218,7 @@ class ImageLoader(QRunnable):
             QRect(source_x, source_y, source_width, source_height),
         )
         painter.end()
-
-        pixmap.setDevicePixelRatio(self.dpr)
-
-        self.signals.loaded.emit(self.image_path, pixmap, self.index)
+        return thumbnail
 
 
 class ImageGallery(QMainWindow, BaseStyledWidget):
@@ -270,6 +296,7 @@ class ImageGallery(QMainWindow, BaseStyledWidget):
         self.is_loading = False
         self.threadpool = QThreadPool()
         self.threadpool.setMaxThreadCount(self.images_per_page)
+        self.thumbnail_cache = WallpaperThumbnailCache()
         self.apply_stylesheet()
         self.is_closing = False
 
@@ -490,6 +517,8 @@ class ImageGallery(QMainWindow, BaseStyledWidget):
         remaining_images = max(0, len(self.image_files) - self.current_index)
         self.expected_images = min(self.images_per_page, remaining_images)
         self.loaded_images = 0
+        # Drop queued loads and prefetches of pages that are no longer adjacent
+        self.threadpool.clear()
 
         # Clear existing widgets and their pixmaps to free memory
         while self.image_layout.count():
@@ -510,16 +539,15 @@ class ImageGallery(QMainWindow, BaseStyledWidget):
             label.mousePressEvent = self.create_mouse_press_event(index)
             self.image_layout.addWidget(label, row, col)
 
-            # Start loading the actual image in background
+            # Use a thumbnail prefetched into memory, otherwise load it in background
             image_path = self.image_files[index]
-            loader = ImageLoader(
-                image_path,
-                self.image_width,
-                self.image_height,
-                self.corner_radius,
-                i,
-                dpr=getattr(self, "dpr", 1.0),
-            )
+            dpr = getattr(self, "dpr", 1.0)
+            key = self.thumbnail_cache.key(image_path, int(self.image_width * dpr), int(self.image_height * dpr), dpr)
+            image = self.thumbnail_cache.cached(key)
+            if image is not None:
+                self._handle_image_loaded(current_token, image_path, image, i)
+                continue
+            loader = self._create_loader(image_path, i)
             loader.signals.loaded.connect(partial(self._handle_image_loaded, current_token))
             self.threadpool.start(loader)
 
@@ -534,12 +562,38 @@ class ImageGallery(QMainWindow, BaseStyledWidget):
         if self.focused_index is None and self.image_files:
             self.focused_index = self.current_index
         self.update_focus()
+        self._prefetch_adjacent_pages()
+
+    def _create_loader(self, image_path, index):
+        return ImageLoader(
+            image_path,
+            self.image_width,
+            self.image_height,
+            self.corner_radius,
+            index,
+            dpr=getattr(self, "dpr", 1.0),
+            cache=self.thumbnail_cache,
+        )
 
-    def _handle_image_loaded(self, token, image_path, pixmap, index):
+    def _prefetch_adjacent_pages(self):
+        """Warm the thumbnail cache for the next and previous page at low priority."""
+        last_start = max(0, len(self.image_files) - self.images_per_page)
+        starts = []
+        for start in (self.current_index + self.images_per_page, self.current_index - self.images_per_page):
+            start = max(0, min(start, last_start))
+            if start != self.current_index and start not in starts:
+                starts.append(start)
+        for start in starts:
+            for image_path in self.image_files[start : start + self.images_per_page]:
+                self.threadpool.start(self._create_loader(image_path, -1), -1)
+
+    def _handle_image_loaded(self, token, image_path, image, index):
         """Process image load callbacks, ignoring stale requests."""
         if token != self.active_token:
             return
 
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(getattr(self, "dpr", 1.0))
         self.update_image_label(image_path, pixmap, index)
         self.loaded_images += 1
         if self.loaded_images >= self.expected_images:
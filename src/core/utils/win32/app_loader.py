@@ -1,16 +1,22 @@
 import ctypes
 import glob
+import hashlib
+import json
+import logging
 import os
 import re
 import subprocess
+import threading
 import winreg
+from dataclasses import dataclass, field
 
 from PyQt6.QtCore import (
     QThread,
     pyqtSignal,
 )
 
-_APPS_CACHE = None
+from core.utils.singleton import Singleton
+from core.utils.system import app_data_path
 
 _CPL_NS_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\ControlPanel\NameSpace"
 
@@ -65,143 +71,347 @@ def _enumerate_control_panel_items():
                 continue
 
 
-class AppListLoader(QThread):
-    """
-    Thread to load the list of applications from the Windows Start Menu and UWP apps.
-    This class caches the results to avoid reloading on subsequent calls.
+_FILTER_KEYWORDS = {
+    "readme",
+    "documentation",
+    "license",
+    "setup",
+    "administrative tools",
+}
+
+_STRICT_FILTER_KEYWORDS = {
+    "uninstall",
+    "installer",
+    "help",
+}
+
+# Pre-compile regex for strict keywords
+_STRICT_PATTERN = re.compile(r"\b(" + "|".join(map(re.escape, _STRICT_FILTER_KEYWORDS)) + r")\b")
+
+_UWP_PACKAGES_KEY = (
+    r"Software\Classes\Local Settings\Software\Microsoft\Windows\CurrentVersion\AppModel\Repository\Packages"
+)
+
+CATALOG_FILE = "app_catalog.json"
+CATALOG_VERSION = 1
+
+
+def _should_filter_app(name: str) -> bool:
+    """Check if app name contains any filter keywords"""
+    name_lower = name.lower()
+
+    # Check loose keywords (substring match)
+    if any(keyword in name_lower for keyword in _FILTER_KEYWORDS):
+        return True
+
+    # Check strict keywords (whole word match)
+    if _STRICT_PATTERN.search(name_lower):
+        return True
+
+    return False
+
+
+def _start_menu_dirs() -> list[str]:
+    return [
+        os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu"),
+        os.path.expandvars(r"%PROGRAMDATA%\Microsoft\Windows\Start Menu"),
+    ]
+
+
+def _hash_fingerprint(parts) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8", "replace"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _registry_subkeys_fingerprint(root, path: str) -> str | None:
+    try:
+        with winreg.OpenKey(root, path) as key:
+            names = []
+            i = 0
+            while True:
+                try:
+                    names.append(winreg.EnumKey(key, i))
+                except OSError:
+                    break
+                i += 1
+    except OSError:
+        return None
+    return _hash_fingerprint(sorted(names))
+
+
+def _start_menu_fingerprint() -> str:
+    """Hash of the modification times of all Start Menu directories.
+
+    Adding, removing or renaming a shortcut changes the mtime of the directory containing it.
     """
+    parts = []
+    pending = _start_menu_dirs()
+    while pending:
+        directory = pending.pop()
+        try:
+            parts.append((directory, os.stat(directory).st_mtime_ns))
+            with os.scandir(directory) as it:
+                pending.extend(entry.path for entry in it if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            parts.append((directory, None))
+    return _hash_fingerprint(sorted(parts, key=lambda part: part[0]))
 
-    apps_loaded = pyqtSignal(list)
 
-    @staticmethod
-    def clear_cache():
-        global _APPS_CACHE
-        _APPS_CACHE = None
+def _scan_start_menu() -> list[tuple[str, str, None]]:
+    apps = []
+    for dir in _start_menu_dirs():
+        for lnk in glob.glob(os.path.join(dir, "**", "*.lnk"), recursive=True):
+            name = os.path.splitext(os.path.basename(lnk))[0]
+            if not _should_filter_app(name):
+                apps.append((name, lnk, None))
 
-    def run(self):
-        global _APPS_CACHE
-        if _APPS_CACHE is not None:
-            self.apps_loaded.emit(_APPS_CACHE)
-            return
-
-        filter_keywords = {
-            "readme",
-            "documentation",
-            "license",
-            "setup",
-            "administrative tools",
-        }
-
-        strict_filter_keywords = {
-            "uninstall",
-            "installer",
-            "help",
-        }
-
-        # Pre-compile regex for strict keywords
-        strict_pattern = re.compile(r"\b(" + "|".join(map(re.escape, strict_filter_keywords)) + r")\b")
-
-        start_menu_dirs = [
-            os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu"),
-            os.path.expandvars(r"%PROGRAMDATA%\Microsoft\Windows\Start Menu"),
-        ]
-        apps = []
-        seen_names = set()
-
-        def should_filter_app(name):
-            """Check if app name contains any filter keywords"""
-            name_lower = name.lower()
-
-            # Check loose keywords (substring match)
-            if any(keyword in name_lower for keyword in filter_keywords):
-                return True
-
-            # Check strict keywords (whole word match)
-            if strict_pattern.search(name_lower):
-                return True
-
-            return False
-
-        def is_duplicate(name):
-            """Check if name (or its space-stripped form) was already seen.
-
-            Some shortcuts use CamelCase without spaces (e.g. "LiveCaptions")
-            while Get-StartApps returns the spaced form ("Live captions").
-            Checking both forms prevents duplicates.
-            """
-            lower = name.lower()
-            stripped = lower.replace(" ", "")
-            return lower in seen_names or stripped in seen_names
+        # Also scan .url files (e.g. Steam games)
+        for url_file in glob.glob(os.path.join(dir, "**", "*.url"), recursive=True):
+            name = os.path.splitext(os.path.basename(url_file))[0]
+            if not _should_filter_app(name):
+                apps.append((name, url_file, None))
+    return apps
+
+
+def _uwp_fingerprint() -> str | None:
+    return _registry_subkeys_fingerprint(winreg.HKEY_CURRENT_USER, _UWP_PACKAGES_KEY)
+
+
+def _scan_uwp_apps() -> list[tuple[str, str, None]]:
+    apps = []
+    try:
+        ps_script = "Get-StartApps | ForEach-Object { [PSCustomObject]@{Name=$_.Name;AppID=$_.AppID} } | ConvertTo-Json -Compress"
+        result = subprocess.run(
+            [
+                "powershell",
+                "-NoProfile",
+                "-NonInteractive",
+                "-NoLogo",
+                "-ExecutionPolicy",
+                "Bypass",
+                "-Command",
+                ps_script,
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=10,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+        )
+        if result.returncode == 0:
+            uwp_list = json.loads(result.stdout)
+            if isinstance(uwp_list, dict):
+                uwp_list = [uwp_list]
+            for entry in uwp_list:
+                name = entry.get("Name")
+                appid = entry.get("AppID")
+                if name and appid and not _should_filter_app(name):
+                    apps.append((name, f"UWP::{appid}", None))
+    except Exception:
+        pass
+    return apps
+
+
+def _control_panel_fingerprint() -> str | None:
+    return _registry_subkeys_fingerprint(winreg.HKEY_LOCAL_MACHINE, _CPL_NS_KEY)
+
+
+def _scan_control_panel() -> list[tuple[str, str, str | None]]:
+    # Control Panel items from registry (Device Manager, Programs and Features, etc.)
+    apps = []
+    try:
+        for name, clsid, canonical, desc in _enumerate_control_panel_items():
+            apps.append((name, f"CPL::{clsid}::{canonical}", desc))
+    except Exception:
+        pass
+    return apps
+
+
+# Sources in priority order, an app name found by an earlier source hides later duplicates
+_SOURCES = (
+    ("start_menu", _start_menu_fingerprint, _scan_start_menu),
+    ("uwp", _uwp_fingerprint, _scan_uwp_apps),
+    ("control_panel", _control_panel_fingerprint, _scan_control_panel),
+)
 
-        def mark_seen(name):
+
+def _merge_sources(sources: dict[str, list]) -> list[tuple[str, str, object]]:
+    apps = []
+    seen_names = set()
+    for source_name, _, _ in _SOURCES:
+        for name, path, extra in sources.get(source_name, ()):
+            # Some shortcuts use CamelCase without spaces (e.g. "LiveCaptions")
+            # while Get-StartApps returns the spaced form ("Live captions").
+            # Checking both forms prevents duplicates.
             lower = name.lower()
+            stripped = lower.replace(" ", "")
+            if lower in seen_names or stripped in seen_names:
+                continue
+            apps.append((name, path, extra))
             seen_names.add(lower)
-            seen_names.add(lower.replace(" ", ""))
+            seen_names.add(stripped)
+    return apps
 
-        for dir in start_menu_dirs:
-            for lnk in glob.glob(os.path.join(dir, "**", "*.lnk"), recursive=True):
-                name = os.path.splitext(os.path.basename(lnk))[0]
-                if should_filter_app(name):
-                    continue
-                if not is_duplicate(name):
-                    apps.append((name, lnk, None))
-                    mark_seen(name)
-
-            # Also scan .url files (e.g. Steam games)
-            for url_file in glob.glob(os.path.join(dir, "**", "*.url"), recursive=True):
-                name = os.path.splitext(os.path.basename(url_file))[0]
-                if should_filter_app(name):
-                    continue
-                if not is_duplicate(name):
-                    apps.append((name, url_file, None))
-                    mark_seen(name)
 
-        try:
-            ps_script = "Get-StartApps | ForEach-Object { [PSCustomObject]@{Name=$_.Name;AppID=$_.AppID} } | ConvertTo-Json -Compress"
-            result = subprocess.run(
-                [
-                    "powershell",
-                    "-NoProfile",
-                    "-NonInteractive",
-                    "-NoLogo",
-                    "-ExecutionPolicy",
-                    "Bypass",
-                    "-Command",
-                    ps_script,
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0:
-                import json as _json
-
-                uwp_list = _json.loads(result.stdout)
-                if isinstance(uwp_list, dict):
-                    uwp_list = [uwp_list]
-                for entry in uwp_list:
-                    name = entry.get("Name")
-                    appid = entry.get("AppID")
-                    if name and appid and not is_duplicate(name) and not should_filter_app(name):
-                        apps.append((name, f"UWP::{appid}", None))
-                        mark_seen(name)
-        except Exception:
-            pass
+@dataclass(frozen=True)
+class AppCatalogDelta:
+    """Apps added, removed or changed by a catalog refresh, `apps` is the complete new list."""
+
+    apps: list
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+def _diff_apps(old: list, new: list) -> AppCatalogDelta:
+    old_by_path = {path: (name, path, extra) for name, path, extra in old}
+    new_by_path = {path: (name, path, extra) for name, path, extra in new}
+    return AppCatalogDelta(
+        apps=new,
+        added=[app for path, app in new_by_path.items() if path not in old_by_path],
+        removed=[app for path, app in old_by_path.items() if path not in new_by_path],
+        updated=[app for path, app in new_by_path.items() if path in old_by_path and old_by_path[path] != app],
+    )
+
+
+class AppCatalog(metaclass=Singleton):
+    """
+    Installed applications from the Start Menu, UWP apps and the Control Panel.
+
+    The catalog is persisted as a snapshot in the YASB app data folder so it is available
+    right after startup. Each source stores a fingerprint (Start Menu directory mtimes,
+    registry package lists) and a refresh only rescans sources whose fingerprint changed.
+    """
 
-        # Source 3: Control Panel items from registry (Device Manager, Programs and Features, etc.)
+    def __init__(self, path: str | None = None):
+        self._path = path or str(app_data_path(CATALOG_FILE))
+        self._lock = threading.Lock()
+        self._sources: dict[str, dict] | None = None
+        self._apps: list | None = None
+        # Set until the sources were verified against the system in this session
+        self._stale = True
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    def invalidate(self) -> None:
+        """Make the next loader verify the sources again."""
+        self._stale = True
+
+    def snapshot(self) -> list | None:
+        """Return the current apps, loading the on-disk snapshot if needed. None if there is none yet."""
+        with self._lock:
+            if self._apps is None:
+                self._sources = self._read_snapshot()
+                if self._sources is not None:
+                    self._apps = _merge_sources({name: data["entries"] for name, data in self._sources.items()})
+            return self._apps
+
+    def refresh(self, force: bool = False) -> AppCatalogDelta:
+        """Rescan sources whose fingerprint changed, `force` rescans all of them."""
+        with self._lock:
+            if self._sources is None:
+                self._sources = self._read_snapshot() or {}
+            old_apps = self._apps or []
+            changed = []
+            for name, fingerprint_func, scan_func in _SOURCES:
+                try:
+                    fingerprint = fingerprint_func()
+                except Exception as e:
+                    logging.debug("Failed to fingerprint app source %s: %s", name, e)
+                    fingerprint = None
+                cached = self._sources.get(name)
+                if (
+                    not force
+                    and cached is not None
+                    and fingerprint is not None
+                    and cached["fingerprint"] == fingerprint
+                ):
+                    continue
+                self._sources[name] = {"fingerprint": fingerprint, "entries": scan_func()}
+                changed.append(name)
+            self._stale = False
+            if not changed and self._apps is not None:
+                return AppCatalogDelta(apps=self._apps)
+            self._apps = _merge_sources({name: data["entries"] for name, data in self._sources.items()})
+            if changed:
+                logging.debug("App catalog sources rescanned: %s", ", ".join(changed))
+                self._write_snapshot()
+            return _diff_apps(old_apps, self._apps)
+
+    def _read_snapshot(self) -> dict[str, dict] | None:
         try:
-            for name, clsid, canonical, desc in _enumerate_control_panel_items():
-                if not is_duplicate(name):
-                    apps.append((name, f"CPL::{clsid}::{canonical}", desc))
-                    mark_seen(name)
-        except Exception:
-            pass
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CATALOG_VERSION:
+                return None
+            return {
+                name: {
+                    "fingerprint": source.get("fingerprint"),
+                    "entries": [tuple(entry) for entry in source.get("entries", [])],
+                }
+                for name, source in data.get("sources", {}).items()
+            }
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning("Ignoring unreadable app catalog %s: %s", self._path, e)
+            return None
+
+    def _write_snapshot(self) -> None:
+        data = {"version": CATALOG_VERSION, "sources": self._sources}
+        tmp_path = self._path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logging.warning("Failed to write app catalog %s: %s", self._path, e)
+
+
+class AppListLoader(QThread):
+    """
+    Thread to load the list of applications from the Windows Start Menu and UWP apps.
 
-        _APPS_CACHE = apps
-        self.apps_loaded.emit(apps)
+    The apps of the persisted `AppCatalog` are emitted first through `apps_loaded`. If the
+    catalog wasn't verified yet, changed sources are rescanned afterwards and the
+    differences are emitted through `apps_changed`. A loader created with `refresh=True`
+    only verifies the catalog and emits `apps_changed`.
+    """
+
+    apps_loaded = pyqtSignal(list)
+    apps_changed = pyqtSignal(object)
+
+    def __init__(self, refresh: bool = False, parent=None):
+        super().__init__(parent)
+        self._refresh = refresh
+
+    @staticmethod
+    def clear_cache():
+        AppCatalog().invalidate()
+
+    def run(self):
+        catalog = AppCatalog()
+        if not self._refresh:
+            apps = catalog.snapshot()
+            if apps is None:
+                # First run without a snapshot, consumers get the complete list once
+                self.apps_loaded.emit(catalog.refresh().apps)
+                return
+            self.apps_loaded.emit(apps)
+            if not catalog.stale:
+                return
+        delta = catalog.refresh()
+        if delta:
+            self.apps_changed.emit(delta)
 
 
 class ShortcutResolver:
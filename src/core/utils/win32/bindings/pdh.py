@@ -22,3 +22,6 @@ pdh.PdhGetFormattedCounterArrayW.restype = LONG
 
 pdh.PdhCloseQuery.argtypes = [HANDLE]
 pdh.PdhCloseQuery.restype = LONG
+
+pdh.PdhRemoveCounter.argtypes = [HANDLE]
+pdh.PdhRemoveCounter.restype = LONG
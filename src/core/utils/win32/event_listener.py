@@ -2,7 +2,7 @@ import ctypes
 import logging
 import time
 
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import Qt, QThread
 from win32gui import GetForegroundWindow
 
 from core.event_service import EventService
@@ -10,39 +10,108 @@ from core.utils.win32.bindings.kernel32 import GetCurrentThreadId
 from core.utils.win32.bindings.ole32 import ole32
 from core.utils.win32.bindings.user32 import user32
 from core.utils.win32.structs import WINEVENTPROC
+from core.utils.win32.win_event_filter import WinEventFilter
 from core.utils.win32.windows import WinEvent
 
+PM_NOREMOVE = 0x0000
+WM_QUIT = 0x0012
+WM_TIMER = 0x0113
+# Posted to the listener thread when the registered events changed
+WM_UPDATE_HOOKS = 0x8000 + 1
+
 msg = ctypes.wintypes.MSG()
 
 
 class SystemEventListener(QThread):
+    """
+    Forwards WinEvents to the `EventService`.
+
+    Hooks are only installed for the WinEvent ids that have registered signals and are
+    recomputed whenever registrations change. Bursts of the same event for the same window
+    are coalesced by a `WinEventFilter`, held back events are flushed on a thread timer.
+    """
+
     def __init__(self):
         super().__init__()
-        self._hook = None
+        self._hooks: dict[tuple[int, int], int] = {}
+        self._failed_ranges: set[tuple[int, int]] = set()
+        self._thread_id: int | None = None
+        self._timer_id = 0
+        self._filter = WinEventFilter()
         self._event_service = EventService()
         self._win_event_process = WINEVENTPROC(self._event_handler)
+        self._event_service.registrations_changed.connect(self._request_hook_update, Qt.ConnectionType.DirectConnection)
 
     def __str__(self):
         return "Win32 System Event Listener"
 
     def _event_handler(self, _win_event_hook, event, hwnd, _id_object, _id_child, _event_thread, _event_time) -> None:
-        if event in WinEvent:
-            event_type = WinEvent._value2member_map_[event]
-            try:
-                self._event_service.emit_event(event_type, hwnd, event_type)
-            except Exception:
-                logging.exception("Failed to emit event %s for %s", event_type, hwnd)
-
-    def _build_event_hook(self) -> int:
-        return user32.SetWinEventHook(
-            WinEvent.EventMin.value,
-            WinEvent.EventObjectEnd.value,
-            0,
-            self._win_event_process,
-            0,
-            0,
-            WinEvent.WinEventOutOfContext.value,
-        )
+        now = time.monotonic()
+        # WM_TIMER is starved during event storms, so held back events are also released here
+        for record_event, record_hwnd, _ in self._filter.due(now):
+            self._deliver(record_event, record_hwnd)
+        for record_event, record_hwnd, _ in self._filter.push(event, hwnd, now):
+            self._deliver(record_event, record_hwnd)
+        if not self._timer_id:
+            self._schedule_flush()
+
+    def _deliver(self, event: int, hwnd: int) -> None:
+        event_type = WinEvent._value2member_map_[event]
+        try:
+            self._event_service.emit_event(event_type, hwnd, event_type)
+        except Exception:
+            logging.exception("Failed to emit event %s for %s", event_type, hwnd)
+
+    def _flush_due(self) -> None:
+        for event, hwnd, _ in self._filter.due(time.monotonic()):
+            self._deliver(event, hwnd)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Run a thread timer while events are held back or hooks failed to install."""
+        needed = self._filter.next_deadline() is not None or bool(self._failed_ranges)
+        if needed and not self._timer_id:
+            self._timer_id = user32.SetTimer(None, 0, max(1, int(self._filter.window * 1000)), None)
+        elif not needed and self._timer_id:
+            user32.KillTimer(None, self._timer_id)
+            self._timer_id = 0
+
+    def _subscribed_event_ids(self) -> set[int]:
+        return {
+            event_type.value
+            for event_type in self._event_service.registered_events()
+            if isinstance(event_type, WinEvent)
+            and WinEvent.EventMin.value <= event_type.value <= WinEvent.EventObjectEnd.value
+        }
+
+    def _request_hook_update(self) -> None:
+        if self._thread_id is not None:
+            user32.PostThreadMessageW(self._thread_id, WM_UPDATE_HOOKS, 0, 0)
+
+    def _update_hooks(self) -> None:
+        """Install hooks for the subscribed event ranges and remove the ones no longer needed."""
+        self._filter.set_subscribed(self._subscribed_event_ids())
+        ranges = set(self._filter.ranges())
+        for event_range in [r for r in self._hooks if r not in ranges]:
+            user32.UnhookWinEvent(self._hooks.pop(event_range))
+        self._failed_ranges &= ranges
+        for event_range in ranges - self._hooks.keys():
+            hook = user32.SetWinEventHook(
+                event_range[0],
+                event_range[1],
+                0,
+                self._win_event_process,
+                0,
+                0,
+                WinEvent.WinEventOutOfContext.value,
+            )
+            if hook:
+                self._hooks[event_range] = hook
+                self._failed_ranges.discard(event_range)
+            elif event_range not in self._failed_ranges:
+                self._failed_ranges.add(event_range)
+                logging.warning("SetWinEventHook failed for events %#x-%#x. Retrying...", *event_range)
+        self._schedule_flush()
 
     def _emit_foreground_window_event(self):
         foreground_event = WinEvent.EventSystemForeground
@@ -54,23 +123,33 @@ class SystemEventListener(QThread):
     def run(self):
         ole32.CoInitialize(0)
         try:
+            # Create the message queue before registrations can post to it
+            user32.PeekMessageW(ctypes.byref(msg), 0, 0, 0, PM_NOREMOVE)
             self._thread_id = GetCurrentThreadId()
-            self._hook = self._build_event_hook()
-
-            if self._hook == 0:
-                logging.warning("SetWinEventHook failed. Retrying indefinitely...")
-
-            while self._hook == 0:
-                time.sleep(1)
-                self._hook = self._build_event_hook()
-
+            self._update_hooks()
             self._emit_foreground_window_event()
 
-            user32.GetMessageW(ctypes.byref(msg), 0, 0, 0)
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                if msg.message == WM_TIMER:
+                    if self._failed_ranges:
+                        self._update_hooks()
+                    self._flush_due()
+                elif msg.message == WM_UPDATE_HOOKS:
+                    self._update_hooks()
         finally:
+            for hook in self._hooks.values():
+                user32.UnhookWinEvent(hook)
+            self._hooks.clear()
+            if self._timer_id:
+                user32.KillTimer(None, self._timer_id)
+                self._timer_id = 0
             ole32.CoUninitialize()
 
     def stop(self):
-        user32.UnhookWinEvent(self._hook)
-        # Post WM_QUIT to unblock GetMessageW
-        user32.PostThreadMessageW(self._thread_id, 0x0012, 0, 0)
+        try:
+            self._event_service.registrations_changed.disconnect(self._request_hook_update)
+        except TypeError:
+            pass
+        # Post WM_QUIT to unblock GetMessageW, the hooks are removed on the listener thread
+        if self._thread_id is not None:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
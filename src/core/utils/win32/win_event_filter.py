@@ -0,0 +1,151 @@
+"""
+Subscription filtering and per-window coalescing of WinEvents.
+
+Kept free of Win32 calls so recorded event streams of (event, hwnd, timestamp) tuples can be
+replayed through it on any platform. `SystemEventListener` drives it from its hook thread.
+"""
+
+from collections.abc import Iterable
+
+# (event id, hwnd, timestamp in seconds)
+type WinEventRecord = tuple[int, int, float]
+
+# Burst window of one event id for one window
+DEFAULT_COALESCE_WINDOW = 0.05
+
+# Event ids this close together share one hook, the handler drops the ids in between
+MAX_RANGE_GAP = 4
+
+
+def hook_ranges(event_ids: Iterable[int], max_gap: int = MAX_RANGE_GAP) -> list[tuple[int, int]]:
+    """Group event ids into (min, max) ranges, one `SetWinEventHook` call each."""
+    ranges: list[tuple[int, int]] = []
+    for event_id in sorted(set(event_ids)):
+        if ranges and event_id - ranges[-1][1] <= max_gap:
+            ranges[-1] = (ranges[-1][0], event_id)
+        else:
+            ranges.append((event_id, event_id))
+    return ranges
+
+
+class WinEventFilter:
+    """
+    Drops events nobody subscribed to and coalesces bursts per (event, hwnd).
+
+    The first event of a burst is delivered right away. Repeats of the same event for the same
+    window inside `window` seconds are held back and only the last one is delivered when the
+    window ends, so subscribers see fewer calls but still end up with the final state.
+
+    Events of one id and events of one window are always delivered in the order they
+    arrived. Before an event is delivered, the older held back events with the same id (for
+    other windows) and of the same window (with other ids) are flushed, so e.g. the last
+    foreground event delivered is the last one received and a title change isn't delivered
+    after the window's destroy event.
+    """
+
+    def __init__(self, window: float = DEFAULT_COALESCE_WINDOW):
+        self.window = window
+        self.subscribed: frozenset[int] = frozenset()
+        self._ranges: list[tuple[int, int]] = []
+        # event -> hwnd -> [end of the burst window, last held back record]
+        self._bursts: dict[int, dict[int, list]] = {}
+        self.received = 0
+        self.delivered = 0
+
+    def set_subscribed(self, event_ids: Iterable[int]) -> bool:
+        """Replace the subscribed event ids, returns True when the set changed."""
+        event_ids = frozenset(event_ids)
+        if event_ids == self.subscribed:
+            return False
+        self.subscribed = event_ids
+        self._ranges = hook_ranges(event_ids)
+        for event in [event for event in self._bursts if event not in event_ids]:
+            del self._bursts[event]
+        return True
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Event id ranges to hook for the subscribed ids."""
+        return list(self._ranges)
+
+    def push(self, event: int, hwnd: int, timestamp: float) -> list[WinEventRecord]:
+        """Take an incoming event, returns the events to deliver right away in order."""
+        if event not in self.subscribed:
+            return []
+        self.received += 1
+        bursts = self._bursts.setdefault(event, {})
+        burst = bursts.get(hwnd)
+        if burst is not None and timestamp < burst[0]:
+            burst[1] = (event, hwnd, timestamp)
+            return []
+        record = (event, hwnd, timestamp)
+        records = self._release_older([record])
+        records.sort(key=lambda held: held[2])
+        records.append(record)
+        bursts[hwnd] = [timestamp + self.window, None]
+        self.delivered += len(records)
+        return records
+
+    def due(self, now: float) -> list[WinEventRecord]:
+        """Return the held back events whose burst window ended, oldest first."""
+        records = []
+        for event, bursts in list(self._bursts.items()):
+            for hwnd, burst in list(bursts.items()):
+                if burst[0] > now:
+                    continue
+                if burst[1] is None:
+                    del bursts[hwnd]
+                else:
+                    records.append(burst[1])
+                    # The delivery opens a new window so a continuing burst stays rate limited
+                    bursts[hwnd] = [now + self.window, None]
+            if not bursts:
+                del self._bursts[event]
+        if records:
+            # Older events still inside their window go first to keep the order
+            records.extend(self._release_older(records))
+        records.sort(key=lambda record: record[2])
+        self.delivered += len(records)
+        return records
+
+    def _release_older(self, records: list[WinEventRecord]) -> list[WinEventRecord]:
+        """Take the held back events older than the given ones with the same id or window.
+
+        Released events are about to be delivered as well, so events held back behind them
+        are released too.
+        """
+        released = []
+        pending = list(records)
+        while pending:
+            event, hwnd, timestamp = pending.pop()
+            candidates = list(self._bursts.get(event, {}).values())
+            candidates.extend(
+                bursts[hwnd] for other, bursts in self._bursts.items() if other != event and hwnd in bursts
+            )
+            for burst in candidates:
+                held = burst[1]
+                if held is not None and held[2] < timestamp:
+                    burst[1] = None
+                    released.append(held)
+                    pending.append(held)
+        return released
+
+    def next_deadline(self) -> float | None:
+        return min((burst[0] for bursts in self._bursts.values() for burst in bursts.values()), default=None)
+
+    def replay(self, records: Iterable[WinEventRecord]) -> list[WinEventRecord]:
+        """Run a recorded stream through the filter and return everything it would deliver."""
+        deliveries = []
+        for event, hwnd, timestamp in records:
+            deliveries.extend(self.due(timestamp))
+            deliveries.extend(self.push(event, hwnd, timestamp))
+        deliveries.extend(self.due(float("inf")))
+        return deliveries
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "subscribed": len(self.subscribed),
+            "hooks": len(self._ranges),
+            "received": self.received,
+            "delivered": self.delivered,
+            "pending": sum(1 for bursts in self._bursts.values() for burst in bursts.values() if burst[1] is not None),
+        }
@@ -1,6 +1,7 @@
 import logging
 import re
 import subprocess
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -10,7 +11,9 @@ from PyQt6.QtGui import QMouseEvent
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QWidget
 
 from core.event_service import EventService
+from core.utils.runtime_stats import RuntimeStats
 from core.utils.utilities import add_shadow
+from core.utils.widgets.label_template import LabelRenderer, compile_label_template
 from core.utils.win32.system_function import function_map
 from core.widgets.registry import register_widget_class
 
@@ -38,6 +41,7 @@ class BaseWidget(QWidget):
         self.widget_name = None  # Set by WidgetBuilder after construction
         self.screen_name = None  # Set by BarManager when bar is created
         self._hotkey_enabled = True  # Set to False by BarManager for duplicate widgets
+        self._runtime_stats = RuntimeStats().widget(self)
 
         if class_name:
             self._widget_frame.setProperty("class", f"widget {class_name}")
@@ -70,7 +74,7 @@ class BaseWidget(QWidget):
 
         self._event_service = EventService()
         self._hotkey_signal.connect(self._handle_hotkey_event)
-        self._event_service.register_event("handle_widget_hotkey", self._hotkey_signal)
+        self._event_service.register_event("handle_widget_hotkey", self._hotkey_signal, owner=self)
 
     def _handle_hotkey_event(self, widget_name: str, action: str, target_screen: str) -> None:
         """
@@ -108,7 +112,7 @@ class BaseWidget(QWidget):
         elif event.button() == Qt.MouseButton.RightButton:
             self._run_callback(self.callback_right)
 
-    def _run_callback(self, callback_str: str | list):
+    def _run_callback(self, callback_str: str | list, timer: bool = False):
         if " " in callback_str:
             callback_args = list(map(lambda x: x.strip('"'), re.findall(r'".+?"|[^ ]+', callback_str)))
             callback_type = callback_args[0]
@@ -120,13 +124,15 @@ class BaseWidget(QWidget):
         is_valid_callback = callback_type in self.callbacks.keys()
         self.callback = self.callbacks[callback_type if is_valid_callback else "default"]
 
+        started = time.perf_counter()
         try:
             self.callbacks[callback_type](*callback_args)
         except Exception:
             logging.exception("Failed to execute callback of type '%s' with args: %s", callback_type, callback_args)
+        self._runtime_stats.record(time.perf_counter() - started, timer=timer)
 
     def _timer_callback(self):
-        self._run_callback(self.callback_timer)
+        self._run_callback(self.callback_timer, timer=True)
 
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
         if cmd in function_map:
@@ -149,6 +155,8 @@ class BaseWidget(QWidget):
         self.widget_layout.addWidget(self._widget_container)
         self._widgets: list[QLabel] = []
         self._widgets_alt: list[QLabel] = []
+        self._label_renderer: LabelRenderer | None = None
+        self._label_alt_renderer: LabelRenderer | None = None
 
     def build_widget_label(
         self,
@@ -156,22 +164,14 @@ class BaseWidget(QWidget):
         content_alt: str | None = None,
         content_shadow: dict[str, Any] | None = None,
     ):
-        def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split("(<span.*?>.*?</span>)", content)
-            label_parts = [part for part in label_parts if part]
+        def process_content(content: str, is_alt: bool = False) -> LabelRenderer:
+            template = compile_label_template(content)
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for segment in template:
+                label = QLabel(segment.text)
+                if segment.is_icon:
+                    label.setProperty("class", segment.class_name)
                 else:
-                    label = QLabel(part)
                     label.setProperty("class", "label alt" if is_alt else "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 label.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -183,8 +183,17 @@ class BaseWidget(QWidget):
                     label.hide()
                 else:
                     label.show()
-            return widgets
+            return LabelRenderer(template, widgets, self._runtime_stats)
 
-        self._widgets = process_content(content)
+        self._label_renderer = process_content(content)
+        self._widgets = self._label_renderer.labels
         if content_alt:
-            self._widgets_alt = process_content(content_alt, is_alt=True)
+            self._label_alt_renderer = process_content(content_alt, is_alt=True)
+            self._widgets_alt = self._label_alt_renderer.labels
+
+    @property
+    def active_label_renderer(self) -> LabelRenderer | None:
+        """Renderer of the label set that is currently shown (label or label_alt)."""
+        if getattr(self, "_show_alt_label", False) and self._label_alt_renderer is not None:
+            return self._label_alt_renderer
+        return self._label_renderer
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import QLabel
 
 from core.utils.utilities import refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
-from core.utils.widgets.glazewm.client import BindingMode, GlazewmClient
+from core.utils.widgets.glazewm.client import BindingMode, GlazewmClient, QueryType
 from core.validation.widgets.glazewm.binding_mode import GlazewmBindingModeConfig
 from core.widgets.base import BaseWidget
 
@@ -35,15 +35,10 @@ class GlazewmBindingModeWidget(BaseWidget):
         self._init_container(self._container_shadow.model_dump())
         self.build_widget_label(self._label_content, self._label_alt_content, self._label_shadow.model_dump())
 
-        self.glazewm_client = GlazewmClient(
-            config.glazewm_server_uri,
-            [
-                "sub -e binding_modes_changed",
-                "query binding-modes",
-            ],
-        )
+        self.glazewm_client = GlazewmClient.get_instance(config.glazewm_server_uri)
         self.glazewm_client.glazewm_connection_status.connect(self._update_connection_status)
         self.glazewm_client.binding_mode_changed.connect(self._update_binding_mode)
+        self.glazewm_client.subscribe(["binding_modes_changed"], [QueryType.BINDING_MODES])
         self.glazewm_client.connect()
 
         self.register_callback("toggle_label", self._toggle_label)
@@ -55,6 +50,8 @@ class GlazewmBindingModeWidget(BaseWidget):
         self.callback_middle = config.callbacks.on_middle
 
         self.hide()
+        if (binding_mode := self.glazewm_client.binding_mode) is not None:
+            self._update_binding_mode(binding_mode)
 
     def _toggle_label(self):
         if self._animation.enabled:
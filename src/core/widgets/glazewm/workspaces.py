@@ -9,7 +9,7 @@ from PyQt6.QtGui import QCursor, QImage, QMouseEvent, QPixmap, QShowEvent, QWhee
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QWidget
 
 from core.utils.utilities import add_shadow, refresh_widget_style
-from core.utils.widgets.glazewm.client import GlazewmClient, Monitor, Window, Workspace
+from core.utils.widgets.glazewm.client import GlazewmClient, Monitor, QueryType, Window, Workspace
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utils import get_monitor_hwnd, get_process_info
 from core.validation.widgets.glazewm.workspaces import GlazewmWorkspacesConfig
@@ -414,15 +414,9 @@ class GlazewmWorkspacesWidget(BaseWidget):
         self.widget_layout.addWidget(self.offline_text)
         self.widget_layout.addWidget(self.workspace_container)
 
-        self.glazewm_client = GlazewmClient(
-            self.config.glazewm_server_uri,
-            [
-                "sub -e workspace_activated workspace_deactivated workspace_updated focus_changed focused_container_moved",
-                "query monitors",
-            ],
-        )
+        self.glazewm_client = GlazewmClient.get_instance(self.config.glazewm_server_uri)
         self.glazewm_client.glazewm_connection_status.connect(self._update_connection_status)  # type: ignore
-        self.glazewm_client.workspaces_data_processed.connect(self._update_workspaces)  # type: ignore
+        self.glazewm_client.monitors_changed.connect(self._on_monitors_changed)  # type: ignore
         self.icon_cache = dict()
         self.workspace_app_icons_enabled = (
             self.config.app_icons.enabled_populated
@@ -434,7 +428,20 @@ class GlazewmWorkspacesWidget(BaseWidget):
     def showEvent(self, a0: QShowEvent | None):
         super().showEvent(a0)
         self.monitor_handle = get_monitor_hwnd(int(QWidget.winId(self)))
+        self.glazewm_client.subscribe(
+            [
+                "workspace_activated",
+                "workspace_deactivated",
+                "workspace_updated",
+                "focus_changed",
+                "focused_container_moved",
+            ],
+            [QueryType.MONITORS],
+        )
         self.glazewm_client.connect()
+        # The client only queries when it has no current state, render the cached one
+        if (monitors := self.glazewm_client.monitors) is not None:
+            self._update_workspaces(monitors)
 
     @pyqtSlot(bool)
     def _update_connection_status(self, status: bool):
@@ -442,6 +449,13 @@ class GlazewmWorkspacesWidget(BaseWidget):
         self.offline_text.setVisible(not status if not self.config.hide_if_offline else False)
 
     @pyqtSlot(list)
+    def _on_monitors_changed(self, changed: list[Monitor]):
+        # Monitor-exclusive bars only show the workspaces of their own monitor
+        if self.config.monitor_exclusive and not any(monitor.hwnd == self.monitor_handle for monitor in changed):
+            return
+        if (monitors := self.glazewm_client.monitors) is not None:
+            self._update_workspaces(monitors)
+
     def _update_workspaces(self, message: list[Monitor]):
         current_mon = next((m for m in message if m.hwnd == self.monitor_handle), None)
         if not current_mon:
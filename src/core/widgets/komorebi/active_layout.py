@@ -248,12 +248,12 @@ class ActiveLayoutWidget(BaseWidget):
         self.k_signal_layout_change.connect(self._on_komorebi_layout_change_event)
         self.k_signal_update.connect(self._on_komorebi_layout_change_event)
 
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update, owner=self)
 
         for event_type in active_layout_change_event_watchlist:
-            self._event_service.register_event(event_type, self.k_signal_layout_change)
+            self._event_service.register_event(event_type, self.k_signal_layout_change, owner=self)
         try:
             self.destroyed.connect(self._on_destroyed)  # type: ignore[attr-defined]
         except Exception:
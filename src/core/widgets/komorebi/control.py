@@ -68,8 +68,8 @@ class KomorebiControlWidget(BaseWidget):
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
         # Register for events
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, owner=self)
         # Ensure we unregister on destruction to prevent late emits hitting deleted objects
         try:
             self.destroyed.connect(self._on_destroyed)  # type: ignore[attr-defined]
@@ -13,6 +13,7 @@ from core.event_enums import KomorebiEvent
 from core.event_service import EventService
 from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state import KomorebiStateDiff
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utils import get_monitor_hwnd
 from core.utils.win32.window_actions import close_application
@@ -151,7 +152,7 @@ class WindowButton(QFrame):
 
 class StackWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
     k_signal_disconnect = pyqtSignal()
     validation_schema = StackConfig
     event_listener = KomorebiEventListener
@@ -222,9 +223,9 @@ class StackWidget(BaseWidget):
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
         self.k_signal_update.connect(self._on_komorebi_update_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiUpdateDiff, self.k_signal_update, owner=self)
         # Unregister on widget destruction to prevent late emits
         try:
             self.destroyed.connect(self._on_destroyed)  # type: ignore[attr-defined]
@@ -235,7 +236,7 @@ class StackWidget(BaseWidget):
         try:
             self._event_service.unregister_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
             self._event_service.unregister_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-            self._event_service.unregister_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+            self._event_service.unregister_event(KomorebiEvent.KomorebiUpdateDiff, self.k_signal_update)
         except Exception:
             pass
 
@@ -295,7 +296,11 @@ class StackWidget(BaseWidget):
         if self.config.hide_if_offline:
             self.hide()
 
-    def _on_komorebi_update_event(self, event: dict, state: dict) -> None:
+    def _on_komorebi_update_event(self, event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        screen_id = self._komorebi_screen.get("id") if self._komorebi_screen else None
+        if not diff.affects_monitor(screen_id):
+            # Nothing on this bar's monitor changed
+            return
         if self._update_komorebi_state(state):
             self._hide_no_window_text()
 
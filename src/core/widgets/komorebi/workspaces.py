@@ -12,6 +12,7 @@ from core.event_service import EventService
 from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.komorebi.animation import KomorebiAnimation
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state import KomorebiStateDiff
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utils import get_monitor_hwnd, get_process_info
 from core.validation.widgets.komorebi.workspaces import KomorebiWorkspacesConfig
@@ -218,7 +219,7 @@ class WorkspaceButtonWithIcons(QFrame):
 
 class WorkspaceWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
     k_signal_disconnect = pyqtSignal()
     validation_schema = KomorebiWorkspacesConfig
     event_listener = KomorebiEventListener
@@ -304,9 +305,9 @@ class WorkspaceWidget(BaseWidget):
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
         self.k_signal_update.connect(self._on_komorebi_update_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, owner=self)
+        self._event_service.register_event(KomorebiEvent.KomorebiUpdateDiff, self.k_signal_update, owner=self)
         try:
             self.destroyed.connect(self._on_destroyed)  # type: ignore[attr-defined]
         except Exception:
@@ -316,7 +317,7 @@ class WorkspaceWidget(BaseWidget):
         try:
             self._event_service.unregister_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
             self._event_service.unregister_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-            self._event_service.unregister_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+            self._event_service.unregister_event(KomorebiEvent.KomorebiUpdateDiff, self.k_signal_update)
         except Exception:
             pass
 
@@ -342,8 +343,9 @@ class WorkspaceWidget(BaseWidget):
         if self.config.hide_if_offline:
             self.hide()
 
-    def _on_komorebi_update_event(self, event: dict, state: dict) -> None:
-        if self._update_komorebi_state(state):
+    def _on_komorebi_update_event(self, event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        screen_id = self._komorebi_screen.get("id") if self._komorebi_screen else None
+        if diff.affects_monitor(screen_id) and self._update_komorebi_state(state):
             # Update icons in workspace buttons (must be done before animation)
             if self._workspace_app_icons_enabled:
                 try:
@@ -88,18 +88,18 @@ class ActiveWindowWidget(BaseWidget):
         self.callback_middle = self.config.callbacks.on_middle
 
         self.foreground_change.connect(self._on_focus_change_event)
-        self._event_service.register_event(WinEvent.EventSystemForeground, self.foreground_change)
-        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.foreground_change)
+        self._event_service.register_event(WinEvent.EventSystemForeground, self.foreground_change, owner=self)
+        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.foreground_change, owner=self)
 
         self.window_name_change.connect(self._on_window_name_change_event)
-        self._event_service.register_event(WinEvent.EventObjectNameChange, self.window_name_change)
-        self._event_service.register_event(WinEvent.EventObjectStateChange, self.window_name_change)
+        self._event_service.register_event(WinEvent.EventObjectNameChange, self.window_name_change, owner=self)
+        self._event_service.register_event(WinEvent.EventObjectStateChange, self.window_name_change, owner=self)
 
         self.window_destroy.connect(self._on_window_destroy_event)
-        self._event_service.register_event(WinEvent.EventObjectDestroy, self.window_destroy)
+        self._event_service.register_event(WinEvent.EventObjectDestroy, self.window_destroy, owner=self)
 
         self.focus_change_workspaces.connect(self._on_focus_change_workspaces)
-        self._event_service.register_event("workspace_update", self.focus_change_workspaces)
+        self._event_service.register_event("workspace_update", self.focus_change_workspaces, owner=self)
 
         # Parent timer to widget so it auto-stops/cleans up on deletion
         self._window_update_timer = QTimer(self)
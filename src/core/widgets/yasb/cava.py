@@ -1,381 +1,28 @@
 import atexit
 import logging
-import os
 import shutil
-import struct
-import subprocess
-import threading
 
-from PyQt6.QtCore import QPointF, QRectF, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QLinearGradient, QPainter, QPainterPath
-from PyQt6.QtWidgets import QApplication, QFrame, QLabel
+from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QLabel
 
-from core.utils.system import app_data_path
+from core.utils.widgets.cava.bar import CavaBar
+from core.utils.widgets.cava.hub import CavaHub, resample_frame
 from core.validation.widgets.yasb.cava import CavaConfig
 from core.widgets.base import BaseWidget
 
 
-class CavaBar(QFrame):
-    _dpr: float | None
-    _cava_widget: CavaWidget
-
-    def __init__(self, cava_widget: CavaWidget) -> None:
-        super().__init__()
-        self._dpr = None
-        self._cava_widget = cava_widget
-        self.setFixedHeight(self._cava_widget.config.bar_height)
-        self.setFixedWidth(
-            self._cava_widget.config.bars_number
-            * (
-                self._cava_widget.config.bar_width
-                + (
-                    self._cava_widget.config.bar_spacing
-                    if self._cava_widget.config.bar_type == "bars_mirrored"
-                    or self._cava_widget.config.bar_type == "bars"
-                    else 0
-                )
-            )
-        )
-        self.setContentsMargins(0, 0, 0, 0)
-
-    def _device_pixel_ratio(self, painter: QPainter) -> float:
-        """Return device pixel ratio for the painter's device."""
-        if self._dpr is not None:
-            return self._dpr
-
-        try:
-            dev = painter.device()
-            if dev:
-                dpr = float(dev.devicePixelRatioF())
-            else:
-                dpr = 1.0
-        except Exception:
-            dpr = 1.0
-
-        self._dpr = dpr if dpr > 0 else 1.0
-        return self._dpr
-
-    def _get_fade_opacity(self, x_position: float) -> float:
-        """Calculate opacity based on position for edge fade effect."""
-        fade_left = self._cava_widget._edge_fade_left
-        fade_right = self._cava_widget._edge_fade_right
-
-        if fade_left <= 0 and fade_right <= 0:
-            return 1.0
-
-        widget_width = self.width()
-
-        if fade_left > 0 and fade_right > 0:
-            # Both sides have fade - cap each to half width to prevent overlap
-            max_fade_width = widget_width / 2
-            effective_fade_left = min(fade_left, max_fade_width)
-            effective_fade_right = min(fade_right, max_fade_width)
-        else:
-            # Only one side has fade - allow it to use full width if needed
-            effective_fade_left = min(fade_left, widget_width) if fade_left > 0 else 0
-            effective_fade_right = min(fade_right, widget_width) if fade_right > 0 else 0
-
-        # Left edge fade (0 to effective_fade_left)
-        if effective_fade_left > 0 and x_position <= effective_fade_left:
-            return max(0.0, x_position / effective_fade_left)
-
-        # Right edge fade (widget_width - effective_fade_right to widget_width)
-        elif effective_fade_right > 0 and x_position >= widget_width - effective_fade_right:
-            return max(0.0, (widget_width - x_position) / effective_fade_right)
-
-        # Middle area - full opacity
-        return 1.0
-
-    def paintEvent(self, event) -> None:
-        """Draw the cava bars according to the selected style."""
-        painter = QPainter(self)
-
-        try:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
-        except Exception:
-            pass
-
-        if self._cava_widget.config.bar_type == "bars_mirrored":
-            self.draw_bars_mirrored(painter)
-        elif self._cava_widget.config.bar_type == "waves":
-            self.draw_waves(painter)
-        elif self._cava_widget.config.bar_type == "waves_mirrored":
-            self.draw_waves_mirrored(painter)
-        else:
-            self.draw_bars(painter)
-
-    def draw_bars(self, painter: QPainter) -> None:
-        """Draw traditional bar visualization"""
-        dpr = self._device_pixel_ratio(painter)
-
-        bar_w_px = max(1, round(self._cava_widget.config.bar_width * dpr))
-        bar_s_px = max(0, round(self._cava_widget.config.bar_spacing * dpr))
-        left_margin_px = round((self._cava_widget.config.bar_spacing / 2.0) * dpr)
-
-        for i, sample in enumerate(self._cava_widget.samples):
-            min_height_logical = float(self._cava_widget.config.min_bar_height) / dpr
-            computed_height = sample * float(self._cava_widget.config.bar_height)
-            height = max(min_height_logical, computed_height)
-            if height > 0.0:
-                x_px = left_margin_px + i * (bar_w_px + bar_s_px)
-                y_px = max(0, round((float(self._cava_widget.config.bar_height) - height) * dpr))
-                h_px = max(1, round(height * dpr))
-
-                rx = x_px / dpr
-                ry = y_px / dpr
-                rw = bar_w_px / dpr
-                rh = h_px / dpr
-
-                if self._cava_widget.config.gradient == 1 and self._cava_widget.colors:
-                    gradient = QLinearGradient(0, 1, 0, 0)
-                    gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-                    stop_step = 1.0 / (len(self._cava_widget.colors) - 1)
-                    for idx, color in enumerate(self._cava_widget.colors):
-                        gradient.setColorAt(idx * stop_step, color)
-
-                    if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-                        fade_opacity = self._get_fade_opacity(rx + rw / 2)
-                        painter.setOpacity(fade_opacity)
-
-                    painter.fillRect(QRectF(rx, ry, rw, rh), gradient)
-                else:
-                    if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-                        fade_opacity = self._get_fade_opacity(rx + rw / 2)
-                        painter.setOpacity(fade_opacity)
-
-                    painter.fillRect(QRectF(rx, ry, rw, rh), self._cava_widget.foreground_color)
-
-    def draw_bars_mirrored(self, painter: QPainter) -> None:
-        """Draw mirrored bar visualization"""
-        if not self._cava_widget.samples:
-            return
-        dpr = self._device_pixel_ratio(painter)
-        width = self.width()
-        height = float(self._cava_widget.config.bar_height)
-        samples = self._cava_widget.samples
-        center_y = height / 2.0
-
-        band_w_px = max(1, round(self._cava_widget.config.bar_width * dpr))
-        band_s_px = max(0, round(self._cava_widget.config.bar_spacing * dpr))
-
-        total_w_px = max(1, round(float(width) * dpr))
-        bars_count = len(samples)
-        total_bars_width_px = bars_count * band_w_px + max(0, (bars_count - 1)) * band_s_px
-        left_margin_px = max(0, (total_w_px - total_bars_width_px) // 2)
-
-        # Precompute brushes (single gradient instance reused)
-        if self._cava_widget.config.gradient == 1 and self._cava_widget.colors:
-            stop_step = 1.0 / (len(self._cava_widget.colors) - 1)
-            gradient_upper = QLinearGradient(0, 1, 0, 0)
-            gradient_upper.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-            gradient_lower = QLinearGradient(0, 0, 0, 1)
-            gradient_lower.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-            for idx, color in enumerate(self._cava_widget.colors):
-                gradient_upper.setColorAt(idx * stop_step, color)
-                gradient_lower.setColorAt(idx * stop_step, color)
-            brush_upper = gradient_upper
-            brush_lower = gradient_lower
-        else:
-            brush_upper = brush_lower = self._cava_widget.foreground_color
-
-        for i, sample in enumerate(samples):
-            ux_px = left_margin_px + i * (band_w_px + band_s_px)
-
-            min_height_logical = float(self._cava_widget.config.min_bar_height) / dpr
-            full_height_logical = max(min_height_logical, sample * float(self._cava_widget.config.bar_height))
-
-            full_h_px = round(full_height_logical * dpr)
-            if full_h_px <= 0:
-                continue
-
-            up_px = full_h_px // 2
-            down_px = full_h_px - up_px
-
-            uy_px = max(0, round(center_y * dpr) - up_px)
-            if up_px > 0:
-                if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-                    fade_opacity = self._get_fade_opacity(ux_px / dpr + (band_w_px / dpr) / 2)
-                    painter.setOpacity(fade_opacity)
-
-                painter.fillRect(QRectF(ux_px / dpr, uy_px / dpr, band_w_px / dpr, up_px / dpr), brush_upper)
-
-            ly_px = round(center_y * dpr)
-            if down_px > 0:
-                max_h_px = round(height * dpr)
-                if ly_px + down_px > max_h_px:
-                    down_px = max(0, max_h_px - ly_px)
-                if down_px > 0:
-                    if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-                        fade_opacity = self._get_fade_opacity(ux_px / dpr + (band_w_px / dpr) / 2)
-                        painter.setOpacity(fade_opacity)
-
-                    painter.fillRect(QRectF(ux_px / dpr, ly_px / dpr, band_w_px / dpr, down_px / dpr), brush_lower)
-
-    def draw_waves(self, painter: QPainter, radius: int = 1) -> None:
-        """Draw wave visualization."""
-        if not self._cava_widget.samples:
-            return
-
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        dpr = self._device_pixel_ratio(painter)
-
-        height = float(self._cava_widget.config.bar_height)
-        samples = self._cava_widget.samples
-
-        if self._cava_widget.config.gradient == 1 and self._cava_widget.colors:
-            stop_step = 1.0 / (len(self._cava_widget.colors) - 1)
-            gradient = QLinearGradient(0, 1, 0, 0)
-            gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-            for idx, color in enumerate(self._cava_widget.colors):
-                gradient.setColorAt(idx * stop_step, color)
-            brush = gradient
-        else:
-            brush = self._cava_widget.foreground_color
-
-        n = len(samples)
-        if n == 0:
-            return
-
-        def smooth(i: int) -> float:
-            start = max(0, i - radius)
-            end = min(n, i + radius + 1)
-            window = samples[start:end]
-            return sum(window) / len(window) if window else 0.0
-
-        widget_w = float(self.width())
-        step = widget_w / max(1, n)
-        points = []
-        min_h_logical = float(self._cava_widget.config.min_bar_height) / dpr
-        for i in range(n):
-            cx = i * step + step / 2.0
-            val = max(min_h_logical, smooth(i) * height)
-            top = max(0.0, height - val)
-            points.append(QPointF(cx, top))
-
-        path = QPainterPath()
-        bottom = height
-        path.moveTo(points[0].x(), bottom)
-        path.lineTo(points[0])
-        for p in points[1:]:
-            path.lineTo(p)
-        path.lineTo(points[-1].x(), bottom)
-        path.closeSubpath()
-
-        if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-            # Draw wave in strips with varying opacity
-            widget_width = self.width()
-            widget_height = int(height)  # Convert to int for setClipRect
-            strip_width = 1  # 1 pixel wide strips for smooth fade
-
-            for x in range(int(widget_width)):
-                opacity = self._get_fade_opacity(x)
-                if opacity > 0:
-                    painter.setOpacity(opacity)
-                    # Create a clip rect for this strip
-                    painter.setClipRect(x, 0, strip_width, widget_height)
-                    painter.fillPath(path, brush)
-
-            # Reset clipping and opacity
-            painter.setClipRect(0, 0, int(widget_width), widget_height)
-            painter.setOpacity(1.0)
-        else:
-            # No fade effect - use simple fillPath for efficiency
-            painter.fillPath(path, brush)
-
-    def draw_waves_mirrored(self, painter: QPainter, radius: int = 1) -> None:
-        """Draw a mirrored wave visualization."""
-        if not self._cava_widget.samples:
-            return
-
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        dpr = self._device_pixel_ratio(painter)
-        height = float(self._cava_widget.config.bar_height)
-        samples = self._cava_widget.samples
-        center_y = height / 2.0
-
-        if self._cava_widget.config.gradient == 1 and self._cava_widget.colors:
-            colors_len = len(self._cava_widget.colors)
-            stop_step = 1.0 / (colors_len - 1) if colors_len > 1 else 1.0
-            gradient = QLinearGradient(0, 0, 0, 1)
-            gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-            for idx, color in enumerate(self._cava_widget.colors):
-                s = idx * stop_step
-                pos_top = max(0.0, 0.5 - s * 0.5)
-                pos_bottom = min(1.0, 0.5 + s * 0.5)
-                gradient.setColorAt(pos_top, color)
-                gradient.setColorAt(pos_bottom, color)
-            fill_brush = gradient
-        else:
-            fill_brush = self._cava_widget.foreground_color
-
-        n = len(samples)
-        if n == 0:
-            return
-
-        def smooth(i: int) -> float:
-            start = max(0, i - radius)
-            end = min(n, i + radius + 1)
-            window = samples[start:end]
-            return sum(window) / len(window) if window else 0.0
-
-        widget_w = float(self.width())
-        step = widget_w / max(1, n)
-
-        top_points = []
-        bottom_points = []
-        min_h_logical = float(self._cava_widget.config.min_bar_height) / dpr
-        for i in range(n):
-            cx = i * step + step / 2.0
-            val = max(min_h_logical, smooth(i) * height / 2.0)
-            top_y = max(0.0, center_y - val)
-            bottom_y = min(height, center_y + val)
-            top_points.append(QPointF(cx, top_y))
-            bottom_points.append(QPointF(cx, bottom_y))
-
-        combined = QPainterPath()
-        combined.moveTo(top_points[0].x(), center_y)
-        combined.lineTo(top_points[0])
-        for p in top_points[1:]:
-            combined.lineTo(p)
-        for p in reversed(bottom_points):
-            combined.lineTo(p)
-        combined.closeSubpath()
-
-        if self._cava_widget._edge_fade_left > 0 or self._cava_widget._edge_fade_right > 0:
-            # Draw wave in strips with varying opacity
-            widget_width = self.width()
-            widget_height = int(height)  # Convert to int for setClipRect
-            strip_width = 1  # 1 pixel wide strips for smooth fade
-
-            for x in range(int(widget_width)):
-                opacity = self._get_fade_opacity(x)
-                if opacity > 0:
-                    painter.setOpacity(opacity)
-                    # Create a clip rect for this strip
-                    painter.setClipRect(x, 0, strip_width, widget_height)
-                    painter.fillPath(combined, fill_brush)
-
-            # Reset clipping and opacity
-            painter.setClipRect(0, 0, int(widget_width), widget_height)
-            painter.setOpacity(1.0)
-        else:
-            # No fade effect - use simple fillPath for efficiency
-            painter.fillPath(combined, fill_brush)
-
-
 class CavaWidget(BaseWidget):
     validation_schema = CavaConfig
     samplesUpdated = pyqtSignal(list)
-    _instance_counter = 0  # Class variable to track instances
 
     _edge_fade_left: int
     _edge_fade_right: int
-    _cava_process: subprocess.Popen[bytes] | None
-    thread_cava: threading.Thread | None
+    _cava_hub: CavaHub | None
+    _pending_frame: tuple[float, ...] | None
     foreground_color: QColor
     colors: list[QColor]
     samples: list[float]
-    _instance_id: int
     _hide_cava_widget: bool
     _stop_cava: bool
     _hide_timer: QTimer | None
@@ -384,12 +31,10 @@ class CavaWidget(BaseWidget):
     def __init__(self, config: CavaConfig):
         super().__init__(class_name=f"cava-widget {config.class_name}")
         self.config = config
-        # Assign unique instance ID
-        CavaWidget._instance_counter += 1
-        self._instance_id = CavaWidget._instance_counter
 
-        self._cava_process = None
-        self.thread_cava = None
+        self._cava_hub = None
+        self._pending_frame = None
+        self.frames_dropped = 0
         self._hide_timer = None
         self._hide_cava_widget = True
         self._stop_cava = False
@@ -445,13 +90,16 @@ class CavaWidget(BaseWidget):
         atexit.register(self.stop_cava)
 
     def _reload_cava(self):
-        """Stop current cava process and start a new one"""
+        """Restart the shared cava process"""
         try:
-            self.stop_cava()
-
             self.samples = [0] * self.config.bars_number
+            self._pending_frame = None
+            self._bar_frame.invalidate_cache()
 
-            QTimer.singleShot(500, self.start_cava)
+            if self._cava_hub:
+                QTimer.singleShot(500, self._cava_hub.restart)
+            else:
+                QTimer.singleShot(500, self.start_cava)
 
             if self.config.hide_empty and self.config.sleep_timer > 0:
                 if self._hide_timer:
@@ -464,15 +112,15 @@ class CavaWidget(BaseWidget):
     def stop_cava(self) -> None:
         self._stop_cava = True
         self.colors.clear()
-        if self._cava_process and self._cava_process.poll() is None:
-            try:
-                self._cava_process.terminate()
-                self._cava_process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                self._cava_process.kill()
-        if self.thread_cava and self.thread_cava.is_alive():
-            if threading.current_thread() != self.thread_cava:
-                self.thread_cava.join(timeout=2)
+        hub = self._cava_hub
+        if hub is None:
+            return
+        self._cava_hub = None
+        try:
+            hub.frame_ready.disconnect(self._on_cava_frame)
+        except TypeError, RuntimeError:
+            pass
+        hub.release(self.config.bars_number)
 
     def initialize_colors(self) -> None:
         self.foreground_color = QColor(self.config.foreground)
@@ -501,6 +149,8 @@ class CavaWidget(BaseWidget):
                         self._hide_cava_widget = False
                     if self._hide_timer:
                         self._hide_timer.start()
+                if self._bar_frame.isVisible():
+                    self._bar_frame.paint_pending = True
                 self._bar_frame.update()
             except Exception as e:
                 logging.error("Error updating cava widget: %s", e)
@@ -512,99 +162,29 @@ class CavaWidget(BaseWidget):
     def start_cava(self) -> None:
         # Reset stop flag to allow new process to start
         self._stop_cava = False
-
-        # Build configuration file, temp config file will be created in YASB TEMP directory
-        lines: list[str] = []
-        lines.append("# Cava config auto-generated by YASB")
-        lines.append("[general]")
-        lines.append(f"bars = {self.config.bars_number}")
-        lines.append(f"bar_spacing = {self.config.bar_spacing}")
-        lines.append(f"bar_width = {self.config.bar_width}")
-        lines.append(f"sleep_timer = {self.config.sleep_timer}")
-        lines.append(f"sensitivity = {self.config.sensitivity}")
-        lines.append(f"lower_cutoff_freq = {self.config.lower_cutoff_freq}")
-        lines.append(f"higher_cutoff_freq = {self.config.higher_cutoff_freq}")
-        lines.append(f"framerate = {self.config.framerate}")
-        lines.append("")
-        lines.append("[input]")
-        lines.append(f"source = {self.config.source}")
-        lines.append("")
-        lines.append("[output]")
-        lines.append("method = raw")
-        lines.append(f"bit_format = {self.config.output_bit_format}")
-        lines.append(f"orientation = {self.config.orientation}")
-        lines.append(f"channels = {self.config.channels}")
-        lines.append(f"mono_option = {self.config.mono_option}")
-        lines.append(f"reverse = {self.config.reverse}")
-        lines.append(f"waveform = {self.config.waveform}")
-        lines.append("")
-        lines.append("[color]")
-        lines.append(f"foreground = '{self.config.foreground}'")
-        lines.append(f"gradient = {self.config.gradient}")
-        if self.config.gradient_color_1:
-            lines.append(f"gradient_color_1 = '{self.config.gradient_color_1}'")
-        if self.config.gradient_color_2:
-            lines.append(f"gradient_color_2 = '{self.config.gradient_color_2}'")
-        if self.config.gradient_color_3:
-            lines.append(f"gradient_color_3 = '{self.config.gradient_color_3}'")
-        lines.append("")
-        lines.append("[smoothing]")
-        lines.append(f"monstercat = {self.config.monstercat}")
-        lines.append(f"waves = {self.config.waves}")
-        lines.append(f"noise_reduction = {int(self.config.noise_reduction)}")
-
-        config_template = "\n".join(lines) + "\n"
-
         self.initialize_colors()
+        if self._cava_hub is None:
+            self._cava_hub = CavaHub.acquire(self.config)
+            self._cava_hub.frame_ready.connect(self._on_cava_frame)
 
-        # Determine byte type settings for reading audio data
-        if self.config.output_bit_format == "16bit":
-            bytetype, bytesize, bytenorm = ("H", 2, 65535)
-        else:
-            bytetype, bytesize, bytenorm = ("B", 1, 255)
-
-        def process_audio():
-            cava_config_path = None
-            try:
-                cava_config_path = app_data_path(f"yasb_cava_config_{self._instance_id}")
-                with open(cava_config_path, "w") as config_file:
-                    config_file.write(config_template)
-                    config_file.flush()
-
-                self._cava_process = subprocess.Popen(
-                    ["cava", "-p", cava_config_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-
-                chunk = bytesize * self.config.bars_number
-                fmt = bytetype * self.config.bars_number
-
-                while not self._stop_cava:
-                    try:
-                        data = self._cava_process.stdout.read(chunk)
-                        if len(data) < chunk:
-                            break
-                        samples = [val / bytenorm for val in struct.unpack(fmt, data)]
-                        self.samplesUpdated.emit(samples)
-                    except Exception as e:
-                        logging.error("Error reading cava data: %s", e)
-                        break
-
-            except Exception as e:
-                logging.error("Error starting cava process: %s", e)
-            finally:
-                # Clean up config file
-                if cava_config_path and os.path.exists(cava_config_path):
-                    try:
-                        os.unlink(cava_config_path)
-                    except:
-                        pass
+    def _on_cava_frame(self, frame: tuple[float, ...]) -> None:
+        if self._stop_cava or self._cava_hub is None:
+            return
+        if self._bar_frame.paint_pending:
+            # The previous frame is not painted yet, keep only the newest one until it is
+            if self._pending_frame is not None:
+                self.frames_dropped += 1
+            self._pending_frame = frame
+            return
+        self._emit_frame(frame)
 
-        # Wait for previous thread to finish if it exists
-        if self.thread_cava and self.thread_cava.is_alive():
-            self.thread_cava.join(timeout=1)
+    def _emit_frame(self, frame: tuple[float, ...]) -> None:
+        if self._stop_cava or self._cava_hub is None:
+            return
+        self.samplesUpdated.emit(list(resample_frame(frame, self.config.bars_number, self._cava_hub.stereo)))
 
-        self.thread_cava = threading.Thread(target=process_audio, daemon=True)
-        self.thread_cava.start()
+    def frame_painted(self) -> None:
+        """Called by the bar frame after painting, delivers a frame that arrived in the meantime."""
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is not None:
+            QTimer.singleShot(0, lambda: self._emit_frame(frame))
@@ -32,6 +32,7 @@ from core.config import HOME_CONFIGURATION_DIR
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, add_shadow, refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.label_template import compile_label_template
 from core.utils.win32.backdrop import enable_blur
 from core.utils.win32.utils import apply_qmenu_style
 from core.validation.widgets.yasb.clock import ClockConfig
@@ -489,9 +490,7 @@ class ClockWidget(BaseWidget):
         # Choose which label set to update (primary or alternate)
         active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
+        template = compile_label_template(active_label_content)
         now = datetime.now(ZoneInfo(self._active_tz)) if self._active_tz else datetime.now().astimezone()
         current_hour = f"{now.hour:02d}"
         current_minute = f"{now.minute:02d}"
@@ -517,36 +516,36 @@ class ClockWidget(BaseWidget):
                 self._timer_label.hide()
                 self._timer_visible = False
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon_placeholder = re.sub(r"<span.*?>|</span>", "", part).strip()
+        for segment, label in zip(template, active_widgets):
+            if isinstance(label, QLabel):
+                if segment.is_icon:
+                    icon_placeholder = segment.text
                     if icon_placeholder == "{icon}":
                         if hour_changed:
                             icon = self._get_icon_for_hour(now.hour)
-                            active_widgets[widget_index].setText(icon)
+                            label.setText(icon)
                             hour_class = f"clock_{current_hour}"
-                            active_widgets[widget_index].setProperty("class", f"icon {hour_class}")
-                            refresh_widget_style(active_widgets[widget_index])
+                            label.setProperty("class", f"icon {hour_class}")
+                            refresh_widget_style(label)
                     elif icon_placeholder == "{alarm}":
                         if self._shared_state._snoozed_alarms:
-                            active_widgets[widget_index].setText(self.config.alarm_icons.snooze)
-                            active_widgets[widget_index].setProperty("class", "icon alarm snooze")
-                            active_widgets[widget_index].setVisible(True)
-                            refresh_widget_style(active_widgets[widget_index])
+                            label.setText(self.config.alarm_icons.snooze)
+                            label.setProperty("class", "icon alarm snooze")
+                            label.setVisible(True)
+                            refresh_widget_style(label)
                         elif self._has_enabled_alarms():
-                            active_widgets[widget_index].setText(self.config.alarm_icons.enabled)
-                            active_widgets[widget_index].setProperty("class", "icon alarm")
-                            active_widgets[widget_index].setVisible(True)
-                            refresh_widget_style(active_widgets[widget_index])
+                            label.setText(self.config.alarm_icons.enabled)
+                            label.setProperty("class", "icon alarm")
+                            label.setVisible(True)
+                            refresh_widget_style(label)
                         else:
-                            active_widgets[widget_index].setText("")
-                            active_widgets[widget_index].setVisible(False)
+                            label.setText("")
+                            label.setVisible(False)
 
                     else:
-                        active_widgets[widget_index].setText(icon_placeholder)
+                        label.setText(icon_placeholder)
                 else:
+                    part = segment.text
                     has_alarm = "{alarm}" in part and (self._shared_state._snoozed_alarms or self._has_enabled_alarms())
 
                     if "{icon}" in part:
@@ -568,23 +567,22 @@ class ClockWidget(BaseWidget):
                     except Exception:
                         format_label_content = part
 
-                    active_widgets[widget_index].setText(format_label_content)
+                    label.setText(format_label_content)
 
                     alarm_state_changed = has_alarm != self._previous_alarm_state
                     if has_alarm:
                         if self._shared_state._snoozed_alarms:
-                            active_widgets[widget_index].setProperty("class", "label alarm snooze")
+                            label.setProperty("class", "label alarm snooze")
                         else:
-                            active_widgets[widget_index].setProperty("class", "label alarm")
-                        refresh_widget_style(active_widgets[widget_index])
+                            label.setProperty("class", "label alarm")
+                        refresh_widget_style(label)
                     else:
                         hour_class = f"clock_{current_hour}"
-                        active_widgets[widget_index].setProperty("class", f"label {hour_class}")
+                        label.setProperty("class", f"label {hour_class}")
                         if hour_changed or alarm_state_changed:
-                            refresh_widget_style(active_widgets[widget_index])
+                            refresh_widget_style(label)
 
                     self._previous_alarm_state = has_alarm
-                widget_index += 1
 
         self._restore_locale_context(org_locale_time, org_locale_ctype)
 
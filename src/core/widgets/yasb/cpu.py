@@ -1,16 +1,17 @@
-import re
 from collections import deque
 
 from PyQt6.QtWidgets import QLabel
 
+from core.utils.class_state import set_widget_class
+from core.utils.runtime_stats import timer_update
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
-from core.utils.widgets.cpu.cpu_api import CpuData, CpuFreq, CpuWorker
+from core.utils.widgets.cpu.cpu_api import CpuData, CpuFreq, CpuSource
 from core.utils.widgets.stat_popup import build_stat_popup
+from core.utils.widgets.telemetry.sampler import TelemetrySampler
 from core.validation.widgets.yasb.cpu import CpuConfig
 from core.widgets.base import BaseWidget
 
@@ -18,9 +19,6 @@ from core.widgets.base import BaseWidget
 class CpuWidget(BaseWidget):
     validation_schema = CpuConfig
 
-    _instances: list[CpuWidget] = []
-    _worker: CpuWorker | None = None
-
     def __init__(self, config: CpuConfig):
         super().__init__(class_name=f"cpu-widget {config.class_name}")
         self.config = config
@@ -42,16 +40,12 @@ class CpuWidget(BaseWidget):
         self.callback_right = self.config.callbacks.on_right
         self.callback_middle = self.config.callbacks.on_middle
 
-        # Add this instance to the shared instances list
-        if self not in CpuWidget._instances:
-            CpuWidget._instances.append(self)
-
-        # Start the shared CPU worker thread
-        if self.config.update_interval > 0 and CpuWidget._worker is None:
-            worker = CpuWorker.get_instance(self.config.update_interval)
-            worker.data_ready.connect(CpuWidget._on_data_ready)
-            worker.start()
-            CpuWidget._worker = worker
+        # Subscribe to the shared sampler at this widget's own interval
+        if self.config.update_interval > 0:
+            self._subscription = TelemetrySampler.instance().subscribe(
+                CpuSource(), self.config.update_interval, parent=self
+            )
+            self._subscription.data_ready.connect(self._on_data_ready)
 
         self._show_placeholder()
 
@@ -66,18 +60,14 @@ class CpuWidget(BaseWidget):
         )
         self._update_label(data)
 
-    @classmethod
-    def _on_data_ready(cls, data: CpuData):
-        """Slot called on the main thread when new CPU data arrives from the worker."""
-        for inst in cls._instances[:]:
-            try:
-                inst._last_data = data
-                inst._update_label(data)
-                if inst.config.menu.enabled:
-                    inst._history.append(data.percent)
-                    inst._update_popup(data)
-            except RuntimeError:
-                cls._instances.remove(inst)
+    @timer_update
+    def _on_data_ready(self, data: CpuData):
+        """Slot called on the main thread when new CPU data arrives from the sampler."""
+        self._last_data = data
+        self._update_label(data)
+        if self.config.menu.enabled:
+            self._history.append(data.percent)
+            self._update_popup(data)
 
     def _update_popup(self, data: CpuData):
         """Push fresh data into the open popup if visible."""
@@ -162,12 +152,6 @@ class CpuWidget(BaseWidget):
             },
         }
 
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         if self.config.progress_bar.enabled and self.progress_widget:
             if self._widget_container_layout.indexOf(self.progress_widget) == -1:
                 self._widget_container_layout.insertWidget(
@@ -176,22 +160,12 @@ class CpuWidget(BaseWidget):
                 )
             self.progress_widget.set_value(data.percent)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = part.format(info=cpu_info)
-                    active_widgets[widget_index].setText(formatted_text)
-                    active_widgets[widget_index].setProperty("class", label_class)
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_cpu_threshold(data.percent)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        renderer = self.active_label_renderer
+        renderer.render(lambda segment: segment.format(info=cpu_info))
+        label_class = "label alt" if self._show_alt_label else "label"
+        status_class = f"status-{self._get_cpu_threshold(data.percent)}"
+        for label in renderer.text_labels():
+            set_widget_class(label, (label_class, status_class))
 
     def _toggle_label(self):
         if self.config.animation.enabled:
@@ -1,16 +1,18 @@
 import os
-import re
 
 import win32api
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QVBoxLayout, QWidget
 
+from core.utils.class_state import set_widget_class
+from core.utils.runtime_stats import timer_update
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.disk.disk_api import DiskSource, DiskSpace, get_disk_space
+from core.utils.widgets.telemetry.sampler import TelemetrySampler
 from core.validation.widgets.yasb.disk import DiskConfig
 from core.widgets.base import BaseWidget
 
@@ -32,7 +34,7 @@ class DiskWidget(BaseWidget):
     validation_schema = DiskConfig
 
     def __init__(self, config: DiskConfig):
-        super().__init__(int(config.update_interval * 1000), class_name=f"disk-widget {config.class_name}")
+        super().__init__(class_name=f"disk-widget {config.class_name}")
         self.config = config
         self._show_alt_label = False
         self.progress_widget = None
@@ -47,8 +49,14 @@ class DiskWidget(BaseWidget):
         self.callback_left = self.config.callbacks.on_left
         self.callback_right = self.config.callbacks.on_right
         self.callback_middle = self.config.callbacks.on_middle
-        self.callback_timer = "update_label"
-        self.start_timer()
+
+        # Free space is read on the shared sampler thread instead of a GUI timer
+        if self.config.update_interval > 0:
+            self._subscription = TelemetrySampler.instance().subscribe(
+                DiskSource(self.config.volume_label), int(self.config.update_interval * 1000), parent=self
+            )
+            self._subscription.data_ready.connect(self._on_space_ready)
+        self._update_label()
 
     def _toggle_label(self):
         if self.config.animation.enabled:
@@ -66,13 +74,13 @@ class DiskWidget(BaseWidget):
         self.show_group_label()
 
     def _update_label(self):
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split(r"(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
+        self._render_space(self._get_space())
+
+    @timer_update
+    def _on_space_ready(self, space: DiskSpace | None):
+        self._render_space(self._format_space(space) if space else None)
 
-        disk_space = self._get_space()
+    def _render_space(self, disk_space: dict | None):
         percent_value = float(disk_space["used"]["percent"].rstrip("%")) if disk_space else 0
 
         if self.config.progress_bar.enabled and self.progress_widget:
@@ -84,27 +92,15 @@ class DiskWidget(BaseWidget):
 
             self.progress_widget.set_value(percent_value)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    # Ensure the icon is correctly set
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    # Update label with formatted content
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = (
-                        part.format(space=disk_space, volume_label=self.config.volume_label.upper())
-                        if disk_space
-                        else part
-                    )
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_disk_threshold(percent_value)}"
-                    )
-                    active_widgets[widget_index].setText(formatted_text)
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        renderer = self.active_label_renderer
+        volume_label = self.config.volume_label.upper()
+        renderer.render(
+            lambda segment: segment.format(space=disk_space, volume_label=volume_label) if disk_space else segment.text
+        )
+        label_class = "label alt" if self._show_alt_label else "label"
+        status_class = f"status-{self._get_disk_threshold(percent_value)}"
+        for label in renderer.text_labels():
+            set_widget_class(label, (label_class, status_class))
 
     def _get_volume_label(self, drive_letter: str) -> str | None:
         if not self.config.group_label.show_label_name:
@@ -200,15 +196,11 @@ class DiskWidget(BaseWidget):
     def _get_space(self, volume_label: str | None = None):
         if volume_label is None:
             volume_label = self.config.volume_label.upper()
+        space = get_disk_space(volume_label)
+        return self._format_space(space) if space else None
 
-        try:
-            free_bytes, total_bytes, _ = win32api.GetDiskFreeSpaceEx(f"{volume_label}:\\")
-        except Exception:
-            return None
-
-        if total_bytes == 0:
-            return None
-
+    def _format_space(self, space: DiskSpace) -> dict:
+        free_bytes, total_bytes = space
         used_bytes = total_bytes - free_bytes
         percent_used = (used_bytes / total_bytes) * 100
         percent_free = 100 - percent_used
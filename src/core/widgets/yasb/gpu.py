@@ -1,17 +1,18 @@
-import re
 from collections import deque
 
 from humanize import naturalsize
 from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout
 
+from core.utils.class_state import set_widget_class
+from core.utils.runtime_stats import timer_update
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
-from core.utils.widgets.gpu.gpu_api import GpuData, GpuWorker
+from core.utils.widgets.gpu.gpu_api import GpuData, GpuSource
 from core.utils.widgets.stat_popup import GraphWidget, build_stat_popup
+from core.utils.widgets.telemetry.sampler import TelemetrySampler
 from core.validation.widgets.yasb.gpu import GpuConfig
 from core.widgets.base import BaseWidget
 
@@ -19,9 +20,7 @@ from core.widgets.base import BaseWidget
 class GpuWidget(BaseWidget):
     validation_schema = GpuConfig
 
-    # Class-level shared data and worker
     _instances: list[GpuWidget] = []
-    _worker: GpuWorker | None = None
 
     def __init__(self, config: GpuConfig):
         super().__init__(class_name=f"gpu-widget {config.class_name}")
@@ -50,35 +49,30 @@ class GpuWidget(BaseWidget):
         if self not in GpuWidget._instances:
             GpuWidget._instances.append(self)
 
-        # Start the shared GPU worker thread
+        # Subscribe to the shared sampler at this widget's own interval
         if self.config.update_interval > 0:
-            worker = GpuWorker.get_instance(self.config.update_interval)
-            worker.add_index(self.config.gpu_index)
-            if GpuWidget._worker is None:
-                worker.data_ready.connect(GpuWidget._on_gpu_data)
-                worker.start()
-                GpuWidget._worker = worker
+            sampler = TelemetrySampler.instance()
+            source = sampler.source(GpuSource.key) or GpuSource()
+            source.add_index(self.config.gpu_index)
+            self._subscription = sampler.subscribe(source, self.config.update_interval, parent=self)
+            self._subscription.data_ready.connect(self._on_gpu_data)
 
         self.hide()
 
-    @classmethod
-    def _on_gpu_data(cls, gpu_data_list: list[GpuData]):
-        """Slot called on main thread when GPU worker emits data."""
-        for inst in cls._instances[:]:
-            try:
-                gpu_data = next((g for g in gpu_data_list if g.index == inst.config.gpu_index), None)
-                if gpu_data:
-                    if inst.isHidden():
-                        inst.show()
-                    inst._update_label(gpu_data)
-                    if inst.config.menu.enabled:
-                        inst._history.append(gpu_data.utilization)
-                        inst._temp_history.append(gpu_data.temp)
-                        inst._update_popup(gpu_data)
-                elif not inst.isHidden():
-                    inst.hide()
-            except RuntimeError:
-                cls._instances.remove(inst)
+    @timer_update
+    def _on_gpu_data(self, gpu_data_list: list[GpuData]):
+        """Slot called on main thread when the sampler emits GPU data."""
+        gpu_data = next((g for g in gpu_data_list if g.index == self.config.gpu_index), None)
+        if gpu_data:
+            if self.isHidden():
+                self.show()
+            self._update_label(gpu_data)
+            if self.config.menu.enabled:
+                self._history.append(gpu_data.utilization)
+                self._temp_history.append(gpu_data.temp)
+                self._update_popup(gpu_data)
+        elif not self.isHidden():
+            self.hide()
 
     def _update_label(self, gpu_data: GpuData):
         """Update the label with GPU data."""
@@ -111,12 +105,6 @@ class GpuWidget(BaseWidget):
             },
         }
 
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         if self.config.progress_bar.enabled and self.progress_widget:
             if self._widget_container_layout.indexOf(self.progress_widget) == -1:
                 self._widget_container_layout.insertWidget(
@@ -125,22 +113,12 @@ class GpuWidget(BaseWidget):
                 )
             self.progress_widget.set_value(gpu_data.utilization)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = part.format(info=gpu_info)
-                    active_widgets[widget_index].setText(formatted_text)
-                    active_widgets[widget_index].setProperty("class", label_class)
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_gpu_threshold(gpu_data.utilization)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        renderer = self.active_label_renderer
+        renderer.render(lambda segment: segment.format(info=gpu_info))
+        label_class = "label alt" if self._show_alt_label else "label"
+        status_class = f"status-{self._get_gpu_threshold(gpu_data.utilization)}"
+        for label in renderer.text_labels():
+            set_widget_class(label, (label_class, status_class))
 
     def _get_gpu_threshold(self, utilization: float) -> str:
         if utilization <= self.config.gpu_thresholds.low:
@@ -3,7 +3,9 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 import time
+from collections import deque
 from functools import lru_cache
 from typing import Any
 
@@ -43,6 +45,8 @@ from core.config import HOME_CONFIGURATION_DIR
 from core.utils.shell_utils import shell_open
 from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.launchpad.grid_view import LaunchpadGridView
+from core.utils.widgets.launchpad.model import LaunchpadAppModel, LaunchpadItem
 from core.utils.win32.app_loader import AppListLoader, ShortcutResolver
 from core.utils.win32.backdrop import enable_blur
 from core.utils.win32.icon_extractor import IconExtractorUtil, UrlExtractorUtil
@@ -86,22 +90,35 @@ def load_and_scale_icon(icon_path: str, size: int, dpr=1.0) -> QPixmap:
 
 
 class IconLoadWorker(QThread):
-    """Background thread for loading icons"""
+    """Background thread for loading icons, more requests can be queued while it runs"""
 
     icon_loaded = pyqtSignal(str, QPixmap)
 
     def __init__(self, icon_requests):
         super().__init__()
-        self.icon_requests = icon_requests
+        self._requests = deque(icon_requests)
+        self._lock = threading.Lock()
+        self._drained = False
         self._should_stop = False
 
     def stop(self):
         self._should_stop = True
 
+    def add_requests(self, icon_requests) -> bool:
+        """Queue more requests, returns False if the worker already finished its queue."""
+        with self._lock:
+            if self._drained or self._should_stop:
+                return False
+            self._requests.extend(icon_requests)
+            return True
+
     def run(self):
-        for icon_path, size, dpr in self.icon_requests:
-            if self._should_stop:
-                break
+        while True:
+            with self._lock:
+                if self._should_stop or not self._requests:
+                    self._drained = True
+                    return
+                icon_path, size, dpr = self._requests.popleft()
             if os.path.isfile(icon_path):
                 try:
                     pixmap = load_and_scale_icon(icon_path, size, dpr)
@@ -361,6 +378,7 @@ class AppDialog(QDialog):
 
         self._app_loader = AppListLoader()
         self._app_loader.apps_loaded.connect(on_apps_loaded)
+        self._app_loader.apps_changed.connect(lambda delta: on_apps_loaded(delta.apps))
         self._app_loader.start()
 
     def _fetch_url_info(self):
@@ -610,11 +628,12 @@ class LaunchpadWidget(BaseWidget):
         self._overlay = None
         self._drop_overlay = None
         self._is_closing = False
-        self._app_icons = []
-        self._all_apps = []
         self._icon_worker = None
-        self._grid_columns = 0
         self._num_drag_items = 0
+        # Apps are kept in memory and only reread when apps.json changed on disk
+        self._apps: list[dict[str, Any]] | None = None
+        self._apps_mtime = None
+        self._app_model = LaunchpadAppModel(self)
         self._previous_hwnd = 0
 
         self._init_container(self._container_shadow)
@@ -648,6 +667,7 @@ class LaunchpadWidget(BaseWidget):
         self._center_popup_on_screen()
         if self._overlay:
             self._overlay.show()
+        self._stored_apps(check_disk=True)
         self._launchpad_popup.show()
         self._populate_grid()
 
@@ -658,6 +678,12 @@ class LaunchpadWidget(BaseWidget):
         if self._launchpad_popup and not self._is_closing:
             self._fade_out_popup()
 
+    def _create_cell(self, item: LaunchpadItem) -> QFrame:
+        """Cell factory of the grid view"""
+        if item.is_group:
+            return self._create_group_widget(item.title, item.apps)
+        return self._create_app_icon_widget(item.app)
+
     def _create_app_icon_widget(self, app_data: dict[str, Any]) -> QFrame:
         """Create an app icon widget"""
         app_icon = QFrame()
@@ -796,7 +822,7 @@ class LaunchpadWidget(BaseWidget):
         return app_icon
 
     def _load_app_icon(self, app_icon):
-        """Load icon for an app icon widget"""
+        """Set a cached icon on an app icon widget, uncached icons are loaded in background"""
         icon_path = app_icon.app_data.get("icon", "")
         if not icon_path or not os.path.isfile(icon_path):
             app_icon.icon_label.setText("")
@@ -807,21 +833,18 @@ class LaunchpadWidget(BaseWidget):
             app_icon.icon_label.setPixmap(_ICON_CACHE[cache_key])
             refresh_widget_style(app_icon.icon_label)
             app_icon._icon_loaded = True
-            return
-        try:
-            pixmap = load_and_scale_icon(icon_path, self._app_icon_size, self._dpr)
-            if not pixmap.isNull():
-                _ICON_CACHE[cache_key] = pixmap
-                app_icon.icon_label.setPixmap(pixmap)
-                refresh_widget_style(app_icon.icon_label)
-                app_icon._icon_loaded = True
-            else:
-                app_icon.icon_label.setText("")
-                app_icon._icon_loaded = True
-        except Exception as e:
-            logging.error("Failed to load icon %s: %s", icon_path, e)
-            app_icon.icon_label.setText("")
-            app_icon._icon_loaded = True
+
+    def _on_cells_created(self, cells):
+        """Load the icons of cells that became visible"""
+        icon_requests = []
+        for cell in cells:
+            if getattr(cell, "_icon_loaded", True):
+                continue
+            request = (cell.app_data.get("icon", ""), self._app_icon_size, self._dpr)
+            if request not in icon_requests:
+                icon_requests.append(request)
+        if icon_requests:
+            self._start_background_loading(icon_requests)
 
     def _reorder_apps(self, source_app_id: str, target_app_id: str):
         try:
@@ -838,14 +861,7 @@ class LaunchpadWidget(BaseWidget):
                 apps.insert(target_index, source_app)
                 self._save_apps(apps)
                 if self._launchpad_popup:
-                    # If we're in a group, refresh the group view
-                    if hasattr(self, "_current_group"):
-                        updated_apps = self._load_apps()
-                        group_apps_list = [app for app in updated_apps if app.get("group") == self._current_group]
-                        self._open_group(self._current_group, group_apps_list)
-                    else:
-                        current_search = self._launchpad_popup.search_input.text()
-                        self._populate_grid(current_search)
+                    self._refresh_view()
 
         except Exception as e:
             logging.error("Failed to reorder apps: %s", e)
@@ -1105,16 +1121,14 @@ class LaunchpadWidget(BaseWidget):
             QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: transparent; }
         """)
 
-        grid_container = QFrame()
-        grid_container.setObjectName("grid-container")
-        grid_container.setStyleSheet("#grid-container { background: transparent; }")
-        grid_container.setContentsMargins(0, 0, 0, 0)
-
-        grid_layout = QGridLayout(grid_container)
-        grid_layout.setContentsMargins(0, 0, 0, 0)
-        grid_layout.setSpacing(0)
-        grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignCenter)
-        scroll_area.setWidget(grid_container)
+        grid_view = LaunchpadGridView(scroll_area, self._create_cell)
+        grid_view.setObjectName("grid-container")
+        grid_view.setStyleSheet("#grid-container { background: transparent; }")
+        grid_view.setContentsMargins(0, 0, 0, 0)
+        grid_view.set_placeholder(self._create_no_apps_label())
+        grid_view.cells_created.connect(self._on_cells_created)
+        grid_view.set_model(self._app_model)
+        scroll_area.setWidget(grid_view)
         main_layout.addWidget(scroll_area)
 
         self.popup.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -1122,8 +1136,7 @@ class LaunchpadWidget(BaseWidget):
         self.popup.search_container = search_container
         self.popup.search_input = search_input
         self.popup.scroll_area = scroll_area
-        self.popup.grid_container = grid_container
-        self.popup.grid_layout = grid_layout
+        self.popup.grid_view = grid_view
 
         self.popup.setAcceptDrops(True)
         self.popup.mousePressEvent = lambda event: self._handle_popup_mouse_press(self.popup, event)
@@ -1150,14 +1163,28 @@ class LaunchpadWidget(BaseWidget):
 
         return self.popup
 
+    def _create_no_apps_label(self):
+        no_apps_label = QLabel(
+            f"No applications found<div style='font-size:14pt;margin-top:12px;font-weight:400'>press <b>{self._shortcuts['add_app']}</b> to add new apps</div>"
+        )
+        no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        no_apps_label.setTextFormat(Qt.TextFormat.RichText)
+        no_apps_label.setStyleSheet("font-size: 24pt;font-family: 'Segoe UI';padding: 40px")
+        return no_apps_label
+
+    def _focused_cell(self):
+        if not self._launchpad_popup:
+            return None
+        return self._launchpad_popup.grid_view.focused_cell()
+
     def _edit_selected_app(self):
-        focused_icon = next((icon for icon in self._app_icons if icon.hasFocus()), None)
-        if focused_icon:
+        focused_icon = self._focused_cell()
+        if focused_icon and hasattr(focused_icon, "app_data"):
             self._edit_app(focused_icon.app_data)
 
     def _delete_selected_app(self):
-        focused_icon = next((icon for icon in self._app_icons if icon.hasFocus()), None)
-        if focused_icon:
+        focused_icon = self._focused_cell()
+        if focused_icon and hasattr(focused_icon, "app_data"):
             self._delete_app(focused_icon.app_data)
 
     def _center_popup_on_screen(self):
@@ -1241,14 +1268,7 @@ class LaunchpadWidget(BaseWidget):
             apps.append(app_dict)
             self._save_apps(apps)
             if self._launchpad_popup and refresh_grid:
-                # If in group, refresh the group view
-                if hasattr(self, "_current_group"):
-                    # Reload apps to get the fresh list
-                    updated_apps = self._load_apps()
-                    group_apps_list = [app for app in updated_apps if app.get("group") == self._current_group]
-                    self._open_group(self._current_group, group_apps_list)
-                else:
-                    self._populate_grid()
+                self._refresh_view()
 
     def _popup_drag_enter_event(self, event):
         if event.mimeData().hasUrls():
@@ -1271,13 +1291,7 @@ class LaunchpadWidget(BaseWidget):
                 self._handle_file_drop(file_path, refresh_grid=False)
 
             # Refresh only once after all files are added
-            if hasattr(self, "_current_group"):
-                # If in group, refresh the group view
-                updated_apps = self._load_apps()
-                group_apps_list = [app for app in updated_apps if app.get("group") == self._current_group]
-                self._open_group(self._current_group, group_apps_list)
-            else:
-                self._populate_grid()
+            self._refresh_view()
 
             event.acceptProposedAction()
         else:
@@ -1297,11 +1311,11 @@ class LaunchpadWidget(BaseWidget):
             event.accept()
 
         elif event.key() in [Qt.Key.Key_Return, Qt.Key.Key_Enter]:
-            focused_icon = next((icon for icon in self._app_icons if icon.hasFocus()), None)
+            focused_icon = self._focused_cell()
             if focused_icon:
                 # Check if it's a group or an app
                 if hasattr(focused_icon, "is_group") and focused_icon.is_group:
-                    self._open_group(focused_icon.group_name, focused_icon.apps_in_group)
+                    self._open_group(focused_icon.group_name)
                 else:
                     self._launch_app(focused_icon.app_data)
             event.accept()
@@ -1316,8 +1330,8 @@ class LaunchpadWidget(BaseWidget):
 
         elif event.key() == Qt.Key.Key_Tab:
             if self._launchpad_popup.search_input.hasFocus():
-                if self._app_icons:
-                    self._app_icons[0].setFocus()
+                if self._launchpad_popup.grid_view.count():
+                    self._focus_icon(0)
             else:
                 self._launchpad_popup.search_input.setFocus()
             event.accept()
@@ -1329,9 +1343,11 @@ class LaunchpadWidget(BaseWidget):
             event.ignore()
 
     def _handle_arrow_navigation(self, key):
-        if not self._app_icons:
+        grid_view = self._launchpad_popup.grid_view
+        count = grid_view.count()
+        if not count:
             return
-        current_index = next((i for i, icon in enumerate(self._app_icons) if icon.hasFocus()), -1)
+        current_index = grid_view.focused_row()
         if current_index == -1:
             self._focus_icon(0)
             return
@@ -1339,11 +1355,11 @@ class LaunchpadWidget(BaseWidget):
         if key == Qt.Key.Key_Left:
             new_index = max(0, current_index - 1)
         elif key == Qt.Key.Key_Right:
-            new_index = min(len(self._app_icons) - 1, current_index + 1)
+            new_index = min(count - 1, current_index + 1)
         elif key == Qt.Key.Key_Up:
-            new_index = max(0, current_index - self._grid_columns)
+            new_index = max(0, current_index - grid_view.columns)
         elif key == Qt.Key.Key_Down:
-            new_index = min(len(self._app_icons) - 1, current_index + self._grid_columns)
+            new_index = min(count - 1, current_index + grid_view.columns)
         self._focus_icon(new_index)
 
     def _popup_enter_event(self, event):
@@ -1354,27 +1370,6 @@ class LaunchpadWidget(BaseWidget):
         self.popup.setCursor(Qt.CursorShape.ArrowCursor)
         QWidget.leaveEvent(self.popup, event)
 
-    def _scroll_to_icon(self, icon):
-        """
-        If the icon is above or below the visible area
-        adjusts the scrollbar so the icon comes into view.
-        """
-        if not self._launchpad_popup:
-            return
-        scroll_area = self._launchpad_popup.scroll_area
-        icon_rect = icon.geometry()
-        scroll_rect = scroll_area.viewport().rect()
-        scrollbar = scroll_area.verticalScrollBar()
-        current_scroll = scrollbar.value()
-        icon_top = icon_rect.top()
-        icon_bottom = icon_rect.bottom()
-        visible_top = current_scroll
-        visible_bottom = current_scroll + scroll_rect.height()
-        if icon_top < visible_top:
-            scrollbar.setValue(icon_top)
-        elif icon_bottom > visible_bottom:
-            scrollbar.setValue(icon_bottom - scroll_rect.height())
-
     def _popup_show_event(self, event):
         if self._window_style["enable_blur"]:
             try:
@@ -1386,7 +1381,7 @@ class LaunchpadWidget(BaseWidget):
 
     def _popup_close_event(self, event):
         if self._icon_worker and self._icon_worker.isRunning():
-            self._icon_worker.terminate()
+            self._icon_worker.stop()
             self._icon_worker.wait()
 
     def _update_search_results(self, text: str):
@@ -1395,159 +1390,25 @@ class LaunchpadWidget(BaseWidget):
     def _populate_grid(self, search_text: str = ""):
         if not self._launchpad_popup:
             return
-        grid_layout = self._launchpad_popup.grid_layout
-        for i in reversed(range(grid_layout.count())):
-            child = grid_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        self._app_icons.clear()
-        self._all_apps = self._load_apps()
-
-        # Filter apps based on search text
-        filtered_apps = []
-        if search_text:
-            # Support group:name syntax for filtering by group
-            if search_text.startswith("group:"):
-                group_filter = search_text[6:].strip().lower()
-                for app_data in self._all_apps:
-                    app_group = (app_data.get("group") or "").lower()
-                    if group_filter in app_group:
-                        filtered_apps.append(app_data)
-            else:
-                for app_data in self._all_apps:
-                    if search_text.lower() in app_data.get("title", "").lower():
-                        filtered_apps.append(app_data)
+        self._stored_apps()
+        if hasattr(self, "_current_group") and not search_text:
+            self._app_model.set_filter(group=self._current_group)
         else:
-            filtered_apps = self._all_apps
+            # Show group folders unless searching or inside a group
+            grouped = self._group_apps and not search_text and not hasattr(self, "_current_group")
+            self._app_model.set_filter(search_text, grouped=grouped)
 
-        if not filtered_apps:
-            no_apps_label = QLabel(
-                f"No applications found<div style='font-size:14pt;margin-top:12px;font-weight:400'>press <b>{self._shortcuts['add_app']}</b> to add new apps</div>"
-            )
-            no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_apps_label.setTextFormat(Qt.TextFormat.RichText)
-            no_apps_label.setStyleSheet("font-size: 24pt;font-family: 'Segoe UI';padding: 40px")
-            grid_layout.addWidget(no_apps_label, 0, 0, 1, 1)
+    def _refresh_view(self):
+        """Show the updated apps in the current view, leaving a group that has no apps left"""
+        if not self._launchpad_popup:
             return
-
-        # Create group-style grid or flat grid based on grouping and search
-        if self._group_apps and not search_text and not hasattr(self, "_current_group"):
-            self._populate_grouped_grid(filtered_apps)
-        else:
-            self._populate_flat_grid(filtered_apps)
-
-    def _populate_flat_grid(self, filtered_apps: list[dict[str, Any]]):
-        """Populate grid without grouping (original behavior)"""
-        grid_layout = self._launchpad_popup.grid_layout
-
-        for app_data in filtered_apps:
-            app_icon = self._create_app_icon_widget(app_data)
-            self._app_icons.append(app_icon)
-
-        if self._app_icons:
-            first_icon = self._app_icons[0]
-            first_icon.setParent(self._launchpad_popup.grid_container)
-            first_icon.updateGeometry()
-
-            self._recalculate_grid_columns()
-
-            # Safety check: ensure _grid_columns is never 0
-            if self._grid_columns <= 0:
-                self._grid_columns = 1
-
-            rows = (len(self._app_icons) + self._grid_columns - 1) // self._grid_columns
-            icon_height = self._app_icons[0].height()
-            total_height = rows * icon_height
-
-            # Set the grid container to the exact height needed
-            self._launchpad_popup.grid_container.setFixedHeight(total_height)
-
-        for index, app_icon in enumerate(self._app_icons):
-            # Ensure _grid_columns is not 0 before using modulo
-            if self._grid_columns <= 0:
-                self._grid_columns = 1
-            row = index // self._grid_columns
-            col = index % self._grid_columns
-            grid_layout.addWidget(app_icon, row, col)
-
-        icon_requests = []
-        for app_data in filtered_apps:
-            icon_path = app_data.get("icon", "")
-            if icon_path and os.path.isfile(icon_path):
-                cache_key = f"{icon_path}_{self._app_icon_size}_{self._dpr}"
-                if cache_key not in _ICON_CACHE:
-                    icon_requests.append((icon_path, self._app_icon_size, self._dpr))
-        if icon_requests:
-            self._start_background_loading(icon_requests)
-
-    def _populate_grouped_grid(self, filtered_apps: list[dict[str, Any]]):
-        """Populate grid with icons for group"""
-        grid_layout = self._launchpad_popup.grid_layout
-
-        # Group apps by group field
-        grouped_apps = {}
-        uncategorized_apps = []
-
-        for app_data in filtered_apps:
-            group = app_data.get("group")
-            if group:
-                if group not in grouped_apps:
-                    grouped_apps[group] = []
-                grouped_apps[group].append(app_data)
-            else:
-                uncategorized_apps.append(app_data)
-
-        # Create list of items to display: group + uncategorized apps
-        display_items = []
-
-        for group_name in sorted(grouped_apps.keys()):
-            display_items.append({"type": "group", "group": group_name, "apps": grouped_apps[group_name]})
-
-        # Add uncategorized apps
-        for app_data in uncategorized_apps:
-            display_items.append({"type": "app", "data": app_data})
-
-        # Create widgets for all items
-        for item in display_items:
-            if item["type"] == "group":
-                group_widget = self._create_group_widget(item["group"], item["apps"])
-                self._app_icons.append(group_widget)
+        if hasattr(self, "_current_group"):
+            if any(app.get("group") == self._current_group for app in self._stored_apps()):
+                self._open_group(self._current_group)
             else:
-                app_icon = self._create_app_icon_widget(item["data"])
-                self._app_icons.append(app_icon)
-
-        if self._app_icons:
-            first_icon = self._app_icons[0]
-            first_icon.setParent(self._launchpad_popup.grid_container)
-            first_icon.updateGeometry()
-
-            self._recalculate_grid_columns()
-
-            if self._grid_columns <= 0:
-                self._grid_columns = 1
-
-            rows = (len(self._app_icons) + self._grid_columns - 1) // self._grid_columns
-            icon_height = self._app_icons[0].height()
-            total_height = rows * icon_height
-            self._launchpad_popup.grid_container.setFixedHeight(total_height)
-
-        for index, widget in enumerate(self._app_icons):
-            if self._grid_columns <= 0:
-                self._grid_columns = 1
-            row = index // self._grid_columns
-            col = index % self._grid_columns
-            grid_layout.addWidget(widget, row, col)
-
-        # Load icons in background for uncategorized apps only
-        icon_requests = []
-        for app_data in uncategorized_apps:
-            icon_path = app_data.get("icon", "")
-            if icon_path and os.path.isfile(icon_path):
-                cache_key = f"{icon_path}_{self._app_icon_size}_{self._dpr}"
-                if cache_key not in _ICON_CACHE:
-                    icon_requests.append((icon_path, self._app_icon_size, self._dpr))
-        if icon_requests:
-            self._start_background_loading(icon_requests)
+                self._close_group()
+        else:
+            self._populate_grid(self._launchpad_popup.search_input.text())
 
     def _create_group_widget(self, group_name: str, apps: list[dict[str, Any]]):
         group_widget = QFrame()
@@ -1618,7 +1479,7 @@ class LaunchpadWidget(BaseWidget):
 
         def mouseReleaseEvent(event):
             if event.button() == Qt.MouseButton.LeftButton:
-                self._open_group(group_name, apps)
+                self._open_group(group_name)
 
         group_widget.mouseReleaseEvent = mouseReleaseEvent
 
@@ -1631,7 +1492,7 @@ class LaunchpadWidget(BaseWidget):
 
         return group_widget
 
-    def _open_group(self, group_name: str, apps: list[dict[str, Any]]):
+    def _open_group(self, group_name: str):
         self._current_group = group_name
 
         # Hide search input and show back button
@@ -1652,15 +1513,7 @@ class LaunchpadWidget(BaseWidget):
         self._launchpad_popup.back_button.setText(f"\U0001f860 {group_name}")
         self._launchpad_popup.back_button.show()
 
-        # Clear grid and app icons
-        grid_layout = self._launchpad_popup.grid_layout
-        for i in reversed(range(grid_layout.count())):
-            child = grid_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        self._app_icons.clear()
-
-        self._populate_flat_grid(apps)
+        self._populate_grid()
 
     def _close_group(self):
         if hasattr(self, "_current_group"):
@@ -1683,7 +1536,7 @@ class LaunchpadWidget(BaseWidget):
         apply_qmenu_style(menu)
 
         open_action = QAction(f"Open {group_name}", menu_parent)
-        open_action.triggered.connect(lambda: self._open_group(group_name, parent_widget.apps_in_group))
+        open_action.triggered.connect(lambda: self._open_group(group_name))
         menu.addAction(open_action)
 
         menu.addSeparator()
@@ -1737,15 +1590,7 @@ class LaunchpadWidget(BaseWidget):
         self._save_apps(apps)
 
         # Refresh grid
-        if hasattr(self, "_current_group"):
-            updated_apps = self._load_apps()
-            group_apps_list = [app for app in updated_apps if app.get("group") == self._current_group]
-            if group_apps_list:
-                self._open_group(self._current_group, group_apps_list)
-            else:
-                self._close_group()
-        else:
-            self._populate_grid()
+        self._refresh_view()
 
     def _fade_in_popup(self):
         if self._window_animation["fade_in_duration"] > 0 and self._launchpad_popup:
@@ -1786,8 +1631,6 @@ class LaunchpadWidget(BaseWidget):
             self._launchpad_popup.hide()
             self._launchpad_popup.deleteLater()
             self._launchpad_popup = None
-            self._app_icons.clear()
-            self._all_apps.clear()
             self._is_closing = False
             AppListLoader.clear_cache()
 
@@ -1816,11 +1659,11 @@ class LaunchpadWidget(BaseWidget):
             self._drop_overlay = None
 
     def _focus_icon(self, index: int = 0):
-        if self._app_icons and 0 <= index < len(self._app_icons):
-            icon = self._app_icons[index]
+        icon = self._launchpad_popup.grid_view.cell(index) if self._launchpad_popup else None
+        if icon:
+            self._launchpad_popup.grid_view.ensure_visible(index)
             icon.setFocus()
             icon.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-            self._scroll_to_icon(icon)
         elif self._launchpad_popup:
             self._launchpad_popup.search_input.setFocus()
 
@@ -1828,8 +1671,9 @@ class LaunchpadWidget(BaseWidget):
         self._focus_icon(0)
 
     def _start_background_loading(self, icon_requests):
-        if self._icon_worker and self._icon_worker.isRunning():
-            self._icon_worker.terminate()
+        if self._icon_worker and self._icon_worker.add_requests(icon_requests):
+            return
+        if self._icon_worker:
             self._icon_worker.wait()
         self._icon_worker = IconLoadWorker(icon_requests)
         self._icon_worker.icon_loaded.connect(self._on_background_icon_loaded)
@@ -1838,34 +1682,15 @@ class LaunchpadWidget(BaseWidget):
     def _on_background_icon_loaded(self, icon_path: str, pixmap: QPixmap):
         cache_key = f"{icon_path}_{self._app_icon_size}_{self._dpr}"
         _ICON_CACHE[cache_key] = pixmap
-        for app_icon in self._app_icons:
+        if not self._launchpad_popup:
+            return
+        for app_icon in self._launchpad_popup.grid_view.cells():
             if hasattr(app_icon, "app_data") and app_icon.app_data.get("icon", "") == icon_path:
                 if hasattr(app_icon, "_icon_loaded") and not app_icon._icon_loaded:
                     app_icon.icon_label.setPixmap(pixmap)
                     refresh_widget_style(app_icon.icon_label)
                     app_icon._icon_loaded = True
 
-    def _recalculate_grid_columns(self):
-        """Recalculate the number of columns based on available width and icon size"""
-        scrollbar_width = 0
-        scroll_area = self._launchpad_popup.scroll_area
-        if scroll_area.verticalScrollBar().isVisible():
-            scrollbar_width = 4
-        if not self._app_icons:
-            self._grid_columns = 1
-            return
-
-        grid_container_width = self.popup.grid_container.width() + scrollbar_width
-
-        first_icon = self._app_icons[0]
-        first_icon.adjustSize()
-        actual_cell_width = first_icon.width()
-
-        max_columns = grid_container_width // actual_cell_width if actual_cell_width > 0 else 1
-
-        calculated_columns = max(1, int(max_columns))
-        self._grid_columns = calculated_columns
-
     def _get_target_screen(self):
         screen = QApplication.screenAt(self.mapToGlobal(self.rect().center()))
         if screen is None:
@@ -1889,13 +1714,7 @@ class LaunchpadWidget(BaseWidget):
             apps.append(app_data)
             self._save_apps(apps)
             if self._launchpad_popup:
-                # If we're in a group, refresh the group view
-                if hasattr(self, "_current_group"):
-                    updated_apps = self._load_apps()
-                    group_apps_list = [app for app in updated_apps if app.get("group") == self._current_group]
-                    self._open_group(self._current_group, group_apps_list)
-                else:
-                    self._populate_grid()
+                self._refresh_view()
 
     def _edit_app(self, app_data: dict[str, Any]):
         all_groups = self._get_all_groups()
@@ -1917,7 +1736,7 @@ class LaunchpadWidget(BaseWidget):
             if icon_changed:
                 self._cleanup_unused_icons()
             if self._launchpad_popup:
-                self._populate_grid()
+                self._refresh_view()
 
     def _warning_dialog(self, message: str):
         """Show a warning dialog with a message"""
@@ -2029,24 +1848,15 @@ class LaunchpadWidget(BaseWidget):
             self._save_apps(apps)
             self._cleanup_unused_icons()
             if self._launchpad_popup:
-                # If we're in a group, check if there are apps left in the group
-                if hasattr(self, "_current_group"):
-                    group_apps = [app for app in apps if app.get("group") == self._current_group]
-                    if group_apps:
-                        # Still apps in group, refresh the group view
-                        self._open_group(self._current_group, group_apps)
-                    else:
-                        # No apps left in group, go back to main window
-                        self._close_group()
-                else:
-                    # Not in a group, just refresh the grid
-                    self._populate_grid()
+                # Refresh the view, leaving the group if no apps are left in it
+                self._refresh_view()
 
-                if self._app_icons:
-                    if prev_focus_index is not None and 0 <= prev_focus_index < len(self._app_icons):
-                        self._app_icons[prev_focus_index].setFocus()
+                grid_view = self._launchpad_popup.grid_view
+                if grid_view.count():
+                    if prev_focus_index is not None and 0 <= prev_focus_index < grid_view.count():
+                        self._focus_icon(prev_focus_index)
                     else:
-                        self._app_icons[0].setFocus()
+                        self._focus_icon(0)
 
     def _cleanup_unused_icons(self):
         try:
@@ -2074,6 +1884,29 @@ class LaunchpadWidget(BaseWidget):
             logging.error("Failed to cleanup unused icons: %s", e)
 
     def _load_apps(self) -> list[dict[str, Any]]:
+        """Return a copy of the apps that can be modified and passed to `_save_apps`"""
+        return [dict(app) for app in self._stored_apps()]
+
+    def _stored_apps(self, check_disk: bool = False) -> list[dict[str, Any]]:
+        """Return the in-memory apps, reading apps.json on first use or when it changed on disk"""
+        if self._apps is not None and check_disk and self._data_file_mtime() != self._apps_mtime:
+            self._apps = None
+        if self._apps is None:
+            self._apps_mtime = self._data_file_mtime()
+            self._set_apps(self._read_apps())
+        return self._apps
+
+    def _set_apps(self, apps: list[dict[str, Any]]):
+        self._apps = apps
+        self._app_model.set_apps(apps)
+
+    def _data_file_mtime(self):
+        try:
+            return os.stat(self._data_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_apps(self) -> list[dict[str, Any]]:
         try:
             if os.path.exists(self._data_file):
                 with open(self._data_file, encoding="utf-8") as f:
@@ -2085,7 +1918,7 @@ class LaunchpadWidget(BaseWidget):
 
     def _get_all_groups(self) -> list[str]:
         """Get all unique groups from apps"""
-        apps = self._load_apps()
+        apps = self._stored_apps()
         groups = set()
         for app in apps:
             group = app.get("group")
@@ -2112,8 +1945,7 @@ class LaunchpadWidget(BaseWidget):
             self._save_apps(apps)
 
             if self._launchpad_popup:
-                current_search = self._launchpad_popup.search_input.text()
-                self._populate_grid(current_search)
+                self._refresh_view()
 
         except Exception as e:
             logging.error("Failed to order apps by %s: %s", order_type, e)
@@ -2124,3 +1956,8 @@ class LaunchpadWidget(BaseWidget):
                 json.dump(apps, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logging.error("Failed to save apps to %s: %s", self._data_file, e)
+            # Reread whatever ended up on disk
+            self._apps = None
+            return
+        self._apps_mtime = self._data_file_mtime()
+        self._set_apps([dict(app) for app in apps])
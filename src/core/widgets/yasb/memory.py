@@ -1,17 +1,18 @@
 import collections
-import re
 
 from humanize import naturalsize
 from PyQt6.QtWidgets import QLabel
 
+from core.utils.class_state import set_widget_class
+from core.utils.runtime_stats import timer_update
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
-from core.utils.widgets.memory.memory_api import MemoryData, MemoryWorker, SwapMemory, VirtualMemory
+from core.utils.widgets.memory.memory_api import MemoryData, MemorySource, SwapMemory, VirtualMemory
 from core.utils.widgets.stat_popup import build_stat_popup
+from core.utils.widgets.telemetry.sampler import TelemetrySampler
 from core.validation.widgets.yasb.memory import MemoryConfig
 from core.widgets.base import BaseWidget
 
@@ -19,9 +20,6 @@ from core.widgets.base import BaseWidget
 class MemoryWidget(BaseWidget):
     validation_schema = MemoryConfig
 
-    _instances: list[MemoryWidget] = []
-    _worker: MemoryWorker | None = None
-
     def __init__(self, config: MemoryConfig):
         super().__init__(class_name=f"memory-widget {config.class_name}")
         self.config = config
@@ -41,16 +39,12 @@ class MemoryWidget(BaseWidget):
         self.callback_right = self.config.callbacks.on_right
         self.callback_middle = self.config.callbacks.on_middle
 
-        # Add this instance to the shared instances list
-        if self not in MemoryWidget._instances:
-            MemoryWidget._instances.append(self)
-
-        # Start the shared memory worker thread
-        if self.config.update_interval > 0 and MemoryWidget._worker is None:
-            worker = MemoryWorker.get_instance(self.config.update_interval)
-            worker.data_ready.connect(MemoryWidget._on_data_ready)
-            worker.start()
-            MemoryWidget._worker = worker
+        # Subscribe to the shared sampler at this widget's own interval
+        if self.config.update_interval > 0:
+            self._subscription = TelemetrySampler.instance().subscribe(
+                MemorySource(), self.config.update_interval, parent=self
+            )
+            self._subscription.data_ready.connect(self._on_data_ready)
 
         self._show_placeholder()
 
@@ -60,18 +54,14 @@ class MemoryWidget(BaseWidget):
         swap_mem = SwapMemory(total=0, used=0, free=0, percent=0.0)
         self._update_label(virtual_mem, swap_mem)
 
-    @classmethod
-    def _on_data_ready(cls, data: MemoryData):
-        """Slot called on main thread when new memory data arrives from the worker."""
-        for inst in cls._instances[:]:
-            try:
-                inst._last_data = data
-                inst._update_label(data.virtual, data.swap)
-                if inst.config.menu.enabled:
-                    inst._history.append(data.virtual.percent)
-                    inst._update_popup(data)
-            except RuntimeError:
-                cls._instances.remove(inst)
+    @timer_update
+    def _on_data_ready(self, data: MemoryData):
+        """Slot called on main thread when new memory data arrives from the sampler."""
+        self._last_data = data
+        self._update_label(data.virtual, data.swap)
+        if self.config.menu.enabled:
+            self._history.append(data.virtual.percent)
+            self._update_popup(data)
 
     def _update_popup(self, data: MemoryData):
         """Push fresh data into the open popup if visible."""
@@ -151,12 +141,6 @@ class MemoryWidget(BaseWidget):
     def _update_label(self, virtual_mem, swap_mem):
         """Update label using shared memory data."""
 
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         _round = lambda value: round(value) if self.config.hide_decimal else value
         _naturalsize = lambda value: naturalsize(value, True, True, "%.0f" if self.config.hide_decimal else "%.1f")
         label_options = {
@@ -180,24 +164,12 @@ class MemoryWidget(BaseWidget):
                 )
             self.progress_widget.set_value(virtual_mem.percent)
 
-        for part in label_parts:
-            part = part.strip()
-            for fmt_str, value in label_options.items():
-                part = part.replace(fmt_str, str(value))
-
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-                    # Set memory threshold as property
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_virtual_memory_threshold(virtual_mem.percent)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        renderer = self.active_label_renderer
+        renderer.render(lambda segment: segment.replace(label_options), render_icons=True)
+        label_class = "label alt" if self._show_alt_label else "label"
+        status_class = f"status-{self._get_virtual_memory_threshold(virtual_mem.percent)}"
+        for label in renderer.text_labels():
+            set_widget_class(label, (label_class, status_class))
 
     def _toggle_label(self):
         if self.config.animation.enabled:
@@ -43,7 +43,9 @@ class NotificationsWidget(BaseWidget):
 
         # Register the WindowsNotificationUpdate event
         self.event_service = EventService()
-        self.event_service.register_event("WindowsNotificationUpdate", self.windows_notification_update_signal)  # type: ignore
+        self.event_service.register_event(  # type: ignore
+            "WindowsNotificationUpdate", self.windows_notification_update_signal, owner=self
+        )
         self.windows_notification_update_signal.connect(self._on_windows_notification_update)
 
         self._update_label()
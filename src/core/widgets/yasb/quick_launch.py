@@ -41,7 +41,13 @@ from core.utils.utilities import PopupWidget
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.quick_launch.base_provider import ProviderResult
 from core.utils.widgets.quick_launch.context_menu import QuickLaunchContextMenuService
-from core.utils.widgets.quick_launch.icon_utils import load_and_scale_icon, svg_to_pixmap
+from core.utils.widgets.quick_launch.icon_utils import (
+    PIXMAP_CACHE,
+    alpha_bounds,
+    load_and_scale_icon,
+    scale_image_data,
+    svg_to_pixmap,
+)
 from core.utils.widgets.quick_launch.providers.resources.icons import (
     ICON_NO_RESULTS,
     ICON_SEARCH_INPUT,
@@ -61,13 +67,13 @@ class ResultListModel(QAbstractListModel):
     RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
     ICON_ROLE = Qt.ItemDataRole.UserRole + 2
 
-    _emoji_cache: dict[tuple[str, int, float], QPixmap | None] = {}
-
     def __init__(self, parent=None):
         super().__init__(parent)
         self._results: list[ProviderResult] = []
         self._icons: dict[int, QPixmap] = {}
         self._late_icons: dict[str, QPixmap] = {}
+        # Result id -> row, for icons that arrive after the results
+        self._rows: dict[str, int] = {}
         self._icon_size: int = 0
         self._dpr: float = 1.0
 
@@ -109,6 +115,7 @@ class ResultListModel(QAbstractListModel):
         """Replace all results. Icons are computed lazily on first access."""
         self.beginResetModel()
         self._results = list(results)
+        self._rows = {r.id: i for i, r in enumerate(self._results) if r.id}
         self._icons.clear()
         self._late_icons.clear()
         self._icon_size = icon_size
@@ -132,8 +139,8 @@ class ResultListModel(QAbstractListModel):
         We should find a better way to do this without rendering to a large canvas and scanning for bounds,
         but this emoji fonts looks like have a bad gemetry.
         """
-        key = (char, size, dpr)
-        cached = ResultListModel._emoji_cache.get(key)
+        key = ("emoji", char, size, dpr)
+        cached = PIXMAP_CACHE.get(key)
         if cached is not None:
             return cached
         target = int(size * dpr)
@@ -151,45 +158,11 @@ class ResultListModel(QAbstractListModel):
         p.drawText(img.rect(), Qt.AlignmentFlag.AlignCenter, char)
         p.end()
 
-        img = img.convertToFormat(QImage.Format.Format_ARGB32)
-        width, height = img.width(), img.height()
-        ptr = img.bits()
-        ptr.setsize(img.sizeInBytes())
-        raw = bytes(ptr)
-        bpl = img.bytesPerLine()
-        scan_width = width * 4
-
-        top = 0
-        for y in range(height):
-            off = y * bpl
-            if any(raw[i] for i in range(off + 3, off + scan_width, 4)):
-                top = y
-                break
-
-        bottom = height - 1
-        for y in range(height - 1, top, -1):
-            off = y * bpl
-            if any(raw[i] for i in range(off + 3, off + scan_width, 4)):
-                bottom = y
-                break
-
-        left = width
-        right = 0
-        for y in range(top, bottom + 1):
-            off = y * bpl
-            row_alphas = raw[off + 3 : off + scan_width : 4]
-            l = next((i for i, a in enumerate(row_alphas) if a), None)
-            if l is not None:
-                if l < left:
-                    left = l
-                r = len(row_alphas) - 1
-                while r >= 0 and not row_alphas[r]:
-                    r -= 1
-                if r > right:
-                    right = r
-
-        if right < left or bottom < top:
+        bounds = alpha_bounds(img)
+        if bounds is None:
             return None
+        width, height = img.width(), img.height()
+        left, top, right, bottom = bounds.left(), bounds.top(), bounds.right(), bounds.bottom()
 
         pad = 2
         crop_rect = QRect(
@@ -203,20 +176,23 @@ class ResultListModel(QAbstractListModel):
             target, target, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
         )
         pixmap.setDevicePixelRatio(dpr)
-        ResultListModel._emoji_cache[key] = pixmap
+        PIXMAP_CACHE.put(key, pixmap)
         return pixmap
 
-    def update_icon(self, result_id: str, icon_path: str, icon_size: int, dpr: float):
-        """Update an icon that was loaded asynchronously."""
-        pixmap = load_and_scale_icon(icon_path, icon_size, dpr)
-        if pixmap.isNull():
-            return
-        self._late_icons[result_id] = pixmap
-        for i, r in enumerate(self._results):
-            if r.id == result_id:
-                idx = self.index(i)
-                self.dataChanged.emit(idx, idx, [self.ICON_ROLE])
-                break
+    def update_icons(self, icons: list[tuple[str, str]], icon_size: int, dpr: float):
+        """Update icons that were loaded asynchronously, `icons` holds `(result_id, icon_path)` tuples."""
+        rows = []
+        for result_id, icon_path in icons:
+            row = self._rows.get(result_id)
+            if row is None:
+                continue
+            pixmap = load_and_scale_icon(icon_path, icon_size, dpr)
+            if pixmap.isNull():
+                continue
+            self._late_icons[result_id] = pixmap
+            rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [self.ICON_ROLE])
 
     def result_at(self, row: int) -> ProviderResult | None:
         if 0 <= row < len(self._results):
@@ -432,7 +408,7 @@ class QuickLaunchWidget(BaseWidget):
 
         self._service = QuickLaunchService.instance()
         self._service.request_refresh.connect(self._on_request_refresh)
-        self._service.icon_ready.connect(self._on_icon_ready)
+        self._service.icons_ready.connect(self._on_icons_ready)
         self._service.query_finished.connect(self._on_query_finished)
         self._service.configure_providers(
             self.config.providers.model_dump(), self.config.max_results, self.config.show_icons, self.config.icon_size
@@ -508,6 +484,7 @@ class QuickLaunchWidget(BaseWidget):
                 p.on_deactivate()
             except Exception:
                 pass
+        logging.debug("Quick Launch pixmap cache: %s", PIXMAP_CACHE.stats())
         self._pending_query_id = None
         self._active_prefix = None
         self._preview_visible = False
@@ -1050,15 +1027,9 @@ class QuickLaunchWidget(BaseWidget):
             img_label = QLabel()
             img_label.setProperty("class", "preview-image")
             img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            pixmap = QPixmap()
-            pixmap.loadFromData(preview["image_data"])
-            if not pixmap.isNull():
-                frame_w = self._popup.preview_frame.width() or int(self.config.popup.width * 0.38)
-                scaled = pixmap.scaled(
-                    QSize(frame_w - 24, int(self.config.popup.height * 0.55)),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+            frame_w = self._popup.preview_frame.width() or int(self.config.popup.width * 0.38)
+            scaled = scale_image_data(preview["image_data"], QSize(frame_w - 24, int(self.config.popup.height * 0.55)))
+            if not scaled.isNull():
                 img_label.setPixmap(scaled)
             layout.addWidget(img_label, stretch=1)
         else:
@@ -1196,16 +1167,17 @@ class QuickLaunchWidget(BaseWidget):
         if self._popup and self._popup.isVisible():
             self._update_results(self._popup.search_input.text())
 
-    def _on_icon_ready(self, result_id: str, icon_path: str):
+    def _on_icons_ready(self, icons: list):
         if self._popup and self._popup.isVisible() and self._result_model:
-            self._result_model.update_icon(result_id, icon_path, self.config.icon_size, self._dpr)
+            self._result_model.update_icons(icons, self.config.icon_size, self._dpr)
 
-    def _on_query_finished(self, query_id: str, results: list):
+    def _on_query_finished(self, query_id: str, results: list, final: bool = True):
         if query_id != self._pending_query_id:
             return
         if not self._popup or not self._popup.isVisible():
             return
-        if not any(getattr(r, "is_loading", False) for r in results):
+        # Partial results arrive while slower providers are still running
+        if final and not any(getattr(r, "is_loading", False) for r in results):
             self._stop_loader()
         self._apply_results(results)
         self._update_prediction()
@@ -30,6 +30,8 @@ class ServerMonitor(BaseWidget):
         self._server_status_data = None
         self._first_run = True
         self._animations = []
+        # Server url -> its row in the open menu
+        self._server_rows: dict[str, QWidget] = {}
         self._icon_path = os.path.join(SCRIPT_PATH, "assets", "images", "app_transparent.png")
 
         # Construct container
@@ -54,6 +56,7 @@ class ServerMonitor(BaseWidget):
         )
         self._service_released = False
         self._service.status_updated.connect(self._handle_status_update)
+        self._service.server_checked.connect(self._handle_server_checked)
         self._service.refresh_started.connect(self._on_refresh_started)
         self.destroyed.connect(lambda *_: self._release_service())
 
@@ -77,7 +80,41 @@ class ServerMonitor(BaseWidget):
 
     def _handle_status_update(self, run_id: int, status_data):
         status_list: list[dict] = [dict(s) for s in (status_data or []) if isinstance(s, dict)]
+        self._server_status_data = self._with_summary(status_list)
+        summary = self._server_status_data[-1]
+        self._last_refresh_time = datetime.now()
+        self._update_label()
+        self._send_notification(run_id, summary["offline_count"], summary["ssl_warning"], summary["no_internet"])
+
+        if hasattr(self, "dialog") and self.dialog:
+            try:
+                if self.dialog.isVisible():
+                    self._set_menu_loader(False)
+                    try:
+                        self._update_menu_content()
+                    except Exception:
+                        pass
+                    if self._first_run:
+                        self.dialog.hide()
+                        self.show_menu()
+            except RuntimeError:
+                pass
+        self._first_run = False
+
+    def _handle_server_checked(self, _run_id: int, status: dict) -> None:
+        """Show one server's result as soon as it is checked, the full list follows when the run ends."""
+        if not isinstance(status, dict) or status.get("url") is None:
+            return
+        checked = {s.get("url"): s for s in (self._server_status_data or [])[:-1]}
+        checked[status["url"]] = dict(status)
+        self._server_status_data = self._with_summary(
+            [checked[server.url] for server in self.config.servers if server.url in checked]
+        )
+        self._update_label()
+        self._update_menu_row(checked[status["url"]])
 
+    def _with_summary(self, status_list: list[dict]) -> list[dict]:
+        """Append the online/offline summary entry the label and menu read from the end of the list."""
         online_count = sum(1 for s in status_list if s.get("status") == "Online")
         offline_count = sum(1 for s in status_list if s.get("status") == "Offline")
         no_internet = offline_count > 0 and all(
@@ -95,26 +132,7 @@ class ServerMonitor(BaseWidget):
                 "no_internet": no_internet,
             }
         )
-
-        self._server_status_data = status_list
-        self._last_refresh_time = datetime.now()
-        self._update_label()
-        self._send_notification(run_id, offline_count, ssl_warning, no_internet)
-
-        if hasattr(self, "dialog") and self.dialog:
-            try:
-                if self.dialog.isVisible():
-                    self._set_menu_loader(False)
-                    try:
-                        self._update_menu_content()
-                    except Exception:
-                        pass
-                    if self._first_run:
-                        self.dialog.hide()
-                        self.show_menu()
-            except RuntimeError:
-                pass
-        self._first_run = False
+        return status_list
 
     def _set_menu_loader(self, active: bool) -> None:
         loader = getattr(self, "_menu_loader_line", None)
@@ -312,6 +330,25 @@ class ServerMonitor(BaseWidget):
         except Exception:
             pass
 
+    def _update_menu_row(self, server_data: dict) -> None:
+        """Replace the row of one server in the open menu."""
+        if not (hasattr(self, "dialog") and self.dialog):
+            return
+        try:
+            if not self.dialog.isVisible():
+                return
+            row = self._server_rows.get(server_data["url"])
+            if row is None:
+                # The menu still shows the placeholder
+                self._update_menu_content()
+                return
+            new_row = self._build_server_row(server_data)
+            row.parentWidget().layout().replaceWidget(row, new_row)
+            row.deleteLater()
+            self._server_rows[server_data["url"]] = new_row
+        except RuntimeError:
+            return
+
     def _trigger_reload(self):
         self._set_menu_loader(True)
         self._service.start_now()
@@ -350,78 +387,80 @@ class ServerMonitor(BaseWidget):
             row_container_layout.addWidget(loading_widget)
 
         else:
+            self._server_rows = {}
             for server_data in server_data_list:
                 if not server_data or server_data.get("url") is None:
                     continue
-                row_widget = QWidget()
-                server_status = QLabel()
-                if server_data["status"] == "Online":
-                    server_data_status = self.config.icons.online
-                    server_data_response_time = server_data["response_time"]
-                    class_name = "online"
-                else:
-                    server_data_status = self.config.icons.offline
-                    server_data_response_time = ""
-                    class_name = "offline"
-
-                if isinstance(server_data.get("ssl"), int) and server_data["ssl"] < self.config.ssl_warning:
-                    server_data_status = self.config.icons.warning
-                    class_name += " warning"
-
-                if (isinstance(server_data.get("ssl"), int) and server_data["ssl"] < self.config.ssl_warning) or (
-                    server_data["status"] == "Offline"
-                ):
-                    # Add opacity effect for animation
-                    opacity_effect = QGraphicsOpacityEffect()
-                    server_status.setGraphicsEffect(opacity_effect)
-                    animation = QPropertyAnimation(opacity_effect, b"opacity")
-                    animation.setDuration(1000)
-                    animation.setStartValue(1.0)
-                    animation.setEndValue(0.6)
-                    animation.setLoopCount(-1)
-                    animation.setEasingCurve(QEasingCurve.Type.SineCurve)
-                    animation.start()
-                    self._animations.append(animation)  # Store animation reference
-
-                row_widget.setProperty("class", f"row {class_name}")
-                row_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-                _server_url = (
-                    f"https://{server_data['url']}" if self.config.ssl_check else f"http://{server_data['url']}"
-                )
-                row_widget.mousePressEvent = lambda _, url=_server_url: (QDesktopServices.openUrl(QUrl(url)), None)[1]
-                row_widget_layout = QVBoxLayout(row_widget)
-                row_widget_layout.setContentsMargins(0, 0, 0, 0)
-                row_widget_layout.setSpacing(0)
-
-                name_status_widget = QWidget()
-                h_layout = QHBoxLayout(name_status_widget)
-                h_layout.setContentsMargins(0, 0, 0, 0)
-
-                server_name = QLabel(server_data["name"])
-                server_name.setProperty("class", "name")
-                h_layout.addWidget(server_name)
-                h_layout.addStretch()
-
-                server_status.setText(server_data_status)
-                server_status.setProperty("class", "status")
-                h_layout.addWidget(server_status)
-
-                ssl_status = ""
-                if self.config.ssl_check and isinstance(server_data.get("ssl"), int):
-                    ssl_status = f", SSL certificate expires in {server_data['ssl']} days"
-                if server_data["status"] == "Online":
-                    details_text = (
-                        f"{server_data_response_time}{ssl_status}, response code: {server_data['response_code']}"
-                    )
-                else:
-                    details_text = "Server is offline"
-
-                details = QLabel(details_text)
-                details.setProperty("class", "details")
-
-                row_widget_layout.addWidget(name_status_widget)
-                row_widget_layout.addWidget(details)
+                row_widget = self._build_server_row(server_data)
+                self._server_rows[server_data["url"]] = row_widget
                 row_container_layout.addWidget(row_widget)
 
         scroll_area.setWidget(row_container)
         return scroll_area
+
+    def _build_server_row(self, server_data: dict) -> QWidget:
+        row_widget = QWidget()
+        server_status = QLabel()
+        if server_data["status"] == "Online":
+            server_data_status = self.config.icons.online
+            server_data_response_time = server_data["response_time"]
+            class_name = "online"
+        else:
+            server_data_status = self.config.icons.offline
+            server_data_response_time = ""
+            class_name = "offline"
+
+        if isinstance(server_data.get("ssl"), int) and server_data["ssl"] < self.config.ssl_warning:
+            server_data_status = self.config.icons.warning
+            class_name += " warning"
+
+        if (isinstance(server_data.get("ssl"), int) and server_data["ssl"] < self.config.ssl_warning) or (
+            server_data["status"] == "Offline"
+        ):
+            # Add opacity effect for animation
+            opacity_effect = QGraphicsOpacityEffect()
+            server_status.setGraphicsEffect(opacity_effect)
+            animation = QPropertyAnimation(opacity_effect, b"opacity")
+            animation.setDuration(1000)
+            animation.setStartValue(1.0)
+            animation.setEndValue(0.6)
+            animation.setLoopCount(-1)
+            animation.setEasingCurve(QEasingCurve.Type.SineCurve)
+            animation.start()
+            self._animations.append(animation)  # Store animation reference
+
+        row_widget.setProperty("class", f"row {class_name}")
+        row_widget.setCursor(Qt.CursorShape.PointingHandCursor)
+        _server_url = f"https://{server_data['url']}" if self.config.ssl_check else f"http://{server_data['url']}"
+        row_widget.mousePressEvent = lambda _, url=_server_url: (QDesktopServices.openUrl(QUrl(url)), None)[1]
+        row_widget_layout = QVBoxLayout(row_widget)
+        row_widget_layout.setContentsMargins(0, 0, 0, 0)
+        row_widget_layout.setSpacing(0)
+
+        name_status_widget = QWidget()
+        h_layout = QHBoxLayout(name_status_widget)
+        h_layout.setContentsMargins(0, 0, 0, 0)
+
+        server_name = QLabel(server_data["name"])
+        server_name.setProperty("class", "name")
+        h_layout.addWidget(server_name)
+        h_layout.addStretch()
+
+        server_status.setText(server_data_status)
+        server_status.setProperty("class", "status")
+        h_layout.addWidget(server_status)
+
+        ssl_status = ""
+        if self.config.ssl_check and isinstance(server_data.get("ssl"), int):
+            ssl_status = f", SSL certificate expires in {server_data['ssl']} days"
+        if server_data["status"] == "Online":
+            details_text = f"{server_data_response_time}{ssl_status}, response code: {server_data['response_code']}"
+        else:
+            details_text = "Server is offline"
+
+        details = QLabel(details_text)
+        details.setProperty("class", "details")
+
+        row_widget_layout.addWidget(name_status_widget)
+        row_widget_layout.addWidget(details)
+        return row_widget
@@ -3,9 +3,8 @@ import logging
 
 import win32con
 import win32gui
-from PIL import Image
 from PyQt6.QtCore import QEasingCurve, QMimeData, QPoint, QPropertyAnimation, QRect, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QCursor, QDrag, QImage, QMouseEvent, QPixmap
+from PyQt6.QtGui import QCursor, QDrag, QMouseEvent, QPixmap
 from PyQt6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QSizePolicy, QWidget
 
 from core.utils.qobject import is_valid_qobject
@@ -14,6 +13,7 @@ from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.recycle_bin.recycle_bin_monitor import RecycleBinMonitor
 from core.utils.widgets.taskbar.app_menu import show_context_menu
+from core.utils.widgets.taskbar.icon_store import TaskbarIconStore
 from core.utils.widgets.taskbar.pin_manager import PinManager
 from core.utils.widgets.taskbar.thumbnail import TaskbarThumbnailManager
 from core.utils.win32.app_icons import get_stock_icon, get_window_icon
@@ -489,7 +489,7 @@ class TaskbarWidget(BaseWidget):
         self.config.ignore_apps.processes = list(set(self.config.ignore_apps.processes))
         self.config.ignore_apps.titles = list(set(self.config.ignore_apps.titles))
 
-        self._icon_cache = {}
+        self._icon_store = TaskbarIconStore()
         self._hwnd_to_widget = {}
         self._window_buttons = {}
         self._suspend_updates = False
@@ -858,31 +858,14 @@ class TaskbarWidget(BaseWidget):
         if self.config.icon_size <= 0:
             return None
         try:
-            # Use a special cache key for Recycle Bin: ("RECYCLE_BIN", is_empty, dpi)
-            cache_key = ("RECYCLE_BIN", is_empty, self._dpi)
-
-            # Check if icon is already cached
-            if cache_key in self._icon_cache:
-                return self._icon_cache[cache_key]
-
             # Get stock icon (31 = empty, 32 = full)
-            icon_img = get_stock_icon(31 if is_empty else 32)
-            if not icon_img:
-                return None
-
-            dpi = self._dpi
-            target_size = int(self.config.icon_size * dpi)
-            icon_img = icon_img.resize((target_size, target_size), Image.LANCZOS).convert("RGBA")
-
-            # Convert to QPixmap
-            qimage = QImage(icon_img.tobytes(), icon_img.width, icon_img.height, QImage.Format.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimage)
-            pixmap.setDevicePixelRatio(dpi)
-
-            # Cache the pixmap for future use
-            self._icon_cache[cache_key] = pixmap
-
-            return pixmap
+            stock_id = 31 if is_empty else 32
+            return self._icon_store.image_pixmap(
+                ("RECYCLE_BIN", stock_id),
+                int(self.config.icon_size * self._dpi),
+                self._dpi,
+                lambda: get_stock_icon(stock_id),
+            )
 
         except Exception as e:
             logging.error("Error getting recycle bin icon: %s", e)
@@ -1843,23 +1826,10 @@ class TaskbarWidget(BaseWidget):
                 is_empty = self._recycle_bin_state.get("is_empty", True)
                 return self._get_recycle_bin_icon(is_empty)
 
-            cache_key = (hwnd, title, self._dpi)
-            if cache_key in self._icon_cache:
-                icon_img = self._icon_cache[cache_key]
-            else:
-                icon_img = get_window_icon(hwnd)
-                if icon_img and self._dpi is not None:
-                    pixel_size = int(self.config.icon_size * self._dpi)
-                    icon_img = icon_img.resize((pixel_size, pixel_size), Image.LANCZOS).convert("RGBA")
-                    self._icon_cache[cache_key] = icon_img
-
-            if not icon_img:
+            if self._dpi is None:
                 return None
-
-            qimage = QImage(icon_img.tobytes(), icon_img.width, icon_img.height, QImage.Format.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimage)
-            pixmap.setDevicePixelRatio(self._dpi)
-            return pixmap
+            pixel_size = int(self.config.icon_size * self._dpi)
+            return self._icon_store.window_icon(hwnd, title, pixel_size, self._dpi, get_window_icon)
 
         except Exception:
             logging.debug("Failed to get icons for window with HWND %s", hwnd, exc_info=True)
@@ -1,14 +1,16 @@
 import logging
-import re
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
+from core.utils.class_state import toggle_widget_class
+from core.utils.runtime_stats import timer_update
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import PopupWidget, refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.telemetry.sampler import TelemetrySampler
 from core.utils.widgets.traffic.connection_monitor import InternetChecker
-from core.utils.widgets.traffic.traffic_manager import TrafficDataManager
+from core.utils.widgets.traffic.traffic_manager import NetworkSource, TrafficDataManager
 from core.validation.widgets.yasb.traffic import TrafficWidgetConfig
 from core.widgets.base import BaseWidget
 
@@ -17,7 +19,6 @@ class TrafficWidget(BaseWidget):
     validation_schema = TrafficWidgetConfig
 
     _instances_by_interface: dict[str, list[TrafficWidget]] = {}
-    _shared_timers: dict[str, QTimer] = {}
     _shared_data: dict[str, dict] = {}
 
     def __init__(self, config: TrafficWidgetConfig):
@@ -77,13 +78,12 @@ class TrafficWidget(BaseWidget):
             TrafficWidget._instances_by_interface[self.config.interface] = []
         TrafficWidget._instances_by_interface[self.config.interface].append(self)
 
-        if update_interval > 0 and self.config.interface not in TrafficWidget._shared_timers:
-            TrafficWidget._shared_timers[self.config.interface] = QTimer(self)
-            TrafficWidget._shared_timers[self.config.interface].setInterval(update_interval)
-            TrafficWidget._shared_timers[self.config.interface].timeout.connect(
-                lambda: TrafficWidget._update_interface_data(self.config.interface)
+        # The sampler reads the interface counters once per tick for all widgets at their own intervals
+        if update_interval > 0:
+            self._subscription = TelemetrySampler.instance().subscribe(
+                NetworkSource(self.config.interface), update_interval, parent=self
             )
-            TrafficWidget._shared_timers[self.config.interface].start()
+            self._subscription.data_ready.connect(self._on_io_counters)
 
     def _initialize_instance_counters(self):
         """Initialize instance-specific counters"""
@@ -105,7 +105,7 @@ class TrafficWidget(BaseWidget):
         QTimer.singleShot(100, get_initial_counters)
 
     @classmethod
-    def _update_interface_data(cls, interface: str):
+    def _update_interface_data(cls, interface: str, current_io=None):
         """Update data for all widgets with the same interface"""
         if interface not in cls._instances_by_interface:
             return
@@ -116,7 +116,7 @@ class TrafficWidget(BaseWidget):
 
         try:
             # Get the network data once for this interface
-            net_data = cls._get_shared_net_data(interface, instances[0])
+            net_data = cls._get_shared_net_data(interface, instances[0], current_io)
 
             # Store shared data
             cls._shared_data[interface] = net_data  # type: ignore
@@ -133,7 +133,7 @@ class TrafficWidget(BaseWidget):
             logging.error("Error updating interface data for %s: %s", interface, e)
 
     @classmethod
-    def _get_shared_net_data(cls, interface: str, reference_instance: TrafficWidget):
+    def _get_shared_net_data(cls, interface: str, reference_instance: TrafficWidget, current_io=None):
         """Get network data for a specific interface using a reference instance"""
         try:
             # Use the data manager to calculate everything
@@ -149,6 +149,7 @@ class TrafficWidget(BaseWidget):
                 speed_threshold=reference_instance.config.speed_threshold.model_dump(),
                 max_label_length=reference_instance.config.max_label_length,
                 max_label_length_align=reference_instance.config.max_label_length_align.lower(),
+                current_io=current_io,
             )
 
             if net_data and net_data.get("reset_occurred"):
@@ -180,6 +181,13 @@ class TrafficWidget(BaseWidget):
                 "alltime_downloaded": "< 1 MB",
             }
 
+    @timer_update
+    def _on_io_counters(self, current_io):
+        """Compute the speeds over this widget's own interval from the sampled counters."""
+        net_data = TrafficWidget._get_shared_net_data(self.config.interface, self, current_io)
+        TrafficWidget._shared_data[self.config.interface] = net_data
+        self._update_from_shared_data(net_data)
+
     def _update_from_shared_data(self, shared_data):
         """Update this instance from shared data"""
         if shared_data is None:
@@ -210,52 +218,23 @@ class TrafficWidget(BaseWidget):
 
     def _update_label_with_data(self, shared_data):
         """Update label with provided data"""
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets  # type: ignore
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
-        label_options = [
-            ("{upload_speed}", shared_data["upload_speed"]),
-            ("{download_speed}", shared_data["download_speed"]),
-            ("{today_uploaded}", shared_data["today_uploaded"]),
-            ("{today_downloaded}", shared_data["today_downloaded"]),
-            ("{session_uploaded}", shared_data["session_uploaded"]),
-            ("{session_downloaded}", shared_data["session_downloaded"]),
-            ("{alltime_uploaded}", shared_data["alltime_uploaded"]),
-            ("{alltime_downloaded}", shared_data["alltime_downloaded"]),
-        ]
-
-        for part in label_parts:
-            part = part.strip()
-            for option, value in label_options:
-                part = part.replace(option, str(value))
-
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-
-                # Update CSS class based on internet connection status
-                current_class = active_widgets[widget_index].property("class") or ""
-                if not self._is_internet_connected:
-                    if "offline" not in current_class:
-                        new_class = f"{current_class} offline".strip()
-                        active_widgets[widget_index].setProperty("class", new_class)
-
-                else:
-                    # Remove offline class if connected
-                    if "offline" in current_class:
-                        new_class = current_class.replace("offline", "").strip()
-                        new_class = " ".join(new_class.split())
-                        active_widgets[widget_index].setProperty("class", new_class)
-                refresh_widget_style(active_widgets[widget_index])
-
-                widget_index += 1
+        label_options = {
+            "{upload_speed}": shared_data["upload_speed"],
+            "{download_speed}": shared_data["download_speed"],
+            "{today_uploaded}": shared_data["today_uploaded"],
+            "{today_downloaded}": shared_data["today_downloaded"],
+            "{session_uploaded}": shared_data["session_uploaded"],
+            "{session_downloaded}": shared_data["session_downloaded"],
+            "{alltime_uploaded}": shared_data["alltime_uploaded"],
+            "{alltime_downloaded}": shared_data["alltime_downloaded"],
+        }
+
+        renderer = self.active_label_renderer
+        renderer.render(lambda segment: segment.replace(label_options), render_icons=True)
+
+        # Update CSS class based on internet connection status
+        for label in renderer.labels:
+            toggle_widget_class(label, "offline", not self._is_internet_connected)
 
     def _on_connection_changed(self, is_connected: bool):
         """Handle internet connection status changes"""
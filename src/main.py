@@ -17,6 +17,7 @@ from core.log import enable_debug_logging, init_logger
 from core.tray import SystemTrayManager
 from core.ui.views.welcome import run_setup_wizard
 from core.utils.controller import start_cli_server
+from core.utils.runtime_stats import RuntimeStats
 from core.utils.update_service import get_update_service, start_update_checker
 from core.watcher import create_observer
 from env import load_env, set_font_engine
@@ -119,6 +120,10 @@ async def main_async(app: YASBApplication):
     # Connect the app's aboutToQuit signal to the close event
     app.aboutToQuit.connect(app_close_event.set)
 
+    # Measure event loop lag for `yasbc stats`
+    RuntimeStats().start_heartbeat()
+    app.aboutToQuit.connect(RuntimeStats().stop_heartbeat)
+
     # Initialize configuration early after the single instance check
     config, stylesheet = get_config_and_stylesheet()
 
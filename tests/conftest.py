@@ -0,0 +1,52 @@
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# The application modules are imported as top level packages from src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Tests that need Qt run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """A QApplication on the offscreen platform, shared by every Qt test."""
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class Timings(list[float]):
+    """Durations of one code path in a benchmark.
+
+    Benchmarks assert against another code path or a delay the test controls, a fixed wall-clock
+    limit depends on the machine running the suite.
+    """
+
+    @contextmanager
+    def measure(self):
+        started = time.perf_counter()
+        yield
+        self.append(time.perf_counter() - started)
+
+    @property
+    def p50(self) -> float:
+        return statistics.median(self)
+
+    @property
+    def p99(self) -> float:
+        return statistics.quantiles(self, n=100)[98]
+
+    def __str__(self) -> str:
+        return f"p50 {self.p50 * 1e6:.1f} us p99 {self.p99 * 1e6:.1f} us"
+
+
+@pytest.fixture
+def timings():
+    """Creates the `Timings` of each code path a benchmark compares."""
+    return Timings
@@ -0,0 +1,99 @@
+import random
+import time
+
+import pytest
+
+from core.utils.widgets.quick_launch.fuzzy import AppSearchIndex, fuzzy_score
+
+WORDS = [
+    "Adobe", "Audio", "Calculator", "Camera", "Chrome", "Code", "Control", "Data", "Desktop", "Editor",
+    "Explorer", "Files", "Firefox", "Game", "Git", "Manager", "Media", "Microsoft", "Monitor", "Music",
+    "Notes", "Office", "Paint", "Photo", "Player", "Power", "Remote", "Settings", "Shell", "Studio",
+    "Sync", "System", "Terminal", "Tools", "Update", "Video", "Viewer", "Visual", "Windows", "Zip",
+]  # fmt: skip
+
+QUERIES = ["visual studio code", "windows terminal", "wt", "ms", "power shell", "zzz", "photo viewer"]
+
+
+def _synthetic_apps(count: int, seed: int = 5) -> list[tuple[str, str, None]]:
+    rng = random.Random(seed)
+    apps = []
+    for i in range(count):
+        words = rng.sample(WORDS, rng.randint(1, 4))
+        name = " ".join(words)
+        if i % 5 == 0:
+            path = f"UWP::Vendor.{''.join(rng.sample(WORDS, 2))}_8wekyb3d8bbwe!App"
+        else:
+            path = rf"C:\ProgramData\Microsoft\Windows\Start Menu\Programs\{name} {i}.lnk"
+        apps.append((name, path, None))
+    return apps
+
+
+def _keystrokes(index: AppSearchIndex, query: str) -> tuple[list[list[tuple[int, float]]], list[float]]:
+    """Type *query* one character at a time like the provider does, narrowing to the previous matches."""
+    results, durations = [], []
+    candidates = None
+    for end in range(1, len(query) + 1):
+        started = time.perf_counter()
+        matches = index.search(query[:end], candidates)
+        durations.append(time.perf_counter() - started)
+        candidates = [i for i, _ in matches]
+        results.append(matches)
+    return results, durations
+
+
+def test_scores_match_fuzzy_score():
+    apps = _synthetic_apps(500)
+    index = AppSearchIndex(apps)
+
+    for query in ("vis", "wt", "ms", "code"):
+        scores = dict(index.search(query))
+        for i, (name, _, _) in enumerate(apps):
+            name_score = fuzzy_score(query, name)
+            if name_score is not None:
+                assert scores[i] == name_score
+            else:
+                # Only the package name fallback may match, and never above its cap
+                assert scores.get(i, 0.0) <= 3.5
+
+
+def test_package_name_matches_are_capped():
+    index = AppSearchIndex([("Terminal", "UWP::Microsoft.WindowsTerminal_8wekyb3d8bbwe!App", None)])
+
+    # "windows" only matches the CamelCase-split package name, a word prefix capped below a prefix match
+    assert index.search("windows") == [(0, 3.5)]
+    assert index.search("term") == [(0, 4.0)]
+
+
+def test_narrowing_to_previous_matches_gives_the_full_scan_results():
+    index = AppSearchIndex(_synthetic_apps(2000))
+
+    for query in QUERIES:
+        narrowed, _ = _keystrokes(index, query)
+        assert narrowed == [index.search(query[:end]) for end in range(1, len(query) + 1)]
+
+
+def test_narrowed_keystrokes_are_faster_than_full_scans(timings):
+    apps = _synthetic_apps(5000)
+    started = time.perf_counter()
+    index = AppSearchIndex(apps)
+    build = time.perf_counter() - started
+
+    full_scan, narrowed = timings(), timings()
+    for _ in range(3):
+        for query in QUERIES:
+            for end in range(1, len(query) + 1):
+                with full_scan.measure():
+                    index.search(query[:end])
+            narrowed.extend(_keystrokes(index, query)[1])
+
+    print(
+        f"AppSearchIndex over {len(index)} apps: build {build * 1000:.1f} ms, "
+        f"full scan {full_scan}, narrowed {narrowed}"
+    )
+    assert narrowed.p50 < full_scan.p50
+
+
+@pytest.mark.parametrize("query", ["", "a"])
+def test_empty_index(query):
+    assert AppSearchIndex([]).search(query) == []
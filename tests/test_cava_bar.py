@@ -0,0 +1,123 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtGui import QColor, QImage, QPainter  # noqa: E402
+
+from core.utils.widgets.cava.bar import CavaBar  # noqa: E402
+
+BAR_TYPES = ["bars", "bars_mirrored", "waves", "waves_mirrored"]
+BARS = 64
+PAINTS = 200
+
+
+class FakeCavaWidget:
+    """The parts of `CavaWidget` a `CavaBar` paints from."""
+
+    def __init__(self, bar_type: str, gradient: bool, edge_fade: int = 0):
+        self.config = SimpleNamespace(
+            bar_type=bar_type,
+            bar_height=32,
+            bar_width=4,
+            bar_spacing=2,
+            bars_number=BARS,
+            min_bar_height=1,
+            gradient=1 if gradient else 0,
+        )
+        self.colors = [QColor("#f38ba8"), QColor("#fab387"), QColor("#a6e3a1")] if gradient else []
+        self.foreground_color = QColor("#cdd6f4")
+        self.samples: list[float] = []
+        self._edge_fade_left = edge_fade
+        self._edge_fade_right = edge_fade
+        self.painted = 0
+
+    def frame_painted(self) -> None:
+        self.painted += 1
+
+
+def _frames(count: int, seed: int = 13) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[rng.random() for _ in range(BARS)] for _ in range(count)]
+
+
+def _paint(bar: CavaBar, image: QImage) -> QImage:
+    image.fill(0)
+    bar.render(image)
+    return image
+
+
+def _fill_each(painter: QPainter, rects, brush) -> None:
+    """How bars were filled, one fillRect each, before they were batched into one drawRects call."""
+    for rect in rects:
+        painter.fillRect(rect, brush)
+
+
+def _bar(bar_type: str, gradient: bool, edge_fade: int = 0) -> tuple[FakeCavaWidget, CavaBar, QImage]:
+    widget = FakeCavaWidget(bar_type, gradient, edge_fade)
+    bar = CavaBar(widget)
+    image = QImage(bar.width(), bar.height(), QImage.Format.Format_ARGB32_Premultiplied)
+    return widget, bar, image
+
+
+@pytest.mark.parametrize("bar_type", ["bars", "bars_mirrored"])
+@pytest.mark.parametrize("edge_fade", [0, 40])
+def test_batched_gradient_bars_match_filling_each_bar(qapp, monkeypatch, bar_type, edge_fade):
+    widget, bar, image = _bar(bar_type, gradient=True, edge_fade=edge_fade)
+    frames = _frames(5)
+
+    batched = []
+    for frame in frames:
+        widget.samples = frame
+        batched.append(_paint(bar, image).copy())
+
+    monkeypatch.setattr(CavaBar, "_fill_rects", staticmethod(_fill_each))
+    for frame, expected in zip(frames, batched):
+        widget.samples = frame
+        assert _paint(bar, image) == expected
+    assert widget.painted == 2 * len(frames)
+
+
+def test_gradient_is_drawn_per_bar(qapp):
+    widget, bar, image = _bar("bars", gradient=True)
+    widget.samples = [1.0 if i % 2 else 0.25 for i in range(BARS)]
+    _paint(bar, image)
+
+    # Full and quarter height bars both end in the last gradient color at their top
+    full_x = round(bar._cache.bar_rects[1][0]) + 1
+    quarter_x = round(bar._cache.bar_rects[0][0]) + 1
+    full_top = image.pixelColor(full_x, 0)
+    quarter_top = image.pixelColor(quarter_x, image.height() - round(image.height() / 4))
+    assert full_top.green() > full_top.red()
+    assert quarter_top.green() > quarter_top.red()
+
+
+@pytest.mark.parametrize("bar_type", BAR_TYPES)
+def test_every_frame_is_painted(qapp, bar_type):
+    for gradient in (False, True):
+        widget, bar, image = _bar(bar_type, gradient)
+        for frame in _frames(10):
+            widget.samples = frame
+            _paint(bar, image)
+        assert widget.painted == 10
+
+
+@pytest.mark.parametrize("bar_type", ["bars", "bars_mirrored"])
+@pytest.mark.parametrize("gradient", [False, True], ids=["solid", "gradient"])
+def test_batched_fill_paints_faster_than_filling_each_bar(qapp, monkeypatch, timings, bar_type, gradient):
+    frames = _frames(PAINTS)
+    widget, bar, image = _bar(bar_type, gradient)
+    batched, per_bar = timings(), timings()
+
+    for durations, fill in ((batched, CavaBar._fill_rects), (per_bar, _fill_each)):
+        monkeypatch.setattr(CavaBar, "_fill_rects", staticmethod(fill))
+        for frame in frames:
+            widget.samples = frame
+            with durations.measure():
+                _paint(bar, image)
+
+    print(f"{bar_type} paint of {BARS} bars: batched {batched}, per bar {per_bar}")
+    assert widget.painted == 2 * PAINTS
+    assert batched.p50 < per_bar.p50
@@ -0,0 +1,97 @@
+import statistics
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from PyQt6.QtCore import QObject, pyqtSignal  # noqa: E402
+
+from core.event_service import EventService  # noqa: E402
+
+TOPICS = [f"topic-{i}" for i in range(20)]
+
+
+class Subscriber(QObject):
+    fired = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+        self.fired.connect(self._on_fired)
+
+    def _on_fired(self, _value):
+        self.received += 1
+
+
+@pytest.fixture
+def service(qapp):
+    # A fresh instance instead of the process wide one cached by lru_cache
+    return EventService.__wrapped__()
+
+
+def _subscribe(service: EventService, count: int, topics: list[str]) -> dict[str, list[Subscriber]]:
+    subscribers: dict[str, list[Subscriber]] = {topic: [] for topic in topics}
+    for i in range(count):
+        subscriber = Subscriber()
+        topic = topics[i % len(topics)]
+        service.register_event(topic, subscriber.fired, owner=subscriber)
+        subscribers[topic].append(subscriber)
+    return subscribers
+
+
+def _emit_cost(service: EventService, topic: str, rounds: int = 30, batch: int = 200) -> float:
+    """Median cost of one emit, taken over batches to smooth out scheduler noise."""
+    costs = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(batch):
+            service.emit_event(topic, None)
+        costs.append((time.perf_counter() - started) / batch)
+    return statistics.median(costs)
+
+
+def test_emit_only_reaches_the_subscribers_of_its_topic(service):
+    subscribers = _subscribe(service, 100, TOPICS)
+
+    for _ in range(3):
+        service.emit_event("topic-0", None)
+
+    assert [s.received for s in subscribers["topic-0"]] == [3] * 5
+    assert all(s.received == 0 for topic in TOPICS[1:] for s in subscribers[topic])
+    assert service.stats()["topic-0"] == {"subscribers": 5, "emits": 3}
+    assert service.stats()["topic-1"] == {"subscribers": 5, "emits": 0}
+
+
+def test_emit_cost_does_not_depend_on_unrelated_topics(service):
+    subscribers = _subscribe(service, 5, ["topic-0"])
+    alone = _emit_cost(service, "topic-0")
+
+    # 100 subscribers over 20 topics, topic-0 keeps its own 5 and 19 other topics are added
+    unrelated = _subscribe(service, 95, TOPICS[1:])
+    crowded = _emit_cost(service, "topic-0")
+
+    print(f"emit to 5 of 100 subscribers: {alone * 1e6:.1f} us alone, {crowded * 1e6:.1f} us with 19 other topics")
+    assert crowded < alone * 1.5
+    assert all(s.received == 30 * 200 * 2 for s in subscribers["topic-0"])
+    assert all(s.received == 0 for topic_subscribers in unrelated.values() for s in topic_subscribers)
+
+
+def test_emit_counts_are_exact_across_threads(service):
+    threads, emits = 8, 5000
+    barrier = threading.Barrier(threads)
+
+    def emit():
+        barrier.wait()
+        for i in range(emits):
+            service.emit_event(TOPICS[i % 2], None)
+
+    workers = [threading.Thread(target=emit) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    stats = service.stats()
+    assert stats["topic-0"]["emits"] == stats["topic-1"]["emits"] == threads * emits // 2
@@ -0,0 +1,144 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from core.utils.widgets.github import api  # noqa: E402
+from core.utils.widgets.github.api import GitHubDataManager  # noqa: E402
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class GitHubStub:
+    """Minimal stand-in for the notifications and GraphQL endpoints that counts requests."""
+
+    def __init__(self):
+        self.last_modified = LAST_MODIFIED
+        self.updated_at = {str(i): "2024-01-01T00:00:00Z" for i in range(3)}
+        self.gets = 0
+        self.not_modified = 0
+        self.graphql_aliases: list[int] = []
+
+    def notifications(self) -> list[dict]:
+        return [
+            {
+                "id": notification_id,
+                "repository": {"full_name": "owner/repo", "html_url": "https://github.com/owner/repo"},
+                "subject": {
+                    "title": f"Issue {notification_id}",
+                    "type": "Issue",
+                    "url": f"https://api.github.com/repos/owner/repo/issues/{notification_id}",
+                },
+                "unread": True,
+                "reason": "mention",
+                "updated_at": updated_at,
+            }
+            for notification_id, updated_at in self.updated_at.items()
+        ]
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.gets += 1
+                if self.headers.get("If-Modified-Since") == stub.last_modified:
+                    stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("X-Poll-Interval", "60")
+                    self.end_headers()
+                    return
+                body = json.dumps(stub.notifications()).encode()
+                self.send_response(200)
+                self.send_header("Last-Modified", stub.last_modified)
+                self.send_header("X-Poll-Interval", "60")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["query"]
+                aliases = re.findall(r"(n\d+):", query)
+                stub.graphql_aliases.append(len(aliases))
+                body = json.dumps({"data": {alias: {"issue": {"state": "OPEN"}} for alias in aliases}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    stub = GitHubStub()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub.handler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(GitHubDataManager, "_api_url", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(GitHubDataManager, "_notification_cache", {})
+    monkeypatch.setattr(GitHubDataManager, "_enrichment_cache", {})
+    monkeypatch.setattr(GitHubDataManager, "_poll_interval", 0)
+    monkeypatch.setattr(GitHubDataManager, "_next_poll_at", 0.0)
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def fetch() -> list[dict]:
+    return GitHubDataManager._get_all_notifications("token", only_unread=True, max_notification=50)
+
+
+def test_unchanged_poll_is_answered_from_cache(stub):
+    first = fetch()
+    assert stub.gets == 1
+    assert stub.graphql_aliases == [3]
+    assert {item["issue_state"] for item in first} == {"open"}
+
+    second = fetch()
+    assert stub.gets == 2
+    assert stub.not_modified == 1
+    # A 304 reuses the cached list and enrichment without a GraphQL request
+    assert stub.graphql_aliases == [3]
+    assert second == first
+
+
+def test_only_updated_notifications_are_enriched(stub):
+    fetch()
+    stub.last_modified = "Tue, 02 Jan 2024 00:00:00 GMT"
+    stub.updated_at["1"] = "2024-01-02T00:00:00Z"
+
+    result = fetch()
+    assert stub.not_modified == 0
+    assert stub.graphql_aliases == [3, 1]
+    assert {item["issue_state"] for item in result} == {"open"}
+
+
+def test_poll_interval_is_a_floor_measured_from_the_poll_start(stub, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: now[0])
+    polls = []
+    monkeypatch.setattr(GitHubDataManager, "_token", "token")
+    monkeypatch.setattr(GitHubDataManager, "fetch_notifications", classmethod(lambda cls, *args: polls.append(now[0])))
+
+    fetch()
+    assert GitHubDataManager._poll_interval == 60
+
+    now[0] = 1030.0
+    GitHubDataManager._on_timer()
+    assert polls == []
+
+    # A 60 s timer that fires a little early still polls
+    now[0] = 1059.99
+    GitHubDataManager._on_timer()
+    assert polls == [1059.99]
+
+    now[0] = 1030.0
+    GitHubDataManager.refresh()
+    assert polls == [1059.99, 1030.0]
@@ -0,0 +1,175 @@
+import copy
+import json
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebSockets")
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+from PyQt6.QtNetwork import QHostAddress  # noqa: E402
+from PyQt6.QtWebSockets import QWebSocketServer  # noqa: E402
+
+from core.utils.widgets.glazewm.client import GlazewmClient, QueryType  # noqa: E402
+
+
+def workspace(name: str, focus: bool = False, windows: int = 0) -> dict:
+    return {
+        "type": "workspace",
+        "name": name,
+        "displayName": name,
+        "isDisplayed": True,
+        "hasFocus": focus,
+        "children": [
+            {"type": "window", "id": f"{name}-{i}", "handle": i, "state": {"type": "tiling"}} for i in range(windows)
+        ],
+    }
+
+
+class GlazewmStub:
+    """WebSocket stand-in for the GlazeWM IPC server that records the messages it receives."""
+
+    def __init__(self):
+        self.monitors = [
+            {"hardwareId": "A", "handle": 1, "children": [workspace("1", focus=True)]},
+            {"hardwareId": "B", "handle": 2, "children": [workspace("2")]},
+        ]
+        self.received: list[str] = []
+        self.connections = 0
+        self._sockets = []
+        self.server = QWebSocketServer("glazewm-stub", QWebSocketServer.SslMode.NonSecureMode)
+        self.server.newConnection.connect(self._on_connection)
+        assert self.server.listen(QHostAddress.SpecialAddress.LocalHost, 0)
+
+    @property
+    def uri(self) -> str:
+        return f"ws://127.0.0.1:{self.server.serverPort()}"
+
+    def queries(self, query: str) -> int:
+        return self.received.count(query)
+
+    def push_event(self, event_type: str) -> None:
+        message = json.dumps({"messageType": "event_subscription", "data": {"eventType": event_type}})
+        for socket in self._sockets:
+            socket.sendTextMessage(message)
+
+    def _on_connection(self):
+        socket = self.server.nextPendingConnection()
+        self.connections += 1
+        socket.textMessageReceived.connect(lambda message: self._reply(socket, message))
+        self._sockets.append(socket)
+
+    def _reply(self, socket, message: str) -> None:
+        self.received.append(message)
+        data = {
+            QueryType.MONITORS: {"monitors": copy.deepcopy(self.monitors)},
+            QueryType.TILING_DIRECTION: {"tilingDirection": "horizontal"},
+            QueryType.BINDING_MODES: {"bindingModes": []},
+        }.get(message)
+        if data is not None:
+            socket.sendTextMessage(
+                json.dumps({"messageType": "client_response", "clientMessage": message, "data": data})
+            )
+
+
+def process_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+    assert condition()
+
+
+def settle(duration: float = 0.1) -> None:
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def stub(qapp):
+    stub = GlazewmStub()
+    yield stub
+    stub.server.close()
+
+
+@pytest.fixture
+def changes() -> list[list]:
+    return []
+
+
+@pytest.fixture
+def client(stub, changes):
+    client = GlazewmClient(stub.uri)
+    client.monitors_changed.connect(changes.append)
+    client.subscribe(["focus_changed", "workspace_updated"], [QueryType.MONITORS])
+    client.connect()
+    process_until(lambda: changes)
+    return client
+
+
+def test_first_result_carries_every_monitor(stub, client, changes):
+    assert [monitor.hwnd for monitor in changes[0]] == [1, 2]
+    assert [monitor.hwnd for monitor in client.monitors] == [1, 2]
+    assert stub.queries(QueryType.MONITORS) == 1
+    assert stub.queries("sub -e focus_changed workspace_updated") == 1
+
+
+def test_event_burst_is_answered_by_one_query_and_only_changes_are_emitted(stub, client, changes):
+    stub.monitors[1]["children"][0] = workspace("2", windows=1)
+    for _ in range(10):
+        stub.push_event("focus_changed")
+    process_until(lambda: len(changes) == 2)
+    settle()
+
+    assert stub.queries(QueryType.MONITORS) == 2
+    assert [[monitor.hwnd for monitor in change] for change in changes] == [[1, 2], [2]]
+    assert changes[1][0].workspaces[0].num_windows == 1
+
+    # Events that leave the state as it was cost a query but emit nothing
+    stub.push_event("workspace_updated")
+    process_until(lambda: stub.queries(QueryType.MONITORS) == 3)
+    settle()
+    assert len(changes) == 2
+
+
+def test_events_only_rerun_the_queries_they_affect(stub, client):
+    client.subscribe(["binding_modes_changed"], [QueryType.BINDING_MODES])
+    process_until(lambda: client.binding_mode is not None)
+
+    stub.push_event("binding_modes_changed")
+    process_until(lambda: stub.queries(QueryType.BINDING_MODES) == 2)
+    settle()
+    assert stub.queries(QueryType.MONITORS) == 1
+
+
+def test_subscribing_again_reuses_the_fresh_state(stub, client):
+    # A widget shown again on a connected client reads the cache instead of querying
+    client.subscribe(["focus_changed", "workspace_updated"], [QueryType.MONITORS])
+    settle()
+    assert stub.queries(QueryType.MONITORS) == 1
+    assert [monitor.hwnd for monitor in client.monitors] == [1, 2]
+
+
+def test_widgets_connecting_during_the_handshake_share_it(stub, changes, monkeypatch):
+    client = GlazewmClient(stub.uri)
+    client.monitors_changed.connect(changes.append)
+    client.subscribe(["focus_changed", "workspace_updated"], [QueryType.MONITORS])
+    opened = []
+    open_socket = client._websocket.open
+
+    def record_open(uri):
+        opened.append(uri)
+        open_socket(uri)
+
+    monkeypatch.setattr(client._websocket, "open", record_open)
+    for _ in range(3):
+        client.connect()
+    process_until(lambda: changes)
+    settle()
+
+    # Opening again while connecting would abort the handshake and start over
+    assert len(opened) == 1
+    assert stub.connections == 1
+    assert stub.queries(QueryType.MONITORS) == 1
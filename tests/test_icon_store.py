@@ -0,0 +1,68 @@
+import pytest
+
+from core.utils.singleton import Singleton
+from core.utils.widgets.quick_launch import icon_store
+from core.utils.widgets.quick_launch.icon_store import IconStore
+
+
+@pytest.fixture
+def open_store(tmp_path, monkeypatch):
+    """Open the store file under tmp_path, every call returns a fresh instance like a new session."""
+    path = tmp_path / "icons.pack"
+
+    def open_store() -> IconStore:
+        monkeypatch.delitem(Singleton._instances, IconStore, raising=False)
+        return IconStore(path)
+
+    yield open_store
+    monkeypatch.delitem(Singleton._instances, IconStore, raising=False)
+
+
+def test_new_version_of_a_source_supersedes_the_old_record(tmp_path, open_store):
+    source = tmp_path / "app.exe"
+    source.write_bytes(b"v1")
+    store = open_store()
+    old_key = store.key(str(source), 48)
+    store.put(old_key, b"old icon")
+
+    source.write_bytes(b"version 2")
+    new_key = store.key(str(source), 48)
+    assert new_key != old_key
+    store.put(new_key, b"new icon")
+
+    assert store.get(old_key) is None
+    assert store.get(new_key) == b"new icon"
+    assert store.stats()["entries"] == 1
+    assert store.stats()["dead_bytes"] == icon_store._RECORD.size + len(b"old icon")
+
+    # Reopening the file finds the same live record and dead bytes
+    reopened = open_store()
+    assert reopened.get(new_key) == b"new icon"
+    assert reopened.get(old_key) is None
+    assert reopened.stats()["dead_bytes"] == store.stats()["dead_bytes"]
+
+
+def test_changing_sources_keep_the_file_bounded(tmp_path, open_store, monkeypatch):
+    monkeypatch.setattr(icon_store, "_COMPACT_MIN_DEAD_BYTES", 4096)
+    sources = [tmp_path / f"app{i}.exe" for i in range(10)]
+    icon = b"\x89PNG" + bytes(1000)
+    for version in range(50):
+        store = open_store()
+        for source in sources:
+            source.write_bytes(b"x" * (version + 1))
+            key = store.key(str(source), 48)
+            if store.length(key) is None:
+                store.put(key, icon)
+
+    live = len(sources) * (icon_store._RECORD.size + len(icon))
+    assert store.stats()["entries"] == len(sources)
+    assert store.path.stat().st_size <= len(icon_store._MAGIC) + 2 * live + 4096 + icon_store._RECORD.size + len(icon)
+
+
+def test_outdated_store_is_discarded(tmp_path, open_store):
+    path = tmp_path / "icons.pack"
+    path.write_bytes(b"YQLI\x01\x00\x00\x00" + bytes(40))
+    store = open_store()
+    assert store.get("00" * 16) is None
+    assert store.stats()["entries"] == 0
+    assert not path.exists()
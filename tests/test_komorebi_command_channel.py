@@ -0,0 +1,136 @@
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from core.utils.widgets.komorebi.client import KomorebiClient  # noqa: E402
+from core.utils.widgets.komorebi.command_channel import (  # noqa: E402
+    KomorebiCommand,
+    KomorebiCommandChannel,
+    _SocketTransport,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs unix sockets")
+
+# Stand-in for komorebic.exe: logs its arguments and fails the commands listed in KOMOREBIC_FAIL
+KOMOREBIC_STAND_IN = """\
+import os, sys
+with open(os.environ["KOMOREBIC_LOG"], "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+sys.exit(1 if sys.argv[1] in os.environ.get("KOMOREBIC_FAIL", "").split(",") else 0)
+"""
+
+
+class _MessageHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            with self.server.received_lock:
+                self.server.received.append(json.loads(line))
+
+
+class _KomorebiSocketStandIn(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        super().__init__(path, _MessageHandler)
+        self.received: list[dict] = []
+        self.received_lock = threading.Lock()
+
+    def wait_for(self, count: int, timeout: float = 2.0) -> list[dict]:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.received_lock:
+                if len(self.received) >= count:
+                    return list(self.received)
+            time.sleep(0.001)
+        return list(self.received)
+
+
+@pytest.fixture
+def komorebic(tmp_path, monkeypatch):
+    script = tmp_path / "komorebic"
+    script.write_text(f"#!{sys.executable}\n{KOMOREBIC_STAND_IN}")
+    script.chmod(0o755)
+    log = tmp_path / "komorebic.log"
+    monkeypatch.setenv("KOMOREBIC_LOG", str(log))
+    monkeypatch.delenv("KOMOREBIC_FAIL", raising=False)
+    return str(script), log
+
+
+@pytest.fixture
+def socket_server(tmp_path):
+    server = _KomorebiSocketStandIn(str(tmp_path / "komorebi.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _channel(komorebic_path: str, socket_path: str | None = None) -> KomorebiCommandChannel:
+    channel = KomorebiCommandChannel(komorebic_path, 0.5)
+    channel._use_socket = socket_path is not None
+    if socket_path is not None:
+        channel._socket = _SocketTransport(socket_path, 0.5)
+    return channel
+
+
+def _client(channel: KomorebiCommandChannel) -> KomorebiClient:
+    # Bypass the process wide instance, only the channel is used by the commands
+    client = object.__new__(KomorebiClient)
+    client._channel = channel
+    return client
+
+
+def test_toggle_focuses_the_monitor_at_the_cursor_first(komorebic):
+    path, log = komorebic
+    _client(_channel(path)).toggle("monocle", wait=True)
+
+    assert log.read_text().splitlines() == ["focus-monitor-at-cursor", "toggle-monocle"]
+
+
+def test_toggle_is_skipped_when_the_focus_fails(komorebic, monkeypatch):
+    path, log = komorebic
+    monkeypatch.setenv("KOMOREBIC_FAIL", "focus-monitor-at-cursor")
+    channel = _channel(path)
+    _client(channel).toggle("monocle", wait=True)
+    # The next command still runs, only the toggle tied to the failed focus is dropped
+    channel.send(KomorebiCommand(("flip-layout", "horizontal")), wait=True)
+
+    assert log.read_text().splitlines() == ["focus-monitor-at-cursor", "flip-layout horizontal"]
+
+
+def test_toggle_over_the_socket_sends_both_messages_in_order(komorebic, socket_server):
+    path, log = komorebic
+    _client(_channel(path, socket_server.server_address)).toggle("float", wait=True)
+
+    assert socket_server.wait_for(2) == [{"type": "FocusMonitorAtCursor"}, {"type": "ToggleFloat"}]
+    assert not log.exists()
+
+
+def test_socket_latency_beats_komorebic_processes(komorebic, socket_server, timings):
+    path, log = komorebic
+    count = 20
+    over_socket, over_process = timings(), timings()
+
+    for channel, latencies in (
+        (_channel(path, socket_server.server_address), over_socket),
+        (_channel(path), over_process),
+    ):
+        for i in range(count):
+            with latencies.measure():
+                channel.send(
+                    KomorebiCommand(("focus-stack-window", str(i)), {"type": "FocusStackWindow", "content": i}), True
+                )
+
+    assert len(socket_server.wait_for(count)) == count
+    assert len(log.read_text().splitlines()) == count
+    print(f"komorebi command latency: socket {over_socket}, komorebic process {over_process} ({os.cpu_count()} cpus)")
+    assert over_socket.p50 * 5 < over_process.p50
@@ -0,0 +1,133 @@
+import copy
+import json
+import logging
+
+import pytest
+
+from core.utils.widgets.komorebi.state import FULL_STATE_DIFF, KomorebiMessageFramer, diff_komorebi_state
+
+MESSAGES = [
+    {"event": {"type": "FocusWorkspaceNumber", "content": 1}, "state": {"monitors": {"elements": []}}},
+    {"event": {"type": "TitleUpdate", "content": 'Quote " brace { and } backslash \\'}},
+    {"event": {"type": "TitleUpdate", "content": "Ünïcödé 🪟 title"}, "nested": {"a": {"b": {"c": []}}}},
+]
+
+
+def _stream(messages: list[dict], separator: str = "") -> bytes:
+    return separator.join(json.dumps(message, ensure_ascii=False) for message in messages).encode("utf-8")
+
+
+@pytest.mark.parametrize("separator", ["", "\n", "\r\n  "])
+def test_messages_in_one_read(separator):
+    assert KomorebiMessageFramer().feed(_stream(MESSAGES, separator)) == MESSAGES
+
+
+def test_messages_split_at_every_byte_boundary():
+    data = _stream(MESSAGES, "\n")
+    for split in range(1, len(data)):
+        framer = KomorebiMessageFramer()
+        assert framer.feed(data[:split]) + framer.feed(data[split:]) == MESSAGES, split
+
+
+def test_messages_fed_byte_by_byte():
+    framer = KomorebiMessageFramer()
+    received = []
+    for byte in _stream(MESSAGES):
+        received.extend(framer.feed(bytes([byte])))
+    assert received == MESSAGES
+
+
+def test_unexpected_data_between_messages_is_skipped():
+    data = b"garbage " + _stream(MESSAGES[:1]) + b" more garbage " + _stream(MESSAGES[1:2])
+    assert KomorebiMessageFramer().feed(data) == MESSAGES[:2]
+
+
+def test_oversized_message_is_discarded(caplog):
+    framer = KomorebiMessageFramer(max_message_size=64)
+    with caplog.at_level(logging.WARNING):
+        assert framer.feed(b'{"content": "' + b"x" * 100) == []
+    assert "larger than 64 bytes" in caplog.text
+    assert framer.feed(_stream(MESSAGES[:1])) == MESSAGES[:1]
+
+
+def test_reset_drops_a_partial_message():
+    framer = KomorebiMessageFramer()
+    framer.feed(b'{"event": {"type": "Unfinished"')
+    framer.reset()
+    assert framer.feed(_stream(MESSAGES[:1])) == MESSAGES[:1]
+
+
+def _state(monitors: int = 2, workspaces: int = 3) -> dict:
+    return {
+        "float_override": False,
+        "monitors": {
+            "focused": 0,
+            "elements": [
+                {
+                    "id": 100 + m,
+                    "name": f"DISPLAY{m}",
+                    "workspaces": {
+                        "focused": 0,
+                        "elements": [{"name": f"{m}-{w}", "containers": {"elements": []}} for w in range(workspaces)],
+                    },
+                }
+                for m in range(monitors)
+            ],
+        },
+    }
+
+
+def test_diff_without_a_previous_state_is_full():
+    assert diff_komorebi_state(None, _state()) is FULL_STATE_DIFF
+
+
+def test_diff_of_equal_states_is_empty():
+    diff = diff_komorebi_state(_state(), _state())
+    assert not diff.changed
+    assert not diff.affects_monitor(100)
+    # Widgets without a monitor always update
+    assert diff.affects_monitor(None)
+
+
+def test_diff_reports_the_changed_workspace():
+    new = _state()
+    new["monitors"]["elements"][1]["workspaces"]["elements"][2]["containers"]["elements"].append({"windows": {}})
+
+    diff = diff_komorebi_state(_state(), new)
+
+    assert not diff.global_changed
+    assert diff.monitors == {101}
+    assert diff.changed_workspaces(101) == {2}
+    assert diff.changed_workspaces(100) == frozenset()
+    assert not diff.affects_monitor(100)
+
+
+def test_diff_reports_both_workspaces_of_a_focus_change():
+    new = _state()
+    new["monitors"]["elements"][0]["workspaces"]["focused"] = 2
+
+    diff = diff_komorebi_state(_state(), new)
+
+    assert diff.monitors == {100}
+    assert diff.changed_workspaces(100) == {0, 2}
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda state: state.update(float_override=True),
+        lambda state: state["monitors"].update(focused=1),
+        lambda state: state["monitors"]["elements"].reverse(),
+        lambda state: state["monitors"]["elements"].pop(),
+    ],
+    ids=["global flag", "focused monitor", "reordered monitors", "removed monitor"],
+)
+def test_diff_reports_global_changes(change):
+    old = _state()
+    new = copy.deepcopy(old)
+    change(new)
+
+    diff = diff_komorebi_state(old, new)
+
+    assert diff.global_changed
+    assert diff.affects_monitor(100)
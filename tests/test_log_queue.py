@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from core.utils.log_queue import QueueLogHandler
+
+
+class SlowHandler(logging.Handler):
+    """Collects messages, sleeping per record like a slow disk or a stalled pipe."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(logging.DEBUG)
+        self.delay = delay
+        self.messages: list[str] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.release.wait()
+        time.sleep(self.delay)
+        self.messages.append(record.getMessage())
+
+
+def _record(message: str, *args) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {"name": "test", "levelno": logging.INFO, "levelname": "INFO", "msg": message, "args": args}
+    )
+
+
+def _timed_emits(queue: QueueLogHandler, durations: list[float], count: int) -> None:
+    for i in range(count):
+        started = time.perf_counter()
+        queue.handle(_record("record %d", i))
+        durations.append(time.perf_counter() - started)
+
+
+@contextmanager
+def _queue(handler: SlowHandler, capacity: int) -> Iterator[QueueLogHandler]:
+    queue = QueueLogHandler([handler], capacity=capacity)
+    try:
+        yield queue
+    finally:
+        # A writer left blocked in the handler would hang logging's shutdown on its lock
+        handler.release.set()
+        queue.close()
+
+
+def test_emit_does_not_wait_for_a_slow_handler(timings):
+    handler = SlowHandler(0.01)
+    emits = timings()
+
+    with _queue(handler, capacity=1000) as queue:
+        _timed_emits(queue, emits, 200)
+
+        # Each emit costs a copy and an append, far below a single write of the handler
+        print(f"log emit behind a {handler.delay * 1000:.0f} ms handler: {emits}")
+        assert emits.p99 < handler.delay / 2
+        assert sum(emits) < handler.delay * 20
+        queue.flush(timeout=10)
+        assert handler.messages == [f"record {i}" for i in range(200)]
+        assert queue.stats()["dropped"] == 0
+
+
+def test_full_queue_drops_the_oldest_records_and_reports_them(timings):
+    handler = SlowHandler(0.01)
+    handler.release.clear()
+    emits = timings()
+
+    with _queue(handler, capacity=100) as queue:
+        queue.handle(_record("first"))
+        # The writer is now stuck in the handler with "first", everything else stays queued
+        assert handler.entered.wait(2)
+        _timed_emits(queue, emits, 1000)
+
+        # Dropping the oldest record is as cheap as queueing, no emit waits for the stuck write
+        assert emits.p99 < handler.delay / 2
+        assert queue.stats() == {"queued": 100, "capacity": 100, "dropped": 900}
+        handler.delay = 0
+        handler.release.set()
+        queue.flush(timeout=5)
+        assert handler.messages == [
+            "first",
+            "Log queue full, dropped 900 records",
+            *(f"record {i}" for i in range(900, 1000)),
+        ]
+        assert queue.stats()["queued"] == 0
+
+
+def test_close_drains_the_queue():
+    handler = SlowHandler(0.001)
+    queue = QueueLogHandler([handler], capacity=1000)
+    _timed_emits(queue, [], 50)
+
+    queue.close()
+
+    assert len(handler.messages) == 50
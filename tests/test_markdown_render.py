@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtWidgets import QTextBrowser  # noqa: E402
+
+from core.utils.widgets.ai_chat.markdown_render import (  # noqa: E402
+    StreamingChatRenderer,
+    find_closed_block_end,
+    format_chat_text,
+)
+
+MESSAGES = [
+    "Plain answer without any block boundary.",
+    "First paragraph with **bold** and *italic*.\n\nSecond paragraph with `code` and https://example.com.\n\nEnd",
+    "Intro:\n\n```python\ndef f(x):\n    return x * 2\n```\nAfter the fence\n\n- item *one*\n- item **two**\n",
+    "A [link label\n\nspanning a blank line](https://example.com/a) then text.\n\nTail with www.example.org",
+    "Unclosed fence at the end\n\n```js\nconst a = 1;\n\nconst b = 2;",
+    "Trailing blank lines\n\n\n\n",
+    "Ampersands & <tags> stay text\n\n**bold across\nlines** stays literal\n\n`inline`",
+]
+
+
+def document_structure(browser: QTextBrowser) -> list[tuple]:
+    """Text and character formatting of every fragment, the parts of the rendering a reader sees."""
+    fragments = []
+    block = browser.document().begin()
+    while block.isValid():
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            fmt = fragment.charFormat()
+            fragments.append(
+                (
+                    fragment.text(),
+                    fmt.fontWeight(),
+                    fmt.fontItalic(),
+                    fmt.anchorHref(),
+                    fmt.foreground().color().name(),
+                    fmt.fontFamilies(),
+                )
+            )
+            it += 1
+        fragments.append(("<block>",))
+        block = block.next()
+    return fragments
+
+
+def stream(browser: QTextBrowser, renderer: StreamingChatRenderer, text: str, step: int) -> None:
+    for end in range(step, len(text) + step, step):
+        renderer.update(text[:end])
+    renderer.finish(text)
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+@pytest.mark.parametrize("step", [1, 7, 1000])
+def test_streamed_message_matches_the_final_rendering(qapp, text, step):
+    streamed = QTextBrowser()
+    stream(streamed, StreamingChatRenderer(streamed), text, step)
+
+    final = QTextBrowser()
+    StreamingChatRenderer(final).finish(text)
+
+    assert streamed.toPlainText() == final.toPlainText()
+    assert document_structure(streamed) == document_structure(final)
+
+
+def test_finish_keeps_the_streamed_blocks(qapp):
+    browser = QTextBrowser()
+    renderer = StreamingChatRenderer(browser)
+    renderer.update("First block with **bold**\n\nSecond")
+    rendered = len("First block with bold") + 2
+    changes = []
+    browser.document().contentsChange.connect(lambda position, removed, added: changes.append(position))
+
+    renderer.finish("First block with **bold**\n\nSecond block")
+
+    # Only the tail after the rendered block is replaced
+    assert changes
+    assert min(changes) >= rendered
+    assert browser.toPlainText().endswith("Second block")
+
+
+def test_text_that_does_not_continue_the_stream_is_rendered_from_scratch(qapp):
+    browser = QTextBrowser()
+    renderer = StreamingChatRenderer(browser)
+    renderer.update("Old answer\n\nmore")
+    renderer.finish("New answer")
+    assert browser.toPlainText() == "New answer"
+
+
+def test_closed_block_end():
+    assert find_closed_block_end("one\n\ntwo") == len("one\n\n")
+    assert find_closed_block_end("```\ncode\n\nmore") == 0
+    assert find_closed_block_end("```\ncode\n```\nrest") == len("```\ncode\n```\n")
+    assert find_closed_block_end("[label\n\nstill open") == 0
+    assert format_chat_text("") == ""
@@ -0,0 +1,146 @@
+import threading
+import time
+from threading import Event
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import Qt  # noqa: E402
+
+from core.utils.widgets.quick_launch.workers import QueryWorker  # noqa: E402
+
+
+class SlowProvider:
+    name = "slow"
+    prefix = ""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def get_results(self, text, cancel_event=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.002)
+        with self._lock:
+            self.running -= 1
+        return []
+
+
+class FakeProvider:
+    """Returns its results after `delay`, or only once cancelled when `hang` is set."""
+
+    prefix = ""
+
+    def __init__(self, name: str, delay: float = 0.0, hang: bool = False):
+        self.name = name
+        self.delay = delay
+        self.hang = hang
+        self.entered = Event()
+        self.saw_cancel = Event()
+
+    def match(self, text):
+        return True
+
+    def get_results(self, text, cancel_event=None):
+        self.entered.set()
+        if self.hang:
+            if cancel_event.wait(5):
+                self.saw_cancel.set()
+            return [f"{self.name}:late"]
+        time.sleep(self.delay)
+        return [f"{self.name}:{text}"]
+
+
+@pytest.fixture
+def worker():
+    worker = QueryWorker(max_workers=4, deadline=0.2)
+    yield worker
+    worker.shutdown()
+
+
+def _emits(worker: QueryWorker) -> list[tuple[str, list, bool]]:
+    emits = []
+    worker.finished.connect(lambda *args: emits.append(args), Qt.ConnectionType.DirectConnection)
+    return emits
+
+
+def test_a_provider_never_runs_two_queries_at_once(worker):
+    provider = SlowProvider()
+    barrier = threading.Barrier(16)
+
+    def query():
+        barrier.wait()
+        for _ in range(5):
+            worker._call_provider(provider, "text", Event())
+
+    threads = [threading.Thread(target=query) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = worker.provider_stats()["slow"]
+    assert provider.max_running == 1
+    assert len(worker._provider_locks) == 1
+    # Calls that found the provider busy returned right away and count as timeouts
+    assert stats["calls"] + stats["timeouts"] == 80
+    assert stats["calls"] >= 1
+
+
+def test_a_busy_provider_is_skipped_instead_of_waited_for(worker):
+    provider = FakeProvider("files", hang=True)
+    cancelled_query = Event()
+    thread = threading.Thread(target=worker._call_provider, args=(provider, "old", cancelled_query))
+    thread.start()
+    assert provider.entered.wait(2)
+
+    assert worker._call_provider(provider, "new", Event()) == []
+    # Returned while the cancelled call still holds the provider
+    assert thread.is_alive()
+    assert worker.provider_stats()["files"]["timeouts"] == 1
+
+    cancelled_query.set()
+    thread.join(2)
+
+
+def test_partial_results_are_emitted_in_priority_order(worker):
+    emits = _emits(worker)
+    providers = [FakeProvider("apps", delay=0.05), FakeProvider("calc")]
+
+    worker._run_query("q1", "ab", 10, providers, Event())
+
+    assert emits == [
+        ("q1", ["calc:ab"], False),
+        ("q1", ["apps:ab", "calc:ab"], True),
+    ]
+
+
+def test_deadline_drops_providers_still_running(worker):
+    emits = _emits(worker)
+    hanging = FakeProvider("files", hang=True)
+    providers = [hanging, FakeProvider("apps")]
+
+    started = time.perf_counter()
+    worker._run_query("q1", "ab", 10, providers, Event())
+    elapsed = time.perf_counter() - started
+
+    assert emits[-1] == ("q1", ["apps:ab"], True)
+    assert all(not final for _, _, final in emits[:-1])
+    # The final update comes at the deadline, long before the straggler would give up on its own
+    assert 0.2 <= elapsed < 2.0
+    assert hanging.saw_cancel.wait(2)
+    assert worker.provider_stats()["files"]["timeouts"] == 1
+
+
+def test_cancelled_query_emits_nothing(worker):
+    emits = _emits(worker)
+    cancel = Event()
+    cancel.set()
+
+    worker._run_query("q1", "ab", 10, [FakeProvider("apps")], cancel)
+
+    assert emits == []
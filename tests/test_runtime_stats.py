@@ -0,0 +1,100 @@
+import gc
+import json
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal  # noqa: E402
+from PyQt6.QtWidgets import QLabel, QWidget  # noqa: E402
+
+from core.utils.runtime_stats import RuntimeStats, timer_update  # noqa: E402
+from core.utils.singleton import Singleton  # noqa: E402
+from core.utils.widgets.label_template import LabelRenderer, compile_label_template  # noqa: E402
+
+
+class FakeSource(QObject):
+    data_ready = pyqtSignal(int)
+
+
+class FakeWidget(QWidget):
+    """Stands in for a sampler-fed widget, its label shows the last value."""
+
+    def __init__(self, name: str, source: FakeSource):
+        super().__init__()
+        self.widget_name = name
+        self.screen_name = "offscreen"
+        self.label = QLabel(self)
+        self.renderer = LabelRenderer(compile_label_template("{value}%"), [self.label], RuntimeStats().widget(self))
+        source.data_ready.connect(self._on_data_ready)
+
+    @timer_update
+    def _on_data_ready(self, value: int):
+        self.renderer.render(lambda segment: segment.format(value=value))
+
+
+@pytest.fixture
+def stats(qapp, monkeypatch):
+    monkeypatch.delitem(Singleton._instances, RuntimeStats, raising=False)
+    stats = RuntimeStats()
+    yield stats
+    stats.stop_heartbeat()
+    monkeypatch.delitem(Singleton._instances, RuntimeStats, raising=False)
+
+
+def widget_entry(snapshot: dict, name: str) -> dict:
+    return next(entry for entry in snapshot["widgets"] if entry["name"] == name)
+
+
+def test_sampler_updates_count_as_timer_calls(stats):
+    source = FakeSource()
+    cpu = FakeWidget("cpu", source)
+    for value in (10, 10, 20):
+        source.data_ready.emit(value)
+    stats.widget(cpu).record(0.001)
+
+    entry = widget_entry(stats.snapshot(), "cpu")
+    assert entry["timer_calls"] == 3
+    assert entry["callback_calls"] == 1
+    # The repeated value leaves the label untouched
+    assert entry["label_updates"] == 2
+    assert entry["class"] == "FakeWidget"
+    assert entry["screen"] == "offscreen"
+
+
+def test_snapshot_is_json_and_forgets_deleted_widgets(stats):
+    source = FakeSource()
+    widgets = [FakeWidget(f"w{i}", source) for i in range(3)]
+    stats.record_event("focus_changed", 0.002)
+    stats.register_queue("MainThread", lambda: 7)
+
+    snapshot = json.loads(json.dumps(stats.snapshot()))
+    assert {entry["name"] for entry in snapshot["widgets"]} == {"w0", "w1", "w2"}
+    assert snapshot["events"]["focus_changed"]["calls"] == 1
+    assert any(thread["queue_depth"] == 7 for thread in snapshot["threads"])
+
+    widgets.pop().deleteLater()
+    QCoreApplication.sendPostedEvents(None, 0)
+    QCoreApplication.processEvents()
+    del widgets
+    gc.collect()
+    assert stats.snapshot()["widgets"] == []
+
+
+def test_heartbeat_measures_event_loop_lag(stats):
+    stats.start_heartbeat(interval_ms=10)
+    deadline = time.monotonic() + 0.1
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+    # Block the loop like a slow slot would
+    time.sleep(0.1)
+    deadline = time.monotonic() + 0.05
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+
+    event_loop = stats.snapshot()["event_loop"]
+    assert event_loop["samples"] > 3
+    assert event_loop["max_lag_ms"] >= 50
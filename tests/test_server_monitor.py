@@ -0,0 +1,112 @@
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QEventLoop, QTimer  # noqa: E402
+
+from core.utils.widgets.server_monitor.service import ServerCheckService  # noqa: E402
+
+
+def serve(status: int, delay: float = 0.0, context: ssl.SSLContext | None = None) -> ThreadingHTTPServer:
+    """Start a local stand-in that answers every GET with `status` after `delay` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    if context is not None:
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(*args, **kwargs):
+        server = serve(*args, **kwargs)
+        started.append(server)
+        return f"127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def certificate(tmp_path, monkeypatch):
+    """Self-signed certificate for 127.0.0.1 that expires in 30 days, trusted by default contexts."""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is not available")
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "30", "-subj", "/CN=127.0.0.1"]
+        + ["-addext", "subjectAltName=IP:127.0.0.1", "-keyout", str(key), "-out", str(cert)],
+        check=True,
+        capture_output=True,
+    )
+    monkeypatch.setenv("SSL_CERT_FILE", str(cert))
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+def run_checks(servers: list[dict], ssl_check: bool) -> tuple[list[tuple[int, dict]], list[tuple[int, list]]]:
+    """Run one check through a shared service and collect what it emits."""
+    checked, updated = [], []
+    loop = QEventLoop()
+    service = ServerCheckService.get_instance(servers, True, ssl_check, 5, 3600)
+    service.server_checked.connect(lambda run_id, status: checked.append((run_id, status)))
+    service.status_updated.connect(lambda run_id, statuses: (updated.append((run_id, statuses)), loop.quit()))
+    QTimer.singleShot(10000, loop.quit)
+    loop.exec()
+    service.release()
+    return checked, updated
+
+
+def test_each_server_is_reported_as_soon_as_it_is_checked(qapp, servers):
+    config = [
+        {"name": "slow", "url": servers(200, delay=0.5)},
+        {"name": "fast", "url": servers(200)},
+        {"name": "broken", "url": servers(503)},
+    ]
+
+    checked, updated = run_checks(config, ssl_check=False)
+
+    assert len(updated) == 1
+    run_id, statuses = updated[0]
+    # Results arrive as servers answer, the slow one last
+    assert sorted(status["name"] for _, status in checked) == ["broken", "fast", "slow"]
+    assert checked[-1][1]["name"] == "slow"
+    assert {checked_run for checked_run, _ in checked} == {run_id}
+    # The final list keeps the configured order
+    assert [status["name"] for status in statuses] == ["slow", "fast", "broken"]
+    assert [status["status"] for status in statuses] == ["Online", "Online", "Offline"]
+    assert statuses[2]["response_code"] == 503
+
+
+def test_certificate_expiry_is_read_from_the_request_handshake(qapp, servers, certificate):
+    config = [{"name": "tls", "url": servers(200, context=certificate)}]
+
+    checked, updated = run_checks(config, ssl_check=True)
+
+    status = updated[0][1][0]
+    assert status["status"] == "Online"
+    assert status["ssl"] in (29, 30)
+    assert checked[0][1] == status
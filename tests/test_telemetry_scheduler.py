@@ -0,0 +1,229 @@
+import threading
+import time
+
+import pytest
+
+from core.utils.widgets.telemetry.scheduler import Collector, MetricSource, SampleScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingCollector(Collector):
+    def __init__(self):
+        self.collects = 0
+        self.closed = False
+
+    def collect(self):
+        self.collects += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSource(MetricSource):
+    def __init__(self, key: str, collector: Collector | None = None, min_interval_ms: int = 250):
+        self.key = key
+        self.collector = collector
+        self.min_interval_ms = min_interval_ms
+        self.samples = 0
+        self.opened = 0
+        self.closed = 0
+
+    def open(self):
+        self.opened += 1
+
+    def sample(self):
+        self.samples += 1
+        return self.samples
+
+    def close(self):
+        self.closed += 1
+
+
+def run_for(scheduler: SampleScheduler, clock: FakeClock, seconds: float) -> None:
+    """Advance the fake clock from wakeup to wakeup and deliver like the sampler thread does."""
+    end = clock.now + seconds
+    while (wakeup := scheduler.next_wakeup()) is not None and wakeup <= end:
+        clock.now = wakeup
+        for subscription, value in scheduler.run_due():
+            subscription.callback(value)
+    clock.now = end
+
+
+def test_subscribers_of_one_source_share_samples_at_their_own_rate():
+    clock = FakeClock()
+    scheduler = SampleScheduler(250, clock)
+    source = FakeSource("network")
+    fast, slow = [], []
+    scheduler.subscribe(source, 1000, fast.append)
+    # A second widget subscribes with its own source object for the same interface
+    scheduler.subscribe(FakeSource("network"), 3000, slow.append)
+
+    run_for(scheduler, clock, 30)
+
+    assert len(fast) == 30
+    assert len(slow) == 10
+    # Only the faster rate costs samples, the slow subscriber gets every third one
+    assert source.samples == 30
+    assert set(slow) <= set(fast)
+    assert scheduler.stats()["sources"]["network"]["subscribers"] == 2
+
+
+def test_intervals_are_aligned_and_clamped():
+    clock = FakeClock(1000.1)
+    scheduler = SampleScheduler(250, clock)
+    source = FakeSource("gpu", min_interval_ms=1000)
+    values = []
+    subscription = scheduler.subscribe(source, 300, values.append)
+
+    assert subscription.interval == 1.0
+    assert scheduler.next_wakeup() == pytest.approx(1001.0)
+    run_for(scheduler, clock, 5)
+    assert len(values) == 5
+
+
+def test_shared_collector_runs_once_per_tick():
+    clock = FakeClock()
+    scheduler = SampleScheduler(250, clock)
+    collector = CountingCollector()
+    cpu = FakeSource("cpu", collector)
+    memory = FakeSource("memory", collector)
+    scheduler.subscribe(cpu, 1000, lambda _: None)
+    scheduler.subscribe(memory, 2000, lambda _: None)
+
+    run_for(scheduler, clock, 10)
+
+    assert cpu.samples == 10
+    assert memory.samples == 5
+    assert collector.collects == scheduler.ticks == 10
+
+
+def test_last_unsubscribe_closes_the_source_and_collector():
+    clock = FakeClock()
+    scheduler = SampleScheduler(250, clock)
+    collector = CountingCollector()
+    source = FakeSource("cpu", collector)
+    first = scheduler.subscribe(source, 1000, lambda _: None)
+    second = scheduler.subscribe(source, 1000, lambda _: None)
+    run_for(scheduler, clock, 2)
+
+    scheduler.unsubscribe(first)
+    run_for(scheduler, clock, 2)
+    assert source.closed == 0
+
+    scheduler.unsubscribe(second)
+    # The released source is closed on the next wakeup, which is right away
+    assert scheduler.next_wakeup() == clock.now
+    scheduler.run_due()
+    assert source.opened == source.closed == 1
+    assert collector.closed
+    assert scheduler.next_wakeup() is None
+
+
+def test_source_released_while_it_is_sampled_is_closed_afterwards():
+    clock = FakeClock()
+    scheduler = SampleScheduler(250, clock)
+    source = FakeSource("disk")
+    subscription = scheduler.subscribe(source, 1000, lambda _: None)
+    clock.now = scheduler.next_wakeup()
+
+    batch = scheduler.take_due()
+    # Unsubscribed from the GUI thread while the sampling thread works on the batch
+    scheduler.unsubscribe(subscription)
+    assert len(scheduler.sample_due(batch)) == 1
+    assert source.opened == 1 and source.closed == 0
+
+    scheduler.run_due()
+    assert source.closed == 1
+
+
+def test_failing_source_does_not_stop_the_others():
+    clock = FakeClock()
+    scheduler = SampleScheduler(250, clock)
+
+    class BrokenSource(FakeSource):
+        def sample(self):
+            raise OSError("counter unavailable")
+
+    broken, working = [], []
+    scheduler.subscribe(BrokenSource("disk"), 1000, broken.append)
+    scheduler.subscribe(FakeSource("cpu"), 1000, working.append)
+    run_for(scheduler, clock, 3)
+
+    assert broken == []
+    assert len(working) == 3
+    assert scheduler.stats()["sources"]["disk"]["errors"] == 3
+
+
+def _returns_within(call, timeout: float = 2.0) -> bool:
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_sampler_lock_is_free_while_a_source_is_slow(qapp):
+    from PyQt6.QtCore import QObject
+
+    from core.utils.widgets.telemetry.sampler import TelemetrySampler
+
+    class StuckSource(FakeSource):
+        """Like GetDiskFreeSpaceEx on a sleeping network drive."""
+
+        def __init__(self):
+            super().__init__("disk", min_interval_ms=50)
+            self.entered = threading.Event()
+            self.release = threading.Event()
+
+        def sample(self):
+            self.entered.set()
+            self.release.wait(5)
+            return super().sample()
+
+    sampler = TelemetrySampler(tick_ms=50)
+    stuck = StuckSource()
+    owner = QObject()
+    try:
+        sampler.subscribe(stuck, 50, parent=owner)
+        assert stuck.entered.wait(2)
+
+        other_owner = QObject()
+        assert _returns_within(lambda: sampler.subscribe(FakeSource("cpu"), 50, parent=other_owner).cancel())
+        assert _returns_within(sampler.stats)
+        assert _returns_within(lambda: sampler.source("disk"))
+    finally:
+        stuck.release.set()
+        sampler.stop()
+
+
+def test_sampler_thread_delivers_per_widget_subscriptions(qapp):
+    from PyQt6 import sip
+    from PyQt6.QtCore import QCoreApplication, QObject
+
+    from core.utils.widgets.telemetry.sampler import TelemetrySampler
+
+    sampler = TelemetrySampler(tick_ms=50)
+    source = FakeSource("network", min_interval_ms=50)
+    fast_owner, slow_owner = QObject(), QObject()
+    fast, slow = [], []
+    sampler.subscribe(source, 50, parent=fast_owner).data_ready.connect(fast.append)
+    slow_subscription = sampler.subscribe(FakeSource("network"), 200, parent=slow_owner)
+    slow_subscription.data_ready.connect(slow.append)
+    try:
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline and len(slow) < 3:
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        assert len(slow) >= 3
+        assert len(fast) > len(slow)
+        # Deleting a widget drops only its own subscription
+        sip.delete(slow_owner)
+        assert sampler.stats()["sources"]["network"]["subscribers"] == 1
+    finally:
+        sampler.stop()
@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtGui")
+
+from PyQt6.QtGui import QColor, QImage  # noqa: E402
+
+from core.utils.singleton import Singleton  # noqa: E402
+from core.utils.widgets.wallpapers import thumbnail_cache  # noqa: E402
+from core.utils.widgets.wallpapers.thumbnail_cache import WallpaperThumbnailCache  # noqa: E402
+
+
+def _image(color: str) -> QImage:
+    image = QImage(16, 16, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A cache that keeps one image in memory and about two thumbnails on disk."""
+    monkeypatch.delitem(Singleton._instances, WallpaperThumbnailCache, raising=False)
+    probe = tmp_path / "probe.jpg"
+    _image("red").save(str(probe), "JPG", 90)
+    file_size = probe.stat().st_size
+    probe.unlink()
+    cache = WallpaperThumbnailCache(
+        tmp_path / "thumbs", max_disk_bytes=file_size * 2 + file_size // 2, max_memory_bytes=1
+    )
+    yield cache
+    monkeypatch.delitem(Singleton._instances, WallpaperThumbnailCache, raising=False)
+
+
+def _is_red(image: QImage | None) -> bool:
+    # Thumbnails without alpha are stored as JPEG, colors come back close but not exact
+    if image is None:
+        return False
+    color = image.pixelColor(0, 0)
+    return color.red() > 200 and color.green() < 60 and color.blue() < 60
+
+
+def _disk_keys(cache: WallpaperThumbnailCache) -> list[str]:
+    return [name.split(".")[0] for name in cache._disk]
+
+
+def test_disk_tier_evicts_the_least_recently_used(cache):
+    cache.put("a", _image("red"))
+    cache.put("b", _image("green"))
+    # Served from disk, memory only holds "b", and "a" becomes the most recently used file
+    assert _is_red(cache.get("a"))
+    assert cache.stats()["disk_hits"] == 1
+
+    cache.put("c", _image("blue"))
+
+    assert _disk_keys(cache) == ["a", "c"]
+    assert not (cache.directory / "b.jpg").exists()
+    assert cache.get("b") is None
+
+
+def test_eviction_while_a_get_loads_the_file(cache, monkeypatch):
+    cache.put("a", _image("red"))
+    cache.put("b", _image("green"))
+    real_qimage = thumbnail_cache.QImage
+
+    def load_then_evict(path: str) -> QImage:
+        image = real_qimage(path)
+        # Another loader stores two thumbnails between the file read and the bookkeeping
+        monkeypatch.setattr(thumbnail_cache, "QImage", real_qimage)
+        cache.put("c", _image("blue"))
+        cache.put("d", _image("white"))
+        return image
+
+    monkeypatch.setattr(thumbnail_cache, "QImage", load_then_evict)
+
+    image = cache.get("a")
+
+    assert _is_red(image)
+    assert "a" not in _disk_keys(cache)
+    assert cache.stats()["disk_bytes"] == sum(cache._disk.values())
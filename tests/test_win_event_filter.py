@@ -0,0 +1,121 @@
+import random
+
+from core.utils.win32.win_event_filter import WinEventFilter, hook_ranges
+
+FOREGROUND = 0x0003
+DESTROY = 0x8001
+LOCATION_CHANGE = 0x800B
+NAME_CHANGE = 0x800C
+
+
+def make_filter(*event_ids: int, window: float = 0.05) -> WinEventFilter:
+    event_filter = WinEventFilter(window)
+    event_filter.set_subscribed(event_ids)
+    return event_filter
+
+
+def synthetic_storm(count: int = 20000, seed: int = 1) -> list[tuple[int, int, float]]:
+    rng = random.Random(seed)
+    timestamp = 0.0
+    records = []
+    for _ in range(count):
+        timestamp += rng.uniform(0.0001, 0.002)
+        # Mostly title and location updates, like a progress bar in a window title
+        event = rng.choices([NAME_CHANGE, LOCATION_CHANGE, FOREGROUND, DESTROY], weights=[6, 3, 1, 0.2])[0]
+        records.append((event, rng.choice([101, 102, 103, 104]), timestamp))
+    return records
+
+
+def last_per_key(records) -> dict[tuple[int, int], float]:
+    return {(event, hwnd): timestamp for event, hwnd, timestamp in records}
+
+
+def test_hook_ranges_merge_close_ids():
+    assert hook_ranges([NAME_CHANGE, FOREGROUND, 0x800A, LOCATION_CHANGE]) == [(0x0003, 0x0003), (0x800A, 0x800C)]
+    assert hook_ranges([]) == []
+
+
+def test_unsubscribed_events_are_dropped():
+    event_filter = make_filter(FOREGROUND)
+    assert event_filter.replay([(LOCATION_CHANGE, 1, 0.0), (NAME_CHANGE, 1, 0.001)]) == []
+    assert event_filter.received == 0
+
+
+def test_burst_delivers_first_and_last():
+    event_filter = make_filter(NAME_CHANGE)
+    records = [(NAME_CHANGE, 1, i * 0.001) for i in range(10)]
+    assert event_filter.replay(records) == [records[0], records[-1]]
+
+
+def test_foreground_keeps_order_across_windows():
+    event_filter = make_filter(FOREGROUND)
+    records = [(FOREGROUND, 0xA, 0.000), (FOREGROUND, 0xA, 0.010), (FOREGROUND, 0xB, 0.020)]
+    deliveries = event_filter.replay(records)
+    assert [hwnd for _, hwnd, _ in deliveries] == [0xA, 0xA, 0xB]
+    assert deliveries[-1] == records[-1]
+
+
+def test_immediate_event_releases_the_windows_held_events_first():
+    event_filter = make_filter(NAME_CHANGE, DESTROY)
+    assert event_filter.push(NAME_CHANGE, 1, 0.000) == [(NAME_CHANGE, 1, 0.000)]
+    assert event_filter.push(NAME_CHANGE, 1, 0.010) == []
+
+    # The held title change of window 1 goes out before its destroy, not after it
+    assert event_filter.push(DESTROY, 1, 0.020) == [(NAME_CHANGE, 1, 0.010), (DESTROY, 1, 0.020)]
+    assert event_filter.due(1.0) == []
+
+
+def test_due_event_releases_older_events_of_the_window_under_other_ids():
+    event_filter = make_filter(NAME_CHANGE, LOCATION_CHANGE)
+    event_filter.push(LOCATION_CHANGE, 1, 0.000)
+    event_filter.push(NAME_CHANGE, 1, 0.001)
+    event_filter.push(LOCATION_CHANGE, 1, 0.002)
+    event_filter.push(NAME_CHANGE, 1, 0.040)
+
+    # Only the location burst's window ended, the newer held title change keeps waiting
+    assert event_filter.due(0.0505) == [(LOCATION_CHANGE, 1, 0.002)]
+    assert event_filter.stats()["pending"] == 1
+
+    event_filter = make_filter(NAME_CHANGE, LOCATION_CHANGE)
+    event_filter.push(NAME_CHANGE, 1, 0.000)
+    event_filter.push(LOCATION_CHANGE, 1, 0.001)
+    event_filter.push(LOCATION_CHANGE, 1, 0.002)
+    event_filter.push(NAME_CHANGE, 1, 0.040)
+
+    # The title burst's window ends first, the older held location change has to go before it
+    assert event_filter.due(0.050) == [(LOCATION_CHANGE, 1, 0.002), (NAME_CHANGE, 1, 0.040)]
+    assert event_filter.stats()["pending"] == 0
+
+
+def test_synthetic_storm_reduces_deliveries_and_keeps_final_state():
+    storm = synthetic_storm()
+    subscribed = (FOREGROUND, NAME_CHANGE, DESTROY)
+    event_filter = make_filter(*subscribed)
+    deliveries = event_filter.replay(storm)
+    expected = [record for record in storm if record[0] in subscribed]
+
+    assert event_filter.received == len(expected)
+    # Keeping every window in order flushes held events early, with only 4 windows that costs some coalescing
+    assert len(deliveries) < len(expected) * 0.6
+    # Every (event, hwnd) ends on its last received record
+    assert last_per_key(deliveries) == last_per_key(expected)
+    # Events of one id are delivered in arrival order, so the last foreground window wins
+    for event in subscribed:
+        timestamps = [timestamp for record_event, _, timestamp in deliveries if record_event == event]
+        assert timestamps == sorted(timestamps)
+    # And so are the events of one window, whatever their id
+    for hwnd in (101, 102, 103, 104):
+        timestamps = [timestamp for _, record_hwnd, timestamp in deliveries if record_hwnd == hwnd]
+        assert timestamps == sorted(timestamps)
+    last_foreground = [record for record in expected if record[0] == FOREGROUND][-1]
+    assert [record for record in deliveries if record[0] == FOREGROUND][-1] == last_foreground
+    assert event_filter.stats()["pending"] == 0
+
+
+def test_unsubscribing_drops_held_back_events():
+    event_filter = make_filter(NAME_CHANGE)
+    event_filter.push(NAME_CHANGE, 1, 0.0)
+    event_filter.push(NAME_CHANGE, 1, 0.01)
+    event_filter.set_subscribed([FOREGROUND])
+    assert event_filter.due(1.0) == []
+    assert event_filter.next_deadline() is None